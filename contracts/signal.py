@@ -101,6 +101,10 @@ class Signal(BaseModel):
         None,
         description="uuid4 hex string assigned by petrosa-cio for the decision that produced this signal; None for strategy-direct signals",
     )
+    account_id: str | None = Field(
+        None,
+        description="Target trading account when the engine hosts several (TE_ACCOUNTS); None routes to the primary account",
+    )
     strategy_mode: StrategyMode = Field(
         StrategyMode.DETERMINISTIC, description="Processing mode for this signal"
     )
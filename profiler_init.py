@@ -8,19 +8,32 @@ Alpine Linux base image. To enable profiling, either:
 1. Switch to python:3.11-slim base image, or
 2. Add build dependencies to Alpine (gcc, g++, rust, etc.)
 
-For now, profiling is disabled until we migrate to slim base image.
+For now, profiling is disabled until we migrate to slim base image. The
+built-in sampling profiler (``GET /debug/profile``, see
+tradeengine/sampling_profiler.py) needs no compiled dependencies.
 """
 
 import os
+from typing import Any
 
-try:
-    import pyroscope
 
-    PYROSCOPE_AVAILABLE = True
-except ImportError:
-    PYROSCOPE_AVAILABLE = False
-    print("⚠️  pyroscope-io not installed - profiling unavailable")
-    print("   To enable: migrate to python:3.11-slim base image")
+def _profiler_enabled() -> bool:
+    return os.getenv("ENABLE_PROFILER", "false").lower() in ("true", "1", "yes")
+
+
+# pyroscope is only imported when ENABLE_PROFILER is on, so a normal start
+# does not pay for (or warn about) the profiler agent.
+pyroscope: Any = None
+PYROSCOPE_AVAILABLE = False
+if _profiler_enabled():
+    try:
+        import pyroscope as _pyroscope
+
+        pyroscope = _pyroscope
+        PYROSCOPE_AVAILABLE = True
+    except ImportError:
+        print("⚠️  pyroscope-io not installed - profiling unavailable")
+        print("   To enable: migrate to python:3.11-slim base image")
 
 
 def setup_profiler(
@@ -39,7 +52,7 @@ def setup_profiler(
         return
 
     # Check if profiling is enabled
-    if os.getenv("ENABLE_PROFILER", "false").lower() not in ("true", "1", "yes"):
+    if not _profiler_enabled():
         return
 
     # Get configuration from environment variables
@@ -89,6 +102,5 @@ def setup_profiler(
 
 # Auto-setup if environment variable is set and pyroscope is available
 if PYROSCOPE_AVAILABLE:
-    if os.getenv("ENABLE_PROFILER", "false").lower() in ("true", "1", "yes"):
-        if not os.getenv("PYROSCOPE_NO_AUTO_INIT"):
-            setup_profiler()
+    if not os.getenv("PYROSCOPE_NO_AUTO_INIT"):
+        setup_profiler()
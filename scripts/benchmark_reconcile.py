@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Benchmark loop vs columnar reconciliation detection
+
+Builds a synthetic book (hedge-mode positions, a mix of fully protected,
+half protected, naked and sign-malformed legs, plus a local tracker with
+ghosts and size mismatches) and times detect_divergences /
+detect_unhedged_positions against their NumPy columnar versions.
+
+    python scripts/benchmark_reconcile.py                # 1k, 2k, 5k, 10k
+    python scripts/benchmark_reconcile.py --sizes 500 20000 --repeat 10
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from functools import partial
+from typing import Any
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tradeengine.position_columns import (  # noqa: E402
+    detect_divergences_columnar,
+    detect_unhedged_positions_columnar,
+)
+from tradeengine.position_reconciler import (  # noqa: E402
+    detect_divergences,
+    detect_unhedged_positions,
+)
+
+
+def synthetic_book(
+    n_positions: int, seed: int = 7
+) -> tuple[dict[Any, Any], dict[Any, Any], dict[str, list[dict[str, Any]]]]:
+    """Return (binance_positions, local_positions, orders_by_symbol)."""
+    rng = random.Random(seed)
+    binance: dict[Any, Any] = {}
+    local: dict[Any, Any] = {}
+    orders: dict[str, list[dict[str, Any]]] = {}
+    for i in range(n_positions):
+        symbol = f"SYM{i // 2}USDT"
+        side = "LONG" if i % 2 == 0 else "SHORT"
+        qty = round(rng.uniform(0.001, 5.0), 3)
+        amt = qty if side == "LONG" else -qty
+        if rng.random() < 0.02:
+            amt = -amt  # malformed sign
+        binance[(symbol, side)] = {
+            "symbol": symbol,
+            "positionSide": side,
+            "positionAmt": str(amt),
+        }
+        roll = rng.random()
+        if roll < 0.9:
+            local[(symbol, side)] = {"quantity": qty if roll < 0.85 else qty * 2}
+        legs = orders.setdefault(symbol, [])
+        # Unrelated resting orders on the symbol are part of the real cost.
+        legs.append({"positionSide": side, "type": "LIMIT", "reduceOnly": False})
+        if rng.random() < 0.9:
+            legs.append(
+                {"positionSide": side, "type": "STOP_MARKET", "reduceOnly": True}
+            )
+        if rng.random() < 0.8:
+            legs.append(
+                {
+                    "positionSide": side,
+                    "type": "TAKE_PROFIT_MARKET",
+                    "closePosition": True,
+                }
+            )
+    for i in range(n_positions // 20):
+        local[(f"GHOST{i}USDT", "LONG")] = {"quantity": 1.0}
+    return binance, local, orders
+
+
+def _best_of(fn: Any, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def run(sizes: list[int], repeat: int) -> list[dict[str, Any]]:
+    rows = []
+    for n in sizes:
+        binance, local, orders = synthetic_book(n)
+        assert detect_unhedged_positions_columnar(
+            binance, orders
+        ) == detect_unhedged_positions(binance, orders)
+        assert detect_divergences_columnar(binance, local) == detect_divergences(
+            binance, local
+        )
+        timings = {
+            "unhedged_loop_ms": partial(detect_unhedged_positions, binance, orders),
+            "unhedged_columnar_ms": partial(
+                detect_unhedged_positions_columnar, binance, orders
+            ),
+            "divergence_loop_ms": partial(detect_divergences, binance, local),
+            "divergence_columnar_ms": partial(
+                detect_divergences_columnar, binance, local
+            ),
+        }
+        row: dict[str, Any] = {"positions": n}
+        for name, fn in timings.items():
+            row[name] = 1000 * _best_of(fn, repeat)
+        rows.append(row)
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 2_000, 5_000, 10_000]
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(
+        f"{'positions':>10} {'unhedged loop':>14} {'columnar':>10} "
+        f"{'divergence loop':>16} {'columnar':>10}   (best of {args.repeat}, ms)"
+    )
+    for row in run(args.sizes, args.repeat):
+        print(
+            f"{row['positions']:>10} {row['unhedged_loop_ms']:>14.2f} "
+            f"{row['unhedged_columnar_ms']:>10.2f} {row['divergence_loop_ms']:>16.2f} "
+            f"{row['divergence_columnar_ms']:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
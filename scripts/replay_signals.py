@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Replay a signal capture through the dispatcher
+
+Reads a file written with TE_SIGNAL_CAPTURE_PATH and feeds each signal to
+Dispatcher.dispatch backed by the simulator exchange, then prints
+throughput and per-status counts.
+
+The replay stays offline whatever the environment points at: the
+dispatcher is not initialised (that connects MongoDB, the Data Manager and
+NATS), the per-signal MongoDB lock is replaced by an in-process one, Data
+Manager requests are answered locally and NATS publishing and the audit
+log are disabled for the run.
+
+    python scripts/replay_signals.py capture.bin              # real time
+    python scripts/replay_signals.py capture.bin --speed 20   # 20x faster
+    python scripts/replay_signals.py capture.bin --speed 0    # flat out
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+from collections.abc import Iterator
+from contextlib import ExitStack, contextmanager
+from typing import Any
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tradeengine.dispatcher as dispatcher_module  # noqa: E402
+from shared.audit import audit_logger  # noqa: E402
+from shared.config import settings  # noqa: E402
+from tradeengine.dispatcher import Dispatcher  # noqa: E402
+from tradeengine.exchange.simulator import SimulatorExchange  # noqa: E402
+from tradeengine.services.data_manager_client import (  # noqa: E402
+    BaseDataManagerClient,
+)
+from tradeengine.signal_capture import read_capture, replay  # noqa: E402
+
+
+class LocalLockManager:
+    """In-process stand-in for the MongoDB distributed lock manager."""
+
+    lock_timeout = 60
+
+    def __init__(self) -> None:
+        self._held: set[str] = set()
+
+    def signal_ownership(self, symbol: str) -> str | None:
+        return None  # shard mode off: every signal takes the lock path
+
+    async def execute_with_lock(
+        self,
+        lock_name: str,
+        operation: Any,
+        *args: Any,
+        hold_seconds: int | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        if lock_name in self._held:
+            raise Exception(f"Failed to acquire lock '{lock_name}'")
+        self._held.add(lock_name)
+        try:
+            return await operation(*args, **kwargs)
+        finally:
+            if hold_seconds is None:  # held ones last the whole replay
+                self._held.discard(lock_name)
+
+    async def health_check(self) -> dict[str, Any]:
+        return {"status": "healthy", "type": "local"}
+
+    async def close(self) -> None:
+        pass
+
+
+async def _offline_request(
+    self: BaseDataManagerClient, method: str, path: str, **kwargs: Any
+) -> dict[str, Any]:
+    return {"status": "ok", "data": []}
+
+
+@contextmanager
+def offline() -> Iterator[None]:
+    """Swap the dispatcher's network side effects for local stand-ins."""
+    with ExitStack() as stack:
+
+        def swap(target: Any, name: str, value: Any) -> None:
+            stack.callback(setattr, target, name, getattr(target, name))
+            setattr(target, name, value)
+
+        swap(dispatcher_module, "distributed_lock_manager", LocalLockManager())
+        swap(BaseDataManagerClient, "_retry_request", _offline_request)
+        swap(settings, "nats_enabled", False)
+        swap(audit_logger, "enabled", False)
+        yield
+
+
+async def run(path: str, speed: float, limit: int | None) -> dict:
+    with offline():
+        exchange = SimulatorExchange()
+        await exchange.initialize()
+        dispatcher = Dispatcher(exchange=exchange)
+        dispatcher.heartbeat_monitor = None
+        records = read_capture(path)
+        if limit is not None:
+            records = (r for i, r in enumerate(records) if i < limit)
+        try:
+            stats = await replay(dispatcher, records, speed=speed)
+        finally:
+            await dispatcher.close()
+            await exchange.close()
+    return stats.summary()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("path")
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        help="time scale for captured gaps; 0 replays as fast as possible",
+    )
+    parser.add_argument("--limit", type=int, default=None)
+    parser.add_argument("--log-level", default="WARNING")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=args.log_level.upper())
+    summary = asyncio.run(run(args.path, args.speed, args.limit))
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -60,6 +60,13 @@ class Settings(BaseSettings):
     # on testnet. Rollback: unset TE_OCO_WS_WAKE_ENABLED (or set false).
     te_oco_ws_wake_enabled: bool = False
 
+    # #371 deferred-OCO backstop: CONDITIONAL entries get their SL/TP placed
+    # from the FILLED ORDER_TRADE_UPDATE on the user-data stream. The order
+    # monitor only sweeps pending entries (one open-orders read per symbol,
+    # status lookups for entries that left the book) this often, to catch
+    # fills the stream missed during a disconnect.
+    te_oco_pending_sweep_interval_seconds: float = 30.0
+
     # Redis Configuration (for caching)
     redis_url: str | None = None
     redis_password: str | None = None
@@ -129,6 +136,162 @@ class Settings(BaseSettings):
     # affected. Set TE_FILL_AUDIT_ENRICHMENT_ENABLED=false to disable the extra
     # per-fill REST call per deploy.
     te_fill_audit_enrichment_enabled: bool = True
+    # With the dispatcher attached, the userTrades lookup runs off the order
+    # path: fills are returned immediately, lookups are batched per symbol
+    # over te_fill_audit_batch_window_seconds, and the fee/fee_asset/pnl
+    # arrive as a follow-up "fill_audit" execution event. False restores the
+    # inline lookup (the "filled" event itself carries the values).
+    te_fill_audit_deferred: bool = True
+    te_fill_audit_batch_window_seconds: float = 0.5
+
+    # OrderManager.order_history is a fixed-capacity journal: once it holds
+    # this many finished orders the oldest entry is evicted, so a long-running
+    # pod's memory stays flat. With spill enabled the evicted entries are
+    # batched to the data-manager ``order_history`` collection instead of
+    # being dropped. Spill defaults off (no extra writes) until validated.
+    te_order_history_capacity: int = 5000
+    te_order_history_spill_enabled: bool = False
+
+    # Hot-path metric handles (tradeengine/metric_handles.py): each limited
+    # label (symbol, strategy, failure reason) keeps at most this many
+    # distinct values per metric; later values fold into "other" so a burst
+    # of new error texts cannot mint unbounded series. OTel dual-export
+    # updates are coalesced and replayed every interval seconds.
+    te_metric_label_cap: int = 100
+    te_otel_batch_interval_seconds: float = 5.0
+
+    # Event-loop monitor (tradeengine/loop_monitor.py): a sampler exports
+    # the loop's wake-up lag every te_loop_lag_interval_seconds, and a
+    # watchdog thread samples the stack and running task of any stall
+    # longer than te_slow_callback_threshold_seconds. Worst recent
+    # offenders are on GET /debug/loop (needs te_debug_token, below).
+    te_loop_monitor_enabled: bool = True
+    te_loop_lag_interval_seconds: float = 0.25
+    te_slow_callback_threshold_seconds: float = 0.1
+
+    # GET /debug/profile?seconds=N (tradeengine/sampling_profiler.py): a
+    # pure-Python sampling profiler returning folded stacks or speedscope
+    # JSON. The endpoint requires "Authorization: Bearer <te_debug_token>"
+    # and is refused while the token is empty (default). Thread stacks are
+    # sampled at te_profile_rate_hz; N is capped at te_profile_max_seconds.
+    te_debug_token: str = ""
+    te_profile_rate_hz: float = 100.0
+    te_profile_max_seconds: int = 60
+
+    # Append every raw NATS signal payload, with its receive time, to this
+    # file (tradeengine/signal_capture.py) before it is parsed. Empty
+    # (default) disables capture. Replay a capture against the simulator
+    # with scripts/replay_signals.py.
+    te_signal_capture_path: str = ""
+
+    # Most entries each Dispatcher dedup cache (recent signal ids, local
+    # shard claims) holds before evicting the oldest early
+    # (tradeengine/dedup_cache.py). Evictions are counted in
+    # tradeengine_dedup_cache_evictions_total and should stay at zero.
+    te_signal_dedup_capacity: int = 50_000
+
+    # Log volume budget (shared/log_budget.py): each logging call site may
+    # emit te_log_budget_per_site records per te_log_budget_window_seconds;
+    # the rest are dropped before formatting and reported as "[suppressed
+    # N similar messages]" on that site's next record. ERROR and above are
+    # never dropped. te_log_levels sets per-subsystem levels at startup,
+    # e.g. "tradeengine.dispatcher=WARNING,tradeengine.consumer=INFO"; they
+    # can be changed at runtime with PUT /debug/logging/{logger}.
+    te_log_budget_enabled: bool = True
+    te_log_budget_window_seconds: float = 10.0
+    te_log_budget_per_site: int = 20
+    te_log_levels: str = ""
+
+    # Signal ownership by symbol shard (shared/shard_leases.py). "off" keeps
+    # the per-signal MongoDB lock around every execution. "on" makes each pod
+    # lease a consistent-hash subset of the shard space, subscribes to
+    # signals without the NATS queue group (every pod sees every signal) and
+    # executes only signals for symbols it owns, with in-memory dedup instead
+    # of a network lock. Signals for shards with no live lease or still in
+    # their handover grace, and HTTP /trade signals, keep the lock path; a
+    # pod without a fresh lease table (boot, Mongo outage) skips broadcasts.
+    # Every pod receives a broadcast, so a broadcast signal on the lock path
+    # is not released when it finishes: its lock expires after
+    # te_signal_broadcast_lock_seconds, which must outlast the slowest pod's
+    # delivery of the same signal, or that pod takes the freed lock and
+    # places the trade again.
+    te_signal_shard_mode: str = "off"
+    te_signal_shard_count: int = 32
+    te_signal_shard_lease_seconds: int = 30
+    te_signal_broadcast_lock_seconds: int = 300
+
+    # Per-symbol actor runtime (tradeengine/symbol_actors.py). "off" keeps
+    # the legacy shared-state dispatch. "on" runs signal dispatch, user-data
+    # fill handling and the OCO monitor's per-position checks on one mailbox
+    # task per symbol: same-symbol commands apply in order, different symbols
+    # run in parallel. Idle actors retire after te_symbol_actor_idle_seconds.
+    te_symbol_actor_mode: str = "off"
+    te_symbol_actor_idle_seconds: float = 60.0
+
+    # Executor for batched pre-trade arithmetic (tradeengine/compute_pool.py):
+    # reconciliation sweeps (unhedged detection, protective-price derivation
+    # for naked positions) run chunk-wise on a "thread" or "process" pool
+    # instead of inline on the event loop. "off" computes inline. Batches
+    # below te_compute_pool_min_batch always run inline; 0 workers means one
+    # per CPU.
+    te_compute_pool_mode: str = "off"
+    te_compute_pool_workers: int = 0
+    te_compute_pool_min_batch: int = 64
+
+    # Position reconciliation switches to the NumPy columnar divergence /
+    # unhedged detection (tradeengine/position_columns.py) once Binance
+    # reports at least this many open positions; smaller books keep the
+    # per-position loops, which are cheaper below the packing overhead
+    # (scripts/benchmark_reconcile.py puts the crossover near 2k). 0 disables.
+    te_reconcile_columnar_min_positions: int = 2000
+
+    # Multi-account mode: comma-separated account ids hosted by this process.
+    # Empty (default) is the single-account deployment. The first id is the
+    # primary account (BINANCE_API_KEY / BINANCE_API_SECRET, API routes,
+    # untagged Data Manager positions); each further id reads
+    # BINANCE_API_KEY_<ID> / BINANCE_API_SECRET_<ID> and gets its own
+    # dispatcher, OCO monitor, user-data stream and reconciler. Signals are
+    # routed by their ``account_id`` (unset -> primary). Exchange info, the
+    # HTTP pool, the ticker cache and NATS connections are shared.
+    te_accounts: str = ""
+    te_shared_price_ttl_seconds: float = 1.0
+    te_shared_http_pool_size: int = 32
+
+    # Dispatcher.close_positions_bulk: positions whose OCO cancels and
+    # exchange-presence checks may be in flight at once. The closes
+    # themselves go out as /batchOrders requests of up to 5 orders each.
+    te_bulk_close_concurrency: int = 8
+
+    # Warm restart (tradeengine/state_snapshot.py): local file the dispatcher
+    # rewrites every te_state_snapshot_interval_seconds (and on shutdown)
+    # with its OCO pairs, pending entries, positions, strategy contributions
+    # and last user-data event time. Empty (default) disables. Secondary
+    # accounts append ".<account_id>". On boot a snapshot no older than
+    # te_state_snapshot_max_age_seconds replaces the Data Manager position
+    # load and the blocking OCO rebuild; the exchange scan then runs in the
+    # background and only adds orders the snapshot did not track.
+    te_state_snapshot_path: str = ""
+    te_state_snapshot_interval_seconds: float = 15.0
+    te_state_snapshot_max_age_seconds: float = 900.0
+
+    # User-data stream reconnects: a drop shorter than this is healed by
+    # re-reading only the symbols that could have changed (open positions
+    # and orders in the truth store plus the dispatcher's own active
+    # symbols) instead of the full position/open-order snapshot. Longer
+    # gaps, or scopes wider than te_user_data_delta_reseed_max_symbols,
+    # take the full seed. 0 always seeds fully (legacy behavior). A delta
+    # reseed costs 5 + N REST weight (one positions read, one open-orders
+    # read per symbol) against the full seed's 45, so the cap is clamped
+    # to 39.
+    te_user_data_delta_reseed_max_gap_seconds: float = 120.0
+    te_user_data_delta_reseed_max_symbols: int = 10
+
+    # PositionManager's periodic Data Manager sync writes only positions
+    # changed since the previous pass. Its interval starts at 30s, halves
+    # after a pass that wrote something and doubles after an idle pass,
+    # clamped to these bounds.
+    te_position_sync_min_interval_seconds: float = 5.0
+    te_position_sync_max_interval_seconds: float = 120.0
 
     # #445: exchange-authoritative naked-position remediation.
     # Modes: "off" (read-only, no writes — detection-only), "dry_run"
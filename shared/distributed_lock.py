@@ -17,6 +17,7 @@ from prometheus_client import Counter
 
 from shared.config import Settings
 from shared.constants import UTC, get_mongodb_connection_string, redact_uri
+from shared.shard_leases import ShardLeaseManager
 
 logger = logging.getLogger(__name__)
 
@@ -57,7 +58,17 @@ class DistributedLockManager:
         self.leader_pod_id: str | None = None
         self.heartbeat_task: asyncio.Task[None] | None = None
         self.lock_cleanup_task: asyncio.Task[None] | None = None
+        self.shard_lease_task: asyncio.Task[None] | None = None
         self.settings = Settings()
+        # Symbol-shard leases (TE_SIGNAL_SHARD_MODE=on); None keeps the
+        # per-signal lock path for every signal.
+        self.shard_leases: ShardLeaseManager | None = None
+        if self.settings.te_signal_shard_mode == "on":
+            self.shard_leases = ShardLeaseManager(
+                self.pod_id,
+                self.settings.te_signal_shard_count,
+                self.settings.te_signal_shard_lease_seconds,
+            )
         self.mongodb_client: Any = None
         self.mongodb_db: Any = None
         # Lazy-reconnect state. Backoff is bounded so any momentary Mongo
@@ -87,6 +98,11 @@ class DistributedLockManager:
             # Start cleanup task for expired locks
             self.lock_cleanup_task = asyncio.create_task(self._cleanup_expired_locks())
 
+            # Renew symbol-shard leases on the heartbeat cadence. Runs on every
+            # pod (the leader heartbeat loop only runs on the leader).
+            if self.shard_leases is not None:
+                self.shard_lease_task = asyncio.create_task(self._shard_lease_loop())
+
             # Try to become leader (no-op if Mongo not connected yet — heals on reconnect)
             await self._try_become_leader()
 
@@ -113,6 +129,17 @@ class DistributedLockManager:
                 except asyncio.CancelledError:
                     pass
 
+            # Stop renewing and hand shard leases back so peers take over
+            # without waiting for expiry
+            if self.shard_lease_task:
+                self.shard_lease_task.cancel()
+                try:
+                    await self.shard_lease_task
+                except asyncio.CancelledError:
+                    pass
+            if self.shard_leases is not None and self.mongodb_db is not None:
+                await self.shard_leases.release_all(self.mongodb_db)
+
             # Release leadership if we are the leader
             if self.is_leader:
                 await self._release_leadership()
@@ -488,6 +515,25 @@ class DistributedLockManager:
                 logger.error(f"Error cleaning up expired locks: {e}")
                 await asyncio.sleep(60)
 
+    async def _shard_lease_loop(self) -> None:
+        """Periodically claim/renew this pod's symbol-shard leases"""
+        leases = self.shard_leases
+        if leases is None:
+            return
+        while True:
+            try:
+                if await self._ensure_mongodb_connected():
+                    await leases.renew(self.mongodb_db)
+            except Exception as e:
+                logger.error(f"Error renewing shard leases: {e}")
+            await asyncio.sleep(self.heartbeat_interval)
+
+    def signal_ownership(self, symbol: str) -> str | None:
+        """Shard ownership of ``symbol`` for this pod; None when shard mode is off"""
+        if self.shard_leases is None:
+            return None
+        return self.shard_leases.ownership(symbol)
+
     async def get_leader_info(self) -> dict[str, Any]:
         """Get current leader information"""
         if self.mongodb_db is None:
@@ -568,20 +614,34 @@ class DistributedLockManager:
                 "backoff_seconds": self._init_backoff_seconds,
                 "last_error": self._last_init_error,
             },
+            "shard_leases": (
+                self.shard_leases.snapshot() if self.shard_leases is not None else None
+            ),
         }
 
     async def execute_with_lock(
-        self, lock_name: str, operation: Any, *args: Any, **kwargs: Any
+        self,
+        lock_name: str,
+        operation: Any,
+        *args: Any,
+        hold_seconds: int | None = None,
+        **kwargs: Any,
     ) -> Any:
-        """Execute an operation with a distributed lock"""
-        acquired = await self.acquire_lock(lock_name)
+        """Execute an operation with a distributed lock
+
+        With ``hold_seconds`` the lock is not released afterwards but expires
+        that long after it was taken, so a pod attempting the same operation
+        later in that window still finds it held.
+        """
+        acquired = await self.acquire_lock(lock_name, hold_seconds)
         if not acquired:
             raise Exception(f"Failed to acquire lock '{lock_name}'")
 
         try:
             return await operation(*args, **kwargs)
         finally:
-            await self.release_lock(lock_name)
+            if hold_seconds is None:
+                await self.release_lock(lock_name)
 
 
 # Global distributed lock manager instance
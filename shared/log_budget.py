@@ -0,0 +1,226 @@
+"""Per-call-site log budget and runtime log levels.
+
+The signal path logs several INFO lines per signal, order, OCO tick and
+monitor pass, so under load most logging CPU and log-shipping volume goes
+to repeats of the same few lines. :class:`LogBudget` lets each call site
+(file and line of the ``logger.*`` call) emit at most ``per_site`` records
+per ``window_seconds``; the rest are dropped before they are formatted.
+The next record that site emits carries a ``[suppressed N similar
+messages]`` suffix. ERROR and above always pass.
+
+The budget is enforced twice, on whichever path a record takes:
+
+* :func:`budget_processor` sits right after ``filter_by_level`` in the
+  structlog chain (``shared.logger.configure_structlog``), ahead of the
+  positional-argument formatting and rendering;
+* :class:`LogBudgetFilter` is attached to the root handlers by
+  :func:`install` for plain ``logging`` loggers. ``LogRecord.getMessage``
+  is only called by the handler's formatter, so ``%``-style arguments of a
+  dropped record are never formatted. Records already admitted by the
+  structlog processor are passed through: structlog hands the stdlib
+  logger the caller's own file and line, so the processor notes the site
+  it admitted on this thread and the filter recognises the record by it.
+
+:func:`set_level` / :func:`get_levels` change logger levels per subsystem
+(logger name prefix) at runtime; ``PUT /debug/logging/{name}`` exposes
+them, and ``TE_LOG_LEVELS`` sets them at startup.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import structlog
+
+from shared.config import settings
+
+Site = tuple[str, int]
+
+_STRUCTLOG_DIR = os.path.dirname(structlog.__file__)
+_SKIP_MODULES = ("structlog", "logging", __name__)
+# Site budget_processor last admitted on this thread; the stdlib record the
+# event turns into carries the same site and must not be budgeted again.
+_admitted = threading.local()
+
+
+@dataclass
+class _SiteWindow:
+    started: float
+    emitted: int = 0
+    suppressed: int = 0
+    suppressed_total: int = 0
+
+
+class LogBudget:
+    """Fixed-window record budget per call site."""
+
+    def __init__(
+        self, window_seconds: float = 10.0, per_site: int = 20, enabled: bool = True
+    ) -> None:
+        self.window_seconds = max(0.1, float(window_seconds))
+        self.per_site = max(1, int(per_site))
+        self.enabled = enabled
+        self._sites: dict[Site, _SiteWindow] = {}
+        self._lock = threading.Lock()
+        self.suppressed_total = 0
+
+    @classmethod
+    def from_settings(cls) -> LogBudget:
+        return cls(
+            window_seconds=settings.te_log_budget_window_seconds,
+            per_site=settings.te_log_budget_per_site,
+            enabled=settings.te_log_budget_enabled,
+        )
+
+    def admit(self, site: Site, levelno: int, now: float | None = None) -> int | None:
+        """None drops the record; otherwise how many were suppressed before it."""
+        if not self.enabled or levelno >= logging.ERROR:
+            return 0
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            window = self._sites.get(site)
+            if window is None:
+                window = self._sites[site] = _SiteWindow(started=now)
+            elif now - window.started >= self.window_seconds:
+                window.started = now
+                window.emitted = 0
+            if window.emitted >= self.per_site:
+                window.suppressed += 1
+                window.suppressed_total += 1
+                self.suppressed_total += 1
+                return None
+            window.emitted += 1
+            suppressed, window.suppressed = window.suppressed, 0
+            return suppressed
+
+    def snapshot(self, limit: int = 10) -> dict[str, Any]:
+        with self._lock:
+            noisy = sorted(
+                (
+                    (site, w.suppressed_total)
+                    for site, w in self._sites.items()
+                    if w.suppressed_total
+                ),
+                key=lambda item: -item[1],
+            )[:limit]
+        return {
+            "enabled": self.enabled,
+            "window_seconds": self.window_seconds,
+            "per_site": self.per_site,
+            "suppressed_total": self.suppressed_total,
+            "noisiest_sites": [
+                {"site": f"{path}:{line}", "suppressed": count}
+                for (path, line), count in noisy
+            ],
+        }
+
+
+def _suffix(suppressed: int) -> str:
+    return f" [suppressed {suppressed} similar messages]"
+
+
+def _caller_site() -> Site:
+    frame = sys._getframe(2)
+    while frame.f_back is not None and frame.f_globals.get("__name__", "").startswith(
+        _SKIP_MODULES
+    ):
+        frame = frame.f_back
+    return frame.f_code.co_filename, frame.f_lineno
+
+
+def budget_processor(
+    logger: Any, method_name: str, event_dict: dict[str, Any]
+) -> dict[str, Any]:
+    """structlog processor applying :data:`log_budget` per call site."""
+    if not log_budget.enabled:
+        return event_dict
+    levelno = logging.getLevelName(method_name.upper())
+    if not isinstance(levelno, int):
+        levelno = logging.INFO
+    site = _caller_site()
+    suppressed = log_budget.admit(site, levelno)
+    if suppressed is None:
+        raise structlog.DropEvent
+    _admitted.site = site
+    if suppressed:
+        event_dict["event"] = f"{event_dict.get('event', '')}{_suffix(suppressed)}"
+    return event_dict
+
+
+class LogBudgetFilter(logging.Filter):
+    """Handler filter applying :data:`log_budget` to stdlib records."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        # Every root handler carries this filter; decide once per record so
+        # a second handler neither halves the budget nor double-counts.
+        admitted: bool | None = getattr(record, "_log_budget_admitted", None)
+        if admitted is None:
+            admitted = self._admit(record)
+            record._log_budget_admitted = admitted
+        return admitted
+
+    @staticmethod
+    def _admit(record: logging.LogRecord) -> bool:
+        site = (record.pathname, record.lineno)
+        if record.pathname.startswith(_STRUCTLOG_DIR) or site == getattr(
+            _admitted, "site", None
+        ):
+            # Emitted through structlog: budget_processor already decided.
+            _admitted.site = None
+            return True
+        suppressed = log_budget.admit(site, record.levelno)
+        if suppressed is None:
+            return False
+        if suppressed:
+            # The suffix has no '%', so it survives msg % args unchanged.
+            record.msg = f"{record.msg}{_suffix(suppressed)}"
+        return True
+
+
+_filter = LogBudgetFilter()
+
+
+def install() -> None:
+    """Attach the budget filter to the root handlers and apply TE_LOG_LEVELS.
+
+    Safe to call again after other code (OpenTelemetry) adds handlers.
+    """
+    for handler in logging.getLogger().handlers:
+        if _filter not in handler.filters:
+            handler.addFilter(_filter)
+    for item in settings.te_log_levels.split(","):
+        name, _, level = item.partition("=")
+        if name.strip() and level.strip():
+            try:
+                set_level(name.strip(), level.strip())
+            except ValueError:
+                logging.getLogger(__name__).warning(
+                    "Ignoring TE_LOG_LEVELS entry %r", item
+                )
+
+
+def set_level(name: str, level: str) -> str:
+    """Set the level of logger ``name`` (``root`` for the root logger)."""
+    level = level.upper()
+    if level != "NOTSET" and not isinstance(logging.getLevelName(level), int):
+        raise ValueError(f"unknown log level {level!r}")
+    logging.getLogger(None if name == "root" else name).setLevel(level)
+    return level
+
+
+def get_levels() -> dict[str, str]:
+    """Explicitly set levels: root plus every logger with its own level."""
+    levels = {"root": logging.getLevelName(logging.getLogger().level)}
+    for name, logger in sorted(logging.root.manager.loggerDict.items()):
+        if isinstance(logger, logging.Logger) and logger.level != logging.NOTSET:
+            levels[name] = logging.getLevelName(logger.level)
+    return levels
+
+
+log_budget = LogBudget.from_settings()
@@ -4,20 +4,22 @@ import logging
 import os
 import sys
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import structlog
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import (
-    AsyncEngine,
-    AsyncSession,
-    async_sessionmaker,
-    create_async_engine,
-)
 from structlog.stdlib import LoggerFactory
 
 from shared.config import settings
 from shared.constants import UTC
+from shared.log_budget import (
+    budget_processor,
+    install as install_log_budget,
+)
+
+# SQLAlchemy is only needed once the MySQL audit logger is initialised; it is
+# imported there so importing this module (every dispatcher import) stays cheap.
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
 
 def configure_structlog():
@@ -31,9 +33,12 @@ def configure_structlog():
         stream=sys.stdout,
         level=log_level,
     )
+    install_log_budget()
 
     processors = [
         structlog.stdlib.filter_by_level,
+        # Per-call-site rate limit, ahead of any formatting or rendering
+        budget_processor,
         structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
         structlog.stdlib.PositionalArgumentsFormatter(),
@@ -74,6 +79,12 @@ class AuditLogger:
 
     async def initialize(self) -> None:
         """Initialize MySQL connection with retries and backoff"""
+        from sqlalchemy.ext.asyncio import (
+            AsyncSession,
+            async_sessionmaker,
+            create_async_engine,
+        )
+
         for attempt in range(self.retry_attempts):
             try:
                 # Create async engine for SQLAlchemy
@@ -127,6 +138,8 @@ class AuditLogger:
             logger.debug("MySQL audit logger not available, skipping audit log")
             return
 
+        from sqlalchemy import text
+
         # Create audit record
         audit_record: dict[str, Any] = {
             "timestamp": datetime.now(UTC).isoformat(),
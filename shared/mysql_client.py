@@ -6,6 +6,7 @@ All write methods return PersistResult (not bare bool) so callers can observe
 failures without relying on exception propagation.  Closes #448 Tasks 1.1-1.2.
 """
 
+import asyncio
 import logging
 from datetime import datetime
 from typing import Any, Optional
@@ -20,6 +21,9 @@ from tradeengine.services.data_manager_client import (
 
 logger = logging.getLogger(__name__)
 
+# Position upserts in flight at once during a bulk sync.
+_BULK_UPSERT_CONCURRENCY = 8
+
 
 class DataManagerPositionClient:
     """
@@ -187,6 +191,23 @@ class DataManagerPositionClient:
                 False, exc, operation="upsert_position", symbol=sym
             )
 
+    async def upsert_positions(
+        self, records: list[dict[str, Any]]
+    ) -> list[PersistResult]:
+        """Upsert many position records; one PersistResult per record, in order.
+
+        The Data Manager API has no multi-document upsert, so the writes go
+        out concurrently (at most ``_BULK_UPSERT_CONCURRENCY`` in flight)
+        rather than one after another.
+        """
+        semaphore = asyncio.Semaphore(_BULK_UPSERT_CONCURRENCY)
+
+        async def upsert(record: dict[str, Any]) -> PersistResult:
+            async with semaphore:
+                return await self.upsert_position(record)
+
+        return list(await asyncio.gather(*(upsert(r) for r in records)))
+
     async def close_position(
         self, symbol: str, position_side: str, update_data: dict[str, Any]
     ) -> PersistResult:
@@ -220,6 +241,23 @@ class DataManagerPositionClient:
                 False, exc, operation="close_position", symbol=symbol
             )
 
+    async def archive_orders(self, records: list[dict[str, Any]]) -> PersistResult:
+        """Batch-insert finished orders evicted from the in-memory journal."""
+        try:
+            response = await self.data_manager_client._client.insert(
+                database="mongodb", collection="order_history", data=records
+            )
+            ok = int(response.get("inserted_count", 0)) > 0
+            if not ok:
+                logger.warning(
+                    "Archiving %d orders via Data Manager inserted nothing",
+                    len(records),
+                )
+            return self._make_result(ok, operation="archive_orders")
+        except Exception as exc:
+            logger.error("Failed to archive %d orders: %s", len(records), exc)
+            return self._make_result(False, exc, operation="archive_orders")
+
     # ------------------------------------------------------------------
     # Read methods
     # ------------------------------------------------------------------
@@ -0,0 +1,240 @@
+"""
+Lease-based symbol-shard ownership for signal processing
+
+Every accepted signal used to take a per-signal MongoDB lock
+(``signal_<fingerprint>``) around order execution: a ``find_one_and_update``
+upsert to acquire and a ``delete_one`` to release, i.e. two round-trips on
+the critical path of every trade, plus the lock collection absorbing one
+insert/delete pair per signal.
+
+In shard mode (``TE_SIGNAL_SHARD_MODE=on``) the symbol space is split into
+``te_signal_shard_count`` shards (``crc32(symbol) % count``). Pods register
+in ``shard_members`` and each shard's preferred owner is picked among the
+live members by rendezvous hashing, so a pod joining or leaving only moves
+the shards it wins or held. A pod claims its preferred shards as leases in
+``shard_leases`` (same expired-or-mine ``find_one_and_update`` pattern as
+:class:`shared.distributed_lock.DistributedLockManager.acquire_lock`),
+renews them on the lock manager's heartbeat cadence and releases the ones it
+no longer prefers so the new owner can claim them.
+
+Per signal the dispatcher then asks :meth:`ShardLeaseManager.ownership`,
+a local dict lookup:
+
+* ``mine``     — this pod holds a live lease: execute with in-memory dedup,
+  no network lock;
+* ``other``    — another pod holds a live lease: when the signal was
+  broadcast to every pod, skip it (the owner has it too);
+* ``unowned``  — no live lease known (handover, expired owner): fall
+  back to the per-signal distributed lock, so nothing is dropped;
+* ``pending``  — this pod has no lease table it can trust (before its first
+  renew, or none for ``lease_seconds``): a broadcast signal is skipped, as
+  the pod cannot tell whether an owner is executing it without the lock.
+
+A pod stops treating a lease as its own ``safety_margin`` seconds before it
+expires, so clock skew between pods cannot produce two owners. After it
+gains a shard it keeps answering ``unowned`` (per-signal lock) for
+``handover_grace`` seconds: pods still holding the previous table see the
+shard as unowned too, and the lock keeps them from executing the same
+broadcast signal. By the end of the grace every other pod has either
+reloaded the table (and answers ``other``) or gone ``pending``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+import zlib
+from collections.abc import Callable, Iterable
+from datetime import datetime, timedelta
+from typing import Any
+
+import pymongo.errors
+
+from shared.constants import UTC
+
+logger = logging.getLogger(__name__)
+
+SHARD_LEASE_COLLECTION = "shard_leases"
+SHARD_MEMBER_COLLECTION = "shard_members"
+
+MINE = "mine"
+OTHER = "other"
+UNOWNED = "unowned"
+PENDING = "pending"
+
+
+def shard_for(symbol: str, num_shards: int) -> int:
+    """Stable shard index for a symbol (identical on every pod)."""
+    return zlib.crc32(symbol.upper().encode()) % num_shards
+
+
+def preferred_owner(shard: int, members: Iterable[str]) -> str | None:
+    """Rendezvous-hash winner for ``shard`` among ``members``."""
+    best: tuple[bytes, str] | None = None
+    for pod in members:
+        score = hashlib.blake2b(f"{pod}:{shard}".encode(), digest_size=8).digest()
+        if best is None or (score, pod) > best:
+            best = (score, pod)
+    return best[1] if best else None
+
+
+def _as_epoch(value: Any) -> float:
+    if isinstance(value, datetime):
+        if value.tzinfo is None:  # MongoDB returns naive UTC
+            value = value.replace(tzinfo=UTC)
+        return value.timestamp()
+    return float(value or 0.0)
+
+
+class ShardLeaseManager:
+    """Claims, renews and answers ownership of symbol shards for one pod."""
+
+    def __init__(
+        self,
+        pod_id: str,
+        num_shards: int,
+        lease_seconds: float,
+        safety_margin: float | None = None,
+        clock: Callable[[], float] = time.time,
+        handover_grace: float | None = None,
+    ) -> None:
+        self.pod_id = pod_id
+        self.num_shards = max(1, int(num_shards))
+        self.lease_seconds = float(lease_seconds)
+        self.safety_margin = (
+            safety_margin if safety_margin is not None else self.lease_seconds / 4
+        )
+        self.handover_grace = (
+            handover_grace if handover_grace is not None else self.lease_seconds
+        )
+        self._clock = clock
+        # shard -> (owner pod_id, lease expiry as epoch seconds), as last read
+        self._leases: dict[int, tuple[str, float]] = {}
+        # shard -> when this pod gained it (start of its handover grace)
+        self._gained_at: dict[int, float] = {}
+        self._members: list[str] = []
+        # Start of the last successful renew (the table is at least that fresh)
+        self._last_renewed_at: float | None = None
+
+    def shard_for(self, symbol: str) -> int:
+        return shard_for(symbol, self.num_shards)
+
+    def ownership(self, symbol: str) -> str:
+        now = self._clock()
+        if (
+            self._last_renewed_at is None
+            or now - self._last_renewed_at > self.lease_seconds
+        ):
+            return PENDING
+        shard = self.shard_for(symbol)
+        lease = self._leases.get(shard)
+        if lease is None:
+            return UNOWNED
+        owner, expires = lease
+        if owner == self.pod_id:
+            if now < self._gained_at.get(shard, now) + self.handover_grace:
+                return UNOWNED
+            return MINE if now < expires - self.safety_margin else UNOWNED
+        return OTHER if now < expires else UNOWNED
+
+    def owned_shards(self) -> list[int]:
+        now = self._clock()
+        return sorted(
+            shard
+            for shard, (owner, expires) in self._leases.items()
+            if owner == self.pod_id and now < expires - self.safety_margin
+        )
+
+    async def renew(self, db: Any) -> None:
+        """One heartbeat: refresh membership, claim/renew/release, reload table."""
+        started = self._clock()
+        now = datetime.now(UTC)
+        expires = now + timedelta(seconds=self.lease_seconds)
+        members_coll = db[SHARD_MEMBER_COLLECTION]
+        leases_coll = db[SHARD_LEASE_COLLECTION]
+
+        await members_coll.update_one(
+            {"_id": self.pod_id},
+            {"$set": {"last_heartbeat": now, "expires_at": expires}},
+            upsert=True,
+        )
+        members = [
+            doc["_id"]
+            async for doc in members_coll.find({"expires_at": {"$gt": now}}, {"_id": 1})
+        ]
+        if self.pod_id not in members:
+            members.append(self.pod_id)
+        self._members = sorted(members)
+
+        desired = {
+            shard
+            for shard in range(self.num_shards)
+            if preferred_owner(shard, members) == self.pod_id
+        }
+        held = {s for s, (owner, _) in self._leases.items() if owner == self.pod_id}
+
+        for shard in held - desired:
+            # Hand over: stop treating it as ours before the delete lands.
+            self._leases.pop(shard, None)
+            await leases_coll.delete_one({"_id": shard, "pod_id": self.pod_id})
+
+        for shard in desired:
+            try:
+                await leases_coll.find_one_and_update(
+                    {
+                        "_id": shard,
+                        "$or": [
+                            {"expires_at": {"$lt": now}},
+                            {"pod_id": self.pod_id},
+                        ],
+                    },
+                    {
+                        "$set": {
+                            "pod_id": self.pod_id,
+                            "expires_at": expires,
+                            "updated_at": now,
+                        }
+                    },
+                    upsert=True,
+                )
+            except pymongo.errors.DuplicateKeyError:
+                # Previous owner still holds it until it releases or expires.
+                pass
+
+        table: dict[int, tuple[str, float]] = {}
+        async for doc in leases_coll.find({}):
+            table[int(doc["_id"])] = (str(doc["pod_id"]), _as_epoch(doc["expires_at"]))
+        # A shard whose lease was live in the previous table keeps its grace
+        # start; a new or lapsed-and-reclaimed one starts a fresh grace.
+        kept = {
+            shard: self._gained_at.get(shard, started)
+            for shard, (owner, expires) in self._leases.items()
+            if owner == self.pod_id and expires > started
+        }
+        reloaded = self._clock()
+        self._leases = table
+        self._gained_at = {
+            shard: kept.get(shard, reloaded)
+            for shard, (owner, _) in table.items()
+            if owner == self.pod_id
+        }
+        self._last_renewed_at = started
+
+    async def release_all(self, db: Any) -> None:
+        """Give up every lease and membership (graceful shutdown)."""
+        self._leases = {
+            s: lease for s, lease in self._leases.items() if lease[0] != self.pod_id
+        }
+        self._gained_at.clear()
+        await db[SHARD_LEASE_COLLECTION].delete_many({"pod_id": self.pod_id})
+        await db[SHARD_MEMBER_COLLECTION].delete_one({"_id": self.pod_id})
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "num_shards": self.num_shards,
+            "lease_seconds": self.lease_seconds,
+            "members": list(self._members),
+            "owned_shards": self.owned_shards(),
+            "last_renewed_at": self._last_renewed_at,
+        }
@@ -134,6 +134,7 @@ class TestDistributedLockHealthCheck:
         lock._last_init_attempt_at = None
         lock._init_backoff_seconds = 1.0
         lock._last_init_error = None
+        lock.shard_leases = None
 
         with (
             patch(
@@ -1026,6 +1026,21 @@ class TestAdditionalMethods:
         price = await binance_exchange.get_symbol_price("BTCUSDT")
         assert price == 50000.0
 
+    @pytest.mark.asyncio
+    async def test_get_symbol_price_reads_off_the_event_loop(self, binance_exchange):
+        """The synchronous ticker call must not run on the loop thread"""
+        import threading
+
+        callers = []
+
+        def ticker(symbol):
+            callers.append(threading.get_ident())
+            return {"price": "50000.0"}
+
+        binance_exchange.client.futures_symbol_ticker = ticker
+        assert await binance_exchange.get_symbol_price("BTCUSDT") == 50000.0
+        assert callers and callers[0] != threading.get_ident()
+
     @pytest.mark.asyncio
     async def test_get_price(self, binance_exchange):
         """Test get_price method (alias for get_symbol_price)"""
@@ -12,8 +12,9 @@ These tests exercise the enrichment helper in isolation plus the
 
 from __future__ import annotations
 
+import asyncio
 import sys
-from unittest.mock import MagicMock, Mock
+from unittest.mock import AsyncMock, MagicMock, Mock
 
 import pytest
 
@@ -38,6 +39,7 @@ _mock_binance.exceptions.BinanceAPIException = _MockBinanceAPIException
 
 from contracts.order import OrderSide, OrderType, TradeOrder  # noqa: E402
 from tradeengine.exchange.binance import BinanceFuturesExchange  # noqa: E402
+from tradeengine.exchange.fill_audit import FillAuditPipeline  # noqa: E402
 
 
 def _build_order(amount: float = 0.02) -> TradeOrder:
@@ -251,3 +253,50 @@ def test_format_execution_result_exposes_pnl_key():
         {"orderId": 1, "status": "FILLED", "fills": [], "pnl": 9.75}, order
     )
     assert with_pnl["pnl"] == pytest.approx(9.75)
+
+
+@pytest.mark.asyncio
+async def test_deferred_fills_are_batched_per_symbol_and_published():
+    """With a sink the order path returns at once; one userTrades read per batch."""
+    exchange = _exchange_with_trades(
+        _TWO_TRADES + [dict(_TWO_TRADES[0], id=3, orderId=8888, realizedPnl="-1.0")]
+    )
+    published: list[tuple[TradeOrder, dict]] = []
+
+    async def sink(order, result):
+        published.append((order, result))
+
+    exchange.fill_audit = FillAuditPipeline(exchange, sink, window_seconds=0.01)
+    first = {"orderId": 9999, "symbol": "BTCUSDT", "status": "FILLED"}
+    second = {"orderId": 8888, "symbol": "BTCUSDT", "status": "FILLED"}
+
+    await exchange._audit_fill(first, _build_order())
+    await exchange._audit_fill(second, _build_order())
+    exchange.client.futures_account_trades.assert_not_called()
+    assert "fills" not in first
+
+    await asyncio.sleep(0.05)
+
+    exchange.client.futures_account_trades.assert_called_once()
+    assert "startTime" in exchange.client.futures_account_trades.call_args.kwargs
+    by_id = {r["order_id"]: r for _, r in published}
+    assert by_id["9999"]["fees"] == pytest.approx(0.488)
+    assert by_id["9999"]["pnl"] == pytest.approx(5.5)
+    assert by_id["8888"]["pnl"] == pytest.approx(-1.0)
+
+
+@pytest.mark.asyncio
+async def test_deferred_fill_without_trades_is_retried_then_dropped():
+    exchange = _exchange_with_trades([])
+    sink = AsyncMock()
+    pipeline = FillAuditPipeline(exchange, sink, window_seconds=0.0, max_attempts=2)
+
+    assert pipeline.submit(
+        {"orderId": 1, "symbol": "BTCUSDT", "status": "FILLED"}, _build_order()
+    )
+    assert not pipeline.submit({"orderId": 2, "status": "NEW"}, _build_order())
+    await asyncio.sleep(0.1)
+
+    assert exchange.client.futures_account_trades.call_count == 2
+    assert pipeline.snapshot()["dropped"] == 1
+    sink.assert_not_awaited()
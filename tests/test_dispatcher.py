@@ -1,3 +1,4 @@
+import time
 from datetime import datetime
 from unittest.mock import patch
 
@@ -6,6 +7,7 @@ import pytest
 from contracts.order import OrderStatus, TradeOrder
 from contracts.signal import OrderType, Signal, StrategyMode
 from shared.constants import UTC
+from tradeengine.dedup_cache import DedupCache
 from tradeengine.dispatcher import Dispatcher
 
 
@@ -266,8 +268,6 @@ async def test_generate_signal_id_identical_signals(dispatcher: Dispatcher) -> N
     id2 = dispatcher._generate_signal_id(signal2)
 
     assert id1 == id2
-    assert "test-strategy_BTCUSDT_buy" in id1
-    assert "2024-01-01T12:00:00" in id1
 
 
 @pytest.mark.asyncio
@@ -340,11 +340,6 @@ async def test_generate_signal_id_different_signals(dispatcher: Dispatcher) -> N
 
     # All IDs should be unique
     assert len(set(ids)) == 4
-    # Verify each ID contains expected components
-    assert "test-1_BTCUSDT_buy" in ids[0]
-    assert "test-2_BTCUSDT_buy" in ids[1]
-    assert "test-1_ETHUSDT_buy" in ids[2]
-    assert "test-1_BTCUSDT_sell" in ids[3]
 
 
 @pytest.mark.asyncio
@@ -407,14 +402,11 @@ async def test_generate_signal_id_different_timestamps(dispatcher: Dispatcher) -
     assert id1 != id2
     # Same second (even with different microseconds) should produce same ID
     assert id1 == id3
-    assert "test-strategy_BTCUSDT_buy" in id1
-    assert "2024-01-01T12:00:00" in id1
-    assert "2024-01-01T12:00:01" in id2
 
 
 @pytest.mark.asyncio
 async def test_generate_signal_id_format(dispatcher: Dispatcher) -> None:
-    """Test ID format and consistency"""
+    """IDs are compact integer keys, stable for the same signal"""
     timestamp = datetime(2024, 1, 1, 12, 0, 0)
     signal = Signal(
         strategy_id="test-strategy",
@@ -433,9 +425,8 @@ async def test_generate_signal_id_format(dispatcher: Dispatcher) -> None:
 
     signal_id = dispatcher._generate_signal_id(signal)
 
-    # Verify format: strategy_id_symbol_action_timestamp
-    assert signal_id == "test-strategy_BTCUSDT_buy_2024-01-01T12:00:00"
-    assert signal_id.count("_") == 3  # Three underscores separating components
+    assert isinstance(signal_id, int)
+    assert signal_id == dispatcher._generate_signal_id(signal.model_copy())
 
 
 @pytest.mark.asyncio
@@ -465,10 +456,9 @@ async def test_generate_signal_id_no_timestamp(dispatcher: Dispatcher) -> None:
 
     signal_id = dispatcher._generate_signal_id(signal)
 
-    # Should still generate ID without timestamp (empty string for timestamp part)
-    assert "test-strategy_BTCUSDT_buy" in signal_id
-    # When timestamp is None, the ID should end with an empty timestamp (just the separator)
-    assert signal_id.endswith("_") or signal_id.count("_") >= 2
+    # Should still generate an ID without a timestamp
+    assert isinstance(signal_id, int)
+    assert signal_id == dispatcher._generate_signal_id(signal)
 
 
 # ============================================================================
@@ -794,12 +784,31 @@ async def test_get_price_unknown_symbol(dispatcher: Dispatcher) -> None:
 def test_cleanup_signal_cache(dispatcher: Dispatcher) -> None:
     """Test signal cache cleanup"""
     # Add some signals to cache
-    dispatcher.signal_cache["test-1"] = 1000.0
-    dispatcher.signal_cache["test-2"] = 2000.0
-    dispatcher.last_cache_cleanup = 0  # Force cleanup
+    dispatcher.signal_cache.add("test-1", now=1000.0)
+    dispatcher.signal_cache.add("test-2", now=2000.0)
+    dispatcher.signal_cache.add("test-3", now=time.time())
 
     # Call cleanup
     dispatcher._cleanup_signal_cache()
 
-    # Cache should be cleaned (or entries expired)
-    assert isinstance(dispatcher.signal_cache, dict)
+    # Expired entries are gone, the live one stays
+    assert list(dispatcher.signal_cache) == ["test-3"]
+
+
+def test_signal_dedup_cache_is_bounded_and_expiry_ordered() -> None:
+    """Capacity evicts oldest first; re-adding a key refreshes its slot."""
+    cache = DedupCache("test", ttl=10, capacity=3)
+    for i, key in enumerate(["a", "b", "c"]):
+        cache.add(key, now=100.0 + i)
+    cache.add("a", now=104.0)  # refresh: "b" is now the oldest
+    cache.add("d", now=105.0)
+
+    assert list(cache) == ["c", "a", "d"]
+    assert cache.evictions == 1
+    assert cache.get("b", now=105.0) is None
+    assert cache.claim("c", now=105.0) is False
+    # "c" (added at 102) expires at 112; "a" and "d" are still live
+    assert cache.get("c", now=112.0) is None
+    assert list(cache) == ["a", "d"]
+    assert cache.claim("c", now=112.0) is True
+    assert cache.snapshot()["size"] == 3
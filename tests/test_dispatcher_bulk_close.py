@@ -0,0 +1,202 @@
+"""Tests for Dispatcher.close_positions_bulk and the batch order path."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from tradeengine.dispatcher import Dispatcher
+from tradeengine.exchange.binance import BinanceFuturesExchange
+from tradeengine.exchange_truth_store import ExchangeTruthStore, PositionSnapshot
+
+
+class _FakeConsumer:
+    def __init__(self, store: ExchangeTruthStore) -> None:
+        self.store = store
+
+
+def _snapshot(symbol: str, side: str) -> PositionSnapshot:
+    return PositionSnapshot(
+        symbol=symbol, side=side, quantity=1.0, entry_price=100.0, unrealized_pnl=0.0
+    )
+
+
+def _dispatcher(exchange: object, held: list[tuple[str, str]]) -> Dispatcher:
+    disp = Dispatcher(exchange=exchange)
+    disp.oco_manager.active_oco_pairs = {}
+    disp.position_manager.close_position_record = AsyncMock()
+    store = ExchangeTruthStore()
+    store._positions = {key: _snapshot(*key) for key in held}
+    store._is_ready = True
+    disp.user_data_consumer = _FakeConsumer(store)  # type: ignore[assignment]
+    return disp
+
+
+def _positions(*keys: tuple[str, str]) -> list[dict]:
+    return [
+        {
+            "position_id": f"pos-{symbol}-{side}",
+            "symbol": symbol,
+            "position_side": side,
+            "quantity": 1.0,
+        }
+        for symbol, side in keys
+    ]
+
+
+@pytest.mark.asyncio
+async def test_bulk_close_batches_orders_and_defers_records() -> None:
+    exchange = MagicMock()
+    exchange.execute_batch = AsyncMock(
+        side_effect=lambda orders: [
+            {"status": "FILLED", "order_id": f"c{i}"} for i, _ in enumerate(orders)
+        ]
+    )
+    exchange.execute = AsyncMock()
+    disp = _dispatcher(exchange, [("BTCUSDT", "LONG"), ("ETHUSDT", "SHORT")])
+    positions = _positions(
+        ("BTCUSDT", "LONG"), ("SOLUSDT", "LONG"), ("ETHUSDT", "SHORT")
+    )
+
+    results = await disp.close_positions_bulk(positions, reason="drawdown_flatten")
+
+    assert [r["status"] for r in results] == [
+        "success",
+        "skipped_no_exchange_position",
+        "success",
+    ]
+    assert [r["position_id"] for r in results] == [p["position_id"] for p in positions]
+    exchange.execute_batch.assert_awaited_once()
+    (orders,) = exchange.execute_batch.await_args.args
+    assert [(o.symbol, o.side, o.reduce_only) for o in orders] == [
+        ("BTCUSDT", "sell", True),
+        ("ETHUSDT", "buy", True),
+    ]
+    exchange.execute.assert_not_called()
+
+    assert results[0]["record_update"] == "deferred"
+    await asyncio.gather(*disp._close_record_tasks)
+    recorded = [
+        c.args[0] for c in disp.position_manager.close_position_record.await_args_list
+    ]
+    assert recorded == ["pos-BTCUSDT-LONG", "pos-ETHUSDT-SHORT"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_close_keeps_records_of_rejected_closes_open() -> None:
+    exchange = MagicMock()
+    exchange.execute_batch = AsyncMock(
+        return_value=[
+            {"status": "FILLED", "order_id": "c0"},
+            {"status": "failed", "error": "-2022 ReduceOnly Order is rejected."},
+        ]
+    )
+    keys = [("BTCUSDT", "LONG"), ("ETHUSDT", "SHORT")]
+    disp = _dispatcher(exchange, keys)
+
+    results = await disp.close_positions_bulk(_positions(*keys), cio_audited=True)
+
+    assert [r["status"] for r in results] == ["success", "failed"]
+    assert results[0]["record_update"] == "deferred"
+    assert "record_update" not in results[1]
+    assert "-2022" in results[1]["error"]
+    await asyncio.gather(*disp._close_record_tasks)
+    recorded = [
+        c.args[0] for c in disp.position_manager.close_position_record.await_args_list
+    ]
+    assert recorded == ["pos-BTCUSDT-LONG"]
+
+    # A batch that raises closes nothing and leaves every record open.
+    disp.position_manager.close_position_record.reset_mock()
+    exchange.execute_batch = AsyncMock(side_effect=RuntimeError("-1001 disconnected"))
+    results = await disp.close_positions_bulk(_positions(*keys), cio_audited=True)
+
+    assert [r["status"] for r in results] == ["failed", "failed"]
+    assert all(r["error"] == "-1001 disconnected" for r in results)
+    assert not any("record_update" in r for r in results)
+    assert not disp._close_record_tasks
+    disp.position_manager.close_position_record.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_bulk_close_bounds_concurrent_cancels() -> None:
+    class _SingleOrderExchange:
+        def __init__(self) -> None:
+            self.execute = AsyncMock(return_value={"status": "NEW"})
+
+    keys = [(f"S{i}USDT", "LONG") for i in range(6)]
+    disp = _dispatcher(_SingleOrderExchange(), keys)
+    positions = _positions(*keys)
+    disp.oco_manager.active_oco_pairs = {p["position_id"]: {} for p in positions}
+    in_flight = peak = 0
+
+    async def cancel(position_id: str) -> bool:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return True
+
+    disp.oco_manager.cancel_oco_pair = cancel  # type: ignore[method-assign]
+    with patch.object(disp.settings, "te_bulk_close_concurrency", 2):
+        results = await disp.close_positions_bulk(positions, cio_audited=True)
+
+    assert peak == 2
+    assert all(r["oco_cancelled"] and r["position_closed"] for r in results)
+    assert disp.exchange.execute.await_count == 6
+    await disp.close()
+
+
+@pytest.mark.asyncio
+async def test_bulk_close_without_batch_keeps_fills_when_one_close_raises() -> None:
+    class _SingleOrderExchange:
+        async def execute(self, order: object) -> dict:
+            if order.symbol == "ETHUSDT":  # type: ignore[attr-defined]
+                raise RuntimeError("-1001 disconnected")
+            return {"status": "FILLED"}
+
+    keys = [("BTCUSDT", "LONG"), ("ETHUSDT", "LONG"), ("SOLUSDT", "LONG")]
+    disp = _dispatcher(_SingleOrderExchange(), keys)
+
+    results = await disp.close_positions_bulk(_positions(*keys), cio_audited=True)
+
+    assert [r["status"] for r in results] == ["success", "failed", "success"]
+    assert [r["position_closed"] for r in results] == [True, False, True]
+    assert results[0]["close_result"] == {"status": "FILLED"}
+    await disp.close()
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_chunks_and_maps_per_order_errors() -> None:
+    exchange = BinanceFuturesExchange()
+    exchange.initialized = True
+    exchange.symbol_info = {
+        f"S{i}USDT": {"status": "TRADING", "filters": []} for i in range(7)
+    }
+    exchange.client = MagicMock()
+    exchange.client.futures_symbol_ticker.return_value = {"price": "100"}
+
+    def place_batch(batchOrders):
+        return [
+            {"code": -2022, "msg": "ReduceOnly Order is rejected."}
+            if o["symbol"] == "S3USDT"
+            else {"orderId": 1, "status": "FILLED", "symbol": o["symbol"]}
+            for o in batchOrders
+        ]
+
+    exchange.client.futures_place_batch_order.side_effect = place_batch
+    disp = Dispatcher.__new__(Dispatcher)
+    orders = [
+        disp._build_close_order(f"p{i}", f"S{i}USDT", "LONG", 1.0) for i in range(7)
+    ]
+
+    results = await exchange.execute_batch(orders)
+
+    assert exchange.client.futures_place_batch_order.call_count == 2
+    assert [r["status"] for r in results] == ["FILLED"] * 3 + ["failed"] + [
+        "FILLED"
+    ] * 3
+    assert "-2022" in results[3]["error"]
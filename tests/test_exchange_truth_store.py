@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import asyncio
 import json
+import time
 from contextlib import asynccontextmanager
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -401,7 +402,7 @@ class TestUserDataStreamConsumer:
 
     @pytest.mark.asyncio
     async def test_reconnect_path_seeds_after_each_connect(self):
-        """AC4: disconnect → reconnect → REST seed fires again."""
+        """AC4: disconnect → reconnect → REST seed once the stream is open."""
         exchange = _make_exchange()
         consumer = UserDataStreamConsumer(exchange)
 
@@ -453,8 +454,9 @@ class TestUserDataStreamConsumer:
                 finally:
                     stopper.cancel()
 
-        # seed must have been called at least twice (once per connect attempt)
-        assert seed_call_count >= 2
+        # the failed connect never seeds; the first open stream seeds fully
+        assert seed_call_count >= 1
+        assert consumer.full_seeds == seed_call_count
 
     @pytest.mark.asyncio
     async def test_health_check_after_seed(self):
@@ -470,6 +472,205 @@ class TestUserDataStreamConsumer:
         assert health["last_updated"] is not None
 
 
+def _account_update(symbol: str, side: str, qty: str, event_ms: int) -> dict:
+    return {
+        "e": "ACCOUNT_UPDATE",
+        "E": event_ms,
+        "a": {"P": [{"s": symbol, "ps": side, "pa": qty, "ep": "100", "up": "0"}]},
+    }
+
+
+@asynccontextmanager
+async def _held_ws(messages: list[str]):
+    """A connection that delivers ``messages`` then stays open until closed."""
+
+    class _HeldWS:
+        def __init__(self, msgs):
+            self._iter = iter(msgs)
+
+        def __aiter__(self):
+            return self
+
+        async def __anext__(self):
+            try:
+                return next(self._iter)
+            except StopIteration:
+                await asyncio.Event().wait()
+
+    yield _HeldWS(messages)
+
+
+class TestResumableStream:
+    @pytest.mark.asyncio
+    async def test_store_drops_events_older_than_applied_state(self):
+        store = ExchangeTruthStore()
+        await store.seed_from_rest(
+            [
+                {
+                    "symbol": "BTCUSDT",
+                    "positionSide": "LONG",
+                    "positionAmt": "1",
+                    "updateTime": 2000,
+                }
+            ],
+            [{"symbol": "BTCUSDT", "orderId": 9, "status": "NEW", "updateTime": 2000}],
+        )
+
+        await store.update_positions_from_account_update(
+            _account_update("BTCUSDT", "LONG", "0", 1500)
+        )
+        await store.update_order_from_trade_update(
+            {
+                "e": "ORDER_TRADE_UPDATE",
+                "o": {"s": "BTCUSDT", "i": 9, "X": "FILLED", "T": 1500},
+            }
+        )
+        assert ("BTCUSDT", "LONG") in store.get_positions()
+        assert len(store.get_open_orders("BTCUSDT")) == 1
+
+        await store.update_positions_from_account_update(
+            _account_update("BTCUSDT", "LONG", "0", 2500)
+        )
+        assert store.get_positions() == {}
+        assert store.last_event_ms == 2500
+
+    @pytest.mark.asyncio
+    async def test_short_gap_reseeds_only_affected_symbols(self):
+        exchange = _make_exchange()
+        exchange.client.futures_position_information.return_value = [
+            {"symbol": "BTCUSDT", "positionSide": "LONG", "positionAmt": "2"},
+            {"symbol": "DOGEUSDT", "positionSide": "LONG", "positionAmt": "5"},
+        ]
+        consumer = UserDataStreamConsumer(exchange, active_symbols=lambda: ["SOLUSDT"])
+        await consumer.store.seed_from_rest(
+            [
+                {"symbol": "BTCUSDT", "positionSide": "LONG", "positionAmt": "1"},
+                {"symbol": "XRPUSDT", "positionSide": "SHORT", "positionAmt": "-3"},
+            ],
+            [{"symbol": "ETHUSDT", "orderId": 1, "status": "NEW"}],
+        )
+        consumer._seed_store = AsyncMock()
+        consumer._in_sync_at = time.monotonic() - 5
+
+        await consumer._resync()
+
+        consumer._seed_store.assert_not_awaited()
+        assert consumer.last_resync == "delta"
+        # positionRisk weighs the same filtered or not: read it once.
+        exchange.client.futures_position_information.assert_called_once_with()
+        queried = {
+            c.kwargs["symbol"]
+            for c in exchange.client.futures_get_open_orders.call_args_list
+        }
+        assert queried == {"BTCUSDT", "XRPUSDT", "ETHUSDT", "SOLUSDT"}
+        positions = consumer.store.get_positions()
+        assert positions[("BTCUSDT", "LONG")].quantity == 2.0
+        assert ("XRPUSDT", "SHORT") not in positions
+        assert ("DOGEUSDT", "LONG") not in positions
+        assert consumer.store.get_open_orders("ETHUSDT") == []
+
+    @pytest.mark.asyncio
+    async def test_long_gap_or_wide_scope_takes_full_seed(self):
+        consumer = UserDataStreamConsumer(
+            _make_exchange(),
+            active_symbols=lambda: ["A", "B", "C"],
+            delta_reseed_max_symbols=2,
+        )
+        consumer._seed_store = AsyncMock()
+
+        consumer._in_sync_at = time.monotonic() - 3600
+        await consumer._resync()
+        consumer._in_sync_at = time.monotonic()
+        await consumer._resync()
+
+        assert consumer._seed_store.await_count == 2
+        assert (consumer.full_seeds, consumer.delta_seeds) == (2, 0)
+
+        # Past 39 symbols the per-symbol order reads outweigh the full seed.
+        wide = UserDataStreamConsumer(_make_exchange(), delta_reseed_max_symbols=100)
+        assert wide._delta_reseed_max_symbols == 39
+
+    @pytest.mark.asyncio
+    async def test_rotation_opens_new_stream_before_closing_old(self):
+        consumer = UserDataStreamConsumer(_make_exchange(), rotate_seconds=0.05)
+        consumer._create_listen_key = AsyncMock(return_value="TEST_KEY")
+        consumer._seed_store = AsyncMock()
+        consumer._renewal_loop = AsyncMock()
+        streams = iter(
+            [
+                [json.dumps(_account_update("BTCUSDT", "LONG", "1", 1000))],
+                [json.dumps(_account_update("ETHUSDT", "SHORT", "-1", 2000))],
+            ]
+        )
+        held: list = []
+
+        def _connect(url):
+            held.append(url)
+            return _held_ws(next(streams, []))
+
+        consumer._running = True
+        with patch("websockets.connect", side_effect=_connect):
+            task = asyncio.ensure_future(consumer._consumer_loop())
+            while consumer.handovers < 2:
+                await asyncio.sleep(0.01)
+            consumer._running = False
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        assert set(consumer.store.get_positions()) == {
+            ("BTCUSDT", "LONG"),
+            ("ETHUSDT", "SHORT"),
+        }
+        consumer._seed_store.assert_awaited_once()
+        assert len(held) >= 3
+
+    @pytest.mark.asyncio
+    async def test_fill_seen_on_both_links_of_a_handover_fires_once(self):
+        fills: list = []
+
+        async def _on_fill(o):
+            fills.append(o["i"])
+
+        consumer = UserDataStreamConsumer(
+            _make_exchange(), on_fill=_on_fill, rotate_seconds=0.05
+        )
+        consumer._create_listen_key = AsyncMock(return_value="TEST_KEY")
+        consumer._seed_store = AsyncMock()
+        consumer._renewal_loop = AsyncMock()
+        # Both connections share the listen key, so the old link applies the
+        # fill and the replacement buffers and replays the same event.
+        filled = json.dumps(
+            {
+                "e": "ORDER_TRADE_UPDATE",
+                "o": {"s": "BTCUSDT", "i": 42, "X": "FILLED", "z": "1", "T": 1000},
+            }
+        )
+        streams = iter([[filled], [filled]])
+
+        consumer._running = True
+        with patch(
+            "websockets.connect", side_effect=lambda url: _held_ws(next(streams, []))
+        ):
+            task = asyncio.ensure_future(consumer._consumer_loop())
+            while consumer.handovers < 1:
+                await asyncio.sleep(0.01)
+            consumer._running = False
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        assert fills == [42]
+
+        # Same millisecond but more filled: a new event, not a replay.
+        store = ExchangeTruthStore(on_fill=_on_fill)
+        for status, cum in (("PARTIALLY_FILLED", "1"), ("FILLED", "2")):
+            await store.update_order_from_trade_update(
+                {"o": {"s": "ETHUSDT", "i": 7, "X": status, "z": cum, "T": 5}}
+            )
+        assert fills == [42, 7]
+
+
 # ---------------------------------------------------------------------------
 # ExchangeTruthStore.update_from_rest (AC1 + AC2 — #446-B)
 # ---------------------------------------------------------------------------
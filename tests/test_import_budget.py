@@ -0,0 +1,35 @@
+"""Cold-import budget for the API module."""
+
+from tradeengine.import_profile import (
+    COLD_IMPORT_BUDGET_S,
+    DEFAULT_MODULE,
+    LAZY_MODULES,
+    loaded_modules,
+    parse_importtime,
+    profile_import,
+)
+
+
+def test_parse_importtime_nests_children_under_parent():
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       100 |        100 |     zlib\n"
+        "import time:       200 |        300 |   gzip\n"
+        "import time:        50 |         50 |   io\n"
+        "import time:       400 |        750 | tarfile\n"
+    )
+    (root,) = parse_importtime(stderr)
+    assert root.name == "tarfile"
+    assert [c.name for c in root.children] == ["gzip", "io"]
+    assert root.children[0].children[0].name == "zlib"
+
+
+def test_cold_import_stays_under_budget():
+    elapsed, roots = profile_import(DEFAULT_MODULE)
+    assert any(node.name == DEFAULT_MODULE for node in roots)
+    assert elapsed < COLD_IMPORT_BUDGET_S, f"cold import took {elapsed:.2f}s"
+
+
+def test_optional_subsystems_are_not_imported_eagerly():
+    loaded = loaded_modules(DEFAULT_MODULE)
+    assert not loaded & set(LAZY_MODULES)
@@ -0,0 +1,112 @@
+"""Unit tests for the cached, cardinality-limited metric handles."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+from prometheus_client import CollectorRegistry, Counter, Histogram
+
+from tradeengine import metric_handles
+from tradeengine.metric_handles import (
+    OTHER,
+    BoundMetric,
+    CardinalityLimiter,
+    OTelBatcher,
+)
+
+
+@pytest.fixture
+def batcher(monkeypatch: pytest.MonkeyPatch) -> OTelBatcher:
+    b = OTelBatcher(interval=60.0, max_pending=100)
+    monkeypatch.setattr(metric_handles, "otel_batcher", b)
+    return b
+
+
+def _counter(name: str) -> tuple[Counter, CollectorRegistry]:
+    registry = CollectorRegistry()
+    counter = Counter(name, "test", ["symbol", "reason"], registry=registry)
+    return counter, registry
+
+
+def test_children_are_cached_per_label_tuple() -> None:
+    counter, registry = _counter("t_cached_total")
+    handle = BoundMetric(counter)
+
+    first = handle.labels(symbol="BTCUSDT", reason="x")
+    assert handle.labels(symbol="BTCUSDT", reason="x") is first
+    first.inc()
+    first.inc(2)
+
+    assert (
+        registry.get_sample_value(
+            "t_cached_total", {"symbol": "BTCUSDT", "reason": "x"}
+        )
+        == 3
+    )
+
+
+def test_limited_labels_fold_into_other() -> None:
+    counter, registry = _counter("t_folded_total")
+    limiter = CardinalityLimiter(max_values=2)
+    handle = BoundMetric(counter, limited=("reason",), limiter=limiter)
+
+    for reason in ["a", "b", "c", "d", "a"]:
+        handle.labels(symbol="BTCUSDT", reason=reason).inc()
+
+    sample = registry.get_sample_value
+    assert sample("t_folded_total", {"symbol": "BTCUSDT", "reason": "a"}) == 2
+    assert sample("t_folded_total", {"symbol": "BTCUSDT", "reason": "b"}) == 1
+    assert sample("t_folded_total", {"symbol": "BTCUSDT", "reason": OTHER}) == 2
+    assert sample("t_folded_total", {"symbol": "BTCUSDT", "reason": "c"}) is None
+    assert limiter.series_count("t_folded", "reason") == 2
+    assert limiter.folded_total == 2
+
+
+def test_otel_updates_are_coalesced_until_flush(batcher: OTelBatcher) -> None:
+    counter, _ = _counter("t_otel_total")
+    registry = CollectorRegistry()
+    hist = Histogram("t_otel_seconds", "test", ["symbol"], registry=registry)
+    otel_counter, otel_hist = MagicMock(), MagicMock()
+    c_handle = BoundMetric(counter, otel=otel_counter)
+    h_handle = BoundMetric(hist, otel=otel_hist)
+
+    for _ in range(5):
+        c_handle.labels(symbol="BTCUSDT", reason="x").inc()
+    h_handle.labels(symbol="BTCUSDT").observe(0.25)
+
+    otel_counter.add.assert_not_called()
+    otel_hist.record.assert_not_called()
+    assert len(batcher) == 2
+
+    batcher.flush()
+    otel_counter.add.assert_called_once_with(5, {"symbol": "BTCUSDT", "reason": "x"})
+    otel_hist.record.assert_called_once_with(0.25, {"symbol": "BTCUSDT"})
+    assert len(batcher) == 0
+
+
+def test_otel_queue_flushes_inline_when_full(monkeypatch: pytest.MonkeyPatch) -> None:
+    b = OTelBatcher(interval=60.0, max_pending=3)
+    monkeypatch.setattr(metric_handles, "otel_batcher", b)
+    registry = CollectorRegistry()
+    hist = Histogram("t_full_seconds", "test", ["symbol"], registry=registry)
+    otel_hist = MagicMock()
+    handle = BoundMetric(hist, otel=otel_hist).labels(symbol="BTCUSDT")
+
+    for _ in range(3):
+        handle.observe(1.0)
+
+    assert otel_hist.record.call_count == 3
+    assert len(b) == 0
+
+
+@pytest.mark.asyncio
+async def test_stop_flushes_pending(batcher: OTelBatcher) -> None:
+    counter, _ = _counter("t_stop_total")
+    otel_counter = MagicMock()
+    BoundMetric(counter, otel=otel_counter).labels(symbol="X", reason="y").inc()
+
+    batcher.start()
+    await batcher.stop()
+
+    otel_counter.add.assert_called_once_with(1, {"symbol": "X", "reason": "y"})
@@ -435,3 +435,76 @@ async def test_route_does_not_trigger_rollback_when_defer_raises(
     assert routed is result
     assert routed["status"] == "deferred_oco_failed"
     assert "monitor task crashed" in routed["error"]
+
+
+# -----------------------------------------------------------------------------
+# Fill-driven resolution + batched backstop sweep
+# -----------------------------------------------------------------------------
+
+
+def _pending(oco_manager: OCOManager, entry_id: str = "entry-cond-1") -> TradeOrder:
+    order = _make_conditional_order()
+    oco_manager.pending_entries[entry_id] = {
+        "order": order,
+        "symbol": order.symbol,
+        "entry_order_id": entry_id,
+        "registered_at": 0.0,
+    }
+    return order
+
+
+@pytest.mark.asyncio
+async def test_on_entry_fill_places_oco_from_trade_update(
+    oco_manager: OCOManager, mock_dispatcher: Mock
+) -> None:
+    order = _pending(oco_manager)
+    fill = {
+        "s": "BTCUSDT",
+        "i": "entry-cond-1",
+        "X": "FILLED",
+        "ap": "50210.5",
+        "z": "0.001",
+    }
+
+    assert await oco_manager.on_entry_fill(fill) is True
+
+    assert oco_manager.pending_entries == {}
+    passed_order, synthetic_result = (
+        mock_dispatcher._place_risk_management_orders.await_args.args
+    )
+    assert passed_order is order
+    assert synthetic_result["fill_price"] == pytest.approx(50210.5)
+    assert synthetic_result["amount"] == pytest.approx(0.001)
+
+
+@pytest.mark.asyncio
+async def test_on_entry_fill_ignores_orders_that_are_not_pending(
+    oco_manager: OCOManager, mock_dispatcher: Mock
+) -> None:
+    _pending(oco_manager)
+
+    assert await oco_manager.on_entry_fill({"i": "other-order", "ap": "1"}) is False
+
+    assert "entry-cond-1" in oco_manager.pending_entries
+    mock_dispatcher._place_risk_management_orders.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_sweep_skips_status_lookup_for_entries_still_resting(
+    oco_manager: OCOManager, mock_exchange: Mock, mock_dispatcher: Mock
+) -> None:
+    _pending(oco_manager, "resting-1")
+    _pending(oco_manager, "gone-1")
+    mock_exchange.get_all_open_orders = AsyncMock(return_value={"resting-1"})
+    mock_exchange.get_order_status.return_value = {
+        "status": "FILLED",
+        "executed_qty": 0.001,
+        "cummulative_quote_qty": 50.0,
+    }
+
+    await oco_manager._check_pending_entries()
+
+    mock_exchange.get_all_open_orders.assert_awaited_once_with(symbol="BTCUSDT")
+    mock_exchange.get_order_status.assert_awaited_once_with("BTCUSDT", "gone-1")
+    assert list(oco_manager.pending_entries) == ["resting-1"]
+    mock_dispatcher._place_risk_management_orders.assert_awaited_once()
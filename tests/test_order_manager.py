@@ -1,12 +1,13 @@
 """Tests for OrderManager class."""
 
 import asyncio
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from contracts.order import OrderStatus, TradeOrder
 from shared.constants import UTC
+from shared.retry import PersistResult
 from tradeengine.order_manager import OrderManager
 
 
@@ -519,3 +520,69 @@ async def test_track_order_with_meta(
 
     assert len(order_manager.order_history) == 1
     assert "original_order" in order_manager.order_history[0]
+
+
+# ============================================================================
+# Bounded Order Journal Tests
+# ============================================================================
+
+
+def test_order_history_is_bounded_and_counts_evictions() -> None:
+    """The journal keeps only the newest ``capacity`` entries."""
+    om = OrderManager(history_capacity=3, spill_evicted=False)
+    for i in range(5):
+        om.order_history.append({"order_id": f"h{i}", "status": "filled"})
+
+    assert len(om.order_history) == 3
+    assert [o["order_id"] for o in om.get_order_history()] == ["h2", "h3", "h4"]
+    assert om.order_history[0]["order_id"] == "h2"
+    assert om.order_history[-1]["order_id"] == "h4"
+    assert om.get_order("h0") is None
+    assert om.get_order("h4")["order_id"] == "h4"
+
+    summary = om.get_order_summary()
+    assert summary["total_orders"] == 3
+    assert summary["status_distribution"] == {"filled": 3}
+    assert summary["evicted_orders"] == 2
+
+
+def test_order_history_status_counters_follow_evictions() -> None:
+    """Running status counters drop evicted entries without a rescan."""
+    om = OrderManager(history_capacity=2, spill_evicted=False)
+    om.order_history.append({"order_id": "a", "status": "cancelled"})
+    om.order_history.append({"order_id": "b", "status": "filled"})
+    om.order_history.append({"order_id": "c", "status": "filled"})
+
+    assert om.get_order_summary()["status_distribution"] == {"filled": 2}
+
+    om.order_history.clear()
+    assert om.order_history == []
+    assert om.get_order_summary()["status_distribution"] == {}
+
+
+@pytest.mark.asyncio
+async def test_evicted_orders_leave_query_index_and_spill() -> None:
+    """Evicted entries are removed from /orders and archived in one batch."""
+    om = OrderManager(history_capacity=2, spill_evicted=True)
+    with patch("shared.mysql_client.position_client") as mock_client:
+        mock_client.archive_orders = AsyncMock(
+            return_value=PersistResult(ok=True, operation="archive_orders")
+        )
+        for i in range(4):
+            order = TradeOrder(symbol="BTCUSDT", type="market", side="buy", amount=1)
+            await om.track_order(order, {"order_id": f"o{i}", "status": "filled"})
+
+        assert om.query_orders()[0] == 2
+        await om.close()
+
+    archived = [
+        record["order_id"]
+        for call in mock_client.archive_orders.await_args_list
+        for record in call.args[0]
+    ]
+    assert archived == ["o0", "o1"]
+    assert all(
+        "original_order" not in record
+        for call in mock_client.archive_orders.await_args_list
+        for record in call.args[0]
+    )
@@ -282,36 +282,33 @@ class TestConditionalOrderEdgeCases:
         # Should handle gracefully without order_id
 
     @pytest.mark.asyncio
-    async def test_monitor_conditional_order_not_found(self, order_manager):
-        """Test monitoring conditional order that doesn't exist"""
-        await order_manager._monitor_conditional_order("nonexistent_order_id")
-        # Should return early without error
+    async def test_price_update_for_unknown_symbol(self, order_manager):
+        """Test a price tick for a symbol with no resting triggers"""
+        await order_manager.on_price_update("NOPEUSDT", 1.0)
+        # Should be a no-op apart from refreshing the price cache
+        assert order_manager.price_cache["NOPEUSDT"] == 1.0
 
-    @pytest.mark.skip(reason="Flaky test - async background task timing is unreliable")
     @pytest.mark.asyncio
-    async def test_monitor_conditional_order_timeout(self, order_manager, sample_order):
+    async def test_conditional_order_timeout(self, order_manager, sample_order):
         """Test conditional order timing out"""
         sample_order.type = OrderType.CONDITIONAL_LIMIT
         sample_order.meta = {
             "conditional_price": 51000.0,
             "conditional_direction": "above",
-            "conditional_timeout": 0.1,  # Very short timeout
+            "conditional_timeout": 0,
         }
         result = {"status": "pending", "order_id": "timeout_test_123"}
-        await order_manager._setup_conditional_order(sample_order, result)
+        with patch("asyncio.create_task"):
+            await order_manager._setup_conditional_order(sample_order, result)
 
         # Verify order was set up
         assert "timeout_test_123" in order_manager.conditional_orders
 
-        # Wait for timeout (monitoring runs in background task)
-        await asyncio.sleep(0.3)  # Wait longer than timeout
+        await order_manager._expire_conditional_orders()
 
-        # Order should be removed from conditional_orders or moved to history
-        # The monitoring task may still be running, so check both
-        assert "timeout_test_123" not in order_manager.conditional_orders or any(
-            o.get("order_id") == "timeout_test_123" and o.get("status") == "timeout"
-            for o in order_manager.order_history
-        )
+        assert "timeout_test_123" not in order_manager.conditional_orders
+        assert "timeout_test_123" not in order_manager.price_triggers
+        assert order_manager.get_order("timeout_test_123")["status"] == "timeout"
 
     @pytest.mark.asyncio
     async def test_execute_conditional_order_not_found(self, order_manager):
@@ -402,7 +399,7 @@ class TestOrderManagerHelperMethods:
         assert "conditional_stop_123" in order_manager.conditional_orders
 
     @pytest.mark.asyncio
-    async def test_monitor_conditional_order_executes_on_condition(
+    async def test_price_update_executes_on_condition(
         self, order_manager, sample_order
     ):
         """Test that conditional order executes when condition is met"""
@@ -412,41 +409,46 @@ class TestOrderManagerHelperMethods:
             "conditional_direction": "above",
         }
         result = {"status": "pending", "order_id": "conditional_exec_123"}
-        await order_manager._setup_conditional_order(sample_order, result)
+        with patch("asyncio.create_task"):
+            await order_manager._setup_conditional_order(sample_order, result)
 
-        # Mock _get_current_price to return price above condition
-        order_manager._get_current_price = AsyncMock(return_value=52000.0)
         order_manager._execute_conditional_order = AsyncMock()
 
-        # Manually call monitor (normally runs in background)
-        await order_manager._monitor_conditional_order("conditional_exec_123")
+        # Below the trigger: nothing fires
+        await order_manager.on_price_update("BTCUSDT", 50000.0)
+        order_manager._execute_conditional_order.assert_not_called()
 
-        # Should execute conditional order
+        await order_manager.on_price_update("BTCUSDT", 52000.0)
         order_manager._execute_conditional_order.assert_called_once_with(
-            "conditional_exec_123"
+            "conditional_exec_123", execution_price=52000.0
         )
 
     @pytest.mark.asyncio
-    async def test_monitor_conditional_order_handles_exception(
+    async def test_trigger_feed_handles_price_exception(
         self, order_manager, sample_order
     ):
-        """Test that monitoring handles exceptions gracefully"""
+        """Test that the shared feed survives a failing price read"""
         sample_order.type = OrderType.CONDITIONAL_LIMIT
         sample_order.meta = {
             "conditional_price": 51000.0,
             "conditional_direction": "above",
         }
         result = {"status": "pending", "order_id": "conditional_error_123"}
-        await order_manager._setup_conditional_order(sample_order, result)
+        with patch("asyncio.create_task"):
+            await order_manager._setup_conditional_order(sample_order, result)
 
-        # Mock _get_current_price to raise exception
         order_manager._get_current_price = AsyncMock(
             side_effect=Exception("Price fetch error")
         )
 
-        # Should handle exception gracefully
-        await order_manager._monitor_conditional_order("conditional_error_123")
-        # Should not raise exception
+        async def stop_feed(_interval):
+            order_manager.price_triggers.clear()
+
+        # Should handle exception gracefully and keep the order resting
+        with patch("tradeengine.order_manager.asyncio.sleep", new=stop_feed):
+            await order_manager._trigger_feed_loop()
+        order_manager._get_current_price.assert_awaited_once_with("BTCUSDT")
+        assert "conditional_error_123" in order_manager.conditional_orders
 
     @pytest.mark.asyncio
     async def test_execute_conditional_order_updates_status(
@@ -759,35 +761,35 @@ class TestConditionalOrderMonitoring:
         assert len(order_manager.conditional_orders) == 0
 
     @pytest.mark.asyncio
-    async def test_monitor_conditional_order_not_found_early_return(
-        self, order_manager
-    ):
-        """Test monitoring conditional order that doesn't exist"""
-        # Should return early without error
-        await order_manager._monitor_conditional_order("nonexistent_order")
-        # Should not raise exception
-
-    @pytest.mark.asyncio
-    async def test_monitor_conditional_order_with_exception(
+    async def test_trigger_feed_uses_price_source_once_per_symbol(
         self, order_manager, sample_order
     ):
-        """Test monitoring conditional order with exception during price check"""
+        """Test that many resting orders on one symbol share one price read"""
         sample_order.type = OrderType.CONDITIONAL_LIMIT
-        sample_order.meta = {
-            "conditional_price": 51000.0,
-            "conditional_direction": "above",
-        }
-        result = {"status": "pending", "order_id": "error_test_123"}
-        await order_manager._setup_conditional_order(sample_order, result)
+        with patch("asyncio.create_task"):
+            for i, (price, direction) in enumerate(
+                [(51000.0, "above"), (53000.0, "above"), (49500.0, "below")]
+            ):
+                sample_order.meta = {
+                    "conditional_price": price,
+                    "conditional_direction": direction,
+                }
+                await order_manager._setup_conditional_order(
+                    sample_order, {"order_id": f"ladder_{i}"}
+                )
 
-        # Mock _get_current_price to raise exception
-        order_manager._get_current_price = AsyncMock(
-            side_effect=Exception("Price fetch error")
-        )
+        source = AsyncMock(return_value=52000.0)
+        order_manager.set_price_source(source)
 
-        # Should handle exception gracefully
-        await order_manager._monitor_conditional_order("error_test_123")
-        # Should not raise exception
+        async def stop_feed(_interval):
+            order_manager.price_triggers.clear()
+
+        with patch("tradeengine.order_manager.asyncio.sleep", new=stop_feed):
+            await order_manager._trigger_feed_loop()
+
+        source.assert_awaited_once_with("BTCUSDT")
+        assert set(order_manager.conditional_orders) == {"ladder_1", "ladder_2"}
+        assert order_manager.get_order("ladder_0")["execution_price"] == 52000.0
 
     @pytest.mark.asyncio
     async def test_execute_conditional_order_full_flow(
@@ -857,35 +859,32 @@ class TestConditionalOrderMonitoring:
         assert "BTCUSDT" in order_manager.price_cache
 
     @pytest.mark.asyncio
-    async def test_monitor_conditional_order_condition_met_executes(
+    async def test_trigger_feed_condition_met_executes(
         self, order_manager, sample_order
     ):
-        """Test that monitoring executes order when condition is met"""
+        """Test that the shared feed executes an order when condition is met"""
         sample_order.type = OrderType.CONDITIONAL_LIMIT
         sample_order.meta = {
             "conditional_price": 51000.0,
             "conditional_direction": "above",
         }
         result = {"status": "pending", "order_id": "condition_met_123"}
-        await order_manager._setup_conditional_order(sample_order, result)
+        with patch("asyncio.create_task"):
+            await order_manager._setup_conditional_order(sample_order, result)
 
         # Mock price to meet condition
         order_manager._get_current_price = AsyncMock(return_value=52000.0)
-        order_manager._execute_conditional_order = AsyncMock()
 
-        # Manually call monitor (normally runs in background)
-        await order_manager._monitor_conditional_order("condition_met_123")
+        # Run the feed inline (normally runs in background); it exits once
+        # no trigger is left resting
+        await order_manager._trigger_feed_loop()
 
-        # Should execute conditional order
-        order_manager._execute_conditional_order.assert_called_once_with(
-            "condition_met_123"
-        )
+        assert "condition_met_123" not in order_manager.conditional_orders
+        assert order_manager.get_order("condition_met_123")["status"] == "executed"
 
     @pytest.mark.asyncio
-    async def test_monitor_conditional_order_timeout_cleanup(
-        self, order_manager, sample_order
-    ):
-        """Test that monitoring cleans up on timeout"""
+    async def test_trigger_feed_timeout_cleanup(self, order_manager, sample_order):
+        """Test that the shared feed cleans up on timeout"""
         sample_order.type = OrderType.CONDITIONAL_LIMIT
         sample_order.meta = {
             "conditional_price": 51000.0,
@@ -893,16 +892,14 @@ class TestConditionalOrderMonitoring:
             "conditional_timeout": 0.1,  # Very short timeout
         }
         result = {"status": "pending", "order_id": "timeout_cleanup_123"}
-        await order_manager._setup_conditional_order(sample_order, result)
+        with patch("asyncio.create_task"):
+            await order_manager._setup_conditional_order(sample_order, result)
 
         # Mock price to not meet condition
         order_manager._get_current_price = AsyncMock(return_value=50000.0)
 
-        # Manually call monitor with short timeout
-        await order_manager._monitor_conditional_order("timeout_cleanup_123")
-
-        # Wait for timeout
-        await asyncio.sleep(0.2)
+        with patch("tradeengine.order_manager.PRICE_MONITORING_INTERVAL", 0.05):
+            await asyncio.wait_for(order_manager._trigger_feed_loop(), timeout=2)
 
         # Order should be moved to history with timeout status
         assert "timeout_cleanup_123" not in order_manager.conditional_orders
@@ -9,6 +9,7 @@ Tests cover:
 - Position closing and cleanup
 """
 
+import asyncio
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -1307,3 +1308,99 @@ async def test_refresh_portfolio_value_both_absent_returns_false(position_manage
     )
     result = await position_manager._refresh_portfolio_value()
     assert result is False
+
+
+class TestDifferentialSync:
+    """Only positions changed since the last sync are written."""
+
+    @staticmethod
+    def _position(symbol: str, side: str) -> dict:
+        now = datetime.now(UTC)
+        return {
+            "symbol": symbol,
+            "position_side": side,
+            "quantity": 1.0,
+            "avg_price": 100.0,
+            "unrealized_pnl": 0.0,
+            "realized_pnl": 0.0,
+            "total_cost": 100.0,
+            "total_value": 100.0,
+            "entry_time": now,
+            "last_update": now,
+        }
+
+    @pytest.mark.asyncio
+    async def test_sync_writes_dirty_positions_and_changed_pnl_only(
+        self, position_manager
+    ):
+        from shared.retry import PersistResult
+
+        keys = [(f"S{i}USDT", "LONG") for i in range(50)]
+        position_manager.positions = {k: self._position(*k) for k in keys}
+        client = MagicMock()
+        client.upsert_positions = AsyncMock(
+            side_effect=lambda records: [PersistResult(ok=True) for _ in records]
+        )
+        client.update_daily_pnl = AsyncMock(return_value=PersistResult(ok=True))
+
+        with patch("tradeengine.position_manager.position_client", client):
+            assert await position_manager._sync_positions_to_data_manager() == 0
+            assert client.update_daily_pnl.await_count == 1
+            assert await position_manager._sync_positions_to_data_manager() == 0
+            assert client.update_daily_pnl.await_count == 1
+            client.upsert_positions.assert_not_awaited()
+
+            position_manager.positions[keys[3]]["quantity"] = 2.0
+            position_manager._index_position(
+                keys[3], position_manager.positions[keys[3]]
+            )
+            position_manager.positions[("NEWUSDT", "SHORT")] = self._position(
+                "NEWUSDT", "SHORT"
+            )
+            del position_manager.positions[keys[7]]
+            assert await position_manager._sync_positions_to_data_manager() == 2
+            (records,) = client.upsert_positions.await_args.args
+            assert {(r["symbol"], r["quantity"]) for r in records} == {
+                ("S3USDT", 2.0),
+                ("NEWUSDT", 1.0),
+            }
+
+            client.upsert_positions.side_effect = lambda records: [
+                PersistResult(ok=False, error="503") for _ in records
+            ]
+            position_manager._index_position(
+                keys[0], position_manager.positions[keys[0]]
+            )
+            assert await position_manager._sync_positions_to_data_manager() == 1
+            assert position_manager._dirty_positions == {keys[0]}
+
+            assert (
+                await position_manager._sync_positions_to_data_manager(full=True) == 50
+            )
+
+    @pytest.mark.asyncio
+    async def test_periodic_sync_interval_tracks_change_rate(self, position_manager):
+        sleeps: list[float] = []
+        written = iter([3, 1, 0, 0, 0, 0])
+
+        async def fake_sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+            if len(sleeps) > 6:
+                raise asyncio.CancelledError
+
+        position_manager._sync_positions_to_data_manager = AsyncMock(
+            side_effect=lambda: next(written)
+        )
+        with (
+            patch("tradeengine.position_manager.asyncio.sleep", fake_sleep),
+            patch.object(
+                position_manager.settings, "te_position_sync_min_interval_seconds", 5.0
+            ),
+            patch.object(
+                position_manager.settings, "te_position_sync_max_interval_seconds", 60.0
+            ),
+            pytest.raises(asyncio.CancelledError),
+        ):
+            await position_manager._periodic_sync()
+
+        assert sleeps == [30.0, 15.0, 7.5, 15.0, 30.0, 60.0, 60.0]
@@ -1,3 +1,4 @@
+import random
 from unittest.mock import MagicMock
 
 import pytest
@@ -52,3 +53,71 @@ def test_get_cio_portfolio_summary_empty(manager):
     assert summary["open_positions_count"] == 0
     assert summary["gross_exposure"] == 0.0
     assert summary["same_asset_pct"] == 0.0
+
+
+def _brute_force(positions, symbol):
+    open_rows = [(k, p) for k, p in positions.items() if p.get("quantity", 0) != 0]
+    return {
+        "long": sum(
+            p["quantity"] * p["avg_price"]
+            for p in positions.values()
+            if p.get("quantity", 0) > 0
+        ),
+        "gross": sum(abs(p["quantity"] * p["avg_price"]) for _, p in open_rows),
+        "same": sum(
+            abs(p["quantity"] * p["avg_price"]) for k, p in open_rows if k[0] == symbol
+        ),
+        "upnl": sum(p.get("unrealized_pnl", 0.0) for p in positions.values()),
+        "open": len(open_rows),
+    }
+
+
+def test_aggregates_track_random_updates(manager):
+    rng = random.Random(7)
+    symbols = ["BTCUSDT", "ETHUSDT", "SOLUSDT"]
+    for _ in range(300):
+        key = (rng.choice(symbols), rng.choice(["LONG", "SHORT"]))
+        if rng.random() < 0.2:
+            manager.positions.pop(key, None)
+        else:
+            manager.positions[key] = {
+                "quantity": rng.choice([0.0, rng.uniform(-2, 2)]),
+                "avg_price": rng.uniform(10, 100),
+                "unrealized_pnl": rng.uniform(-5, 5),
+            }
+        expected = _brute_force(manager.positions, "ETHUSDT")
+        summary = manager.get_cio_portfolio_summary("ETHUSDT")
+
+        assert manager._calculate_portfolio_exposure() == pytest.approx(
+            expected["long"] / 10000.0, abs=1e-9
+        )
+        assert summary["gross_exposure"] == pytest.approx(
+            expected["gross"] / 10000.0, abs=1e-9
+        )
+        assert summary["same_asset_pct"] == pytest.approx(
+            expected["same"] / 10000.0, abs=1e-9
+        )
+        assert summary["open_positions_count"] == expected["open"]
+        assert manager.get_total_unrealized_pnl() == pytest.approx(
+            expected["upnl"], abs=1e-9
+        )
+
+    manager.positions.clear()
+    assert manager.get_cio_portfolio_summary("ETHUSDT")["gross_exposure"] == 0.0
+    assert manager.get_total_unrealized_pnl() == 0.0
+
+
+def test_apply_mark_price_revalues_symbol_without_marking_dirty(manager):
+    manager.positions = {
+        ("BTCUSDT", "LONG"): {"quantity": 0.1, "avg_price": 40000.0},
+        ("BTCUSDT", "SHORT"): {"quantity": 0.2, "avg_price": 41000.0},
+        ("ETHUSDT", "LONG"): {"quantity": 1.0, "avg_price": 2000.0},
+    }
+
+    manager.apply_mark_price("BTCUSDT", 40500.0)
+
+    assert manager.positions[("BTCUSDT", "LONG")]["unrealized_pnl"] == 50.0
+    assert manager.positions[("BTCUSDT", "SHORT")]["unrealized_pnl"] == 100.0
+    assert "unrealized_pnl" not in manager.positions[("ETHUSDT", "LONG")]
+    assert manager.get_total_unrealized_pnl() == 150.0
+    assert not manager._dirty_positions
@@ -0,0 +1,49 @@
+"""Unit tests for the shared conditional-order trigger ladders."""
+
+from __future__ import annotations
+
+from tradeengine.price_triggers import PriceTriggerBook
+
+
+def test_above_and_below_ladders_fire_only_crossed_triggers() -> None:
+    book = PriceTriggerBook()
+    book.add("a1", "BTCUSDT", "above", 101.0)
+    book.add("a2", "BTCUSDT", "above", 105.0)
+    book.add("b1", "BTCUSDT", "below", 99.0)
+    book.add("b2", "BTCUSDT", "below", 95.0)
+    book.add("e1", "ETHUSDT", "above", 10.0)
+
+    assert book.pop_crossed("BTCUSDT", 100.0) == []
+    # Touching the trigger counts as crossing, like _check_condition.
+    assert book.pop_crossed("BTCUSDT", 101.0) == ["a1"]
+    assert book.pop_crossed("BTCUSDT", 94.0) == ["b1", "b2"]
+    assert book.pop_crossed("BTCUSDT", 200.0) == ["a2"]
+    assert book.symbols() == ["ETHUSDT"]
+    assert len(book) == 1
+
+
+def test_remove_and_reregister() -> None:
+    book = PriceTriggerBook()
+    book.add("x", "BTCUSDT", "above", 100.0, deadline=10.0)
+    assert book.remove("x") is True
+    assert book.remove("x") is False
+    assert book.pop_crossed("BTCUSDT", 150.0) == []
+
+    book.add("y", "BTCUSDT", "below", 50.0, deadline=5.0)
+    book.add("y", "BTCUSDT", "above", 60.0, deadline=50.0)
+    # The replaced registration's deadline is ignored.
+    assert book.pop_expired(20.0) == []
+    assert book.pop_crossed("BTCUSDT", 40.0) == []
+    assert book.pop_crossed("BTCUSDT", 60.0) == ["y"]
+
+
+def test_expiry_includes_orders_without_a_usable_trigger() -> None:
+    book = PriceTriggerBook()
+    book.add("bad", "BTCUSDT", "sideways", 100.0, deadline=1.0)
+    book.add("none", "BTCUSDT", "above", None, deadline=2.0)
+    book.add("ok", "BTCUSDT", "above", 100.0, deadline=3.0)
+
+    assert book.symbols() == ["BTCUSDT"]
+    assert book.pop_crossed("BTCUSDT", 1_000.0) == ["ok"]
+    assert book.pop_expired(2.5) == ["bad", "none"]
+    assert len(book) == 0
@@ -0,0 +1,202 @@
+"""Unit tests for the /positions and /orders secondary indexes."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from contracts.order import TradeOrder
+from shared.constants import UTC
+from tradeengine.exchange_truth_store import ExchangeTruthStore, PositionSnapshot
+from tradeengine.order_manager import OrderManager
+from tradeengine.position_manager import PositionManager
+from tradeengine.query_index import RecordIndex
+
+
+def _t(minutes: int) -> datetime:
+    return datetime(2026, 7, 1, 12, 0, tzinfo=UTC) + timedelta(minutes=minutes)
+
+
+def _pos(symbol: str, side: str, qty: float, pnl: float, minutes: int) -> dict:
+    return {
+        "symbol": symbol,
+        "position_side": side,
+        "quantity": qty,
+        "avg_price": 100.0,
+        "unrealized_pnl": pnl,
+        "entry_time": _t(minutes),
+    }
+
+
+@pytest.fixture
+def manager() -> PositionManager:
+    pm = PositionManager()
+    pm.positions = {
+        ("BTCUSDT", "LONG"): _pos("BTCUSDT", "LONG", 0.5, 10.0, 0),
+        ("BTCUSDT", "SHORT"): _pos("BTCUSDT", "SHORT", 0.2, -4.0, 5),
+        ("ETHUSDT", "LONG"): _pos("ETHUSDT", "LONG", 3.0, 2.5, 10),
+    }
+    return pm
+
+
+def test_record_index_equality_range_and_sort() -> None:
+    idx = RecordIndex(indexed_fields=("kind",), sorted_fields=("n",))
+    for i in range(10):
+        idx.upsert(i, {"kind": "even" if i % 2 == 0 else "odd", "n": i})
+
+    total, page = idx.query(equals={"kind": "odd"}, sort_by="n", descending=True)
+    assert total == 5
+    assert [r["n"] for r in page] == [9, 7, 5, 3, 1]
+
+    total, page = idx.query(ranges={"n": (3, 6)}, sort_by="n")
+    assert total == 4
+    assert [r["n"] for r in page] == [3, 4, 5, 6]
+
+    # Unfiltered pages come straight off the sorted view.
+    total, page = idx.query(sort_by="n", offset=2, limit=3)
+    assert total == 10
+    assert [r["n"] for r in page] == [2, 3, 4]
+
+
+def test_record_index_reupsert_moves_entries() -> None:
+    idx = RecordIndex(indexed_fields=("kind",), sorted_fields=("n",))
+    rec = {"kind": "a", "n": 1}
+    idx.upsert("x", rec)
+    rec["kind"] = "b"
+    rec["n"] = 99
+    idx.upsert("x", rec)
+
+    assert idx.query(equals={"kind": "a"})[0] == 0
+    assert idx.query(equals={"kind": "b"})[0] == 1
+    assert idx.query(ranges={"n": (50, None)})[0] == 1
+
+    idx.remove("x")
+    assert len(idx) == 0
+    assert idx.query(sort_by="n") == (0, [])
+
+
+def test_record_index_mixed_types_do_not_break_sort() -> None:
+    idx = RecordIndex(indexed_fields=(), sorted_fields=("v",))
+    idx.upsert(1, {"v": "text"})
+    idx.upsert(2, {"v": 5})
+    idx.upsert(3, {})  # missing -> 0
+    total, page = idx.query(sort_by="v")
+    assert total == 3
+    assert [r.get("v") for r in page] == [None, 5, "text"]
+
+
+def test_query_positions_maps_endpoint_field_names(manager: PositionManager) -> None:
+    total, page = manager.query_positions(side="LONG", sort_by="size")
+    assert total == 2
+    assert [p["symbol"] for p in page] == ["ETHUSDT", "BTCUSDT"]
+
+    total, page = manager.query_positions(min_pnl=0.0, sort_by="pnl", descending=False)
+    assert [p["unrealized_pnl"] for p in page] == [2.5, 10.0]
+
+    # Local positions are always open.
+    assert manager.query_positions(status="open")[0] == 3
+    assert manager.query_positions(status="closed")[0] == 0
+
+
+def test_query_positions_default_sort_is_newest_first(
+    manager: PositionManager,
+) -> None:
+    total, page = manager.query_positions(limit=2)
+    assert total == 3
+    assert [p["symbol"] for p in page] == ["ETHUSDT", "BTCUSDT"]
+    assert page[1]["position_side"] == "SHORT"
+
+
+def test_direct_position_writes_keep_index_in_step(manager: PositionManager) -> None:
+    manager.positions[("SOLUSDT", "LONG")] = _pos("SOLUSDT", "LONG", 1.0, 0.0, 20)
+    assert manager.query_positions(symbol="SOLUSDT")[0] == 1
+
+    del manager.positions[("SOLUSDT", "LONG")]
+    assert manager.query_positions(symbol="SOLUSDT")[0] == 0
+
+    manager.positions.pop(("BTCUSDT", "SHORT"))
+    assert manager.query_positions(symbol="BTCUSDT")[0] == 1
+
+    manager.positions.clear()
+    assert manager.query_positions()[0] == 0
+
+
+@pytest.mark.asyncio
+async def test_update_position_reindexes_in_place_edits() -> None:
+    pm = PositionManager()
+    order = TradeOrder(
+        symbol="BTCUSDT",
+        side="buy",
+        type="market",
+        amount=0.1,
+        target_price=50000.0,
+        position_side="LONG",
+    )
+    with patch.object(pm, "_sync_positions_to_data_manager", new=AsyncMock()):
+        await pm.update_position(order, {"fill_price": 50000.0, "amount": 0.1})
+        await pm.update_position(order, {"fill_price": 50000.0, "amount": 0.4})
+
+    total, page = pm.query_positions(min_size=0.45)
+    assert total == 1
+    assert page[0]["quantity"] == pytest.approx(0.5)
+
+
+@pytest.mark.asyncio
+async def test_truth_store_query_uses_an_index_kept_in_step_with_the_store(
+    manager: PositionManager,
+) -> None:
+    store = ExchangeTruthStore()
+    store._positions = {
+        ("BTCUSDT", "LONG"): PositionSnapshot("BTCUSDT", "LONG", 0.5, 100.0, 1.0)
+    }
+    manager.exchange_truth_store = store
+
+    with (
+        patch("tradeengine.position_manager.TE_EXCHANGE_TRUTH_STORE_ENABLED", "on"),
+        patch(
+            "tradeengine.position_manager._new_position_index",
+            side_effect=AssertionError("index rebuilt per query"),
+        ),
+    ):
+        assert manager.query_positions()[0] == 1
+
+        await store.update_positions_from_account_update(
+            {"P": [{"s": "ETHUSDT", "ps": "SHORT", "pa": "-2", "ep": "10"}]}
+        )
+        total, page = manager.query_positions(side="SHORT")
+        assert total == 1
+        assert page[0]["source"] == "exchange"
+
+        await store.update_positions_from_account_update(
+            {"P": [{"s": "BTCUSDT", "ps": "LONG", "pa": "0"}]}
+        )
+        assert manager.query_positions(symbol="BTCUSDT")[0] == 0
+
+        await store.seed_from_rest([], [])
+        assert manager.query_positions()[0] == 0
+
+
+@pytest.mark.asyncio
+async def test_query_orders_across_active_and_history() -> None:
+    om = OrderManager()
+    for i, (symbol, status) in enumerate(
+        [("BTCUSDT", "filled"), ("ETHUSDT", "pending"), ("BTCUSDT", "failed")]
+    ):
+        order = TradeOrder(
+            symbol=symbol, side="buy", type="market", amount=1.0, target_price=1.0
+        )
+        await om.track_order(order, {"order_id": f"o{i}", "status": status})
+
+    total, page = om.query_orders(symbol="BTCUSDT")
+    assert total == 2
+    assert [o["order_id"] for o in page] == ["o2", "o0"]
+
+    assert om.query_orders(status="pending")[0] == 1
+
+    om.cancel_order("o1")
+    total, page = om.query_orders(status="cancelled")
+    assert total == 1
+    assert page[0]["order_id"] == "o1"
+    assert om.query_orders(status="pending")[0] == 0
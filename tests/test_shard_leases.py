@@ -0,0 +1,319 @@
+"""Tests for symbol-shard leases and the dispatcher's ownership branching."""
+
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pymongo.errors
+import pytest
+
+from contracts.signal import Signal, SignalStrength, SignalType, StrategyMode
+from shared.constants import UTC
+from shared.distributed_lock import DistributedLockManager
+from shared.shard_leases import (
+    MINE,
+    OTHER,
+    PENDING,
+    UNOWNED,
+    ShardLeaseManager,
+    preferred_owner,
+    shard_for,
+)
+from tests.integration.fakes import FakeExchange, FakePositionManager
+from tradeengine.dispatcher import Dispatcher
+
+
+class _Cursor:
+    def __init__(self, docs):
+        self._docs = list(docs)
+
+    def __aiter__(self):
+        return self._iter()
+
+    async def _iter(self):
+        for doc in self._docs:
+            yield doc
+
+
+class _Collection:
+    """Just enough of motor's collection API for the lease and lock managers."""
+
+    def __init__(self, key="_id"):
+        self.key = key
+        self.docs = {}
+
+    @staticmethod
+    def _matches(doc, flt):
+        for key, cond in flt.items():
+            if key == "$or":
+                if not any(_Collection._matches(doc, sub) for sub in cond):
+                    return False
+            elif isinstance(cond, dict):
+                value = doc.get(key)
+                if "$lt" in cond and not (value is not None and value < cond["$lt"]):
+                    return False
+                if "$gt" in cond and not (value is not None and value > cond["$gt"]):
+                    return False
+            elif doc.get(key) != cond:
+                return False
+        return True
+
+    async def update_one(self, flt, update, upsert=False):
+        doc = self.docs.get(flt[self.key])
+        if doc is None and upsert:
+            doc = self.docs[flt[self.key]] = {self.key: flt[self.key]}
+        if doc is not None:
+            doc.update(update["$set"])
+
+    async def find_one_and_update(
+        self, flt, update, upsert=False, return_document=False
+    ):
+        doc = self.docs.get(flt[self.key])
+        if doc is not None:
+            if not self._matches(doc, flt):
+                raise pymongo.errors.DuplicateKeyError("E11000")
+            doc.update(update["$set"])
+            return doc
+        doc = self.docs[flt[self.key]] = {self.key: flt[self.key], **update["$set"]}
+        return doc if return_document else None
+
+    def find(self, flt, projection=None):
+        return _Cursor(d for d in self.docs.values() if self._matches(d, flt))
+
+    async def delete_one(self, flt):
+        doc = self.docs.get(flt[self.key])
+        if doc is not None and self._matches(doc, flt):
+            del self.docs[flt[self.key]]
+        return SimpleNamespace(deleted_count=int(doc is not None))
+
+    async def delete_many(self, flt):
+        for key in [k for k, d in self.docs.items() if self._matches(d, flt)]:
+            del self.docs[key]
+
+
+class _Db(dict):
+    def __missing__(self, name):
+        self[name] = _Collection()
+        return self[name]
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self[name]
+
+
+def test_shard_for_is_stable_and_case_insensitive():
+    assert shard_for("BTCUSDT", 32) == shard_for("btcusdt", 32)
+    assert 0 <= shard_for("ETHUSDT", 32) < 32
+    assert preferred_owner(3, []) is None
+    assert preferred_owner(3, ["a", "b"]) == preferred_owner(3, ["b", "a"])
+
+
+@pytest.mark.asyncio
+async def test_two_pods_split_every_shard_exactly_once():
+    db = _Db()
+    pod_a = ShardLeaseManager("pod-a", 16, lease_seconds=30, handover_grace=0)
+    pod_b = ShardLeaseManager("pod-b", 16, lease_seconds=30, handover_grace=0)
+
+    await pod_a.renew(db)  # alone: claims everything
+    assert pod_a.owned_shards() == list(range(16))
+
+    await pod_b.renew(db)  # joins: its shards are still leased by pod-a
+    assert pod_b.owned_shards() == []
+    await pod_a.renew(db)  # pod-a sees pod-b and hands its shards over
+    await pod_b.renew(db)
+    await pod_a.renew(db)
+
+    owned_a = set(pod_a.owned_shards())
+    owned_b = set(pod_b.owned_shards())
+    assert owned_a and owned_b
+    assert owned_a.isdisjoint(owned_b)
+    assert owned_a | owned_b == set(range(16))
+    for symbol in ("BTCUSDT", "ETHUSDT", "SOLUSDT", "XRPUSDT"):
+        assert {pod_a.ownership(symbol), pod_b.ownership(symbol)} == {MINE, OTHER}
+
+    await pod_a.release_all(db)
+    await pod_b.renew(db)
+    assert pod_b.owned_shards() == list(range(16))
+
+
+@pytest.mark.asyncio
+async def test_own_lease_stops_counting_before_expiry():
+    now = [1000.0]
+    db = _Db()
+    leases = ShardLeaseManager(
+        "pod-a",
+        4,
+        lease_seconds=30,
+        safety_margin=5,
+        clock=lambda: now[0],
+        handover_grace=0,
+    )
+    await leases.renew(db)
+    # The table holds real Mongo expiries; pin one to the fake clock.
+    shard = leases.shard_for("BTCUSDT")
+    leases._leases[shard] = ("pod-a", 1030.0)
+
+    assert leases.ownership("BTCUSDT") == MINE
+    now[0] = 1026.0  # inside the safety margin
+    assert leases.ownership("BTCUSDT") == UNOWNED
+
+
+@pytest.mark.asyncio
+async def test_handover_keeps_the_lock_path_until_every_pod_can_see_the_owner():
+    now = [1000.0]
+    db = _Db()
+    pod_a = ShardLeaseManager("pod-a", 4, lease_seconds=30, clock=lambda: now[0])
+    booting = ShardLeaseManager("pod-b", 4, lease_seconds=30, clock=lambda: now[0])
+    # No table yet: a broadcast must not run under the lock while an owner
+    # might be running it lock-free.
+    assert booting.ownership("BTCUSDT") == PENDING
+
+    await pod_a.renew(db)
+    shard = pod_a.shard_for("BTCUSDT")
+    # Freshly gained: pods with an older table still see it unowned, so the
+    # new owner keeps taking the per-signal lock for the grace window.
+    assert pod_a.ownership("BTCUSDT") == UNOWNED
+    pod_a._leases[shard] = ("pod-a", 1100.0)  # pin the Mongo expiry
+    now[0] = 1031.0
+    assert pod_a.ownership("BTCUSDT") == PENDING  # its own table went stale
+    await pod_a.renew(db)
+    pod_a._leases[shard] = ("pod-a", 1100.0)
+    assert pod_a.ownership("BTCUSDT") == MINE  # grace kept across renews
+
+
+def _signal(symbol="BTCUSDT"):
+    return Signal(
+        strategy_id="test-shard",
+        symbol=symbol,
+        action="buy",
+        signal_type=SignalType.BUY,
+        confidence=0.85,
+        strength=SignalStrength.STRONG,
+        timeframe="1h",
+        price=50000.0,
+        quantity=0.001,
+        current_price=50000.0,
+        timestamp=datetime.now(UTC),
+        source="petrosa-cio",
+        strategy="test-strategy",
+        strategy_mode=StrategyMode.DETERMINISTIC,
+    )
+
+
+def _fake_dispatcher():
+    dispatcher = Dispatcher(exchange=FakeExchange())
+    dispatcher.position_manager = FakePositionManager(
+        max_position_size_pct=0.1,
+        max_daily_loss_pct=0.05,
+        max_portfolio_exposure_pct=0.8,
+        total_portfolio_value=10000.0,
+    )
+    return dispatcher
+
+
+@pytest.fixture
+def dispatcher_with_fakes():
+    dispatcher = _fake_dispatcher()
+    with (
+        patch("shared.audit.audit_logger.enabled", False),
+        patch("shared.audit.audit_logger.connected", False),
+        patch(
+            "tradeengine.services.data_manager_client.BaseDataManagerClient._retry_request",
+            new_callable=lambda: lambda self: AsyncMock(
+                return_value={"status": "ok", "data": []}
+            ),
+        ),
+    ):
+        yield dispatcher
+
+
+@pytest.mark.asyncio
+async def test_broadcast_signal_for_foreign_shard_is_skipped(dispatcher_with_fakes):
+    with (
+        patch(
+            "tradeengine.dispatcher.distributed_lock_manager.signal_ownership",
+            return_value=OTHER,
+        ),
+        patch(
+            "tradeengine.dispatcher.distributed_lock_manager.execute_with_lock",
+            new_callable=AsyncMock,
+        ) as locked,
+    ):
+        result = await dispatcher_with_fakes.dispatch(_signal(), broadcast=True)
+
+    assert result["status"] == "skipped_not_owner"
+    locked.assert_not_called()
+    assert len(dispatcher_with_fakes.signal_cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_broadcast_signal_is_skipped_before_the_first_lease_renew(
+    dispatcher_with_fakes,
+):
+    with (
+        patch(
+            "tradeengine.dispatcher.distributed_lock_manager.signal_ownership",
+            return_value=PENDING,
+        ),
+        patch(
+            "tradeengine.dispatcher.distributed_lock_manager.execute_with_lock",
+            new_callable=AsyncMock,
+        ) as locked,
+    ):
+        result = await dispatcher_with_fakes.dispatch(_signal(), broadcast=True)
+
+    assert result["status"] == "skipped_not_owner"
+    locked.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_owned_shard_executes_without_distributed_lock(dispatcher_with_fakes):
+    dispatcher = dispatcher_with_fakes
+    with (
+        patch(
+            "tradeengine.dispatcher.distributed_lock_manager.signal_ownership",
+            return_value=MINE,
+        ),
+        patch(
+            "tradeengine.dispatcher.distributed_lock_manager.execute_with_lock",
+            new_callable=AsyncMock,
+        ) as locked,
+    ):
+        result = await dispatcher.dispatch(_signal(), broadcast=True)
+
+    assert result["status"] == "executed", result
+    locked.assert_not_called()
+    assert len(dispatcher.local_signal_claims) == 1
+    fingerprint = next(iter(dispatcher.local_signal_claims))
+    assert dispatcher._claim_local_signal(fingerprint) is False
+
+
+@pytest.mark.asyncio
+async def test_broadcast_signal_on_the_lock_path_executes_once_across_pods(
+    dispatcher_with_fakes,
+):
+    db = _Db(distributed_locks=_Collection(key="lock_name"))
+    signal = _signal()
+    results = []
+    # Both pods got the broadcast while its shard is in handover grace; the
+    # second reaches the lock only after the first has finished with it.
+    for dispatcher, pod_id in (
+        (dispatcher_with_fakes, "pod-a"),
+        (_fake_dispatcher(), "pod-b"),
+    ):
+        locks = DistributedLockManager()
+        locks.pod_id = pod_id
+        locks.mongodb_db = db
+        with (
+            patch("tradeengine.dispatcher.distributed_lock_manager", locks),
+            patch.object(locks, "signal_ownership", return_value=UNOWNED),
+        ):
+            results.append(await dispatcher.dispatch(signal, broadcast=True))
+        executed = dispatcher.exchange.executed_orders
+        results[-1]["orders"] = len(executed)
+
+    assert [r["status"] for r in results] == ["executed", "skipped_duplicate"]
+    assert [r["orders"] for r in results] == [1, 0]
+    (lock,) = db.distributed_locks.docs.values()
+    assert lock["pod_id"] == "pod-a"
@@ -0,0 +1,96 @@
+"""Tests for the concurrent startup dependency graph."""
+
+import asyncio
+
+import pytest
+
+from tradeengine.startup_graph import StartupGraph
+
+
+@pytest.mark.asyncio
+async def test_independent_steps_overlap_and_dependents_wait():
+    events: list[str] = []
+    release = asyncio.Event()
+
+    async def slow(name: str) -> None:
+        events.append(f"{name}:start")
+        await release.wait()
+        events.append(f"{name}:end")
+
+    async def dependent() -> None:
+        events.append("dispatcher:start")
+
+    graph = StartupGraph()
+    graph.add("config", lambda: slow("config"))
+    graph.add("binance", lambda: slow("binance"))
+    graph.add("dispatcher", dependent, after=("binance",))
+    graph.start()
+    await asyncio.sleep(0)
+
+    # Both roots are in flight before either finishes.
+    assert events == ["config:start", "binance:start"]
+    release.set()
+    assert await graph.wait_critical() is True
+    assert events.index("dispatcher:start") > events.index("binance:end")
+
+    steps = graph.report()["steps"]
+    assert {s["status"] for s in steps.values()} == {"ok"}
+    assert all(s["duration_s"] is not None for s in steps.values())
+
+
+@pytest.mark.asyncio
+async def test_failed_step_skips_dependents_and_fails_readiness():
+    async def boom() -> None:
+        raise RuntimeError("exchange down")
+
+    async def ok() -> None:
+        return None
+
+    graph = StartupGraph()
+    graph.add("binance", boom)
+    graph.add("dispatcher", ok, after=("binance",))
+    graph.add("dm_probe", ok)
+
+    assert await graph.wait_critical() is False
+    steps = graph.report()["steps"]
+    assert steps["binance"]["status"] == "failed"
+    assert steps["binance"]["error"] == "exchange down"
+    assert steps["dispatcher"]["status"] == "skipped"
+    assert steps["dm_probe"]["status"] == "ok"
+
+
+@pytest.mark.asyncio
+async def test_non_critical_steps_finish_after_ready():
+    release = asyncio.Event()
+
+    async def background() -> None:
+        await release.wait()
+
+    async def ok() -> None:
+        return None
+
+    graph = StartupGraph()
+    graph.add("dispatcher", ok)
+    graph.add("health_evaluator", background, critical=False)
+
+    assert await graph.wait_critical() is True
+    report = graph.report()
+    assert report["ready"] is True
+    assert report["complete"] is False
+    assert report["steps"]["health_evaluator"]["status"] == "running"
+
+    release.set()
+    await graph.wait_all()
+    assert graph.report()["complete"] is True
+
+
+def test_critical_step_cannot_depend_on_non_critical():
+    async def ok() -> None:
+        return None
+
+    graph = StartupGraph()
+    graph.add("probe", ok, critical=False)
+    with pytest.raises(ValueError):
+        graph.add("dispatcher", ok, after=("probe",))
+    with pytest.raises(ValueError):
+        graph.add("consumer", ok, after=("missing",))
@@ -964,3 +964,58 @@ class TestDecisionIdThreading531:
             strategy_position_manager.get_strategy_position_by_entry_order_id("")
             is None
         )
+
+
+class TestStrategyPositionIndexes:
+    """Secondary indexes stay in step with create/close/evict."""
+
+    @staticmethod
+    def _row(pid: str, strategy_id: str, entry_order_id: int, key: str) -> dict:
+        return {
+            "strategy_position_id": pid,
+            "strategy_id": strategy_id,
+            "entry_order_id": entry_order_id,
+            "exchange_position_key": key,
+            "symbol": key.split("_")[0],
+            "side": key.split("_")[1],
+            "entry_quantity": 1.0,
+            "entry_price": 100.0,
+            "status": "open",
+        }
+
+    @pytest.mark.asyncio
+    async def test_indexes_follow_close_and_evict(self, strategy_position_manager):
+        spm = strategy_position_manager
+        spm.strategy_positions["a"] = self._row("a", "s1", 101, "BTCUSDT_LONG")
+        spm.strategy_positions["b"] = self._row("b", "s1", 102, "BTCUSDT_LONG")
+        spm.strategy_positions["c"] = self._row("c", "s2", 103, "ETHUSDT_SHORT")
+
+        assert spm.get_strategy_position_by_entry_order_id(102)["strategy_id"] == "s1"
+        assert [
+            p["strategy_position_id"] for p in spm.get_all_open_strategy_positions()
+        ] == ["a", "b", "c"]
+        assert len(spm.get_strategy_positions_by_strategy("s1")) == 2
+
+        with (
+            patch.object(spm, "_update_strategy_position_closure", AsyncMock()),
+            patch.object(spm, "_close_contribution", AsyncMock()),
+            patch.object(spm, "_reduce_exchange_position", AsyncMock()),
+        ):
+            await spm.close_strategy_position("a", exit_price=110.0)
+            assert await spm.evict_ghost_position("c")
+
+        open_ids = [
+            p["strategy_position_id"] for p in spm.get_all_open_strategy_positions()
+        ]
+        assert open_ids == ["b"]
+        by_key = await spm.get_open_strategy_positions_by_exchange_key("BTCUSDT_LONG")
+        assert [p["strategy_position_id"] for p in by_key] == ["b"]
+        assert spm.get_strategy_position_by_entry_order_id("103") is None
+        assert [p["status"] for p in spm.get_strategy_positions_by_strategy("s1")] == [
+            "closed",
+            "open",
+        ]
+
+        spm.restore_state({"d": self._row("d", "s3", 104, "SOLUSDT_LONG")}, {}, {})
+        assert spm.get_strategy_position_by_entry_order_id("104")["strategy_id"] == "s3"
+        assert len(spm.get_all_open_strategy_positions()) == 2
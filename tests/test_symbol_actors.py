@@ -0,0 +1,158 @@
+"""Tests for the per-symbol actor runtime and its dispatcher wiring."""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from contracts.signal import Signal, SignalStrength, SignalType, StrategyMode
+from shared.constants import UTC
+from tests.integration.fakes import FakeExchange, FakePositionManager
+from tradeengine.dispatcher import Dispatcher
+from tradeengine.symbol_actors import SymbolActorRuntime
+
+
+@pytest.mark.asyncio
+async def test_same_symbol_runs_in_order_other_symbols_in_parallel():
+    runtime = SymbolActorRuntime()
+    events: list[str] = []
+    release = asyncio.Event()
+
+    async def step(name: str, wait: bool = False) -> str:
+        events.append(f"{name}:start")
+        if wait:
+            await release.wait()
+        events.append(f"{name}:end")
+        return name
+
+    first = asyncio.create_task(runtime.call("BTCUSDT", step, "btc-1", wait=True))
+    second = asyncio.create_task(runtime.call("BTCUSDT", step, "btc-2"))
+    other = asyncio.create_task(runtime.call("ETHUSDT", step, "eth-1"))
+
+    # ETH completes while BTC's first command is still blocked.
+    assert await other == "eth-1"
+    assert "btc-2:start" not in events
+
+    release.set()
+    assert await asyncio.gather(first, second) == ["btc-1", "btc-2"]
+    assert events.index("btc-2:start") > events.index("btc-1:end")
+    assert runtime.snapshot()["BTCUSDT"]["processed"] == 2
+    await runtime.stop()
+
+
+@pytest.mark.asyncio
+async def test_reentrant_call_runs_inline_and_errors_propagate():
+    runtime = SymbolActorRuntime()
+
+    async def inner() -> bool:
+        return runtime.in_actor("BTCUSDT")
+
+    async def outer() -> bool:
+        # Would deadlock if it waited on its own mailbox.
+        return await runtime.call("BTCUSDT", inner)
+
+    async def boom() -> None:
+        raise ValueError("bad command")
+
+    assert await runtime.call("BTCUSDT", outer) is True
+    with pytest.raises(ValueError):
+        await runtime.call("BTCUSDT", boom)
+    # The actor survives a failed command.
+    assert await runtime.call("BTCUSDT", inner) is True
+    await runtime.stop()
+
+
+@pytest.mark.asyncio
+async def test_idle_actor_retires_and_is_recreated():
+    runtime = SymbolActorRuntime(idle_seconds=0.01)
+
+    async def noop() -> None:
+        return None
+
+    await runtime.call("BTCUSDT", noop)
+    await asyncio.sleep(0.05)
+    assert runtime.snapshot() == {}
+
+    await runtime.call("BTCUSDT", noop)
+    assert "BTCUSDT" in runtime.snapshot()
+    await runtime.stop()
+    with pytest.raises(RuntimeError):
+        runtime.post("BTCUSDT", noop)
+
+
+def _signal(symbol="BTCUSDT"):
+    return Signal(
+        strategy_id="test-actor",
+        symbol=symbol,
+        action="buy",
+        signal_type=SignalType.BUY,
+        confidence=0.85,
+        strength=SignalStrength.STRONG,
+        timeframe="1h",
+        price=50000.0,
+        quantity=0.001,
+        current_price=50000.0,
+        timestamp=datetime.now(UTC),
+        source="petrosa-cio",
+        strategy="test-strategy",
+        strategy_mode=StrategyMode.DETERMINISTIC,
+    )
+
+
+@pytest.mark.asyncio
+async def test_dispatch_and_fills_run_on_the_symbol_actor():
+    dispatcher = Dispatcher(exchange=FakeExchange())
+    dispatcher.position_manager = FakePositionManager(
+        max_position_size_pct=0.1,
+        max_daily_loss_pct=0.05,
+        max_portfolio_exposure_pct=0.8,
+        total_portfolio_value=10000.0,
+    )
+    dispatcher.symbol_actors = SymbolActorRuntime()
+    seen_in_actor: list[bool] = []
+    original = dispatcher._execute_order_with_consensus
+
+    async def spy(order):
+        seen_in_actor.append(dispatcher.symbol_actors.in_actor(order.symbol))
+        return await original(order)
+
+    dispatcher._execute_order_with_consensus = spy
+
+    async def run_locked(_key, fn, *args):
+        return await fn(*args)
+
+    with (
+        patch("shared.audit.audit_logger.enabled", False),
+        patch("shared.audit.audit_logger.connected", False),
+        patch(
+            "tradeengine.services.data_manager_client.BaseDataManagerClient._retry_request",
+            new_callable=lambda: lambda self: AsyncMock(
+                return_value={"status": "ok", "data": []}
+            ),
+        ),
+        patch(
+            "tradeengine.dispatcher.distributed_lock_manager.execute_with_lock",
+            new=run_locked,
+        ),
+    ):
+        result = await dispatcher.dispatch(_signal())
+
+        assert result["status"] == "executed", result
+        assert seen_in_actor == [True]
+
+        fill_symbols: list[bool] = []
+
+        async def fill_spy(order_obj):
+            fill_symbols.append(dispatcher.symbol_actors.in_actor(order_obj["s"]))
+
+        dispatcher.oco_manager.on_entry_fill = fill_spy
+        await dispatcher._on_user_data_fill(
+            {"s": "BTCUSDT", "i": 1, "S": "BUY", "o": "MARKET", "X": "FILLED"}
+        )
+        # Posted, not run inline: the stream callback returned immediately.
+        assert fill_symbols == []
+        await asyncio.sleep(0.05)
+        assert fill_symbols == [True]
+
+    await dispatcher.symbol_actors.stop()
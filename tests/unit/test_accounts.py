@@ -0,0 +1,230 @@
+"""Unit tests for multi-account contexts and the shared exchange resources."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from contracts.signal import Signal
+from tradeengine.accounts import (
+    AccountContext,
+    AccountRegistry,
+    credentials_for,
+    parse_account_ids,
+)
+from tradeengine.exchange.binance import BinanceFuturesExchange
+from tradeengine.exchange.shared_resources import SharedExchangeResources
+
+
+def _signal(account_id: str | None = None) -> Signal:
+    return Signal(
+        strategy_id="s1",
+        symbol="BTCUSDT",
+        action="buy",
+        confidence=0.9,
+        price=50_000.0,
+        quantity=0.01,
+        current_price=50_000.0,
+        source="test",
+        strategy="test",
+        account_id=account_id,
+    )
+
+
+def _context(account_id: str, primary: bool = False) -> AccountContext:
+    dispatcher = MagicMock()
+    dispatcher.dispatch = AsyncMock(return_value={"status": "executed"})
+    return AccountContext(account_id, MagicMock(), dispatcher, primary=primary)
+
+
+def test_account_ids_and_credentials(monkeypatch):
+    assert parse_account_ids(" main, sub-1 ,,main,sub2 ") == ["main", "sub-1", "sub2"]
+    assert parse_account_ids("") == []
+    monkeypatch.setenv("BINANCE_API_KEY_SUB_1", "k")
+    monkeypatch.setenv("BINANCE_API_SECRET_SUB_1", "s")
+    assert credentials_for("sub-1") == ("k", "s")
+    assert credentials_for("sub2") == ("", "")
+
+
+@pytest.mark.asyncio
+async def test_price_cache_ttl_and_coalescing():
+    now = [0.0]
+    shared = SharedExchangeResources(price_ttl_seconds=1.0, clock=lambda: now[0])
+    calls = 0
+    release = asyncio.Event()
+
+    async def fetch() -> float:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return 100.0 + calls
+
+    waiters = [asyncio.create_task(shared.price("BTCUSDT", fetch)) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+    assert await asyncio.gather(*waiters) == [101.0] * 5
+    assert calls == 1
+
+    now[0] = 0.5
+    assert await shared.price("BTCUSDT", fetch) == 101.0
+    now[0] = 2.0
+    assert await shared.price("BTCUSDT", fetch) == 102.0
+
+    async def boom() -> float:
+        raise RuntimeError("ticker down")
+
+    with pytest.raises(RuntimeError):
+        await shared.price("ETHUSDT", boom)
+    assert shared.snapshot()["cached_prices"] == 1
+
+
+@pytest.mark.asyncio
+@patch("shared.constants.BINANCE_API_KEY", "primary_key")
+@patch("shared.constants.BINANCE_API_SECRET", "primary_secret")
+@patch("shared.constants.NATS_ENABLED", True)
+async def test_accounts_share_exchange_info_pool_and_monitor():
+    shared = SharedExchangeResources()
+    clients = []
+
+    def make_client(**kwargs):
+        client = MagicMock()
+        client.api_key = kwargs["api_key"]
+        client.futures_exchange_info.return_value = {
+            "symbols": [
+                {
+                    "symbol": "BTCUSDT",
+                    "baseAsset": "BTC",
+                    "quoteAsset": "USDT",
+                    "status": "TRADING",
+                    "filters": [],
+                }
+            ]
+        }
+        clients.append(client)
+        return client
+
+    primary = BinanceFuturesExchange(shared=shared)
+    sub = BinanceFuturesExchange(
+        account_id="sub1", api_key="sub_key", api_secret="sub_secret", shared=shared
+    )
+    orphan = BinanceFuturesExchange(account_id="sub2", shared=shared)
+    with patch("tradeengine.exchange.binance.Client", side_effect=make_client):
+        await primary.initialize()
+        await sub.initialize()
+        await orphan.initialize()
+
+    assert [c.api_key for c in clients] == ["primary_key", "sub_key"]
+    assert orphan.client is None  # never falls back to the primary's key
+    clients[0].futures_exchange_info.assert_called_once()
+    clients[1].futures_exchange_info.assert_not_called()
+    assert sub.symbol_info is primary.symbol_info
+    assert "BTCUSDT" in sub.symbol_info
+    for client in clients:
+        client.session.mount.assert_any_call("https://", shared.http_adapter)
+    assert sub.rate_monitor is primary.rate_monitor is shared.rate_monitor
+
+    await sub.close()
+    shared.rate_monitor.stop.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_registry_routes_by_account_id():
+    main = _context("main", primary=True)
+    registry = AccountRegistry(main)
+    sub = _context("sub1")
+    registry.accounts["sub1"] = sub
+
+    assert (await registry.dispatch(_signal()))["status"] == "executed"
+    main.dispatcher.dispatch.assert_awaited_once()
+
+    not_ready = await registry.dispatch(_signal("sub1"))
+    assert not_ready["reason"] == "account_not_ready"
+    sub.ready = True
+    await registry.dispatch(_signal("sub1"), broadcast=True)
+    sub.dispatcher.dispatch.assert_awaited_once()
+    assert sub.dispatcher.dispatch.await_args.kwargs == {"broadcast": True}
+
+    unknown = await registry.dispatch(_signal("nope"))
+    assert (unknown["status"], unknown["reason"]) == ("rejected", "unknown_account")
+    assert registry.snapshot()["status"] == "healthy"
+
+
+@pytest.mark.asyncio
+async def test_secondary_start_failure_is_isolated():
+    registry = AccountRegistry(_context("main", primary=True))
+    good, bad = _context("good"), _context("bad")
+    for ctx in (good, bad):
+        ctx.exchange.initialize = AsyncMock()
+        ctx.exchange.start_ping_loop = AsyncMock()
+        ctx.dispatcher.initialize = AsyncMock()
+        registry.accounts[ctx.account_id] = ctx
+    bad.exchange.client = None
+
+    await registry.start_secondaries()
+
+    assert good.ready and not bad.ready
+    assert bad.error == "credentials missing"
+    assert registry.snapshot()["status"] == "degraded"
+
+
+@pytest.mark.asyncio
+async def test_position_manager_loads_only_its_account():
+    from tradeengine.position_manager import PositionManager
+
+    docs = [
+        {"symbol": "BTCUSDT", "position_side": "LONG", "quantity": 1.0},
+        {
+            "symbol": "ETHUSDT",
+            "position_side": "SHORT",
+            "quantity": 2.0,
+            "account_id": "sub1",
+        },
+    ]
+    client = MagicMock()
+    client.get_open_positions = AsyncMock(return_value=docs)
+    with patch("tradeengine.position_manager.position_client", client):
+        primary = PositionManager()
+        sub = PositionManager(account_id="sub1")
+        await primary._load_positions_from_data_manager()
+        await sub._load_positions_from_data_manager()
+
+    assert list(primary.positions) == [("BTCUSDT", "LONG")]
+    assert list(sub.positions) == [("ETHUSDT", "SHORT")]
+
+
+@pytest.mark.asyncio
+async def test_secondary_accounts_keep_their_own_strategy_positions():
+    from shared.retry import PersistResult
+    from tradeengine.dispatcher import Dispatcher
+    from tradeengine.strategy_position_manager import strategy_position_manager
+
+    client = MagicMock()
+    client.create_position = AsyncMock(return_value=PersistResult(ok=True))
+    primary_positions = dict(strategy_position_manager.exchange_positions)
+    with (
+        patch.dict(
+            "tradeengine.strategy_position_manager._account_managers", clear=True
+        ),
+        patch("tradeengine.strategy_position_manager.position_client", client),
+    ):
+        primary = Dispatcher()
+        sub = Dispatcher(account_id="sub1")
+        manager = sub.strategy_position_manager
+        assert primary.strategy_position_manager is strategy_position_manager
+        assert manager is not strategy_position_manager
+        assert Dispatcher(account_id="sub1").strategy_position_manager is manager
+        assert sub.oco_manager.account_id == "sub1"
+
+        order = MagicMock(symbol="BTCUSDT")
+        await manager.create_strategy_position(
+            _signal("sub1"), order, {"fill_price": 50_000.0, "amount": 0.01}
+        )
+
+    # Same symbol and side on the primary is a different exchange position.
+    assert "BTCUSDT_LONG" in manager.exchange_positions
+    assert strategy_position_manager.exchange_positions == primary_positions
+    written = [call.args[0] for call in client.create_position.await_args_list]
+    assert len(written) == 3
+    assert all(doc["account_id"] == "sub1" for doc in written)
@@ -233,44 +233,70 @@ def test_build_returns_none_when_nats_disabled():
     assert build_tradeengine_health_evaluator(nats_servers="") is None
 
 
-def test_counter_total_aggregates_labels():
-    from tradeengine.evaluators.health_evaluator import (
-        _counter_total,
-        _histogram_sum_count,
-    )
+class _MonoClock:
+    def __init__(self) -> None:
+        self.t = 1_000.0
 
-    class _Family:
-        def __init__(self, samples):
-            self.samples = samples
+    def __call__(self) -> float:
+        return self.t
 
-    class _Sample:
-        def __init__(self, name, value):
-            self.name = name
-            self.value = value
 
-    class _Metric:
-        def __init__(self, samples):
-            self._samples = samples
+def test_rolling_window_expires_old_buckets():
+    from tradeengine.evaluators.rolling_window import RollingWindow
 
-        def collect(self):
-            return [_Family(self._samples)]
+    mono = _MonoClock()
+    w = RollingWindow(window_s=15.0, clock=mono)
+    w.add(2.0)
+    mono.t += 5
+    w.add(4.0)
+    assert (w.count, w.sum, w.mean()) == (2, 6.0, 3.0)
 
-    counter = _Metric(
-        [
-            _Sample("foo_total", 3.0),
-            _Sample("foo_total", 7.0),
-            _Sample("foo_created", 0.0),  # ignored
-        ]
-    )
-    assert _counter_total(counter) == 10.0
-
-    histogram = _Metric(
-        [
-            _Sample("foo_sum", 12.5),
-            _Sample("foo_count", 5.0),
-            _Sample("foo_sum", 2.5),
-            _Sample("foo_count", 1.0),
-            _Sample("foo_bucket", 99.0),  # ignored
-        ]
-    )
-    assert _histogram_sum_count(histogram) == (15.0, 6.0)
+    mono.t += 11  # first bucket falls out of the 15s window
+    assert (w.count, w.sum) == (1, 4.0)
+
+    mono.t += 60  # everything expires; lifetime totals are kept
+    assert (w.count, w.sum, w.mean()) == (0, 0.0, None)
+    assert (w.total_count, w.total_sum) == (2, 6.0)
+
+
+@pytest.mark.asyncio
+async def test_windowed_source_gives_a_verdict_on_the_first_tick(clock):
+    from tradeengine.evaluators.rolling_window import HealthSignals
+
+    mono = _MonoClock()
+    signals = HealthSignals(window_s=15.0, clock=mono)
+    ev = _make(signals.snapshot, clock)
+
+    for _ in range(10):
+        signals.risk_checks.add()
+    signals.order_latency.add(0.5)
+    verdict, reason = await ev.evaluate()
+    assert verdict == "healthy"
+    assert "checks 10" in reason
+
+    # Next tick: the window only holds what happened since.
+    mono.t += 15
+    for _ in range(8):
+        signals.risk_checks.add()
+        signals.risk_rejections.add()
+    verdict, reason = await ev.evaluate()
+    assert verdict == "unhealthy"
+    assert "8/8 rejected" in reason
+
+    mono.t += 15
+    signals.divergences.add(2)
+    verdict, reason = await ev.evaluate()
+    assert verdict == "unhealthy"
+    assert "divergence: +2" in reason
+
+
+def test_metric_handle_tap_feeds_rolling_window():
+    from tradeengine.evaluators.rolling_window import RollingWindow
+    from tradeengine.metric_handles import BoundMetric
+    from tradeengine.metrics import risk_checks_total
+
+    tapped = RollingWindow(window_s=15.0)
+    handle = BoundMetric(risk_checks_total, tap=tapped.add)
+    handle.labels(check_type="tap_test", result="passed", exchange="binance").inc()
+    handle.labels(check_type="tap_test", result="passed", exchange="binance").inc()
+    assert tapped.total_sum == 2.0
@@ -0,0 +1,155 @@
+"""Per-call-site log budget and runtime log levels."""
+
+from __future__ import annotations
+
+import io
+import logging
+import time
+
+import structlog
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from shared import log_budget
+from shared.log_budget import LogBudget, LogBudgetFilter, budget_processor
+from tradeengine.api_debug_routes import router
+
+
+class _Counted:
+    """Argument that records whether it was ever formatted."""
+
+    formatted = 0
+
+    def __str__(self) -> str:
+        _Counted.formatted += 1
+        return "arg"
+
+
+def test_budget_suppresses_per_call_site_without_formatting(monkeypatch):
+    budget = LogBudget(window_seconds=0.1, per_site=3)
+    monkeypatch.setattr(log_budget, "log_budget", budget)
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.addFilter(LogBudgetFilter())
+    logger = logging.getLogger("test_log_budget.stdlib")
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    _Counted.formatted = 0
+
+    def tick() -> None:
+        logger.info("tick %s", _Counted())
+
+    try:
+        for _ in range(10):
+            tick()
+        logger.info("other site")  # its own budget
+        for _ in range(2):
+            logger.error("boom %s", 1)  # errors are never dropped
+        time.sleep(0.15)
+        tick()
+    finally:
+        logger.removeHandler(handler)
+
+    lines = stream.getvalue().splitlines()
+    assert lines.count("tick arg") == 3
+    assert "other site" in lines
+    assert lines.count("boom 1") == 2
+    assert lines[-1] == "tick arg [suppressed 7 similar messages]"
+    assert _Counted.formatted == 4
+    snapshot = budget.snapshot()
+    assert snapshot["suppressed_total"] == 7
+    assert snapshot["noisiest_sites"][0]["suppressed"] == 7
+
+
+def test_two_handlers_share_one_decision_per_record(monkeypatch):
+    budget = LogBudget(window_seconds=60, per_site=4)
+    monkeypatch.setattr(log_budget, "log_budget", budget)
+    budget_filter = LogBudgetFilter()
+    streams = [io.StringIO(), io.StringIO()]
+    handlers = [logging.StreamHandler(stream) for stream in streams]
+    logger = logging.getLogger("test_log_budget.handlers")
+    for handler in handlers:
+        handler.addFilter(budget_filter)
+        logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    def tick() -> None:
+        logger.info("tick")
+
+    try:
+        for _ in range(10):
+            tick()
+    finally:
+        for handler in handlers:
+            logger.removeHandler(handler)
+
+    assert [len(stream.getvalue().splitlines()) for stream in streams] == [4, 4]
+    assert budget.suppressed_total == 6
+
+
+def test_structlog_calls_are_budgeted_and_levels_change_at_runtime(monkeypatch):
+    budget = LogBudget(window_seconds=60, per_site=2)
+    monkeypatch.setattr(log_budget, "log_budget", budget)
+    monkeypatch.setattr(
+        "tradeengine.api_debug_routes.settings.te_debug_token", "secret"
+    )
+    records: list[logging.LogRecord] = []
+    collector = logging.Handler()
+    collector.emit = records.append  # type: ignore[method-assign]
+    # As on the root handlers: records structlog already admitted pass.
+    collector.addFilter(LogBudgetFilter())
+    # Built like configure_structlog()'s loggers: records carry the caller's
+    # file and line, the same site budget_processor charged.
+    stdlib_logger = structlog.stdlib.LoggerFactory()("test_log_budget.structlog")
+    monkeypatch.setattr(stdlib_logger, "propagate", False)
+    monkeypatch.setattr(stdlib_logger, "disabled", False)
+    stdlib_logger.addHandler(collector)
+    stdlib_logger.setLevel(logging.INFO)
+    # The head of configure_structlog()'s chain, wrapped directly: other
+    # tests reconfigure structlog and logging, so the global config is not
+    # reliable here.
+    logger = structlog.wrap_logger(
+        stdlib_logger,
+        processors=[
+            structlog.stdlib.filter_by_level,
+            budget_processor,
+            structlog.stdlib.PositionalArgumentsFormatter(),
+            structlog.processors.KeyValueRenderer(key_order=["event"]),
+        ],
+        wrapper_class=structlog.stdlib.BoundLogger,
+    )
+    try:
+        for i in range(5):
+            logger.info("fill %s", i)
+    finally:
+        stdlib_logger.removeHandler(collector)
+        stdlib_logger.setLevel(logging.NOTSET)
+    assert len(records) == 2
+    assert "fill 1" in records[-1].getMessage()
+    assert budget.suppressed_total == 3
+
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+    auth = {"Authorization": "Bearer secret"}
+    assert client.put("/debug/logging/test_log_budget?level=DEBUG").status_code == 401
+    assert (
+        client.put(
+            "/debug/logging/test_log_budget?level=LOUD", headers=auth
+        ).status_code
+        == 400
+    )
+    response = client.put("/debug/logging/test_log_budget?level=WARNING", headers=auth)
+    assert response.status_code == 200
+    try:
+        assert logging.getLogger("test_log_budget.structlog").getEffectiveLevel() == (
+            logging.WARNING
+        )
+        state = client.get("/debug/logging").json()
+        assert state["levels"]["test_log_budget"] == "WARNING"
+        assert state["budget"]["suppressed_total"] == 3
+    finally:
+        client.put("/debug/logging/test_log_budget?level=NOTSET", headers=auth)
+    assert "test_log_budget" not in log_budget.get_levels()
@@ -0,0 +1,51 @@
+"""Unit tests for the event-loop lag and slow-callback monitor."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from tradeengine.loop_monitor import LoopMonitor
+
+
+async def _blocking_fetch() -> None:
+    time.sleep(0.3)
+
+
+@pytest.mark.asyncio
+async def test_stall_is_attributed_to_the_blocking_task():
+    monitor = LoopMonitor(interval=0.02, slow_threshold=0.05)
+    monitor.start()
+    try:
+        await asyncio.sleep(0.05)
+        await asyncio.create_task(_blocking_fetch(), name="fetch-task")
+        await asyncio.sleep(0.05)
+    finally:
+        await monitor.stop()
+
+    snapshot = monitor.snapshot()
+    assert snapshot["slow_callbacks_total"] >= 1
+    worst = snapshot["worst_recent"][0]
+    assert worst["duration"] >= 0.25
+    assert worst["task"] == "fetch-task"
+    assert worst["coroutine"] == "_blocking_fetch"
+    assert worst["site"].endswith("_blocking_fetch")
+    assert "test_loop_monitor.py" in worst["site"]
+    (offender,) = snapshot["offenders"]
+    assert offender["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_short_lag_is_measured_but_not_reported():
+    monitor = LoopMonitor(interval=0.01, slow_threshold=0.5)
+    monitor.start()
+    await asyncio.sleep(0.1)
+    await monitor.stop()
+
+    snapshot = monitor.snapshot()
+    assert snapshot["running"] is False
+    assert snapshot["lag_last_minute"]["p50"] is not None
+    assert snapshot["slow_callbacks_total"] == 0
+    assert snapshot["offenders"] == []
@@ -0,0 +1,143 @@
+"""Unit tests for the columnar reconciliation detectors."""
+
+from __future__ import annotations
+
+import random
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from tradeengine.position_columns import (
+    detect_divergences_columnar,
+    detect_unhedged_positions_columnar,
+)
+from tradeengine.position_reconciler import (
+    PositionReconciler,
+    detect_divergences,
+    detect_unhedged_positions,
+)
+
+
+def _binance_pos(symbol: str, side: str, amt: float) -> dict:
+    return {"symbol": symbol, "positionSide": side, "positionAmt": str(amt)}
+
+
+def _local_pos(symbol: str, side: str, qty: float) -> dict:
+    return {"symbol": symbol, "position_side": side, "quantity": qty}
+
+
+def _make_reconciler(binance_raw: list, local_positions: dict) -> PositionReconciler:
+    exchange = MagicMock()
+    exchange.get_position_info = AsyncMock(return_value=binance_raw)
+    exchange.get_open_algo_orders = AsyncMock(return_value=[])
+    pm = MagicMock()
+    pm.get_positions = MagicMock(return_value=local_positions)
+    return PositionReconciler(
+        exchange=exchange, position_manager=pm, interval_seconds=60
+    )
+
+
+_ORDER_SHAPES = [
+    {"type": "STOP_MARKET", "reduceOnly": True},
+    {"type": "TAKE_PROFIT_MARKET", "reduceOnly": True},
+    {"type": "STOP_MARKET", "closePosition": True},
+    {"origType": "TAKE_PROFIT", "reduceOnly": "true"},
+    {"type": "STOP_MARKET", "reduceOnly": False},
+    {"type": "LIMIT", "reduceOnly": True},
+]
+
+
+def _random_book(seed: int, n: int) -> tuple[dict, dict]:
+    rng = random.Random(seed)
+    positions: dict = {}
+    orders: dict = {}
+    for i in range(n):
+        symbol = f"S{i % (n // 3 + 1)}USDT"
+        side = rng.choice(["LONG", "SHORT"])
+        amt = rng.uniform(0.01, 3.0) * (1 if side == "LONG" else -1)
+        if rng.random() < 0.1:
+            amt = -amt
+        positions[(symbol, side)] = {
+            "symbol": symbol,
+            "positionSide": side,
+            "positionAmt": str(amt),
+        }
+        for _ in range(rng.randint(0, 3)):
+            leg = dict(rng.choice(_ORDER_SHAPES))
+            leg["positionSide"] = rng.choice([side, "BOTH", "LONG", "SHORT"])
+            orders.setdefault(symbol, []).append(leg)
+    return positions, orders
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_unhedged_columnar_matches_loop(seed):
+    positions, orders = _random_book(seed, 400)
+    expected = detect_unhedged_positions(positions, orders)
+    assert detect_unhedged_positions_columnar(positions, orders) == expected
+    assert {d["category"] for d in expected} >= {"unhedged", "malformed_position"}
+
+
+def test_unhedged_columnar_empty_inputs():
+    assert detect_unhedged_positions_columnar({}, {}) == []
+    positions = {("BTCUSDT", "LONG"): _binance_pos("BTCUSDT", "LONG", 1.0)}
+    assert detect_unhedged_positions_columnar(
+        positions, {}
+    ) == detect_unhedged_positions(positions, {})
+
+
+def test_divergences_columnar_matches_loop():
+    binance = {
+        ("BTCUSDT", "LONG"): _binance_pos("BTCUSDT", "LONG", 0.5),
+        ("ETHUSDT", "SHORT"): _binance_pos("ETHUSDT", "SHORT", -2.0),
+        ("SOLUSDT", "LONG"): _binance_pos("SOLUSDT", "LONG", 10.0),
+    }
+    local = {
+        ("BTCUSDT", "LONG"): _local_pos("BTCUSDT", "LONG", 0.5),
+        ("ETHUSDT", "SHORT"): _local_pos("ETHUSDT", "SHORT", 1.5),
+        ("XRPUSDT", "LONG"): _local_pos("XRPUSDT", "LONG", 100.0),
+    }
+    expected = detect_divergences(binance, local)
+    assert [d["category"] for d in expected] == ["untracked", "mutation", "ghost"]
+    assert detect_divergences_columnar(binance, local) == expected
+    for b, lp in ((binance, {}), ({}, local), ({}, {})):
+        assert detect_divergences_columnar(b, lp) == detect_divergences(b, lp)
+
+
+@pytest.mark.asyncio
+async def test_reconciler_switches_to_columnar_at_threshold():
+    binance_raw = [_binance_pos("BTCUSDT", "LONG", 0.5)]
+    local = {("ETHUSDT", "LONG"): _local_pos("ETHUSDT", "LONG", 1.0)}
+
+    for threshold, expect_columnar in ((1, True), (2, False), (0, False)):
+        reconciler = _make_reconciler(binance_raw, local)
+        with (
+            patch(
+                "tradeengine.position_reconciler.settings."
+                "te_reconcile_columnar_min_positions",
+                threshold,
+            ),
+            patch(
+                "tradeengine.position_columns.detect_divergences_columnar",
+                wraps=detect_divergences_columnar,
+            ) as columnar,
+            patch(
+                "tradeengine.position_columns.detect_unhedged_positions_columnar",
+                wraps=detect_unhedged_positions_columnar,
+            ) as columnar_unhedged,
+        ):
+            divergences = await reconciler.reconcile_once()
+        assert columnar.called is expect_columnar
+        assert columnar_unhedged.called is expect_columnar
+        assert {d["category"] for d in divergences} == {
+            "untracked",
+            "ghost",
+            "unhedged",
+        }
+
+
+def test_benchmark_script_smoke():
+    from scripts.benchmark_reconcile import run
+
+    (row,) = run([200], repeat=1)
+    assert row["positions"] == 200
+    assert row["unhedged_columnar_ms"] >= 0
@@ -0,0 +1,133 @@
+"""Unit tests for the pure pre-trade math and the batch compute pool."""
+
+from __future__ import annotations
+
+import functools
+
+import pytest
+
+from tradeengine.compute_pool import ComputePool
+from tradeengine.position_reconciler import (
+    _detect_unhedged_chunk,
+    detect_unhedged_positions,
+)
+from tradeengine.risk.pretrade import (
+    derive_protective_prices,
+    derive_protective_prices_batch,
+    order_amount,
+    percent_filter_decision,
+)
+
+
+def test_order_amount_bases():
+    assert order_amount(0.5, None, 10_000, 100.0, 0.1) == (0.5, "quantity")
+    assert order_amount(0.05, None, 10_000, 100.0, 0.1) == (0.1, "quantity_below_min")
+    assert order_amount(0.5, 0.1, 10_000, 100.0, 0.1) == (10.0, "pct")
+    assert order_amount(None, 0.1, 0, 100.0, 0.1) == (0.1, "pct_unavailable")
+    assert order_amount(None, None, 10_000, 100.0, 0.1) == (0.1, "minimum")
+
+
+def test_percent_filter_decision_matches_the_filter_rules():
+    # Inside the band, non-stop: unchanged.
+    d = percent_filter_decision(101.0, 100.0, 1.05, 0.95, False, 6.0)
+    assert (d.action, d.price) == ("valid", 101.0)
+    # Above the band, non-stop: pulled to the band edge with margin.
+    d = percent_filter_decision(120.0, 100.0, 1.05, 0.95, False, 6.0)
+    assert d.action == "adjusted"
+    assert d.price == pytest.approx(100.0 * 1.05 * 0.99)
+    # Stop farther than the floor allows inside a 5% filter: #541 clamp.
+    d = percent_filter_decision(110.0, 100.0, 1.05, 0.95, True, 6.0)
+    assert d.action == "clamped"
+    assert d.price == pytest.approx(d.max_price)
+    # Stop inside the safety floor of a wide filter: rejected.
+    d = percent_filter_decision(97.0, 100.0, 1.15, 0.85, True, 6.0)
+    assert (d.action, d.price) == ("rejected", None)
+
+
+def test_derive_protective_prices_widens_then_reanchors():
+    # Stored SL 2% under entry is widened to the 6% floor.
+    p = derive_protective_prices("LONG", 98.0, None, 100.0, None, 6.5, 4.0, 6.0)
+    assert p.sl_price == pytest.approx(94.0)
+    assert p.sl_widened_from == 98.0
+    assert p.tp_price == pytest.approx(104.0)
+    # Market already below the fallback SL: re-anchored under the live mark.
+    p = derive_protective_prices("LONG", None, None, 100.0, 93.0, 6.5, 4.0, 6.0)
+    assert p.sl_reanchored_from == pytest.approx(93.5)
+    assert p.sl_price == pytest.approx(93.0 * 0.94)
+    # A floor at/above the widest placeable band leaves no stop: flatten.
+    p = derive_protective_prices("LONG", None, None, 100.0, 93.0, 25.0, 4.0, 25.0)
+    assert p.must_flatten is True
+    # No entry price: stored values pass through untouched.
+    p = derive_protective_prices("SHORT", 105.0, 95.0, None, None, 6.5, 4.0, 6.0)
+    assert (p.sl_price, p.tp_price, p.must_flatten) == (105.0, 95.0, False)
+
+
+def _positions(n: int) -> dict:
+    positions = {}
+    for i in range(n):
+        side = "LONG" if i % 2 else "SHORT"
+        amt = 1.0 if side == "LONG" else -1.0
+        if i % 7 == 0:
+            amt = -amt  # malformed sign
+        positions[(f"SYM{i}USDT", side)] = {
+            "symbol": f"SYM{i}USDT",
+            "positionSide": side,
+            "positionAmt": amt,
+        }
+    return positions
+
+
+def _orders(positions: dict) -> dict:
+    orders = {}
+    for i, (symbol, side) in enumerate(positions):
+        legs = [{"positionSide": side, "type": "STOP_MARKET", "reduceOnly": True}]
+        if i % 3:
+            legs.append(
+                {"positionSide": side, "type": "TAKE_PROFIT_MARKET", "reduceOnly": True}
+            )
+        orders[symbol] = legs
+    return orders
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode", ["off", "thread", "process"])
+async def test_pool_modes_return_the_inline_result_in_order(mode):
+    positions = _positions(300)
+    orders = _orders(positions)
+    pool = ComputePool(mode, max_workers=2, min_batch=50)
+    try:
+        pooled = await pool.map_chunked(
+            functools.partial(_detect_unhedged_chunk, orders),
+            list(positions.items()),
+        )
+    finally:
+        pool.close()
+    assert pooled == detect_unhedged_positions(positions, orders)
+    assert {d["category"] for d in pooled} == {"unhedged", "malformed_position"}
+
+
+@pytest.mark.asyncio
+async def test_small_batches_stay_inline_and_failures_fall_back():
+    calls: list[int] = []
+
+    def record(chunk):
+        calls.append(len(chunk))
+        return chunk
+
+    pool = ComputePool("thread", max_workers=4, min_batch=64)
+    assert await pool.map_chunked(record, range(10)) == list(range(10))
+    assert calls == [10]
+    assert pool.snapshot()["started"] is False
+
+    inputs = [("LONG", None, None, 100.0, None, 6.5, 4.0, 6.0)] * 200
+
+    def flaky(chunk):
+        if len(chunk) < len(inputs):
+            raise RuntimeError("worker died")
+        return derive_protective_prices_batch(chunk)
+
+    broken = ComputePool("thread", max_workers=2, min_batch=10)
+    result = await broken.map_chunked(flaky, inputs)
+    broken.close()
+    assert len(result) == 200
+    assert result[0] == derive_protective_prices(*inputs[0])
@@ -0,0 +1,106 @@
+"""Unit tests for the built-in sampling profiler and its debug endpoint."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from tradeengine.api_debug_routes import router
+from tradeengine.sampling_profiler import (
+    ProfilerBusyError,
+    SamplingProfiler,
+    to_speedscope,
+)
+
+
+def _spin(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(1000))
+
+
+async def _waiting_coroutine() -> None:
+    await asyncio.sleep(10)
+
+
+@pytest.mark.asyncio
+async def test_profile_folds_thread_and_task_stacks():
+    profiler = SamplingProfiler()
+    stop = threading.Event()
+    worker = threading.Thread(target=_spin, args=(stop,), name="spinner")
+    worker.start()
+    waiter = asyncio.create_task(_waiting_coroutine(), name="waiter")
+    try:
+        profile = await profiler.profile(0.3, rate_hz=200)
+    finally:
+        stop.set()
+        worker.join()
+        waiter.cancel()
+
+    collapsed = profile.collapsed()
+    spinner = [line for line in collapsed.splitlines() if "thread:spinner" in line]
+    assert spinner and all("_spin (" in line for line in spinner)
+    assert any(
+        line.startswith("task:waiter;_waiting_coroutine (")
+        for line in collapsed.splitlines()
+    )
+    assert not any("sampling-profiler" in line for line in collapsed.splitlines())
+
+    doc = to_speedscope(profile)
+    assert [p["name"] for p in doc["profiles"]] == [
+        "tradeengine threads",
+        "tradeengine tasks",
+    ]
+    threads = doc["profiles"][0]
+    assert len(threads["samples"]) == len(threads["weights"])
+    assert max(i for s in threads["samples"] for i in s) < len(doc["shared"]["frames"])
+
+
+@pytest.mark.asyncio
+async def test_one_profile_at_a_time():
+    profiler = SamplingProfiler()
+    first = asyncio.create_task(profiler.profile(0.1, include_tasks=False))
+    await asyncio.sleep(0)
+    with pytest.raises(ProfilerBusyError):
+        await profiler.profile(0.1)
+    await first
+    assert not profiler.busy
+
+
+def test_profile_endpoint_requires_token():
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+
+    with patch("tradeengine.api_debug_routes.settings.te_debug_token", ""):
+        assert client.get("/debug/profile?seconds=0.1").status_code == 403
+    with patch("tradeengine.api_debug_routes.settings.te_debug_token", "s3cret"):
+        assert client.get("/debug/profile?seconds=0.1").status_code == 401
+        response = client.get(
+            "/debug/profile?seconds=0.1&tasks=false",
+            headers={"Authorization": "Bearer s3cret"},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        too_long = client.get(
+            "/debug/profile?seconds=3600", headers={"Authorization": "Bearer s3cret"}
+        )
+        assert too_long.status_code == 400
+
+
+def test_loop_endpoint_requires_token():
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+
+    with patch("tradeengine.api_debug_routes.settings.te_debug_token", ""):
+        assert client.get("/debug/loop").status_code == 403
+    with patch("tradeengine.api_debug_routes.settings.te_debug_token", "s3cret"):
+        assert client.get("/debug/loop").status_code == 401
+        response = client.get("/debug/loop", headers={"Authorization": "Bearer s3cret"})
+        assert response.status_code == 200
+        assert "offenders" in response.json()
@@ -0,0 +1,134 @@
+"""Signal capture file round-trip and replay pacing."""
+
+from __future__ import annotations
+
+import json
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from shared.config import settings
+from shared.constants import UTC
+from shared.distributed_lock import distributed_lock_manager
+from tradeengine.consumer import SignalConsumer
+from tradeengine.services.data_manager_client import BaseDataManagerClient
+from tradeengine.signal_capture import (
+    CapturedSignal,
+    SignalCaptureWriter,
+    read_capture,
+    replay,
+)
+
+
+def _payload(
+    symbol: str = "BTCUSDT", age_seconds: float = 0.0, source: str = "test"
+) -> bytes:
+    sent = datetime.now(UTC) - timedelta(seconds=age_seconds)
+    return json.dumps(
+        {
+            "strategy_id": "s1",
+            "symbol": symbol,
+            "action": "buy",
+            "confidence": 0.9,
+            "price": 50_000.0,
+            "quantity": 0.01,
+            "current_price": 50_000.0,
+            "source": source,
+            "strategy": "test",
+            "timestamp": sent.isoformat(),
+        }
+    ).encode()
+
+
+@pytest.mark.asyncio
+async def test_consumer_captures_raw_messages_before_parsing(tmp_path):
+    path = str(tmp_path / "signals.bin")
+    consumer = SignalConsumer(dispatcher=MagicMock())
+    consumer.dispatcher.dispatch = AsyncMock(return_value={"status": "executed"})
+    consumer.capture = SignalCaptureWriter(path)
+
+    good = _payload()
+    for data in (good, b"{not json"):
+        await consumer._message_handler(
+            SimpleNamespace(subject="signals.trading", data=data, reply=None)
+        )
+    await consumer.stop_consuming()
+
+    records = list(read_capture(path))
+    assert [r.payload for r in records] == [good, b"{not json"]
+    assert {r.subject for r in records} == {"signals.trading"}
+    assert all(abs(r.received_at - time.time()) < 5 for r in records)
+
+    # Reopening appends rather than truncating.
+    writer = SignalCaptureWriter(path)
+    writer.write("signals.trading", good)
+    writer.close()
+    assert len(list(read_capture(path))) == 3
+
+    # A crash mid-append leaves a partial record; reading stops before it.
+    with open(path, "ab") as f:
+        f.write(b"\x00\x01\x02")
+    assert len(list(read_capture(path))) == 3
+
+
+@pytest.mark.asyncio
+async def test_replay_paces_and_preserves_signal_age():
+    now = time.time()
+    records = [
+        CapturedSignal(now - 60, "s", _payload("BTCUSDT", age_seconds=61)),
+        CapturedSignal(now - 59.8, "s", _payload("ETHUSDT", age_seconds=60)),
+        CapturedSignal(now - 59.6, "s", b"garbage"),
+    ]
+    seen = []
+
+    async def dispatch(signal):
+        seen.append((signal.symbol, datetime.now(UTC) - signal.timestamp))
+        return {"status": "executed"}
+
+    dispatcher = SimpleNamespace(dispatch=dispatch)
+
+    stats = await replay(dispatcher, records, speed=2.0)
+    assert [s for s, _ in seen] == ["BTCUSDT", "ETHUSDT"]
+    # Ages are what they were on arrival (1s and 0.2s), not a minute.
+    assert abs(seen[0][1].total_seconds() - 1.0) < 0.5
+    assert abs(seen[1][1].total_seconds() - 0.2) < 0.5
+    assert stats.signals == 3 and stats.errors == 1
+    assert stats.statuses == {"executed": 2, "error": 1}
+    assert stats.wall_seconds >= 0.2 - 0.02  # 0.4s of capture at 2x
+
+    seen.clear()
+    fast = await replay(dispatcher, records, speed=0)
+    assert fast.wall_seconds < 0.1
+    assert len(seen) == 2
+
+
+@pytest.mark.asyncio
+async def test_replay_script_runs_the_real_dispatcher_offline(tmp_path):
+    from scripts.replay_signals import run
+
+    path = str(tmp_path / "signals.bin")
+    writer = SignalCaptureWriter(path)
+    for symbol in ("BTCUSDT", "ETHUSDT"):
+        writer.write("signals.trading", _payload(symbol, source="petrosa-cio"))
+    writer.close()
+    retry_request = BaseDataManagerClient._retry_request
+    nats_enabled = settings.nats_enabled
+
+    with (
+        patch.object(
+            distributed_lock_manager, "acquire_lock", side_effect=AssertionError
+        ) as acquire_lock,
+        patch("nats.connect", side_effect=AssertionError) as nats_connect,
+    ):
+        summary = await run(path, speed=0, limit=None)
+
+    assert summary["signals"] == 2 and summary["errors"] == 0
+    assert "error" not in summary["statuses"]
+    acquire_lock.assert_not_called()
+    nats_connect.assert_not_called()
+    # Everything swapped for the run is put back.
+    assert BaseDataManagerClient._retry_request is retry_request
+    assert settings.nats_enabled == nats_enabled
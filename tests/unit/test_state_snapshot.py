@@ -0,0 +1,169 @@
+"""Unit tests for the warm-restart state snapshot."""
+
+from __future__ import annotations
+
+import time
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from contracts.order import OrderType, TradeOrder
+from tradeengine.dispatcher import Dispatcher
+from tradeengine.exchange_truth_store import ExchangeTruthStore
+from tradeengine.state_snapshot import (
+    SnapshotError,
+    StateSnapshotter,
+    TradingStateSnapshot,
+    capture,
+    decode,
+    encode,
+)
+from tradeengine.strategy_position_manager import StrategyPositionManager
+
+
+def _oco(sl: str, tp: str) -> dict:
+    return {
+        "position_id": f"pos-{sl}",
+        "sl_order_id": sl,
+        "tp_order_id": tp,
+        "symbol": "BTCUSDT",
+        "position_side": "LONG",
+        "status": "active",
+        "quantity": 0.01,
+        "created_at": 1.0,
+    }
+
+
+def _algo(algo_id: int, symbol: str, side: str, order_type: str) -> dict:
+    return {
+        "algoId": algo_id,
+        "symbol": symbol,
+        "positionSide": side,
+        "type": order_type,
+    }
+
+
+def _dispatcher() -> Dispatcher:
+    disp = Dispatcher(exchange=MagicMock())
+    disp.oco_manager.active_oco_pairs = {"BTCUSDT_LONG": [_oco("11", "12")]}
+    disp.oco_manager.pending_entries = {
+        "900": {
+            "order": TradeOrder(
+                symbol="ETHUSDT",
+                side="buy",
+                type=OrderType.CONDITIONAL_LIMIT,
+                amount=0.5,
+                target_price=2000.0,
+            ),
+            "symbol": "ETHUSDT",
+            "entry_order_id": "900",
+            "registered_at": 5.0,
+        }
+    }
+    disp.position_manager.positions = {
+        ("BTCUSDT", "LONG"): {
+            "symbol": "BTCUSDT",
+            "position_side": "LONG",
+            "quantity": 0.01,
+            "avg_price": 50_000.0,
+            "entry_time": datetime(2026, 1, 2, tzinfo=UTC),
+        }
+    }
+    disp.position_manager.daily_pnl = 12.5
+    return disp
+
+
+def test_round_trip_and_rejects_damaged_files():
+    snapshot = capture(_dispatcher())
+    restored = decode(encode(snapshot))
+
+    assert restored == snapshot
+    assert restored.positions[("BTCUSDT", "LONG")]["entry_time"] == datetime(
+        2026, 1, 2, tzinfo=UTC
+    )
+
+    data = bytearray(encode(snapshot))
+    data[-1] ^= 0xFF
+    with pytest.raises(SnapshotError, match="checksum"):
+        decode(bytes(data))
+    with pytest.raises(SnapshotError, match="version"):
+        decode(b"TESNAP\x00\x63" + bytes(data[8:]))
+    with pytest.raises(SnapshotError):
+        decode(b"garbage")
+
+
+def test_snapshotter_ignores_stale_or_foreign_snapshots(tmp_path):
+    disp = _dispatcher()
+    snapshotter = StateSnapshotter(disp, tmp_path / "state.bin", max_age_seconds=60)
+    assert snapshotter.load() is None
+
+    snapshotter.save()
+    assert snapshotter.load() is not None
+    assert [p.name for p in tmp_path.iterdir()] == ["state.bin"]
+
+    stale = TradingStateSnapshot(taken_at=time.time() - 120)
+    (tmp_path / "state.bin").write_bytes(encode(stale))
+    assert snapshotter.load() is None
+
+    foreign = TradingStateSnapshot(taken_at=time.time(), account_id="sub1")
+    (tmp_path / "state.bin").write_bytes(encode(foreign))
+    assert snapshotter.load() is None
+
+
+@pytest.mark.asyncio
+async def test_warm_restore_reconciles_only_untracked_orders(tmp_path):
+    source = _dispatcher()
+    StateSnapshotter(source, tmp_path / "state.bin").save()
+
+    disp = Dispatcher(exchange=MagicMock())
+    warm = StateSnapshotter(disp, tmp_path / "state.bin").load()
+    assert warm is not None
+    disp.position_manager.restore_state(warm)
+    disp.oco_manager.restore_state(warm.oco_pairs, warm.pending_entries)
+
+    assert disp.position_manager.positions == source.position_manager.positions
+    assert disp.position_manager.daily_pnl == 12.5
+    entry = disp.oco_manager.pending_entries["900"]
+    assert isinstance(entry["order"], TradeOrder)
+    assert entry["order"].target_price == 2000.0
+
+    disp.oco_manager.exchange.get_open_algo_orders = AsyncMock(
+        return_value=[
+            _algo(11, "BTCUSDT", "LONG", "STOP_MARKET"),
+            _algo(12, "BTCUSDT", "LONG", "TAKE_PROFIT_MARKET"),
+            _algo(21, "SOLUSDT", "SHORT", "STOP_MARKET"),
+            _algo(22, "SOLUSDT", "SHORT", "TAKE_PROFIT_MARKET"),
+        ]
+    )
+    disp.oco_manager.start_monitoring = AsyncMock()  # type: ignore[method-assign]
+
+    assert await disp.oco_manager.reconcile_from_exchange() == 1
+    assert len(disp.oco_manager.active_oco_pairs["BTCUSDT_LONG"]) == 1
+    assert disp.oco_manager.active_oco_pairs["SOLUSDT_SHORT"][0]["sl_order_id"] == "21"
+
+
+def test_strategy_state_and_stream_time_round_trip():
+    disp = _dispatcher()
+    store = ExchangeTruthStore()
+    store._last_updated = datetime(2026, 3, 4, 5, 6, tzinfo=UTC)
+    disp.user_data_consumer = MagicMock(store=store)
+    manager = StrategyPositionManager()
+    manager.strategy_positions = {"sp1": {"symbol": "BTCUSDT", "status": "open"}}
+    manager.contributions = {"BTCUSDT_LONG": [{"strategy_position_id": "sp1"}]}
+
+    with patch("tradeengine.dispatcher.strategy_position_manager", manager):
+        snapshot = decode(encode(capture(disp)))
+
+    assert snapshot.last_user_data_event == store.last_updated
+    restored = StrategyPositionManager()
+    restored.strategy_positions = {"sp2": {"status": "open"}}
+    restored.restore_state(
+        snapshot.strategy_positions or {},
+        snapshot.exchange_positions or {},
+        snapshot.contributions or {},
+    )
+    assert set(restored.strategy_positions) == {"sp1", "sp2"}
+    assert restored.get_contributions("BTCUSDT_LONG") == [
+        {"strategy_position_id": "sp1"}
+    ]
@@ -0,0 +1,197 @@
+"""Several Binance accounts in one tradeengine process.
+
+``TE_ACCOUNTS=main,sub1,sub2`` turns one pod into N account contexts. The
+first id is the primary account: it is the ``binance_exchange`` /
+``dispatcher`` pair the API routes have always used, reads
+``BINANCE_API_KEY`` / ``BINANCE_API_SECRET`` and owns the process-wide
+singletons. Every further id gets its own :class:`BinanceFuturesExchange`
+(credentials from ``BINANCE_API_KEY_<ID>`` / ``BINANCE_API_SECRET_<ID>``)
+and :class:`Dispatcher` — position manager, OCO monitor and user-data
+stream are per account, because their state is.
+
+What does not depend on the API key is shared: the exchange-info table,
+HTTP connection pool, ticker cache and rate monitor
+(:class:`SharedExchangeResources`), the NATS signal consumer and the
+heartbeat monitor. The consumer hands signals to :meth:`AccountRegistry.dispatch`,
+which routes on ``Signal.account_id`` (unset means the primary).
+
+With ``TE_ACCOUNTS`` empty the registry holds the primary only and the
+process behaves as a single-account deployment.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import re
+from dataclasses import dataclass
+from typing import Any
+
+from contracts.signal import Signal
+from shared.config import settings
+from tradeengine.dispatcher import Dispatcher
+from tradeengine.exchange.binance import BinanceFuturesExchange
+from tradeengine.exchange.shared_resources import SharedExchangeResources
+
+logger = logging.getLogger(__name__)
+
+
+def parse_account_ids(raw: str) -> list[str]:
+    """Account ids from ``TE_ACCOUNTS``, in order, without blanks or repeats."""
+    ids: list[str] = []
+    for part in (raw or "").split(","):
+        account_id = part.strip()
+        if account_id and account_id not in ids:
+            ids.append(account_id)
+    return ids
+
+
+def credentials_for(account_id: str) -> tuple[str, str]:
+    """``BINANCE_API_KEY_<ID>`` / ``BINANCE_API_SECRET_<ID>`` for an account."""
+    suffix = re.sub(r"\W", "_", account_id).upper()
+    return (
+        os.getenv(f"BINANCE_API_KEY_{suffix}", ""),
+        os.getenv(f"BINANCE_API_SECRET_{suffix}", ""),
+    )
+
+
+@dataclass
+class AccountContext:
+    """One account's exchange client and dispatcher."""
+
+    account_id: str
+    exchange: BinanceFuturesExchange
+    dispatcher: Dispatcher
+    primary: bool = False
+    ready: bool = False
+    error: str | None = None
+
+
+class AccountRegistry:
+    """Account contexts hosted by this process and the signal router over them."""
+
+    def __init__(
+        self,
+        primary: AccountContext,
+        shared: SharedExchangeResources | None = None,
+    ) -> None:
+        self.primary = primary
+        self.shared = shared
+        self.accounts: dict[str, AccountContext] = {primary.account_id: primary}
+
+    @classmethod
+    def from_settings(cls) -> AccountRegistry:
+        ids = parse_account_ids(settings.te_accounts)
+        shared = SharedExchangeResources.from_settings() if ids else None
+        primary_exchange = BinanceFuturesExchange(shared=shared)
+        registry = cls(
+            AccountContext(
+                account_id=ids[0] if ids else "default",
+                exchange=primary_exchange,
+                dispatcher=Dispatcher(exchange=primary_exchange),
+                primary=True,
+            ),
+            shared=shared,
+        )
+        for account_id in ids[1:]:
+            registry.add(account_id, *credentials_for(account_id))
+        return registry
+
+    def add(self, account_id: str, api_key: str, api_secret: str) -> AccountContext:
+        """Register a secondary account sharing the primary's resources."""
+        if account_id in self.accounts:
+            raise ValueError(f"account {account_id!r} is already registered")
+        exchange = BinanceFuturesExchange(
+            account_id=account_id,
+            api_key=api_key,
+            api_secret=api_secret,
+            shared=self.shared,
+        )
+        dispatcher = Dispatcher(exchange=exchange, account_id=account_id)
+        dispatcher.heartbeat_monitor = self.primary.dispatcher.heartbeat_monitor
+        context = AccountContext(account_id, exchange, dispatcher)
+        self.accounts[account_id] = context
+        return context
+
+    @property
+    def secondaries(self) -> list[AccountContext]:
+        return [ctx for ctx in self.accounts.values() if not ctx.primary]
+
+    async def _start(self, ctx: AccountContext) -> None:
+        try:
+            await ctx.exchange.initialize()
+            if ctx.exchange.client is None:
+                raise RuntimeError("credentials missing")
+            await ctx.exchange.start_ping_loop()
+            await ctx.dispatcher.initialize()
+            ctx.ready = True
+            logger.info("Account %s ready", ctx.account_id)
+        except Exception as e:
+            ctx.error = str(e)
+            logger.error("Account %s failed to start: %s", ctx.account_id, e)
+
+    async def start_secondaries(self) -> None:
+        """Initialise every secondary account concurrently.
+
+        Runs after the primary is up (it fills the shared exchange info).
+        A failing account is reported in :meth:`snapshot` and rejects its
+        signals; it never takes the others down.
+        """
+        await asyncio.gather(*(self._start(ctx) for ctx in self.secondaries))
+
+    def route(self, signal: Signal) -> AccountContext | None:
+        account_id = signal.account_id
+        if not account_id:
+            return self.primary
+        return self.accounts.get(account_id)
+
+    async def dispatch(self, signal: Signal, **kwargs: Any) -> dict[str, Any]:
+        """Hand ``signal`` to its account's dispatcher."""
+        ctx = self.route(signal)
+        if ctx is None or not (ctx.primary or ctx.ready):
+            reason = "unknown_account" if ctx is None else "account_not_ready"
+            logger.warning(
+                "Rejecting signal %s for account %s: %s",
+                signal.strategy_id,
+                signal.account_id,
+                reason,
+            )
+            return {
+                "status": "rejected",
+                "reason": reason,
+                "account_id": signal.account_id,
+                "symbol": signal.symbol,
+            }
+        return await ctx.dispatcher.dispatch(signal, **kwargs)
+
+    async def initialize(self) -> None:
+        """Dispatcher-compatible no-op; the lifespan graph starts each account."""
+
+    async def close(self) -> None:
+        """Stop every secondary account, then the shared resources."""
+        for ctx in self.secondaries:
+            try:
+                await ctx.exchange.stop_ping_loop()
+                await ctx.exchange.close()
+                await ctx.dispatcher.close()
+            except Exception as e:
+                logger.error("Account %s shutdown error: %s", ctx.account_id, e)
+        if self.shared is not None:
+            await self.shared.close()
+
+    def snapshot(self) -> dict[str, Any]:
+        ready = all(ctx.primary or ctx.ready for ctx in self.accounts.values())
+        return {
+            "status": "healthy" if ready else "degraded",
+            "primary": self.primary.account_id,
+            "accounts": {
+                account_id: {
+                    "primary": ctx.primary,
+                    "ready": ctx.primary or ctx.ready,
+                    "error": ctx.error,
+                }
+                for account_id, ctx in self.accounts.items()
+            },
+            "shared": self.shared.snapshot() if self.shared is not None else None,
+        }
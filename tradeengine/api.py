@@ -42,25 +42,30 @@ from contracts.order import TradeOrder
 from contracts.signal import Signal
 from shared.audit import audit_logger
 from shared.config import Settings
+from shared.log_budget import install as install_log_budget
 from shared.mysql_client import position_client
+from tradeengine.accounts import AccountRegistry
 from tradeengine.api_config_routes import (
     router as config_router,
     set_config_manager,
 )
+from tradeengine.api_debug_routes import router as debug_router
 from tradeengine.api_filter_routes import (
     router as filter_router,
     set_config_manager as set_filter_config_manager,
 )
+from tradeengine.compute_pool import compute_pool
 from tradeengine.config_manager import TradingConfigManager
 from tradeengine.db.mongodb_client import config_client
-from tradeengine.dispatcher import Dispatcher
-from tradeengine.exchange.binance import BinanceFuturesExchange
 from tradeengine.exchange.simulator import SimulatorExchange
+from tradeengine.loop_monitor import loop_monitor
+from tradeengine.metric_handles import otel_batcher
 from tradeengine.position_health_guard import (
     PositionStopsHealthResponse,
     check_position_stops,
 )
 from tradeengine.services.execution_event_publisher import execution_event_publisher
+from tradeengine.startup_graph import StartupGraph
 from tradeengine.strategy_position_manager import (
     strategy_position_manager as _strategy_position_manager,
 )
@@ -97,9 +102,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         except Exception as e:
             logger.error(f"Failed to initialize telemetry: {e}")
 
+    # Telemetry may have added log handlers; put them under the log budget
+    install_log_budget()
+
+    # Replays the hot-path OTel dual-export updates in batches
+    otel_batcher.start()
+    if settings.te_loop_monitor_enabled:
+        loop_monitor.start()
+
     # Initialize components
     startup_success = True
     consumer_task = None  # Keep reference to prevent garbage collection
+    startup: StartupGraph | None = None
 
     try:
         # Validate MongoDB configuration first - fail catastrophically if not configured
@@ -109,22 +123,6 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         validate_mongodb_config()
         logger.info("✅ MongoDB configuration validated successfully")
 
-        # Initialize trading configuration manager
-        logger.info("Initializing trading configuration manager...")
-
-        trading_config_manager = TradingConfigManager(
-            mongodb_client=config_client, cache_ttl_seconds=60
-        )
-        await trading_config_manager.start()
-
-        # Set global config manager for API routes
-        set_config_manager(trading_config_manager)
-        set_filter_config_manager(trading_config_manager)
-
-        # Store in app state
-        app.state.trading_config_manager = trading_config_manager
-        logger.info("✅ Trading configuration manager initialized")
-
         # Initialize and register configuration rate limiter
         if ConfigRateLimiter:
             rate_limiter = ConfigRateLimiter(
@@ -146,91 +144,130 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         else:
             logger.info("Audit logging disabled")
 
-        # Initialize exchanges
-        logger.info("Initializing Binance exchange...")
-        await binance_exchange.initialize()
+        # Startup dependency graph: independent initialisers run concurrently,
+        # each step starts once the steps it names in ``after`` succeeded.
+        # Readiness waits for the critical steps only; the rest finish in the
+        # background and report through /ready's ``startup`` section.
+        from shared.config import settings as _te_settings
 
-        # TEST BINANCE CONNECTION AND BALANCE
-        try:
-            logger.info("🧪 TESTING BINANCE CONNECTION AND BALANCE...")
-            account_info = await binance_exchange.get_account_info()
-            usdt_balance: dict[str, Any] = next(
-                (a for a in account_info.get("assets", []) if a.get("asset") == "USDT"),
-                {},
-            )
-            logger.info(
-                f"💰 BINANCE ACCOUNT STATUS: "
-                f"USDT Balance: {usdt_balance.get('availableBalance', 'N/A')} | "
-                f"Total Wallet: {usdt_balance.get('walletBalance', 'N/A')} | "
-                f"Can Trade: {account_info.get('can_trade')}"
+        startup = StartupGraph()
+        app.state.startup_graph = startup
+
+        async def _start_config_manager() -> None:
+            logger.info("Initializing trading configuration manager...")
+
+            trading_config_manager = TradingConfigManager(
+                mongodb_client=config_client, cache_ttl_seconds=60
             )
+            await trading_config_manager.start()
 
-            # Test specific symbol info
-            ticker = await binance_exchange.get_symbol_price("BTCUSDT")
-            logger.info(f"📈 BTCUSDT Connection Test: Current Price ${ticker:,.2f}")
+            # Set global config manager for API routes
+            set_config_manager(trading_config_manager)
+            set_filter_config_manager(trading_config_manager)
 
-        except Exception as test_error:
-            logger.error(f"❌ BINANCE CONNECTION TEST FAILED: {test_error}")
+            # Store in app state
+            app.state.trading_config_manager = trading_config_manager
+            logger.info("✅ Trading configuration manager initialized")
 
-        logger.info("Initializing simulator exchange...")
+        async def _init_binance() -> None:
+            logger.info("Initializing Binance exchange...")
+            await binance_exchange.initialize()
 
-        # Start Binance background ping loop (decouples /ready from exchange latency)
-        await binance_exchange.start_ping_loop()
-        logger.info("✅ Binance background ping loop started")
+        async def _probe_binance() -> None:
+            # TEST BINANCE CONNECTION AND BALANCE
+            try:
+                logger.info("🧪 TESTING BINANCE CONNECTION AND BALANCE...")
+                account_info = await binance_exchange.get_account_info()
+                usdt_balance: dict[str, Any] = next(
+                    (
+                        a
+                        for a in account_info.get("assets", [])
+                        if a.get("asset") == "USDT"
+                    ),
+                    {},
+                )
+                logger.info(
+                    f"💰 BINANCE ACCOUNT STATUS: "
+                    f"USDT Balance: {usdt_balance.get('availableBalance', 'N/A')} | "
+                    f"Total Wallet: {usdt_balance.get('walletBalance', 'N/A')} | "
+                    f"Can Trade: {account_info.get('can_trade')}"
+                )
 
-        # Initialize dispatcher
-        logger.info("Initializing dispatcher...")
-        await dispatcher.initialize()
+                # Test specific symbol info
+                ticker = await binance_exchange.get_symbol_price("BTCUSDT")
+                logger.info(f"📈 BTCUSDT Connection Test: Current Price ${ticker:,.2f}")
 
-        # AC1-AC3, AC6 (#451): Run DataManager boot probe — gate /readyz on result
-        try:
-            from tradeengine.services.data_manager_boot_probe import (
-                DataManagerBootProbe,
-            )
+            except Exception as test_error:
+                logger.error(f"❌ BINANCE CONNECTION TEST FAILED: {test_error}")
+
+        async def _start_ping_loop() -> None:
+            # Start Binance background ping loop (decouples /ready from exchange latency)
+            await binance_exchange.start_ping_loop()
+            logger.info("✅ Binance background ping loop started")
+
+        async def _init_dispatcher() -> None:
+            logger.info("Initializing dispatcher...")
+            await dispatcher.initialize()
+
+        async def _run_dm_boot_probe() -> None:
+            # AC1-AC3, AC6 (#451): Run DataManager boot probe — gate /readyz on result
+            try:
+                from tradeengine.services.data_manager_boot_probe import (
+                    DataManagerBootProbe,
+                )
 
-            _dm_url = os.getenv("DATA_MANAGER_URL", "http://petrosa-data-manager:8000")
-            _probe = DataManagerBootProbe(base_url=_dm_url)
-            _probe_result = await _probe.run(pod_name=os.getenv("HOSTNAME", "unknown"))
-            app.state.dm_boot_probe_result = _probe_result
-            if not _probe_result.success:
+                _dm_url = os.getenv(
+                    "DATA_MANAGER_URL", "http://petrosa-data-manager:8000"
+                )
+                _probe = DataManagerBootProbe(base_url=_dm_url)
+                _probe_result = await _probe.run(
+                    pod_name=os.getenv("HOSTNAME", "unknown")
+                )
+                app.state.dm_boot_probe_result = _probe_result
+                if not _probe_result.success:
+                    logger.error(
+                        "❌ DataManager boot probe FAILED — failure_mode=%s. "
+                        "Pod readiness is gated until this is resolved.",
+                        _probe_result.failure_mode,
+                    )
+                else:
+                    logger.info(
+                        "✅ DataManager boot probe passed (probe_id=%s)",
+                        _probe_result.probe_id,
+                    )
+            except Exception as _probe_exc:
                 logger.error(
-                    "❌ DataManager boot probe FAILED — failure_mode=%s. "
-                    "Pod readiness is gated until this is resolved.",
-                    _probe_result.failure_mode,
+                    "DataManager boot probe raised an unexpected exception: %s",
+                    _probe_exc,
                 )
-            else:
-                logger.info(
-                    "✅ DataManager boot probe passed (probe_id=%s)",
-                    _probe_result.probe_id,
+                app.state.dm_boot_probe_result = None
+
+        def _reconciler_enabled() -> bool:
+            # #540: decouple the watchdog from `simulation_enabled`. The live
+            # deployment sets TE_NAKED_POSITION_REMEDIATION_MODE but leaves
+            # SIMULATION_ENABLED at its True default, so the legacy gate
+            # (`enabled AND not simulation_enabled`) evaluated False and the
+            # reconciler/remediator were never constructed — `arm_only` was a
+            # silent no-op while real orders filled on Binance. A naked-position
+            # safety net must run whenever real orders can be placed. Default
+            # (`position_reconciliation_requires_live_only=False`) starts the
+            # watchdog whenever reconciliation is enabled; set the flag True to
+            # restore the old sim-gated behavior.
+            _reconciliation_enabled = _te_settings.position_reconciliation_enabled
+            _real_trading_active = not _te_settings.simulation_enabled
+            if _te_settings.position_reconciliation_requires_live_only:
+                _should_start_reconciler = (
+                    _reconciliation_enabled and _real_trading_active
                 )
-        except Exception as _probe_exc:
-            logger.error(
-                "DataManager boot probe raised an unexpected exception: %s", _probe_exc
-            )
-            app.state.dm_boot_probe_result = None
+            else:
+                _should_start_reconciler = _reconciliation_enabled
+            return _should_start_reconciler
 
-        # Start position reconciler (FR65 / AC1)
-        from shared.config import settings as _te_settings
-        from tradeengine.position_reconciler import PositionReconciler
-
-        # #540: decouple the watchdog from `simulation_enabled`. The live
-        # deployment sets TE_NAKED_POSITION_REMEDIATION_MODE but leaves
-        # SIMULATION_ENABLED at its True default, so the legacy gate
-        # (`enabled AND not simulation_enabled`) evaluated False and the
-        # reconciler/remediator were never constructed — `arm_only` was a
-        # silent no-op while real orders filled on Binance. A naked-position
-        # safety net must run whenever real orders can be placed. Default
-        # (`position_reconciliation_requires_live_only=False`) starts the
-        # watchdog whenever reconciliation is enabled; set the flag True to
-        # restore the old sim-gated behavior.
-        _reconciliation_enabled = _te_settings.position_reconciliation_enabled
-        _real_trading_active = not _te_settings.simulation_enabled
-        if _te_settings.position_reconciliation_requires_live_only:
-            _should_start_reconciler = _reconciliation_enabled and _real_trading_active
-        else:
-            _should_start_reconciler = _reconciliation_enabled
+        def _build_reconciler(
+            exchange: Any, account_dispatcher: Any
+        ) -> tuple[Any, Any]:
+            from tradeengine.position_reconciler import PositionReconciler
 
-        if _should_start_reconciler:
             # #445: optionally attach the exchange-authoritative naked-position
             # remediator. Default mode "off" preserves read-only FR65 behavior.
             _remediator = None
@@ -240,9 +277,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
                 )
 
                 _remediator = NakedPositionRemediator(
-                    exchange=binance_exchange,
-                    position_manager=dispatcher.position_manager,
-                    close_position=dispatcher.close_position_with_cleanup,
+                    exchange=exchange,
+                    position_manager=account_dispatcher.position_manager,
+                    close_position=account_dispatcher.close_position_with_cleanup,
                     # Settings stores the mode as a free-form str; the
                     # remediator's _coerce_mode() validates/normalizes it (and
                     # falls back to "off" on garbage), so passing str is safe.
@@ -255,6 +292,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
                     # of re-arming with a guaranteed-to-fail price (#second-wave
                     # OCO-orphan: 2.4% strategy SL vs 6% floor deadlock).
                     min_sl_distance_pct=_te_settings.te_min_sl_distance_pct,
+                    compute_pool=compute_pool,
                 )
             except Exception:
                 logger.exception(
@@ -264,160 +302,228 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
                 _remediator = None
 
             _reconciler = PositionReconciler(
-                exchange=binance_exchange,
-                position_manager=dispatcher.position_manager,
+                exchange=exchange,
+                position_manager=account_dispatcher.position_manager,
                 interval_seconds=_te_settings.position_reconciliation_interval_seconds,
                 remediator=_remediator,
+                compute_pool=compute_pool,
             )
-            await _reconciler.start()
-            app.state.position_reconciler = _reconciler
-            app.state.naked_position_remediator = _remediator
-
-            # #500: surface the EFFECTIVE remediation mode prominently and
-            # export it as a metric so operators can alert when the watchdog
-            # is detection-only. Use the remediator's coerced .mode (falls
-            # back to "off" on a garbage env) rather than the raw setting so
-            # the log/metric reflect reality. A fresh deploy with an unset
-            # TE_NAKED_POSITION_REMEDIATION_MODE now defaults to "dry_run".
-            _effective_mode = (
-                _remediator.mode
-                if _remediator is not None
-                else _te_settings.naked_position_remediation_mode
-            )
-            from tradeengine.metrics import (
-                set_naked_position_remediation_mode,
-                set_position_reconciler_running,
-            )
-
-            set_naked_position_remediation_mode(_effective_mode)
-            # #540: reconciler is running — clear the skip-while-live alert.
-            set_position_reconciler_running(True, skipped_while_live=False)
-            logger.info(
-                "✅ Position reconciler started (interval=%ss, "
-                "naked_remediation_mode=%s, simulation_enabled=%s)",
-                _te_settings.position_reconciliation_interval_seconds,
-                _effective_mode,
-                _te_settings.simulation_enabled,
-            )
-            if str(_effective_mode).lower() == "off":
-                # Detection-only: watchdog will count naked positions but never
-                # re-arm or flatten. This should never happen on a default
-                # deploy after #500 — flag it loudly for the operator.
-                logger.warning(
-                    "⚠️ Naked-position remediation mode is 'off' — the watchdog "
-                    "DETECTS naked positions but takes NO corrective action "
-                    "(no re-arm, no flatten). Set "
-                    "TE_NAKED_POSITION_REMEDIATION_MODE to dry_run/arm_only/"
-                    "arm_or_flatten to enable enforcement (#500)."
+            return _reconciler, _remediator
+
+        async def _start_position_reconciler() -> None:
+            # Start position reconciler (FR65 / AC1)
+            _real_trading_active = not _te_settings.simulation_enabled
+            _reconciliation_enabled = _te_settings.position_reconciliation_enabled
+            if _reconciler_enabled():
+                _reconciler, _remediator = _build_reconciler(
+                    binance_exchange, dispatcher
                 )
-        else:
-            # #540 AC4: the reconciler is skipped. If real trading is active
-            # (simulation disabled) this is a dangerous misconfiguration — a
-            # naked position can go un-remediated. Surface it loudly and mark
-            # the alertable metric so it is never silent again. The only way
-            # to reach here with real trading active is the opt-in legacy
-            # `position_reconciliation_requires_live_only=True` path combined
-            # with reconciliation being disabled, or reconciliation disabled
-            # outright.
-            from tradeengine.metrics import set_position_reconciler_running
-
-            _skipped_while_live = _real_trading_active and _reconciliation_enabled
-            set_position_reconciler_running(
-                False, skipped_while_live=_skipped_while_live
-            )
-            if _skipped_while_live:
-                logger.warning(
-                    "🚨 Position reconciler SKIPPED while real trading is "
-                    "ENABLED (simulation_enabled=False) — naked positions will "
-                    "NOT be remediated. This is the #540 misconfiguration. "
-                    "Review position_reconciliation_requires_live_only=%s and "
-                    "position_reconciliation_enabled=%s.",
-                    _te_settings.position_reconciliation_requires_live_only,
-                    _te_settings.position_reconciliation_enabled,
+                await _reconciler.start()
+                app.state.position_reconciler = _reconciler
+                app.state.naked_position_remediator = _remediator
+
+                # #500: surface the EFFECTIVE remediation mode prominently and
+                # export it as a metric so operators can alert when the watchdog
+                # is detection-only. Use the remediator's coerced .mode (falls
+                # back to "off" on a garbage env) rather than the raw setting so
+                # the log/metric reflect reality. A fresh deploy with an unset
+                # TE_NAKED_POSITION_REMEDIATION_MODE now defaults to "dry_run".
+                _effective_mode = (
+                    _remediator.mode
+                    if _remediator is not None
+                    else _te_settings.naked_position_remediation_mode
                 )
-            else:
+                from tradeengine.metrics import (
+                    set_naked_position_remediation_mode,
+                    set_position_reconciler_running,
+                )
+
+                set_naked_position_remediation_mode(_effective_mode)
+                # #540: reconciler is running — clear the skip-while-live alert.
+                set_position_reconciler_running(True, skipped_while_live=False)
                 logger.info(
-                    "⚠️ Position reconciler disabled (simulation=%s, enabled=%s, "
-                    "requires_live_only=%s)",
+                    "✅ Position reconciler started (interval=%ss, "
+                    "naked_remediation_mode=%s, simulation_enabled=%s)",
+                    _te_settings.position_reconciliation_interval_seconds,
+                    _effective_mode,
                     _te_settings.simulation_enabled,
-                    _te_settings.position_reconciliation_enabled,
-                    _te_settings.position_reconciliation_requires_live_only,
                 )
-
-        # Initialize and start NATS consumer
-        logger.info("Initializing NATS consumer...")
-        from tradeengine.consumer import signal_consumer
-
-        # Pass the dispatcher with configured exchange to the consumer
-        consumer_initialized = await signal_consumer.initialize(dispatcher=dispatcher)
-        if consumer_initialized:
-            logger.info("✅ NATS consumer initialized successfully with exchange")
-            # Start consumer in background task and keep strong reference
-            consumer_task = asyncio.create_task(signal_consumer.start_consuming())
-            # Store reference in app state to prevent garbage collection
-            app.state.consumer_task = consumer_task
-
-            # Add error callback to detect if task fails
-            def task_done_callback(task: asyncio.Task) -> None:  # type: ignore[type-arg]
-                try:
-                    task.result()  # This will raise any exception that occurred
-                except nats.errors.ConnectionClosedError as e:
-                    logger.error(
-                        f"❌ NATS consumer connection closed: {e}", exc_info=True
+                if str(_effective_mode).lower() == "off":
+                    # Detection-only: watchdog will count naked positions but never
+                    # re-arm or flatten. This should never happen on a default
+                    # deploy after #500 — flag it loudly for the operator.
+                    logger.warning(
+                        "⚠️ Naked-position remediation mode is 'off' — the watchdog "
+                        "DETECTS naked positions but takes NO corrective action "
+                        "(no re-arm, no flatten). Set "
+                        "TE_NAKED_POSITION_REMEDIATION_MODE to dry_run/arm_only/"
+                        "arm_or_flatten to enable enforcement (#500)."
+                    )
+            else:
+                # #540 AC4: the reconciler is skipped. If real trading is active
+                # (simulation disabled) this is a dangerous misconfiguration — a
+                # naked position can go un-remediated. Surface it loudly and mark
+                # the alertable metric so it is never silent again. The only way
+                # to reach here with real trading active is the opt-in legacy
+                # `position_reconciliation_requires_live_only=True` path combined
+                # with reconciliation being disabled, or reconciliation disabled
+                # outright.
+                from tradeengine.metrics import set_position_reconciler_running
+
+                _skipped_while_live = _real_trading_active and _reconciliation_enabled
+                set_position_reconciler_running(
+                    False, skipped_while_live=_skipped_while_live
+                )
+                if _skipped_while_live:
+                    logger.warning(
+                        "🚨 Position reconciler SKIPPED while real trading is "
+                        "ENABLED (simulation_enabled=False) — naked positions will "
+                        "NOT be remediated. This is the #540 misconfiguration. "
+                        "Review position_reconciliation_requires_live_only=%s and "
+                        "position_reconciliation_enabled=%s.",
+                        _te_settings.position_reconciliation_requires_live_only,
+                        _te_settings.position_reconciliation_enabled,
                     )
-                    logger.info("Reconnecting NATS consumer...")
-                    # nc is already None after stop_consuming() reset it; belt-and-suspenders
-                    signal_consumer.nc = None
+                else:
+                    logger.info(
+                        "⚠️ Position reconciler disabled (simulation=%s, enabled=%s, "
+                        "requires_live_only=%s)",
+                        _te_settings.simulation_enabled,
+                        _te_settings.position_reconciliation_enabled,
+                        _te_settings.position_reconciliation_requires_live_only,
+                    )
+
+        async def _start_secondary_accounts() -> None:
+            # TE_ACCOUNTS: the primary has loaded the shared exchange info;
+            # bring the other accounts up together, each with its own
+            # naked-position watchdog.
+            await account_registry.start_secondaries()
+            if not _reconciler_enabled():
+                return
+            app.state.account_reconcilers = {}
+            for ctx in account_registry.secondaries:
+                if ctx.ready:
+                    _reconciler, _ = _build_reconciler(ctx.exchange, ctx.dispatcher)
+                    await _reconciler.start()
+                    app.state.account_reconcilers[ctx.account_id] = _reconciler
+
+        async def _start_consumer() -> None:
+            nonlocal consumer_task
+
+            # Initialize and start NATS consumer
+            logger.info("Initializing NATS consumer...")
+            from tradeengine.consumer import signal_consumer
+
+            # Pass the dispatcher with configured exchange to the consumer
+            consumer_initialized = await signal_consumer.initialize(
+                dispatcher=account_registry
+                if account_registry.secondaries
+                else dispatcher
+            )
+            if consumer_initialized:
+                logger.info("✅ NATS consumer initialized successfully with exchange")
+                # Start consumer in background task and keep strong reference
+                consumer_task = asyncio.create_task(signal_consumer.start_consuming())
+                # Store reference in app state to prevent garbage collection
+                app.state.consumer_task = consumer_task
+
+                # Add error callback to detect if task fails
+                def task_done_callback(task: asyncio.Task) -> None:  # type: ignore[type-arg]
                     try:
-                        new_task = asyncio.create_task(
-                            signal_consumer.start_consuming()
-                        )
-                        app.state.consumer_task = new_task
-                        new_task.add_done_callback(task_done_callback)
-                        logger.info("✅ NATS consumer reconnect+restart scheduled")
-                    except Exception as restart_error:
+                        task.result()  # This will raise any exception that occurred
+                    except nats.errors.ConnectionClosedError as e:
                         logger.error(
-                            f"❌ Failed to restart NATS consumer: {restart_error}"
-                        )
-                except Exception as e:
-                    logger.error(f"❌ NATS consumer task failed: {e}", exc_info=True)
-                    # Try to restart the consumer on failure
-                    logger.info("Attempting to restart NATS consumer...")
-                    try:
-                        new_task = asyncio.create_task(
-                            signal_consumer.start_consuming()
+                            f"❌ NATS consumer connection closed: {e}", exc_info=True
                         )
-                        app.state.consumer_task = new_task
-                        new_task.add_done_callback(task_done_callback)
-                        logger.info("✅ NATS consumer restarted successfully")
-                    except Exception as restart_error:
+                        logger.info("Reconnecting NATS consumer...")
+                        # nc is already None after stop_consuming() reset it; belt-and-suspenders
+                        signal_consumer.nc = None
+                        try:
+                            new_task = asyncio.create_task(
+                                signal_consumer.start_consuming()
+                            )
+                            app.state.consumer_task = new_task
+                            new_task.add_done_callback(task_done_callback)
+                            logger.info("✅ NATS consumer reconnect+restart scheduled")
+                        except Exception as restart_error:
+                            logger.error(
+                                f"❌ Failed to restart NATS consumer: {restart_error}"
+                            )
+                    except Exception as e:
                         logger.error(
-                            f"❌ Failed to restart NATS consumer: {restart_error}"
+                            f"❌ NATS consumer task failed: {e}", exc_info=True
                         )
+                        # Try to restart the consumer on failure
+                        logger.info("Attempting to restart NATS consumer...")
+                        try:
+                            new_task = asyncio.create_task(
+                                signal_consumer.start_consuming()
+                            )
+                            app.state.consumer_task = new_task
+                            new_task.add_done_callback(task_done_callback)
+                            logger.info("✅ NATS consumer restarted successfully")
+                        except Exception as restart_error:
+                            logger.error(
+                                f"❌ Failed to restart NATS consumer: {restart_error}"
+                            )
 
-            consumer_task.add_done_callback(task_done_callback)
-            logger.info(
-                "✅ NATS consumer started in background with monitoring and auto-restart"
-            )
-        else:
-            logger.warning("⚠️ NATS consumer not initialized (likely disabled)")
+                consumer_task.add_done_callback(task_done_callback)
+                logger.info(
+                    "✅ NATS consumer started in background with monitoring and auto-restart"
+                )
+            else:
+                logger.warning("⚠️ NATS consumer not initialized (likely disabled)")
 
-        # Start health evaluator (publishes evaluator.tradeengine.verdict).
-        # Read-only over existing Prometheus metrics. Guarded so an older
-        # petrosa-otel that lacks the evaluators framework degrades gracefully.
-        try:
-            from tradeengine.evaluators import build_tradeengine_health_evaluator
+        async def _start_health_evaluator() -> None:
+            # Start health evaluator (publishes evaluator.tradeengine.verdict).
+            # Read-only over existing Prometheus metrics. Guarded so an older
+            # petrosa-otel that lacks the evaluators framework degrades gracefully.
+            try:
+                from tradeengine.evaluators import build_tradeengine_health_evaluator
 
-            _evaluator = build_tradeengine_health_evaluator(
-                nats_servers=_te_settings.nats_servers
+                _evaluator = build_tradeengine_health_evaluator(
+                    nats_servers=_te_settings.nats_servers
+                )
+                if _evaluator is not None:
+                    await _evaluator.start()
+                    app.state.health_evaluator = _evaluator
+                    logger.info("✅ Health evaluator started")
+            except ImportError:
+                logger.warning(
+                    "petrosa_otel.evaluators unavailable; health evaluator disabled"
+                )
+
+        startup.add("config_manager", _start_config_manager)
+        startup.add("binance", _init_binance)
+        startup.add("binance_probe", _probe_binance, after=("binance",), critical=False)
+        startup.add("binance_ping_loop", _start_ping_loop, after=("binance",))
+        startup.add("dispatcher", _init_dispatcher, after=("binance",))
+        startup.add("dm_boot_probe", _run_dm_boot_probe)
+        if account_registry.secondaries:
+            startup.add(
+                "secondary_accounts",
+                _start_secondary_accounts,
+                after=("dispatcher",),
+                critical=False,
             )
-            if _evaluator is not None:
-                await _evaluator.start()
-                app.state.health_evaluator = _evaluator
-                logger.info("✅ Health evaluator started")
-        except ImportError:
-            logger.warning(
-                "petrosa_otel.evaluators unavailable; health evaluator disabled"
+        startup.add(
+            "position_reconciler", _start_position_reconciler, after=("dispatcher",)
+        )
+        startup.add(
+            "nats_consumer",
+            _start_consumer,
+            after=("config_manager", "dispatcher", "position_reconciler"),
+        )
+        startup.add("health_evaluator", _start_health_evaluator, critical=False)
+
+        if not await startup.wait_critical():
+            raise RuntimeError(
+                "critical startup steps failed: "
+                + ", ".join(
+                    f"{name} ({step['error']})"
+                    for name, step in startup.report()["steps"].items()
+                    if step["critical"] and step["status"] != "ok"
+                )
             )
 
         logger.info("Trading engine startup completed successfully")
@@ -436,7 +542,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Shutdown
     logger.info("Shutting down Petrosa Trading Engine...")
     try:
-        # Flush telemetry first
+        # Non-critical startup steps may still be running
+        if startup is not None:
+            await startup.cancel_pending()
+
+        await loop_monitor.stop()
+        # Flush telemetry first (batched metric updates before the exporter)
+        await otel_batcher.stop()
         if flush_telemetry:
             flush_telemetry()
             logger.info("✅ Telemetry flushed")
@@ -466,10 +578,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         if hasattr(app.state, "position_reconciler"):
             await app.state.position_reconciler.stop()
             logger.info("✅ Position reconciler stopped")
+        for _account_reconciler in getattr(
+            app.state, "account_reconcilers", {}
+        ).values():
+            await _account_reconciler.stop()
+        compute_pool.close()
 
         # Cancel Binance ping loop before closing exchange
         await binance_exchange.stop_ping_loop()
 
+        await account_registry.close()
         await binance_exchange.close()
         await simulator_exchange.close()
         await dispatcher.close()
@@ -507,11 +625,17 @@ app.include_router(config_router)
 # Include filter API routes
 app.include_router(filter_router)
 
+# Include debug API routes
+app.include_router(debug_router)
+
 # Initialize components
 settings = Settings()
-binance_exchange = BinanceFuturesExchange()
+# The primary account's exchange/dispatcher back every API route; further
+# TE_ACCOUNTS contexts only receive routed signals.
+account_registry = AccountRegistry.from_settings()
+binance_exchange = account_registry.primary.exchange
 simulator_exchange = SimulatorExchange()
-dispatcher = Dispatcher(exchange=binance_exchange)
+dispatcher = account_registry.primary.dispatcher
 
 logger = logging.getLogger(__name__)
 
@@ -591,6 +715,11 @@ async def health_check() -> HealthResponse:
             "binance_exchange": await binance_exchange.health_check(),
             "simulator_exchange": await simulator_exchange.health_check(),
             "audit_logger": audit_logger.health(),
+            **(
+                {"accounts": account_registry.snapshot()}
+                if account_registry.secondaries
+                else {}
+            ),
             "mongodb_config": {
                 "status": "healthy",
                 "configured": True,
@@ -684,6 +813,15 @@ async def readiness_check() -> dict[str, Any]:
 
         validate_mongodb_config()
 
+        # Startup graph: per-step timing, and the non-critical steps that
+        # may still be finishing after the pod went ready
+        _startup = getattr(app.state, "startup_graph", None)
+        startup_report = (
+            _startup.report() if isinstance(_startup, StartupGraph) else None
+        )
+        if startup_report is not None and not startup_report["ready"]:
+            raise HTTPException(status_code=503, detail="Startup in progress")
+
         # AC2 (#451): Gate readiness on boot probe result
         _probe_result = getattr(app.state, "dm_boot_probe_result", None)
         if _probe_result is not None and not _probe_result.success:
@@ -730,7 +868,11 @@ async def readiness_check() -> dict[str, Any]:
         )
 
         if all_healthy:
-            return {"status": "ready", "components": component_status}
+            return {
+                "status": "ready",
+                "components": component_status,
+                "startup": startup_report,
+            }
 
         # Build detailed error message with component details
         failed_components = {
@@ -1437,67 +1579,21 @@ async def get_positions(
     Results are paginated and sortable.
     """
     try:
-        # Get positions from position manager
-        all_positions = dispatcher.position_manager.get_positions()
-
-        # Convert to list if it's a dict
-        if isinstance(all_positions, dict):
-            positions_list = list(all_positions.values())
-        else:
-            positions_list = all_positions
-
-        # Apply filters
-        filtered_positions = positions_list
-
-        if symbol:
-            filtered_positions = [
-                p for p in filtered_positions if p.get("symbol") == symbol
-            ]
-
-        if side:
-            filtered_positions = [
-                p for p in filtered_positions if p.get("side") == side
-            ]
-
-        if status:
-            filtered_positions = [
-                p for p in filtered_positions if p.get("status") == status
-            ]
-
-        if min_size is not None:
-            filtered_positions = [
-                p for p in filtered_positions if p.get("size", 0) >= min_size
-            ]
-
-        if max_size is not None:
-            filtered_positions = [
-                p for p in filtered_positions if p.get("size", 0) <= max_size
-            ]
-
-        if min_pnl is not None:
-            filtered_positions = [
-                p for p in filtered_positions if p.get("pnl", 0) >= min_pnl
-            ]
-
-        if max_pnl is not None:
-            filtered_positions = [
-                p for p in filtered_positions if p.get("pnl", 0) <= max_pnl
-            ]
-
-        total_count = len(filtered_positions)
-
-        # Apply sorting
-        reverse = sort_order.lower() == "desc"
-        try:
-            filtered_positions = sorted(
-                filtered_positions, key=lambda x: x.get(sort_by, 0), reverse=reverse
-            )
-        except (KeyError, TypeError):
-            # If sort field doesn't exist, skip sorting
-            pass
-
-        # Apply pagination
-        paginated_positions = filtered_positions[offset : offset + limit]
+        # Filter, sort and page through the position manager's secondary
+        # indexes instead of copying and scanning every position per request.
+        total_count, paginated_positions = dispatcher.position_manager.query_positions(
+            symbol=symbol,
+            side=side,
+            status=status,
+            min_size=min_size,
+            max_size=max_size,
+            min_pnl=min_pnl,
+            max_pnl=max_pnl,
+            sort_by=sort_by,
+            descending=sort_order.lower() == "desc",
+            offset=offset,
+            limit=limit,
+        )
 
         return {
             "status": "success",
@@ -1600,22 +1696,20 @@ async def get_orders(
     Results are paginated and sortable.
     """
     try:
-        # Note: This is a placeholder implementation. In production, you would:
-        # 1. Query order history from position manager or database
-        # 2. Apply filters (symbol, status, side, type, time range)
-        # 3. Sort by specified field and order
-        # 4. Apply pagination (offset and limit)
-
-        # Placeholder: Return empty list until order history is implemented
-        all_orders_list: list[dict[str, Any]] = []
-
-        # Apply filters here (when order history is implemented)
-        filtered_orders = all_orders_list
-        total_count = len(filtered_orders)
-
-        # Apply sorting and pagination
-        # filtered_orders = apply_sorting(filtered_orders, sort_by, sort_order)
-        paginated_orders = filtered_orders[offset : offset + limit]
+        # Orders tracked by the dispatcher's OrderManager (active, conditional
+        # and history), served from its secondary indexes.
+        total_count, paginated_orders = dispatcher.order_manager.query_orders(
+            symbol=symbol,
+            status=status,
+            side=side,
+            type=type,
+            from_time=from_time,
+            to_time=to_time,
+            sort_by=sort_by,
+            descending=sort_order.lower() == "desc",
+            offset=offset,
+            limit=limit,
+        )
 
         return {
             "status": "success",
@@ -0,0 +1,97 @@
+"""
+Debug API Routes.
+
+Runtime diagnostics for operators: event-loop lag, the worst recent
+blocking offenders, an on-demand sampling profile, and per-subsystem log
+levels with the log budget's suppression counts.
+"""
+
+import hmac
+from typing import Any, Literal
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
+
+from shared import log_budget
+from shared.config import settings
+from tradeengine.loop_monitor import loop_monitor
+from tradeengine.sampling_profiler import (
+    ProfilerBusyError,
+    sampling_profiler,
+    to_speedscope,
+)
+
+router = APIRouter(prefix="/debug", tags=["debug"])
+
+
+def require_debug_token(authorization: str | None = Header(None)) -> None:
+    """Bearer-token check for debug endpoints that expose code internals."""
+    token = settings.te_debug_token
+    if not token:
+        raise HTTPException(status_code=403, detail="Debug endpoints are disabled")
+    scheme, _, supplied = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(
+        supplied.strip().encode(), token.encode()
+    ):
+        raise HTTPException(status_code=401, detail="Invalid debug token")
+
+
+@router.get("/loop", dependencies=[Depends(require_debug_token)])
+async def get_loop_health(
+    limit: int = Query(10, ge=1, le=100, description="Offenders to return"),
+) -> dict[str, Any]:
+    """Event-loop lag percentiles and the worst recent slow callbacks."""
+    return loop_monitor.snapshot(limit)
+
+
+@router.get("/profile", dependencies=[Depends(require_debug_token)])
+async def get_profile(
+    seconds: float = Query(10.0, gt=0, description="How long to sample"),
+    format: Literal["collapsed", "speedscope"] = Query("collapsed"),
+    rate: float | None = Query(None, gt=0, le=1000, description="Samples/second"),
+    tasks: bool = Query(True, description="Also sample asyncio task stacks"),
+) -> Response:
+    """Sample every thread (and task) for ``seconds`` and return the stacks.
+
+    ``collapsed`` is folded-stack text for flamegraph.pl / speedscope;
+    ``speedscope`` is a speedscope JSON file.
+    """
+    if seconds > settings.te_profile_max_seconds:
+        raise HTTPException(
+            status_code=400,
+            detail=f"seconds must be <= {settings.te_profile_max_seconds}",
+        )
+    try:
+        profile = await sampling_profiler.profile(
+            seconds, rate_hz=rate, include_tasks=tasks
+        )
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=409, detail=str(e)) from e
+    if format == "speedscope":
+        return JSONResponse(to_speedscope(profile))
+    return PlainTextResponse(profile.collapsed())
+
+
+@router.get("/logging")
+async def get_logging() -> dict[str, Any]:
+    """Explicit logger levels and what the log budget has suppressed."""
+    return {
+        "levels": log_budget.get_levels(),
+        "budget": log_budget.log_budget.snapshot(),
+    }
+
+
+@router.put("/logging/{name}", dependencies=[Depends(require_debug_token)])
+async def set_logging_level(
+    name: str,
+    level: str = Query(..., description="DEBUG, INFO, WARNING, ERROR or NOTSET"),
+) -> dict[str, Any]:
+    """Set the level of one subsystem (logger name prefix, or ``root``).
+
+    NOTSET hands the subsystem back to its parent's level.
+    """
+    try:
+        applied = log_budget.set_level(name, level)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    return {"logger": name, "level": applied, "levels": log_budget.get_levels()}
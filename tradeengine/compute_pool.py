@@ -0,0 +1,117 @@
+"""Optional executor for batched pure computation.
+
+Reconciliation-time sweeps (unhedged detection over every Binance
+position, protective-price derivation for every naked position) are plain
+arithmetic on plain data, but they ran inline on the event loop between
+network awaits, so a large book held the loop for the whole sweep.
+
+:class:`ComputePool` runs such a batch as ``fn(chunk)`` over contiguous
+chunks of the input and concatenates the results in order:
+
+* ``TE_COMPUTE_POOL_MODE=off`` (default) — one inline ``fn(items)`` call,
+  identical to the old behaviour;
+* ``thread`` — chunks run on a ``ThreadPoolExecutor`` so the loop stays
+  free for I/O (the arithmetic still shares the GIL);
+* ``process`` — chunks run on a ``ProcessPoolExecutor`` and scale across
+  cores; ``fn`` and its arguments must be picklable (module-level
+  functions, ``functools.partial`` of them, plain data).
+
+Batches smaller than ``min_batch`` always run inline: below that the
+executor hand-off costs more than the work. A failing worker falls back to
+computing the batch inline, so enabling the pool can never lose a result.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from shared.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+MODES = ("off", "thread", "process")
+
+
+class ComputePool:
+    """Runs chunked pure-function batches inline or on an executor."""
+
+    def __init__(
+        self,
+        mode: str = "off",
+        max_workers: int | None = None,
+        min_batch: int = 64,
+    ) -> None:
+        normalized = (mode or "off").strip().lower()
+        if normalized not in MODES:
+            logger.warning("ComputePool: unknown mode %r; using 'off'", mode)
+            normalized = "off"
+        self.mode = normalized
+        self.max_workers = max(1, max_workers or os.cpu_count() or 1)
+        self.min_batch = max(1, int(min_batch))
+        self._executor: Executor | None = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.mode == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="compute"
+                )
+        return self._executor
+
+    async def map_chunked(
+        self, fn: Callable[[list[T]], list[R]], items: Sequence[T]
+    ) -> list[R]:
+        """Return ``fn(items)``, computed chunk-wise off the loop when enabled."""
+        batch = list(items)
+        if self.mode == "off" or len(batch) < self.min_batch:
+            return fn(batch)
+
+        n_chunks = min(self.max_workers, max(1, len(batch) // self.min_batch))
+        size = -(-len(batch) // n_chunks)
+        chunks = [batch[i : i + size] for i in range(0, len(batch), size)]
+        loop = asyncio.get_running_loop()
+        try:
+            executor = self._get_executor()
+            parts = await asyncio.gather(
+                *(loop.run_in_executor(executor, fn, chunk) for chunk in chunks)
+            )
+        except Exception as e:
+            logger.warning(
+                "ComputePool(%s): batch of %d failed on executor (%s); "
+                "computing inline",
+                self.mode,
+                len(batch),
+                e,
+            )
+            return fn(batch)
+        return [result for part in parts for result in part]
+
+    def close(self) -> None:
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "max_workers": self.max_workers,
+            "min_batch": self.min_batch,
+            "started": self._executor is not None,
+        }
+
+
+compute_pool = ComputePool(
+    settings.te_compute_pool_mode,
+    max_workers=settings.te_compute_pool_workers or None,
+    min_batch=settings.te_compute_pool_min_batch,
+)
@@ -2,7 +2,7 @@ import asyncio
 import json
 import logging
 from datetime import datetime, timezone
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import nats
 import nats.aio.client
@@ -30,6 +30,10 @@ from contracts.signal import Signal
 from shared.config import settings
 from tradeengine.defaults import DEFAULT_TRADING_PARAMETERS
 from tradeengine.dispatcher import Dispatcher
+from tradeengine.signal_capture import SignalCaptureWriter
+
+if TYPE_CHECKING:
+    from tradeengine.accounts import AccountRegistry
 
 logger = logging.getLogger(__name__)
 
@@ -48,14 +52,22 @@ nats_errors = Counter("tradeengine_nats_errors_total", "Total NATS errors", ["ty
 class SignalConsumer:
     """NATS consumer for trading signals"""
 
-    def __init__(self, dispatcher: Dispatcher | None = None) -> None:
+    # Raw-message recorder (TE_SIGNAL_CAPTURE_PATH), opened in initialize()
+    capture: SignalCaptureWriter | None = None
+
+    def __init__(
+        self, dispatcher: "Dispatcher | AccountRegistry | None" = None
+    ) -> None:
         self.nc: nats.aio.client.Client | None = None
         self.running: bool = False
         self.subscription: nats.aio.subscription.Subscription | None = None
-        self.dispatcher = dispatcher  # Use provided dispatcher or None
+        # A Dispatcher, or the AccountRegistry routing over several (TE_ACCOUNTS)
+        self.dispatcher = dispatcher
         self._dispatcher_provided = dispatcher is not None
 
-    async def initialize(self, dispatcher: Dispatcher | None = None) -> bool:
+    async def initialize(
+        self, dispatcher: "Dispatcher | AccountRegistry | None" = None
+    ) -> bool:
         """Initialize NATS connection"""
         try:
             # Use provided dispatcher if given
@@ -106,6 +118,12 @@ class SignalConsumer:
                 NATS_MAX_RECONNECT_ATTEMPTS,
             )
 
+            if settings.te_signal_capture_path and self.capture is None:
+                self.capture = SignalCaptureWriter(settings.te_signal_capture_path)
+                logger.info(
+                    "Capturing raw signals to %s", settings.te_signal_capture_path
+                )
+
             # Only initialize dispatcher if we created it ourselves
             if not self._dispatcher_provided and self.dispatcher:
                 await self.dispatcher.initialize()
@@ -149,9 +167,15 @@ class SignalConsumer:
         else:
             subscribe_subject = subject
 
+        # Shard mode: every pod receives every signal and the dispatcher keeps
+        # only symbols whose shard this pod leases (shared/shard_leases.py).
+        shard_mode = settings.te_signal_shard_mode == "on"
+        queue_group = "" if shard_mode else "tradeengine-workers"
+
         logger.info(
-            "🚀 STARTING NATS CONSUMER | Subject: %s | Queue group: tradeengine-workers (AC-5 #352)",
+            "🚀 STARTING NATS CONSUMER | Subject: %s | Queue group: %s (AC-5 #352)",
             subscribe_subject,
+            queue_group or "none (shard-owned broadcast)",
         )
 
         try:
@@ -163,9 +187,10 @@ class SignalConsumer:
             )
             # AC-5 (#352): queue group ensures exactly one pod processes each signal.
             # Without this, every pod receives every message → duplicate order placement.
+            # Shard mode drops the group on purpose; ownership dedups instead.
             self.subscription = await self.nc.subscribe(
                 subscribe_subject,
-                queue="tradeengine-workers",
+                queue=queue_group,
                 cb=self._message_handler,
             )
 
@@ -206,15 +231,22 @@ class SignalConsumer:
         # CRITICAL: Log at the very start to see if handler is called at all
         logger.debug("HANDLER CALLED | Subject: %s", msg.subject if msg else "None")
         try:
-            logger.info(
+            # Per-message progress is DEBUG; the outcome line below is the
+            # one INFO record per signal.
+            logger.debug(
                 "📨 NATS MESSAGE RECEIVED | Subject: %s | Size: %d bytes",
                 msg.subject,
                 len(msg.data),
             )
+            if self.capture is not None:
+                try:
+                    self.capture.write(msg.subject, msg.data)
+                except OSError as e:
+                    logger.warning("Signal capture write failed: %s", e)
 
             # Parse message into Signal
             signal_data = json.loads(msg.data.decode())
-            logger.info(
+            logger.debug(
                 "📊 PARSING SIGNAL | Strategy: %s | Symbol: %s | Action: %s",
                 signal_data.get("strategy_id", "Unknown"),
                 signal_data.get("symbol", "Unknown"),
@@ -381,7 +413,7 @@ class SignalConsumer:
                             )
                         return
 
-                    logger.info(
+                    logger.debug(
                         "✅ SIGNAL PARSED SUCCESSFULLY | %s | %s %s @ %s",
                         signal.strategy_id,
                         signal.symbol,
@@ -390,11 +422,12 @@ class SignalConsumer:
                     )
 
                     # Dispatch signal within trace context
-                    logger.info("🔄 DISPATCHING SIGNAL: %s", signal.strategy_id)
-                    logger.debug("About to dispatch signal: %s", signal.strategy_id)
+                    logger.debug("🔄 DISPATCHING SIGNAL: %s", signal.strategy_id)
                     if not self.dispatcher:
                         raise RuntimeError("Dispatcher not initialized")
-                    result = await self.dispatcher.dispatch(signal)
+                    result = await self.dispatcher.dispatch(
+                        signal, broadcast=settings.te_signal_shard_mode == "on"
+                    )
                     logger.debug("Dispatch completed for: %s", signal.strategy_id)
 
                     outcome_status = result.get("status", "unknown")
@@ -490,6 +523,10 @@ class SignalConsumer:
         """Stop the consumer"""
         self.running = False
 
+        if self.capture is not None:
+            self.capture.close()
+            self.capture = None
+
         if self.subscription:
             try:
                 await self.subscription.unsubscribe()
@@ -0,0 +1,111 @@
+"""Expiry-ordered, bounded dedup cache for signal ids and fingerprints.
+
+``Dispatcher.signal_cache`` and ``Dispatcher.local_signal_claims`` used to
+be plain dicts swept with a full scan every few minutes, so a signal storm
+grew them without limit between sweeps and then paid one long scan.
+
+Every entry of a :class:`DedupCache` shares the same TTL, so insertion
+order is expiry order: entries live in an ``OrderedDict`` oldest first,
+and expiry pops from the front until it meets a live entry. Insert,
+lookup and expiry are O(1) (expiry amortised). Re-adding a key moves it
+to the back. Past ``capacity`` the oldest entries are evicted early and
+counted in ``tradeengine_dedup_cache_evictions_total`` — an eviction
+means a duplicate inside the TTL could slip through, so it should stay
+at zero in normal operation.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Iterator
+from typing import Any
+
+from prometheus_client import Counter
+
+dedup_cache_evictions = Counter(
+    "tradeengine_dedup_cache_evictions_total",
+    "Dedup entries evicted before their TTL because the cache was full",
+    ["cache"],
+)
+
+
+class DedupCache:
+    """Keys seen within the last ``ttl`` seconds, at most ``capacity`` of them."""
+
+    def __init__(self, name: str, ttl: float, capacity: int) -> None:
+        self.name = name
+        self.ttl = float(ttl)
+        self.capacity = max(1, int(capacity))
+        self._entries: OrderedDict[Hashable, float] = OrderedDict()
+        self.evictions = 0
+        self.expired = 0
+
+    def expire(self, now: float | None = None) -> int:
+        """Drop entries at least ``ttl`` old; returns how many went."""
+        now = time.time() if now is None else now
+        entries = self._entries
+        dropped = 0
+        while entries:
+            key, seen_at = next(iter(entries.items()))
+            if now - seen_at < self.ttl:
+                break
+            entries.popitem(last=False)
+            dropped += 1
+        self.expired += dropped
+        return dropped
+
+    def get(self, key: Hashable, now: float | None = None) -> float | None:
+        """When ``key`` was added, if that was less than ``ttl`` ago."""
+        self.expire(now)
+        return self._entries.get(key)
+
+    def add(self, key: Hashable, now: float | None = None) -> None:
+        now = time.time() if now is None else now
+        self.expire(now)
+        entries = self._entries
+        entries[key] = now
+        entries.move_to_end(key)
+        overflow = len(entries) - self.capacity
+        if overflow > 0:
+            for _ in range(overflow):
+                entries.popitem(last=False)
+            self.evictions += overflow
+            dedup_cache_evictions.labels(cache=self.name).inc(overflow)
+
+    def claim(self, key: Hashable, now: float | None = None) -> bool:
+        """Add ``key`` unless it is already live; True when this call added it."""
+        if self.get(key, now) is not None:
+            return False
+        self.add(key, now)
+        return True
+
+    def discard(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __getitem__(self, key: Hashable) -> float:
+        return self._entries[key]
+
+    def __delitem__(self, key: Hashable) -> None:
+        del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._entries)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "size": len(self._entries),
+            "capacity": self.capacity,
+            "ttl_seconds": self.ttl,
+            "evictions": self.evictions,
+            "expired": self.expired,
+        }
@@ -1,7 +1,9 @@
 import asyncio
+import hashlib
 import logging
 import os
 import time
+import uuid
 from datetime import UTC, datetime
 from typing import Any, Literal
 
@@ -21,24 +23,27 @@ from shared.constants import (
 )
 from shared.distributed_lock import distributed_lock_manager
 from shared.logger import get_logger
+from tradeengine.dedup_cache import DedupCache
 from tradeengine.exchange_truth_store import ExchangeTruthStore, UserDataStreamConsumer
 from tradeengine.leverage_bound_guard import LeverageBoundGuard
+from tradeengine.metric_handles import BoundMetric
 from tradeengine.metrics import (
     atomic_rollback_failed_total,
     dispatcher_thrash_circuit_open_total,
+    hot_order_execution_latency_seconds,
+    hot_order_failures_total,
+    hot_orders_executed_by_type,
+    hot_risk_checks_total,
+    hot_risk_rejections_total,
     oco_cancel_retry_exhausted_total,
     oco_pair_age_seconds,
-    order_execution_latency_seconds,
-    order_failures_total,
     order_placement_skipped_total,
-    orders_executed_by_type,
     otel_oco_pair_age_seconds,
-    risk_checks_total,
-    risk_rejections_total,
     strategy_close_blocked_no_exchange_position_total,
 )
 from tradeengine.order_manager import OrderManager
 from tradeengine.position_manager import PositionManager
+from tradeengine.risk.pretrade import order_amount
 from tradeengine.services.alert_publisher import alert_publisher
 from tradeengine.services.execution_event_publisher import (
     EventType as ExecutionEventType,
@@ -47,11 +52,17 @@ from tradeengine.services.execution_event_publisher import (
 from tradeengine.services.halt_suspected_detector import halt_suspected_detector
 from tradeengine.services.heartbeat_monitor import HeartbeatMonitor
 from tradeengine.signal_aggregator import SignalAggregator
-from tradeengine.strategy_position_manager import strategy_position_manager
+from tradeengine.state_snapshot import StateSnapshotter, TradingStateSnapshot
+from tradeengine.strategy_position_manager import (
+    StrategyPositionManager,
+    strategy_position_manager,
+    strategy_positions_for_account,
+)
 from tradeengine.strategy_position_reconciler import (
     StrategyPositionReconciler,
     _has_matching_exchange_position,
 )
+from tradeengine.symbol_actors import SymbolActorRuntime
 from tradeengine.thrash_guard import ThrashCircuitBreaker
 
 # Prometheus metrics for signal flow tracking
@@ -91,6 +102,14 @@ signals_duplicate = Counter(
     ["strategy", "symbol", "action"],
 )
 
+# Per-signal handles: cached children, strategy/symbol capped at
+# te_metric_label_cap distinct values (see tradeengine/metric_handles.py)
+_hot_signals_received = BoundMetric(signals_received, limited=("strategy", "symbol"))
+_hot_signals_processed = BoundMetric(signals_processed)
+_hot_signals_duplicate = BoundMetric(signals_duplicate, limited=("strategy", "symbol"))
+_hot_orders_executed = BoundMetric(orders_executed, limited=("symbol",))
+_hot_order_execution_time = BoundMetric(order_execution_time, limited=("symbol",))
+
 # OpenTelemetry tracer for business context spans
 tracer = trace.get_tracer(__name__)
 
@@ -98,16 +117,26 @@ tracer = trace.get_tracer(__name__)
 class OCOManager:
     """Manages OCO (One-Cancels-the-Other) logic for SL/TP orders"""
 
-    def __init__(self, exchange: Any, logger: logging.Logger, dispatcher: Any = None):
+    def __init__(
+        self,
+        exchange: Any,
+        logger: logging.Logger,
+        dispatcher: Any = None,
+        account_id: str | None = None,
+    ):
         self.exchange = exchange
         self.logger = logger
         self.dispatcher = dispatcher  # Reference to dispatcher for position management
+        # Selects the account's strategy position manager (None: the primary)
+        self.account_id = account_id
         # CHANGED: Now supports multiple OCO pairs per exchange position (list of dicts)
         self.active_oco_pairs: dict[
             str, list[dict[str, Any]]
         ] = {}  # exchange_position_key -> [oco_info, ...]
         # #371: CONDITIONAL entries whose OCO must wait for FILLED. Key = exchange entry order id.
         self.pending_entries: dict[str, dict[str, Any]] = {}
+        # monotonic time of the last backstop sweep over pending_entries
+        self._last_pending_sweep = 0.0
         self.monitoring_task: asyncio.Task[Any] | None = None
         self.monitoring_active = False
         # #534 (H6 of #977): WS-driven OCO completion nudge. Set by the
@@ -358,10 +387,19 @@ class OCOManager:
                 )
 
         self.logger.info(
-            f"Placing OCO orders: symbol={symbol}, position_side={position_side}, "
-            f"position_id={position_id}, strategy_position_id={strategy_position_id}, "
-            f"quantity={quantity}, stop_loss_price={stop_loss_price}, "
-            f"take_profit_price={take_profit_price}, entry_price={entry_price}"
+            (
+                "Placing OCO orders: symbol=%s, position_side=%s, "
+                "position_id=%s, strategy_position_id=%s, quantity=%s, "
+                "stop_loss_price=%s, take_profit_price=%s, entry_price=%s"
+            ),
+            symbol,
+            position_side,
+            position_id,
+            strategy_position_id,
+            quantity,
+            stop_loss_price,
+            take_profit_price,
+            entry_price,
         )
 
         # Defense-in-depth (#479): when the caller has provided an explicit
@@ -501,14 +539,20 @@ class OCOManager:
 
                 self.logger.info("✅ OCO ORDERS PLACED SUCCESSFULLY")
                 self.logger.info(
-                    f"OCO pair added for strategy {strategy_position_id}: "
-                    f"Total OCO pairs for {exchange_position_key}: "
-                    f"{len(self.active_oco_pairs[exchange_position_key])}"
+                    "OCO pair added for strategy %s: Total OCO pairs for %s: %s",
+                    strategy_position_id,
+                    exchange_position_key,
+                    len(self.active_oco_pairs[exchange_position_key]),
                 )
                 self.logger.info(
-                    f"OCO orders placed: position_id={position_id}, "
-                    f"strategy_position_id={strategy_position_id}, "
-                    f"sl_order_id={sl_order_id}, tp_order_id={tp_order_id}"
+                    (
+                        "OCO orders placed: position_id=%s, strategy_position_id=%s, "
+                        "sl_order_id=%s, tp_order_id=%s"
+                    ),
+                    position_id,
+                    strategy_position_id,
+                    sl_order_id,
+                    tp_order_id,
                 )
 
                 # Export metrics
@@ -517,7 +561,11 @@ class OCOManager:
                     strategy_oco_placed_total,
                 )
                 from tradeengine.strategy_position_manager import (
-                    strategy_position_manager,
+                    strategy_positions_for_account,
+                )
+
+                strategy_position_manager = strategy_positions_for_account(
+                    self.account_id
                 )
 
                 # Get strategy_id from position manager
@@ -576,8 +624,11 @@ class OCOManager:
                             data={"symbol": symbol, "algoId": surviving_id},
                         )
                         self.logger.info(
-                            f"✅ Cancelled orphan {leg_label} algoId={surviving_id} "
-                            f"for {symbol} {position_side}"
+                            "✅ Cancelled orphan %s algoId=%s for %s %s",
+                            leg_label,
+                            surviving_id,
+                            symbol,
+                            position_side,
                         )
                         # #482 AC2: every partial-OCO event ticks the counter so
                         # operators can see how often the path is non-atomic at
@@ -719,9 +770,14 @@ class OCOManager:
             oco_symbol = oco_info["symbol"]
 
             self.logger.info(
-                f"Cancelling OCO pair: symbol={oco_symbol}, "
-                f"strategy_position_id={oco_info.get('strategy_position_id')}, "
-                f"sl_order_id={sl_order_id}, tp_order_id={tp_order_id}"
+                (
+                    "Cancelling OCO pair: symbol=%s, strategy_position_id=%s, "
+                    "sl_order_id=%s, tp_order_id=%s"
+                ),
+                oco_symbol,
+                oco_info.get("strategy_position_id"),
+                sl_order_id,
+                tp_order_id,
             )
 
             pair_cancelled = True
@@ -743,7 +799,10 @@ class OCOManager:
                         data={"symbol": oco_symbol, "algoId": order_id},
                     )
                     self.logger.info(
-                        f"✅ Cancelled algo {label} order {order_id} for {oco_symbol}"
+                        "✅ Cancelled algo %s order %s for %s",
+                        label,
+                        order_id,
+                        oco_symbol,
                     )
                 except Exception as e:
                     self.logger.error(
@@ -753,7 +812,8 @@ class OCOManager:
                     all_cancelled = False
             if pair_cancelled:
                 self.logger.info(
-                    f"✅ OCO PAIR CANCELLED for strategy {oco_info.get('strategy_position_id')}"
+                    "✅ OCO PAIR CANCELLED for strategy %s",
+                    oco_info.get("strategy_position_id"),
                 )
                 oco_info["status"] = "cancelled"
 
@@ -792,15 +852,20 @@ class OCOManager:
 
         # Debug logging
         self.logger.debug(
-            f"Looking for OCO pair: position_id={position_id}, filled_order_id={filled_order_id}, "
-            f"exchange_position_key={exchange_position_key}, "
-            f"active_keys={list(self.active_oco_pairs.keys())}"
+            (
+                "Looking for OCO pair: position_id=%s, filled_order_id=%s, "
+                "exchange_position_key=%s, active_keys=%s"
+            ),
+            position_id,
+            filled_order_id,
+            exchange_position_key,
+            list(self.active_oco_pairs.keys()),
         )
 
         if exchange_position_key and exchange_position_key in self.active_oco_pairs:
             oco_list = self.active_oco_pairs[exchange_position_key]
             self.logger.debug(
-                f"Found {len(oco_list)} OCO pair(s) under {exchange_position_key}"
+                "Found %s OCO pair(s) under %s", len(oco_list), exchange_position_key
             )
             # Find the OCO pair that matches the filled_order_id
             for oco in oco_list:
@@ -810,7 +875,7 @@ class OCOManager:
                 ):
                     oco_info = oco
                     found_key = exchange_position_key
-                    self.logger.debug(f"Matched OCO pair: {oco_info}")
+                    self.logger.debug("Matched OCO pair: %s", oco_info)
                     break
         elif position_id in self.active_oco_pairs:
             # Backward compatibility - old key structure
@@ -880,17 +945,29 @@ class OCOManager:
             return False, "unknown"
 
         self.logger.info(
-            f"OCO triggered: position_id={position_id}, filled_type={filled_type}, "
-            f"filled_order_id={filled_order_id}, order_to_cancel={order_to_cancel}, "
-            f"cancel_type={cancel_type}, close_reason={close_reason}"
+            (
+                "OCO triggered: position_id=%s, filled_type=%s, "
+                "filled_order_id=%s, order_to_cancel=%s, cancel_type=%s, "
+                "close_reason=%s"
+            ),
+            position_id,
+            filled_type,
+            filled_order_id,
+            order_to_cancel,
+            cancel_type,
+            close_reason,
         )
 
         # Guard: if order_to_cancel is None or empty, the paired order is already gone
         # (lost state from pod restart); treat as externally closed — code=-1102 scenario
         if not order_to_cancel:
             self.logger.info(
-                f"INFO: Order externally closed (null order_id), cleaning up local state: "
-                f"position={position_id}, cancel_type={cancel_type}"
+                (
+                    "INFO: Order externally closed (null order_id), cleaning up "
+                    "local state: position=%s, cancel_type=%s"
+                ),
+                position_id,
+                cancel_type,
             )
             self._mark_oco_completed(
                 found_key, position_id, sl_order_id, tp_order_id, close_reason
@@ -920,8 +997,14 @@ class OCOManager:
 
                 if cancel_result:
                     self.logger.info(
-                        f"Order cancelled successfully: order_type={cancel_type}, "
-                        f"order_id={order_to_cancel} (attempt {attempt}/{max_attempts})"
+                        (
+                            "Order cancelled successfully: order_type=%s, order_id=%s "
+                            "(attempt %s/%s)"
+                        ),
+                        cancel_type,
+                        order_to_cancel,
+                        attempt,
+                        max_attempts,
                     )
                     # Update status in the correct location
                     if found_key and found_key in self.active_oco_pairs:
@@ -977,8 +1060,13 @@ class OCOManager:
                 # pod restart). Also idempotent no-op success.
                 if "code=-2013" in str(e) or "Order does not exist" in str(e):
                     self.logger.info(
-                        f"INFO: Order externally closed, cleaning up local state: "
-                        f"position={position_id}, cancel_type={cancel_type}, error={e}"
+                        (
+                            "INFO: Order externally closed, cleaning up local state: "
+                            "position=%s, cancel_type=%s, error=%s"
+                        ),
+                        position_id,
+                        cancel_type,
+                        e,
                     )
                     self._mark_oco_completed(
                         found_key, position_id, sl_order_id, tp_order_id, close_reason
@@ -1071,6 +1159,44 @@ class OCOManager:
                     oco["close_reason"] = close_reason
                     break
 
+    def export_state(
+        self,
+    ) -> tuple[dict[str, list[dict[str, Any]]], dict[str, dict[str, Any]]]:
+        """Copies of active_oco_pairs and pending_entries for a state snapshot."""
+        oco_pairs = {
+            key: [dict(oco) for oco in oco_list]
+            for key, oco_list in self.active_oco_pairs.items()
+        }
+        pending = {
+            entry_id: {**info, "order": info["order"].model_dump(mode="json")}
+            for entry_id, info in self.pending_entries.items()
+        }
+        return oco_pairs, pending
+
+    def restore_state(
+        self,
+        oco_pairs: dict[str, list[dict[str, Any]]],
+        pending_entries: dict[str, dict[str, Any]],
+    ) -> None:
+        """Load OCO pairs and deferred entries from a warm-restart snapshot."""
+        for key, oco_list in oco_pairs.items():
+            self.active_oco_pairs.setdefault(key, []).extend(oco_list)
+        for entry_id, info in pending_entries.items():
+            self.pending_entries[entry_id] = {
+                **info,
+                "order": TradeOrder.model_validate(info["order"]),
+            }
+        self._sync_oco_pairs_gauge()
+
+    def _tracked_order_ids(self) -> set[str]:
+        return {
+            str(oco[leg])
+            for oco_list in self.active_oco_pairs.values()
+            for oco in oco_list
+            for leg in ("sl_order_id", "tp_order_id")
+            if oco.get(leg)
+        }
+
     async def reconcile_from_exchange(self) -> int:
         """Rebuild active_oco_pairs from live Binance open orders on startup.
 
@@ -1098,7 +1224,8 @@ class OCOManager:
         try:
             open_orders = await self.exchange.get_open_algo_orders()
             self.logger.info(
-                f"[STARTUP] Fetched {len(open_orders)} algo orders for OCO reconciliation"
+                "[STARTUP] Fetched %s algo orders for OCO reconciliation",
+                len(open_orders),
             )
         except Exception as e:
             self.logger.warning(
@@ -1114,7 +1241,11 @@ class OCOManager:
                 )
                 open_orders = list(std_orders) if std_orders else []
                 self.logger.info(
-                    f"[STARTUP] Fallback: fetched {len(open_orders)} standard open orders for OCO reconciliation"
+                    (
+                        "[STARTUP] Fallback: fetched %s standard open orders for OCO "
+                        "reconciliation"
+                    ),
+                    len(open_orders),
                 )
             except Exception as e2:
                 self.logger.warning(
@@ -1122,6 +1253,16 @@ class OCOManager:
                 )
                 return 0
 
+        # Warm restart: pairs restored from a state snapshot are already
+        # tracked, so only orders the snapshot did not know about are rebuilt.
+        tracked = self._tracked_order_ids()
+        if tracked:
+            open_orders = [
+                o
+                for o in open_orders
+                if str(o.get("algoId") or o.get("orderId", "")) not in tracked
+            ]
+
         sl_orders: dict[
             str, list[dict[str, Any]]
         ] = {}  # key: "SYMBOL_SIDE" -> list of orders
@@ -1238,7 +1379,7 @@ class OCOManager:
                     f"[STARTUP] Registered orphaned TP order {tp_id} for {key} (no matching SL)"
                 )
 
-        self.logger.info(f"[STARTUP] Rebuilt {rebuilt} active OCO pairs from Binance")
+        self.logger.info("[STARTUP] Rebuilt %s active OCO pairs from Binance", rebuilt)
 
         # AC (#550): emit active_oco_pairs_per_position for every reconciled
         # (symbol, position_side) so the gauge reflects exchange truth after a
@@ -1298,8 +1439,8 @@ class OCOManager:
     ) -> None:
         """Queue a CONDITIONAL entry for post-fill OCO placement.
 
-        The monitor loop polls the entry order; on FILLED it captures avgPrice
-        from the exchange and triggers OCO with the real entry price.
+        The entry's FILLED user-data update (``on_entry_fill``) triggers OCO
+        with the real avgPrice; the monitor loop's slow sweep is the backstop.
         """
         if not entry_order_id:
             self.logger.warning(
@@ -1313,14 +1454,48 @@ class OCOManager:
             "registered_at": time.time(),
         }
         self.logger.info(
-            f"⏸️ OCO DEFERRED: entry {entry_order_id} ({order.symbol}) is CONDITIONAL/NEW — "
-            f"waiting for FILLED before placing SL/TP. pending_count={len(self.pending_entries)}"
+            (
+                "⏸️ OCO DEFERRED: entry %s (%s) is CONDITIONAL/NEW — waiting for "
+                "FILLED before placing SL/TP. pending_count=%s"
+            ),
+            entry_order_id,
+            order.symbol,
+            len(self.pending_entries),
         )
         if not self.monitoring_active:
             await self.start_monitoring()
 
+    async def on_entry_fill(self, order_obj: dict[str, Any]) -> bool:
+        """Resolve a deferred entry straight from its FILLED ``ORDER_TRADE_UPDATE``.
+
+        Called by ``Dispatcher._on_user_data_fill`` with the raw ``o`` payload.
+        ``pending_entries`` is keyed by entry order id, so this is one dict
+        lookup; the OCO goes out as soon as the fill is seen instead of on the
+        next sweep. Returns True when the fill belonged to a pending entry.
+        """
+        entry_id = str(order_obj.get("i", ""))
+        info = self.pending_entries.get(entry_id)
+        if info is None:
+            return False
+        try:
+            executed_qty = float(order_obj.get("z") or 0)
+            avg_price = float(order_obj.get("ap") or 0)
+            if avg_price <= 0:
+                avg_price = float(order_obj.get("L") or order_obj.get("p") or 0)
+        except (ValueError, TypeError):
+            executed_qty = 0.0
+            avg_price = 0.0
+        await self._trigger_deferred_oco(entry_id, info, avg_price, executed_qty)
+        return True
+
     async def _check_pending_entries(self) -> None:
-        """Poll deferred entries; trigger OCO when their entry order is FILLED.
+        """Backstop sweep for deferred entries whose FILLED update was missed.
+
+        Fills normally resolve through :meth:`on_entry_fill`. The sweep reads
+        open orders (standard + algo) once per symbol, which clears every
+        entry still resting on the book; only entries that have left it get
+        an individual status lookup. If the batched read fails, every entry
+        is looked up individually.
 
         Note: partially_filled is intentionally NOT terminal here. A CONDITIONAL
         order can fill in stages; placing OCO sized to the partial fill would
@@ -1329,10 +1504,25 @@ class OCOManager:
         """
         if not self.pending_entries:
             return
+        self._last_pending_sweep = time.monotonic()
+        symbols = sorted({info["symbol"] for info in self.pending_entries.values()})
+        resting: dict[str, set[str]] = {}
+        try:
+            open_sets = await asyncio.gather(
+                *(self.exchange.get_all_open_orders(symbol=s) for s in symbols)
+            )
+            resting = {
+                s: {str(oid) for oid in ids}
+                for s, ids in zip(symbols, open_sets, strict=True)
+            }
+        except Exception as e:
+            self.logger.debug("Pending-entry open-orders sweep failed: %s", e)
+
         filled_terminal = {"filled", "FILLED"}
         for entry_id, info in list(self.pending_entries.items()):
-            order = info["order"]
             symbol = info["symbol"]
+            if entry_id in resting.get(symbol, ()):
+                continue
             try:
                 status_resp = await self.exchange.get_order_status(symbol, entry_id)
             except Exception as e:
@@ -1359,36 +1549,55 @@ class OCOManager:
                 except (ValueError, TypeError):
                     avg_price = 0.0
 
-            if avg_price <= 0 or executed_qty <= 0:
-                self.logger.warning(
-                    f"⚠️ Cannot place deferred OCO for {symbol}: avg_price={avg_price}, "
-                    f"executed_qty={executed_qty}. Dropping pending entry {entry_id}."
-                )
-                del self.pending_entries[entry_id]
-                continue
+            await self._trigger_deferred_oco(entry_id, info, avg_price, executed_qty)
 
-            synthetic_result = {
-                "order_id": entry_id,
-                "status": "filled",
-                "fill_price": avg_price,
-                "amount": executed_qty,
-                "symbol": symbol,
-            }
-            self.logger.info(
-                f"▶️ Deferred OCO trigger: entry {entry_id} FILLED at avg_price={avg_price} "
-                f"qty={executed_qty}. Placing OCO now."
+    async def _trigger_deferred_oco(
+        self,
+        entry_id: str,
+        info: dict[str, Any],
+        avg_price: float,
+        executed_qty: float,
+    ) -> None:
+        """Place the OCO for a FILLED deferred entry (fill event or sweep)."""
+        order = info["order"]
+        symbol = info["symbol"]
+        if self.pending_entries.get(entry_id) is not info:
+            return  # already resolved by the other path
+        if avg_price <= 0 or executed_qty <= 0:
+            self.logger.warning(
+                f"⚠️ Cannot place deferred OCO for {symbol}: avg_price={avg_price}, "
+                f"executed_qty={executed_qty}. Dropping pending entry {entry_id}."
             )
-            # Remove BEFORE awaiting OCO placement so a re-entrant loop tick can't double-trigger.
             del self.pending_entries[entry_id]
-            try:
-                if self.dispatcher:
-                    await self.dispatcher._place_risk_management_orders(
-                        order, synthetic_result
-                    )
-            except Exception as e:
-                self.logger.error(
-                    f"❌ Deferred OCO placement failed for {symbol} (entry {entry_id}): {e}"
+            return
+
+        synthetic_result = {
+            "order_id": entry_id,
+            "status": "filled",
+            "fill_price": avg_price,
+            "amount": executed_qty,
+            "symbol": symbol,
+        }
+        self.logger.info(
+            (
+                "▶️ Deferred OCO trigger: entry %s FILLED at avg_price=%s "
+                "qty=%s. Placing OCO now."
+            ),
+            entry_id,
+            avg_price,
+            executed_qty,
+        )
+        # Remove BEFORE awaiting OCO placement so a re-entrant loop tick can't double-trigger.
+        del self.pending_entries[entry_id]
+        try:
+            if self.dispatcher:
+                await self.dispatcher._place_risk_management_orders(
+                    order, synthetic_result
                 )
+        except Exception as e:
+            self.logger.error(
+                f"❌ Deferred OCO placement failed for {symbol} (entry {entry_id}): {e}"
+            )
 
     async def _cancel_orphaned_order(
         self, symbol: str, order_id: str, is_algo: bool
@@ -1413,7 +1622,7 @@ class OCOManager:
                 # call here passed them swapped, which is what actually produced
                 # the -1102 in production (orderId received a symbol string).
                 await self.exchange.cancel_order(symbol, order_id)
-            self.logger.info(f"🗑️  Cancelled orphaned order {order_id} for {symbol}")
+            self.logger.info("🗑️  Cancelled orphaned order %s for %s", order_id, symbol)
             if is_algo:
                 orphan_algo_cancel_total.labels(
                     outcome="succeeded", symbol=symbol
@@ -1422,8 +1631,12 @@ class OCOManager:
             code = getattr(cancel_err, "code", None)
             if is_algo and code == -4029:
                 self.logger.info(
-                    f"Orphaned algo order {order_id} for {symbol} already "
-                    f"cancelled (-4029); nothing to do"
+                    (
+                        "Orphaned algo order %s for %s already cancelled (-4029); "
+                        "nothing to do"
+                    ),
+                    order_id,
+                    symbol,
                 )
                 orphan_algo_cancel_total.labels(
                     outcome="not_found_4029", symbol=symbol
@@ -1484,17 +1697,25 @@ class OCOManager:
         # Count total OCO pairs across all exchange positions
         total_pairs = sum(len(pairs) for pairs in self.active_oco_pairs.values())
         self.logger.info(
-            f"Active OCO pairs: {total_pairs} across {len(self.active_oco_pairs)} positions"
+            "Active OCO pairs: %s across %s positions",
+            total_pairs,
+            len(self.active_oco_pairs),
         )
 
         while self.monitoring_active and (
             self.active_oco_pairs or self.pending_entries
         ):
             try:
-                # #371: Drive deferred-OCO triggers for CONDITIONAL entries that have FILLED.
-                await self._check_pending_entries()
+                # #371: Deferred-OCO entries resolve from their user-data FILLED
+                # event (on_entry_fill); this slow sweep only catches misses.
+                if (
+                    time.monotonic() - self._last_pending_sweep
+                    >= settings.te_oco_pending_sweep_interval_seconds
+                ):
+                    await self._check_pending_entries()
 
                 # Check each exchange position's OCO pairs
+                actor_checks: list[Any] = []
                 for exchange_position_key, oco_list in list(
                     self.active_oco_pairs.items()
                 ):
@@ -1533,126 +1754,27 @@ class OCOManager:
                             )
                         except Exception as _age_err:  # pragma: no cover - defensive
                             self.logger.debug(
-                                "oco_pair_age_seconds update skipped for "
-                                f"{_oco.get('symbol')} {_oco.get('position_side')}: {_age_err}"
-                            )
-
-                    # Query all open orders for this symbol once
-                    # Use the robust combined list (Standard + Algo) to avoid ghost orders
-                    open_order_ids = await self.exchange.get_all_open_orders(
-                        symbol=symbol
-                    )
-
-                    # Check each OCO pair in this position
-                    for oco_info in oco_list:
-                        if oco_info["status"] != "active":
-                            continue
-
-                        sl_order_id = oco_info["sl_order_id"]
-                        tp_order_id = oco_info["tp_order_id"]
-
-                        # AC-4 (#352): orphaned entries have one side set to None.
-                        # Cancel whichever order still exists and mark completed.
-                        if oco_info.get("orphaned"):
-                            live_id = sl_order_id or tp_order_id
-                            # #490: route by the side that actually carries the
-                            # live order, using the algo-ness recorded at scan
-                            # time — never re-classify by id length.
-                            live_is_algo = (
-                                oco_info.get("sl_is_algo")
-                                if sl_order_id
-                                else oco_info.get("tp_is_algo")
+                                "oco_pair_age_seconds update skipped for %s %s: %s",
+                                _oco.get("symbol"),
+                                _oco.get("position_side"),
+                                _age_err,
                             )
-                            if live_id and live_id in open_order_ids:
-                                await self._cancel_orphaned_order(
-                                    symbol, live_id, bool(live_is_algo)
-                                )
-                            oco_info["status"] = "completed"
-                            continue
 
-                        # Check if orders still exist
-                        sl_exists = sl_order_id in open_order_ids
-                        tp_exists = tp_order_id in open_order_ids
-
-                        # Determine which order filled
-                        filled_order_id = None
-                        close_reason = "unknown"
-
-                        if not sl_exists and tp_exists:
-                            # Stop loss filled
-                            filled_order_id = sl_order_id
-                            close_reason = "stop_loss"
-                            self.logger.info(
-                                f"🔴 SL TRIGGERED for strategy {oco_info.get('strategy_position_id')}"
+                    # Actor mode: each position's check runs on its symbol's
+                    # actor, so symbols are checked in parallel and never
+                    # interleave with a signal or fill for the same symbol.
+                    actors = getattr(self.dispatcher, "symbol_actors", None)
+                    if isinstance(actors, SymbolActorRuntime):
+                        actor_checks.append(
+                            actors.call(
+                                symbol, self._check_position_oco_pairs, symbol, oco_list
                             )
-                        elif sl_exists and not tp_exists:
-                            # Take profit filled
-                            filled_order_id = tp_order_id
-                            close_reason = "take_profit"
-                            self.logger.info(
-                                f"🟢 TP TRIGGERED for strategy {oco_info.get('strategy_position_id')}"
-                            )
-                        elif not sl_exists and not tp_exists:
-                            # Both gone - OCO completed
-                            self.logger.info(
-                                f"✅ OCO completed for strategy {oco_info.get('strategy_position_id')}"
-                            )
-                            oco_info["status"] = "completed"
-                            continue
-
-                        # If an order filled, cancel the other order and close the strategy position
-                        if filled_order_id:
-                            try:
-                                # Cancel the other order (OCO behavior)
-                                # Note: position_id is legacy parameter (not used by _close_position_on_oco_completion)
-                                # but kept for consistency with function signature
-                                position_id = oco_info.get("position_id", "")
-                                (
-                                    cancel_success,
-                                    cancel_reason,
-                                ) = await self.cancel_other_order(
-                                    position_id=position_id,
-                                    filled_order_id=filled_order_id,
-                                    symbol=oco_info["symbol"],
-                                    position_side=oco_info["position_side"],
-                                )
+                        )
+                    else:
+                        await self._check_position_oco_pairs(symbol, oco_list)
 
-                                if cancel_success:
-                                    self.logger.info(
-                                        f"✅ OCO cancellation successful: {cancel_reason}"
-                                    )
-                                else:
-                                    # Handle cancellation failure cases
-                                    # If cancellation fails because order already filled, this indicates
-                                    # a race condition where both SL and TP triggered simultaneously
-                                    # If cancellation fails for other reasons, log warning but proceed
-                                    # with position close to avoid leaving orphaned positions
-                                    if (
-                                        "already filled" in cancel_reason.lower()
-                                        or "not found" in cancel_reason.lower()
-                                    ):
-                                        self.logger.warning(
-                                            f"⚠️  OCO cancellation failed (order may already be filled): {cancel_reason}"
-                                        )
-                                    else:
-                                        self.logger.warning(
-                                            f"⚠️  OCO cancellation failed: {cancel_reason}. Proceeding with position close."
-                                        )
-
-                                # Close position with strategy attribution
-                                # Note: We proceed with position close even if cancellation failed to avoid
-                                # leaving orphaned positions. The exchange will handle any remaining orders.
-                                await self._close_position_on_oco_completion(
-                                    position_id=position_id,  # Legacy parameter, not used by function
-                                    filled_order_id=filled_order_id,
-                                    close_reason=close_reason,
-                                    oco_info=oco_info,
-                                    dispatcher=self.dispatcher,
-                                )
-                            except Exception as e:
-                                self.logger.error(
-                                    f"❌ Failed to process OCO completion: {e}"
-                                )
+                if actor_checks:
+                    await asyncio.gather(*actor_checks)
 
                 # Clean up completed OCO pairs
                 for exchange_position_key in list(self.active_oco_pairs.keys()):
@@ -1702,6 +1824,126 @@ class OCOManager:
 
         self.logger.info("🔍 ORDER MONITORING STOPPED")
 
+    async def _check_position_oco_pairs(
+        self, symbol: str, oco_list: list[dict[str, Any]]
+    ) -> None:
+        """Resolve fills for one exchange position's OCO pairs (one monitor tick)."""
+        # Query all open orders for this symbol once
+        # Use the robust combined list (Standard + Algo) to avoid ghost orders
+        open_order_ids = await self.exchange.get_all_open_orders(symbol=symbol)
+
+        # Check each OCO pair in this position
+        for oco_info in oco_list:
+            if oco_info["status"] != "active":
+                continue
+
+            sl_order_id = oco_info["sl_order_id"]
+            tp_order_id = oco_info["tp_order_id"]
+
+            # AC-4 (#352): orphaned entries have one side set to None.
+            # Cancel whichever order still exists and mark completed.
+            if oco_info.get("orphaned"):
+                live_id = sl_order_id or tp_order_id
+                # #490: route by the side that actually carries the
+                # live order, using the algo-ness recorded at scan
+                # time — never re-classify by id length.
+                live_is_algo = (
+                    oco_info.get("sl_is_algo")
+                    if sl_order_id
+                    else oco_info.get("tp_is_algo")
+                )
+                if live_id and live_id in open_order_ids:
+                    await self._cancel_orphaned_order(
+                        symbol, live_id, bool(live_is_algo)
+                    )
+                oco_info["status"] = "completed"
+                continue
+
+            # Check if orders still exist
+            sl_exists = sl_order_id in open_order_ids
+            tp_exists = tp_order_id in open_order_ids
+
+            # Determine which order filled
+            filled_order_id = None
+            close_reason = "unknown"
+
+            if not sl_exists and tp_exists:
+                # Stop loss filled
+                filled_order_id = sl_order_id
+                close_reason = "stop_loss"
+                self.logger.info(
+                    "🔴 SL TRIGGERED for strategy %s",
+                    oco_info.get("strategy_position_id"),
+                )
+            elif sl_exists and not tp_exists:
+                # Take profit filled
+                filled_order_id = tp_order_id
+                close_reason = "take_profit"
+                self.logger.info(
+                    "🟢 TP TRIGGERED for strategy %s",
+                    oco_info.get("strategy_position_id"),
+                )
+            elif not sl_exists and not tp_exists:
+                # Both gone - OCO completed
+                self.logger.info(
+                    "✅ OCO completed for strategy %s",
+                    oco_info.get("strategy_position_id"),
+                )
+                oco_info["status"] = "completed"
+                continue
+
+            # If an order filled, cancel the other order and close the strategy position
+            if filled_order_id:
+                try:
+                    # Cancel the other order (OCO behavior)
+                    # Note: position_id is legacy parameter (not used by _close_position_on_oco_completion)
+                    # but kept for consistency with function signature
+                    position_id = oco_info.get("position_id", "")
+                    (
+                        cancel_success,
+                        cancel_reason,
+                    ) = await self.cancel_other_order(
+                        position_id=position_id,
+                        filled_order_id=filled_order_id,
+                        symbol=oco_info["symbol"],
+                        position_side=oco_info["position_side"],
+                    )
+
+                    if cancel_success:
+                        self.logger.info(
+                            "✅ OCO cancellation successful: %s", cancel_reason
+                        )
+                    else:
+                        # Handle cancellation failure cases
+                        # If cancellation fails because order already filled, this indicates
+                        # a race condition where both SL and TP triggered simultaneously
+                        # If cancellation fails for other reasons, log warning but proceed
+                        # with position close to avoid leaving orphaned positions
+                        if (
+                            "already filled" in cancel_reason.lower()
+                            or "not found" in cancel_reason.lower()
+                        ):
+                            self.logger.warning(
+                                f"⚠️  OCO cancellation failed (order may already be filled): {cancel_reason}"
+                            )
+                        else:
+                            self.logger.warning(
+                                f"⚠️  OCO cancellation failed: {cancel_reason}. Proceeding with position close."
+                            )
+
+                    # Close position with strategy attribution
+                    # Note: We proceed with position close even if cancellation failed to avoid
+                    # leaving orphaned positions. The exchange will handle any remaining orders.
+                    await self._close_position_on_oco_completion(
+                        position_id=position_id,  # Legacy parameter, not used by function
+                        filled_order_id=filled_order_id,
+                        close_reason=close_reason,
+                        oco_info=oco_info,
+                        dispatcher=self.dispatcher,
+                    )
+                except Exception as e:
+                    self.logger.error(f"❌ Failed to process OCO completion: {e}")
+
     async def _close_position_on_oco_completion(
         self,
         position_id: str,
@@ -1725,10 +1967,10 @@ class OCOManager:
             exchange_position_key = f"{symbol}_{position_side}"
 
             self.logger.info("🎯 STRATEGY OCO TRIGGERED - CLOSING OWNING STRATEGY ONLY")
-            self.logger.info(f"  Symbol: {symbol}")
-            self.logger.info(f"  Position Side: {position_side}")
-            self.logger.info(f"  Close Reason: {close_reason}")
-            self.logger.info(f"  Filled Order ID: {filled_order_id}")
+            self.logger.info("  Symbol: %s", symbol)
+            self.logger.info("  Position Side: %s", position_side)
+            self.logger.info("  Close Reason: %s", close_reason)
+            self.logger.info("  Filled Order ID: %s", filled_order_id)
 
             # NEW: Find which strategy's OCO filled
             owning_oco = oco_info  # This is already the owning OCO from _monitor_orders
@@ -1754,13 +1996,13 @@ class OCOManager:
 
             if not strategy_position_id:
                 self.logger.error(
-                    f"❌ No strategy_position_id in OCO info for {filled_order_id}"
+                    "❌ No strategy_position_id in OCO info for %s", filled_order_id
                 )
                 return
 
-            self.logger.info(f"  🎯 Owning Strategy Position: {strategy_position_id}")
-            self.logger.info(f"  📍 Entry Price: ${entry_price:,.2f}")
-            self.logger.info(f"  📊 Quantity: {exit_quantity}")
+            self.logger.info("  🎯 Owning Strategy Position: %s", strategy_position_id)
+            self.logger.info("  📍 Entry Price: $%.2f", entry_price)
+            self.logger.info("  📊 Quantity: %s", exit_quantity)
 
             # Step 1: Fetch filled order details from Binance
             try:
@@ -1772,11 +2014,11 @@ class OCOManager:
                 exit_price = float(order_details.get("avgPrice", 0))
                 filled_quantity = float(order_details.get("executedQty", 0))
 
-                self.logger.info(f"  📤 Exit Price: ${exit_price:,.2f}")
-                self.logger.info(f"  📤 Filled Quantity: {filled_quantity}")
+                self.logger.info("  📤 Exit Price: $%.2f", exit_price)
+                self.logger.info("  📤 Filled Quantity: %s", filled_quantity)
 
             except Exception as e:
-                self.logger.error(f"❌ Failed to fetch order details: {e}")
+                self.logger.error("❌ Failed to fetch order details: %s", e)
                 # Use strategy's quantity from OCO info
                 exit_price = entry_price  # Fallback
                 filled_quantity = exit_quantity
@@ -1795,13 +2037,17 @@ class OCOManager:
             )
 
             self.logger.info("  💰 P&L Calculation:")
-            self.logger.info(f"     Entry: ${entry_price:,.2f}")
-            self.logger.info(f"     Exit: ${exit_price:,.2f}")
-            self.logger.info(f"     Quantity: {filled_quantity}")
-            self.logger.info(f"     Gross P&L: ${pnl:,.2f} ({pnl_pct:+.2f}%)")
+            self.logger.info("     Entry: $%.2f", entry_price)
+            self.logger.info("     Exit: $%.2f", exit_price)
+            self.logger.info("     Quantity: %s", filled_quantity)
+            self.logger.info("     Gross P&L: $%.2f (%+.2f%%)", pnl, pnl_pct)
 
             # Step 3: Close ONLY this strategy's position
-            from tradeengine.strategy_position_manager import strategy_position_manager
+            from tradeengine.strategy_position_manager import (
+                strategy_positions_for_account,
+            )
+
+            strategy_position_manager = strategy_positions_for_account(self.account_id)
 
             # Get strategy_id from position manager
             strategy_id = "unknown"
@@ -1853,7 +2099,7 @@ class OCOManager:
                 # orphan path. Algo orders fall through to the algo-cancel
                 # fallback inside cancel_order (triggered on -2011/-4132).
                 await self.exchange.cancel_order(symbol, other_order_id)
-                self.logger.info(f"✅ Cancelled paired order: {other_order_id}")
+                self.logger.info("✅ Cancelled paired order: %s", other_order_id)
             except Exception as e:
                 self.logger.warning(
                     f"⚠️ Failed to cancel paired order {other_order_id}: {e}"
@@ -1968,35 +2214,87 @@ class OCOManager:
             )
 
 
+# Exchange statuses meaning a close order was accepted.
+_CLOSE_ACCEPTED_STATUSES = ("NEW", "FILLED", "PARTIALLY_FILLED")
+
+
 class Dispatcher:
     """Central dispatcher for trading operations with distributed state management"""
 
-    def __init__(self, exchange: Any = None) -> None:
+    # Class default so partially constructed instances (``__new__`` in tests)
+    # take the legacy non-actor path.
+    symbol_actors: SymbolActorRuntime | None = None
+    # None is the process's primary account, which owns the process-wide
+    # singletons (lock manager, strategy position manager, heartbeat
+    # monitor). TE_ACCOUNTS secondaries set their id and share the lock
+    # manager and heartbeat monitor; strategy positions are per account.
+    account_id: str | None = None
+    # Warm-restart snapshot writer (TE_STATE_SNAPSHOT_PATH); set in initialize().
+    state_snapshotter: StateSnapshotter | None = None
+
+    @property
+    def strategy_position_manager(self) -> StrategyPositionManager:
+        """This account's strategy positions; the process-wide one for the primary."""
+        if self.account_id is None:
+            return strategy_position_manager
+        return strategy_positions_for_account(self.account_id)
+
+    def __init__(self, exchange: Any = None, account_id: str | None = None) -> None:
+        self.account_id = account_id
         self.settings = Settings()
         self.order_manager = OrderManager()
-        self.position_manager = PositionManager(exchange=exchange)
+        if exchange is not None and hasattr(exchange, "get_symbol_price"):
+            # One ticker read per symbol feeds every resting conditional order
+            self.order_manager.set_price_source(exchange.get_symbol_price)
+        self.position_manager = PositionManager(
+            exchange=exchange, account_id=account_id
+        )
+        if exchange is not None and hasattr(exchange, "get_symbol_price"):
+            # Real ticks only: the fallback price reader is simulated.
+            self.order_manager.add_price_listener(
+                self.position_manager.apply_mark_price
+            )
+        if exchange is not None and hasattr(exchange, "set_fill_audit_sink"):
+            # Fee/pnl backfill runs off the order path and follows up with a
+            # fill_audit execution event.
+            exchange.set_fill_audit_sink(self._on_fill_audit_enriched)
         self.signal_aggregator = SignalAggregator()
         self.exchange = exchange
         self.logger = get_logger(__name__)
 
         # Initialize OCO Manager for SL/TP order management
-        self.oco_manager = OCOManager(exchange, self.logger, self)
+        self.oco_manager = OCOManager(
+            exchange, self.logger, self, account_id=account_id
+        )
 
         # Initialize Leverage Bound Guard (FR64, P6.4)
         self.leverage_bound_guard = LeverageBoundGuard()
 
-        # Duplicate signal detection cache
-        # Format: {signal_id: timestamp} - stores signal IDs with their reception time
-        self.signal_cache: dict[str, float] = {}
-        self.signal_cache_ttl = (
-            10  # Cache TTL in seconds (signals older than this are considered unique)
+        # Duplicate signal detection cache: signal id -> reception time.
+        # Signals older than the TTL (10s) are considered unique.
+        self.signal_cache = DedupCache(
+            "signal_id", ttl=10, capacity=self.settings.te_signal_dedup_capacity
+        )
+        # Fingerprints executed under a local shard lease (TE_SIGNAL_SHARD_MODE);
+        # replaces the per-signal distributed lock for symbols this pod owns.
+        self.local_signal_claims = DedupCache(
+            "signal_fingerprint",
+            ttl=distributed_lock_manager.lock_timeout,
+            capacity=self.settings.te_signal_dedup_capacity,
         )
-        self.signal_cache_cleanup_interval = 300  # Cleanup every 5 minutes
+
+        # Per-symbol actors (TE_SYMBOL_ACTOR_MODE=on): each symbol's signal
+        # dispatch, fill handling and OCO checks run in order on its own
+        # mailbox task. None keeps the legacy shared-state dispatch.
+        self.symbol_actors: SymbolActorRuntime | None = None
+        if str(self.settings.te_symbol_actor_mode).strip().lower() == "on":
+            self.symbol_actors = SymbolActorRuntime(
+                idle_seconds=self.settings.te_symbol_actor_idle_seconds
+            )
 
         # NEW: Accumulation cooldown tracking
         # Format: {(symbol, side): timestamp} - tracks last accumulation time per position
         self.last_accumulation_time: dict[tuple[str, str], float] = {}
-        self.last_cache_cleanup = time.time()
 
         # Signal to order mapping for strategy position tracking
         # Format: {order_id: Signal} - stores signals for strategy position creation
@@ -2019,6 +2317,10 @@ class Dispatcher:
         # completes (see _consume_pending_fill_signal()).
         self.exchange_order_id_to_signal: dict[str, Signal] = {}
 
+        # Deferred position-record updates from close_positions_bulk;
+        # close() waits for them.
+        self._close_record_tasks: set[asyncio.Task[None]] = set()
+
         self.user_data_consumer: UserDataStreamConsumer | None = None
         # #480 — periodic ghost-position eviction for the strategy-layer
         # tracker.  Started after user_data_consumer wires the truth store.
@@ -2033,8 +2335,9 @@ class Dispatcher:
         )
 
         # Initialize Heartbeat Monitor for ecosystem fail-safe (AC: Gate behind nats_enabled)
+        # Secondary accounts are handed the primary's monitor by AccountRegistry.
         self.heartbeat_monitor = None
-        if self.settings.nats_enabled:
+        if self.settings.nats_enabled and account_id is None:
             from shared.constants import NATS_URL
 
             # tradeengine#533: enable restricted-mode persistence when the
@@ -2052,15 +2355,27 @@ class Dispatcher:
     async def initialize(self) -> None:
         """Initialize dispatcher components with distributed state management"""
         try:
+            primary = self.account_id is None
+
             # Initialize distributed lock manager first
-            await distributed_lock_manager.initialize()
+            if primary:
+                await distributed_lock_manager.initialize()
+
+            # Warm restart: a fresh local snapshot stands in for the Data
+            # Manager load and the full OCO rebuild below.
+            self.state_snapshotter = StateSnapshotter.from_settings(self)
+            warm = (
+                self.state_snapshotter.load()
+                if self.state_snapshotter is not None
+                else None
+            )
 
             # Initialize components
             await self.order_manager.initialize()
-            await self.position_manager.initialize()
+            await self.position_manager.initialize(snapshot=warm)
 
             # Start heartbeat monitor (AC: Check if initialized)
-            if self.heartbeat_monitor:
+            if self.heartbeat_monitor and primary:
                 await self.heartbeat_monitor.start()
 
             # CRITICAL FIX: Initialize strategy position manager in background
@@ -2074,7 +2389,7 @@ class Dispatcher:
                     self.logger.info(
                         "Starting strategy position manager initialization in background..."
                     )
-                    await strategy_position_manager.initialize()
+                    await self.strategy_position_manager.initialize()
                     self.logger.info(
                         "✅ Strategy position manager initialized successfully"
                     )
@@ -2086,11 +2401,19 @@ class Dispatcher:
                         "Positions will still work via MongoDB fallback"
                     )
 
+            if warm is not None and warm.strategy_positions is not None:
+                self.strategy_position_manager.restore_state(
+                    warm.strategy_positions,
+                    warm.exchange_positions or {},
+                    warm.contributions or {},
+                )
+
             # Start initialization in background (don't await)
-            asyncio.create_task(init_strategy_position_manager_async())
-            self.logger.info(
-                "Strategy position manager initialization started in background"
-            )
+            if primary:
+                asyncio.create_task(init_strategy_position_manager_async())
+                self.logger.info(
+                    "Strategy position manager initialization started in background"
+                )
 
             # PROACTIVE LEVERAGE SETUP (#465: offload sync REST to a thread so it
             # yields the event loop between symbols and does not starve the
@@ -2107,7 +2430,7 @@ class Dispatcher:
                                 symbol=symbol,
                                 leverage=10,
                             )
-                            self.logger.info(f"✅ Leverage set to 10x for {symbol}")
+                            self.logger.info("✅ Leverage set to 10x for %s", symbol)
                         except Exception as lev_err:
                             self.logger.warning(
                                 f"⚠️ Failed to set leverage for {symbol}: {lev_err}"
@@ -2117,7 +2440,9 @@ class Dispatcher:
 
             # STARTUP OCO RECONCILIATION: Rebuild active_oco_pairs from live Binance state
             # This prevents ghost-order errors (-2013/-1102) after pod restarts
-            if self.exchange:
+            if warm is not None:
+                self._restore_oco_state(warm)
+            elif self.exchange:
                 try:
                     await self.oco_manager.reconcile_from_exchange()
                 except Exception as reconcile_err:
@@ -2131,7 +2456,15 @@ class Dispatcher:
                 # execution event. This is the general fix that captures entry
                 # fills (the OCO path only covers SL/TP exits).
                 self.user_data_consumer = UserDataStreamConsumer(
-                    self.exchange, on_fill=self._on_user_data_fill
+                    self.exchange,
+                    on_fill=self._on_user_data_fill,
+                    active_symbols=self._active_symbols,
+                    delta_reseed_max_gap_seconds=(
+                        self.settings.te_user_data_delta_reseed_max_gap_seconds
+                    ),
+                    delta_reseed_max_symbols=(
+                        self.settings.te_user_data_delta_reseed_max_symbols
+                    ),
                 )
                 await self.user_data_consumer.start()
                 # AC2/AC4 (#459 — 446-C): inject the live ExchangeTruthStore into
@@ -2140,16 +2473,17 @@ class Dispatcher:
                 self.position_manager.exchange_truth_store = (
                     self.user_data_consumer.store
                 )
-                strategy_position_manager.exchange_truth_store = (
-                    self.user_data_consumer.store
-                )
+                # Each account's strategy positions are reconciled against
+                # that account's own store.
+                strategy_positions = self.strategy_position_manager
+                strategy_positions.exchange_truth_store = self.user_data_consumer.store
 
                 # #480 — start the strategy-layer ghost reconciler now that
                 # the truth store is available.  AC1 runs an immediate pass
                 # inside start() so any positions left over from a previous
                 # boot get reconciled before the dispatcher accepts work.
                 self.strategy_position_reconciler = StrategyPositionReconciler(
-                    strategy_pos_manager=strategy_position_manager,
+                    strategy_pos_manager=strategy_positions,
                     store=self.user_data_consumer.store,
                 )
                 try:
@@ -2163,6 +2497,9 @@ class Dispatcher:
                         recon_err,
                     )
 
+            if self.state_snapshotter is not None:
+                self.state_snapshotter.start()
+
             self.logger.info(
                 "Dispatcher initialized successfully with distributed state management"
             )
@@ -2170,18 +2507,66 @@ class Dispatcher:
             self.logger.error(f"Dispatcher initialization error: {e}")
             raise
 
+    def _restore_oco_state(self, warm: TradingStateSnapshot) -> None:
+        """Resume OCO tracking from a snapshot; reconcile only the delta.
+
+        The monitor re-polls every restored pair, so legs that filled or were
+        cancelled while the pod was down are handled as usual. The exchange
+        scan runs in the background and skips order ids the snapshot already
+        tracks, adding only protective orders it did not know about.
+        """
+        self.oco_manager.restore_state(warm.oco_pairs, warm.pending_entries)
+        gap = (
+            (datetime.now(UTC) - warm.last_user_data_event).total_seconds()
+            if warm.last_user_data_event is not None
+            else None
+        )
+        self.logger.info(
+            "Warm restart: restored %d OCO keys, %d pending entries from a "
+            "%.1fs-old snapshot (user-data gap %s)",
+            len(warm.oco_pairs),
+            len(warm.pending_entries),
+            warm.age_seconds(),
+            f"{gap:.1f}s" if gap is not None else "unknown",
+        )
+        if self.oco_manager.active_oco_pairs or self.oco_manager.pending_entries:
+            asyncio.create_task(self.oco_manager.start_monitoring())
+        if self.exchange:
+            asyncio.create_task(self._reconcile_oco_delta())
+
+    async def _reconcile_oco_delta(self) -> None:
+        try:
+            added = await self.oco_manager.reconcile_from_exchange()
+            self.logger.info("Warm restart: OCO delta reconcile added %d", added)
+        except Exception as reconcile_err:
+            self.logger.warning(
+                f"⚠️ OCO delta reconciliation failed (non-fatal): {reconcile_err}"
+            )
+
     async def close(self) -> None:
         """Close dispatcher components"""
         try:
-            if self.heartbeat_monitor is not None:
+            primary = self.account_id is None
+            if self.state_snapshotter is not None:
+                # Final snapshot while the in-memory state is still intact.
+                await self.state_snapshotter.stop()
+            if self.heartbeat_monitor is not None and primary:
                 await self.heartbeat_monitor.stop()
             if self.strategy_position_reconciler is not None:
                 await self.strategy_position_reconciler.stop()
             if self.user_data_consumer is not None:
                 await self.user_data_consumer.stop()
+            if self.symbol_actors is not None:
+                await self.symbol_actors.stop()
+            pending_records: set[asyncio.Task[None]] = getattr(
+                self, "_close_record_tasks", set()
+            )
+            if pending_records:
+                await asyncio.gather(*pending_records, return_exceptions=True)
             await self.order_manager.close()
             await self.position_manager.close()
-            await distributed_lock_manager.close()
+            if primary:
+                await distributed_lock_manager.close()
             self.logger.info("Dispatcher closed successfully")
         except Exception as e:
             self.logger.error(f"Dispatcher close error: {e}")
@@ -2229,6 +2614,20 @@ class Dispatcher:
                     "signal_aggregator": "active",
                     "distributed_lock_manager": distributed_lock_health,
                     "exchange_truth_store": exchange_truth_store_health,
+                    "symbol_actors": (
+                        self.symbol_actors.snapshot()
+                        if self.symbol_actors is not None
+                        else "off"
+                    ),
+                    "state_snapshot": (
+                        self.state_snapshotter.snapshot()
+                        if self.state_snapshotter is not None
+                        else "off"
+                    ),
+                    "signal_dedup": {
+                        "signal_ids": self.signal_cache.snapshot(),
+                        "local_claims": self.local_signal_claims.snapshot(),
+                    },
                 },
             }
         except Exception as e:
@@ -2304,45 +2703,56 @@ class Dispatcher:
                 )
             return {"status": "error", "error": str(e)}
 
-    def _generate_signal_id(self, signal: Signal) -> str:
-        """Generate a unique ID for a signal for deduplication.
+    @property
+    def signal_cache_ttl(self) -> float:
+        return self.signal_cache.ttl
+
+    @signal_cache_ttl.setter
+    def signal_cache_ttl(self, seconds: float) -> None:
+        self.signal_cache.ttl = float(seconds)
+
+    def _generate_signal_id(self, signal: Signal) -> int:
+        """Generate a compact dedup key for a signal.
 
-        Uses strategy_id, symbol, action, and timestamp (rounded to second) to identify duplicates.
-        This allows detecting signals that are sent via both HTTP and NATS within the same second.
+        Hashes strategy_id, symbol, action and the timestamp truncated to the
+        second, so a signal sent via both HTTP and NATS within the same second
+        maps to the same key. Keys are only compared within this process.
         """
-        # Round timestamp to second precision to catch duplicates within 1 second
-        timestamp_second = signal.timestamp.isoformat()[:19] if signal.timestamp else ""
-        return (
-            f"{signal.strategy_id}_{signal.symbol}_{signal.action}_{timestamp_second}"
+        timestamp_second = int(signal.timestamp.timestamp()) if signal.timestamp else -1
+        return hash(
+            (signal.strategy_id, signal.symbol, signal.action, timestamp_second)
         )
 
     def _cleanup_signal_cache(self) -> None:
-        """Remove expired entries from the signal cache."""
-        current_time = time.time()
-
-        # Only cleanup if interval has passed
-        if current_time - self.last_cache_cleanup < self.signal_cache_cleanup_interval:
-            return
-
-        # Remove entries older than TTL
-        expired_ids = [
-            signal_id
-            for signal_id, timestamp in self.signal_cache.items()
-            if current_time - timestamp > self.signal_cache_ttl
-        ]
+        """Remove expired entries from the signal and local claim caches."""
+        expired = self.signal_cache.expire()
+        self.local_signal_claims.expire()
+        if expired:
+            self.logger.debug("Cleaned up %s expired signal cache entries", expired)
+
+    def _claim_local_signal(self, signal_fingerprint: str) -> bool:
+        """In-memory stand-in for the per-signal lock on an owned shard."""
+        return self.local_signal_claims.claim(signal_fingerprint)
+
+    async def dispatch(
+        self, signal: Signal, *, broadcast: bool = False
+    ) -> dict[str, Any]:
+        """Dispatch a signal for processing with distributed state management
 
-        for signal_id in expired_ids:
-            del self.signal_cache[signal_id]
+        ``broadcast`` marks a signal that every pod received (NATS without a
+        queue group, TE_SIGNAL_SHARD_MODE=on): pods that do not own the
+        symbol's shard skip it instead of racing for the per-signal lock.
 
-        if expired_ids:
-            self.logger.debug(
-                f"Cleaned up {len(expired_ids)} expired signal cache entries"
+        With TE_SYMBOL_ACTOR_MODE=on the signal is handed to its symbol's
+        actor and this returns once the actor has processed it.
+        """
+        if self.symbol_actors is not None and not self.symbol_actors.in_actor(
+            signal.symbol
+        ):
+            return await self.symbol_actors.call(  # type: ignore[no-any-return]
+                signal.symbol, self.dispatch, signal, broadcast=broadcast
             )
 
-        self.last_cache_cleanup = current_time
-
-    async def dispatch(self, signal: Signal) -> dict[str, Any]:
-        """Dispatch a signal for processing with distributed state management"""
         with tracer.start_as_current_span("dispatcher.dispatch") as span:
             # Add business context attributes to span
             span.set_attribute("signal.symbol", signal.symbol)
@@ -2371,6 +2781,37 @@ class Dispatcher:
                 # Track signal reception time for latency measurement
                 signal_received_at = time.time()
 
+                # Shard ownership: a broadcast signal for a symbol leased by
+                # another pod is that pod's to process (and to report on).
+                # Until this pod has a lease table it can trust ("pending")
+                # it cannot rule out an owner running the signal lock-free.
+                ownership = (
+                    distributed_lock_manager.signal_ownership(signal.symbol)
+                    if broadcast
+                    else None
+                )
+                if ownership in ("other", "pending"):
+                    _hot_signals_processed.labels(
+                        status="skipped_not_owner", action=signal.action
+                    ).inc()
+                    span.set_attribute("signal.skipped", True)
+                    span.set_attribute(
+                        "skip.reason",
+                        "shard_not_owned"
+                        if ownership == "other"
+                        else "shard_leases_pending",
+                    )
+                    span.set_status(trace.Status(trace.StatusCode.OK))
+                    return {
+                        "status": "skipped_not_owner",
+                        "reason": (
+                            "Symbol shard is owned by another pod"
+                            if ownership == "other"
+                            else "Shard lease table not loaded yet"
+                        ),
+                        "symbol": signal.symbol,
+                    }
+
                 # FAIL-SAFE: Check if Heartbeat Monitor is in restricted mode (AC: Follow GEMINI.md mandate)
                 if (
                     self.heartbeat_monitor is not None
@@ -2385,7 +2826,7 @@ class Dispatcher:
                             f"🛑 FAIL-SAFE ABORT: Rejecting {signal.action.upper()} for {signal.symbol} "
                             f"due to RESTRICTED_MODE (CIO heartbeat lost - LLM reasoning unavailable)"
                         )
-                        signals_processed.labels(
+                        _hot_signals_processed.labels(
                             status="aborted_restricted", action=signal.action
                         ).inc()
                         span.set_attribute("signal.aborted", True)
@@ -2409,7 +2850,7 @@ class Dispatcher:
                         }
 
                 # Track signal reception in metrics
-                signals_received.labels(
+                _hot_signals_received.labels(
                     strategy=signal.strategy_id,
                     symbol=signal.symbol,
                     action=signal.action,
@@ -2424,7 +2865,7 @@ class Dispatcher:
                             f"🛑 CIO ENFORCEMENT FAILURE: Rejecting {signal.action.upper()} for {signal.symbol} "
                             f"from UNAUTHORIZED source '{signal.source}'. Expected 'petrosa-cio'."
                         )
-                        signals_processed.labels(
+                        _hot_signals_processed.labels(
                             status="rejected_unauthorized_source", action=signal.action
                         ).inc()
                         span.set_attribute("signal.rejected", True)
@@ -2451,57 +2892,66 @@ class Dispatcher:
                         }
                     else:
                         self.logger.info(
-                            f"🔒 CIO AUDIT VERIFIED: Signal from {signal.source} for {signal.symbol} {signal.action.upper()}"
+                            "🔒 CIO AUDIT VERIFIED: Signal from %s for %s %s",
+                            signal.source,
+                            signal.symbol,
+                            signal.action.upper(),
                         )
 
                 # Enhanced logging for signal reception
                 self.logger.info(
-                    f"📩 SIGNAL RECEIVED: {signal.strategy_id} | "
-                    f"{signal.symbol} {signal.action.upper()} @ {signal.current_price} | "
-                    f"Confidence: {signal.confidence:.2%} | "
-                    f"Timeframe: {signal.timeframe}"
+                    "📩 SIGNAL RECEIVED: %s | %s %s @ %s | Confidence: %.2f%% | "
+                    "Timeframe: %s",
+                    signal.strategy_id,
+                    signal.symbol,
+                    signal.action.upper(),
+                    signal.current_price,
+                    signal.confidence * 100,
+                    signal.timeframe,
                 )
 
                 # Check for duplicate signals (prevents double processing from HTTP + NATS)
                 signal_id = self._generate_signal_id(signal)
                 current_time = time.time()
 
-                if signal_id in self.signal_cache:
-                    age = current_time - self.signal_cache[signal_id]
-                    if age < self.signal_cache_ttl:
-                        # Duplicate detected within TTL window
-                        self.logger.warning(
-                            f"🚫 DUPLICATE SIGNAL DETECTED AND REJECTED: {signal.strategy_id} | "
-                            f"{signal.symbol} {signal.action.upper()} | "
-                            f"Age: {age:.2f}s | Original received {age:.2f}s ago"
-                        )
-                        signals_duplicate.labels(
-                            strategy=signal.strategy_id,
-                            symbol=signal.symbol,
-                            action=signal.action,
-                        ).inc()
-                        span.set_attribute("signal.duplicate", True)
-                        span.set_status(trace.Status(trace.StatusCode.OK))
-                        return {
-                            "status": "duplicate",
-                            "reason": f"Duplicate signal detected (age: {age:.2f}s)",
-                            "original_time": self.signal_cache[signal_id],
-                            "duplicate_age_seconds": age,
-                        }
+                # get() expires stale entries first, so a hit is within TTL
+                original_time = self.signal_cache.get(signal_id, current_time)
+                if original_time is not None:
+                    age = current_time - original_time
+                    self.logger.warning(
+                        "🚫 DUPLICATE SIGNAL DETECTED AND REJECTED: %s | %s %s | "
+                        "Age: %.2fs | Original received %.2fs ago",
+                        signal.strategy_id,
+                        signal.symbol,
+                        signal.action.upper(),
+                        age,
+                        age,
+                    )
+                    _hot_signals_duplicate.labels(
+                        strategy=signal.strategy_id,
+                        symbol=signal.symbol,
+                        action=signal.action,
+                    ).inc()
+                    span.set_attribute("signal.duplicate", True)
+                    span.set_status(trace.Status(trace.StatusCode.OK))
+                    return {
+                        "status": "duplicate",
+                        "reason": f"Duplicate signal detected (age: {age:.2f}s)",
+                        "original_time": original_time,
+                        "duplicate_age_seconds": age,
+                    }
 
                 # Store signal in cache
-                self.signal_cache[signal_id] = current_time
-
-                # Cleanup old cache entries periodically
-                self._cleanup_signal_cache()
+                self.signal_cache.add(signal_id, current_time)
 
                 # Handle hold signals
                 if signal.action == "hold":
                     self.logger.info(
-                        f"⏸️  HOLD SIGNAL FILTERED: {signal.strategy_id} | "
-                        f"{signal.symbol} | No action taken"
+                        "⏸️  HOLD SIGNAL FILTERED: %s | %s | No action taken",
+                        signal.strategy_id,
+                        signal.symbol,
                     )
-                    signals_processed.labels(status="hold", action="hold").inc()
+                    _hot_signals_processed.labels(status="hold", action="hold").inc()
                     span.set_attribute("signal.action", "hold")
                     span.set_status(trace.Status(trace.StatusCode.OK))
                     return {"status": "hold", "reason": "Signal indicates hold action"}
@@ -2527,8 +2977,14 @@ class Dispatcher:
                             if elapsed < ACCUMULATION_COOLDOWN_SECONDS:
                                 remaining = ACCUMULATION_COOLDOWN_SECONDS - elapsed
                                 self.logger.info(
-                                    f"⏱️ ACCUMULATION COOLDOWN: {signal.symbol} {position_side} "
-                                    f"- {remaining:.0f}s remaining (existing qty: {existing_quantity})"
+                                    (
+                                        "⏱️ ACCUMULATION COOLDOWN: %s %s - %.0fs remaining (existing "
+                                        "qty: %s)"
+                                    ),
+                                    signal.symbol,
+                                    position_side,
+                                    remaining,
+                                    existing_quantity,
                                 )
                                 span.set_attribute("signal.rejected", True)
                                 span.set_attribute(
@@ -2549,8 +3005,10 @@ class Dispatcher:
 
                 # Log signal processing
                 self.logger.info(
-                    f"⚙️  PROCESSING SIGNAL: {signal.strategy_id} | "
-                    f"{signal.symbol} {signal.action.upper()}"
+                    "⚙️  PROCESSING SIGNAL: %s | %s %s",
+                    signal.strategy_id,
+                    signal.symbol,
+                    signal.action.upper(),
                 )
 
                 # Process the signal
@@ -2561,9 +3019,13 @@ class Dispatcher:
                 signal_status = result.get("status")
                 if signal_status in ("success", "executed"):
                     self.logger.info(
-                        f"✅ SIGNAL VALIDATED: {signal.strategy_id} | "
-                        f"Converting to order for {signal.symbol} | "
-                        f"Processing status: {signal_status}"
+                        (
+                            "✅ SIGNAL VALIDATED: %s | Converting to order for %s | "
+                            "Processing status: %s"
+                        ),
+                        signal.strategy_id,
+                        signal.symbol,
+                        signal_status,
                     )
 
                     # FIX: Pass the processed order_params to _signal_to_order
@@ -2581,26 +3043,60 @@ class Dispatcher:
                     # This prevents multiple pods from processing the same signal
                     signal_fingerprint = self._generate_signal_fingerprint(signal)
 
-                    self.logger.info(
-                        f"🔐 ACQUIRING DISTRIBUTED LOCK: signal_{signal_fingerprint}"
+                    # Owned shard: the lease already serialises this symbol
+                    # onto this pod, so dedup locally and skip the Mongo lock.
+                    # Anything else (shard mode off, unowned shard, a shard
+                    # still in its handover grace, HTTP signal for a foreign
+                    # shard) takes the per-signal lock.
+                    owns_shard = (
+                        distributed_lock_manager.signal_ownership(signal.symbol)
+                        == "mine"
                     )
+                    if owns_shard:
+                        lock_acquired = self._claim_local_signal(signal_fingerprint)
+                    else:
+                        self.logger.info(
+                            "🔐 ACQUIRING DISTRIBUTED LOCK: signal_%s",
+                            signal_fingerprint,
+                        )
                     # Execute order with distributed lock to ensure consensus
                     # Lock key includes signal fingerprint to prevent duplicate processing
                     try:
-                        execution_result = (
-                            await distributed_lock_manager.execute_with_lock(
-                                f"signal_{signal_fingerprint}",
-                                self._execute_order_with_consensus,
-                                order,
+                        if not owns_shard:
+                            # Every pod got a broadcast: releasing its lock
+                            # would let a pod that reaches it later run it
+                            # again, so the lock is left to expire instead.
+                            lock_options: dict[str, Any] = {}
+                            if broadcast:
+                                lock_options["hold_seconds"] = (
+                                    self.settings.te_signal_broadcast_lock_seconds
+                                )
+                            execution_result = (
+                                await distributed_lock_manager.execute_with_lock(
+                                    f"signal_{signal_fingerprint}",
+                                    self._execute_order_with_consensus,
+                                    order,
+                                    **lock_options,
+                                )
+                            )
+                        elif lock_acquired:
+                            execution_result = await self._execute_order_with_consensus(
+                                order
+                            )
+                        else:
+                            raise Exception(
+                                f"Failed to acquire lock 'signal_{signal_fingerprint}'"
                             )
-                        )
                     except Exception as lock_error:
                         if "Failed to acquire lock" in str(lock_error):
                             self.logger.info(
-                                f"🔒 LOCK ACQUISITION FAILED: {signal.strategy_id} | "
-                                f"Signal already being processed by another pod - SKIPPING"
+                                (
+                                    "🔒 LOCK ACQUISITION FAILED: %s | Signal already being processed "
+                                    "by another pod - SKIPPING"
+                                ),
+                                signal.strategy_id,
                             )
-                            signals_processed.labels(
+                            _hot_signals_processed.labels(
                                 status="skipped_duplicate", action=signal.action
                             ).inc()
                             span.set_attribute("signal.skipped", True)
@@ -2645,19 +3141,24 @@ class Dispatcher:
                                 self.last_accumulation_time[position_key] = time.time()
 
                     self.logger.info(
-                        f"🎯 SIGNAL DISPATCH COMPLETE: {signal.strategy_id} | "
-                        f"Execution status: {execution_result.get('status')} | "
-                        f"Dispatch status: {result['status']}"
+                        (
+                            "🎯 SIGNAL DISPATCH COMPLETE: %s | Execution status: %s | "
+                            "Dispatch status: %s"
+                        ),
+                        signal.strategy_id,
+                        execution_result.get("status"),
+                        result["status"],
                     )
-                    signals_processed.labels(
+                    _hot_signals_processed.labels(
                         status=result["status"], action=signal.action
                     ).inc()
                 elif signal_status == "rejected":
                     self.logger.info(
-                        f"⛔ SIGNAL REJECTED: {signal.strategy_id} | "
-                        f"Reason: {result.get('reason', 'Unknown')}"
+                        "⛔ SIGNAL REJECTED: %s | Reason: %s",
+                        signal.strategy_id,
+                        result.get("reason", "Unknown"),
                     )
-                    signals_processed.labels(
+                    _hot_signals_processed.labels(
                         status="rejected", action=signal.action
                     ).inc()
                     await self._emit_execution_event_from_signal(
@@ -2674,10 +3175,12 @@ class Dispatcher:
                     )
                 else:
                     self.logger.warning(
-                        f"⚠️  SIGNAL VALIDATION FAILED: {signal.strategy_id} | "
-                        f"Status: {signal_status} | Reason: {result.get('reason', 'Unknown')}"
+                        "⚠️  SIGNAL VALIDATION FAILED: %s | Status: %s | Reason: %s",
+                        signal.strategy_id,
+                        signal_status,
+                        result.get("reason", "Unknown"),
                     )
-                    signals_processed.labels(
+                    _hot_signals_processed.labels(
                         status="failed", action=signal.action
                     ).inc()
 
@@ -2699,7 +3202,7 @@ class Dispatcher:
         """Execute order with distributed consensus"""
         try:
             # Check risk limits with distributed state
-            risk_checks_total.labels(
+            hot_risk_checks_total.labels(
                 check_type="position_limits",
                 result="checking",
                 exchange=order.exchange,
@@ -2736,12 +3239,12 @@ class Dispatcher:
                 }
                 rej_source = pm_source_map.get(pm_reason, "risk_check")
                 order.mark_rejected(source=rej_source, reason=pm_reason)
-                risk_rejections_total.labels(
+                hot_risk_rejections_total.labels(
                     reason="position_limits_exceeded",
                     symbol=order.symbol,
                     exchange=order.exchange,
                 ).inc()
-                risk_checks_total.labels(
+                hot_risk_checks_total.labels(
                     check_type="position_limits",
                     result="rejected",
                     exchange=order.exchange,
@@ -2762,13 +3265,13 @@ class Dispatcher:
                     "rejection_source": rej_source,
                 }
 
-            risk_checks_total.labels(
+            hot_risk_checks_total.labels(
                 check_type="position_limits",
                 result="passed",
                 exchange=order.exchange,
             ).inc()
 
-            risk_checks_total.labels(
+            hot_risk_checks_total.labels(
                 check_type="daily_loss_limits",
                 result="checking",
                 exchange=order.exchange,
@@ -2782,12 +3285,12 @@ class Dispatcher:
                     source="risk_check",
                     reason="daily_loss_limits_exceeded",
                 )
-                risk_rejections_total.labels(
+                hot_risk_rejections_total.labels(
                     reason="daily_loss_limits_exceeded",
                     symbol=order.symbol,
                     exchange=order.exchange,
                 ).inc()
-                risk_checks_total.labels(
+                hot_risk_checks_total.labels(
                     check_type="daily_loss_limits",
                     result="rejected",
                     exchange=order.exchange,
@@ -2807,14 +3310,14 @@ class Dispatcher:
                     "rejection_source": "risk_check",
                 }
 
-            risk_checks_total.labels(
+            hot_risk_checks_total.labels(
                 check_type="daily_loss_limits",
                 result="passed",
                 exchange=order.exchange,
             ).inc()
 
             # -- AC2 + AC3: Leverage Bound check (FR64, P6.4) ----------------
-            risk_checks_total.labels(
+            hot_risk_checks_total.labels(
                 check_type="leverage_bound",
                 result="checking",
                 exchange=order.exchange,
@@ -2842,7 +3345,9 @@ class Dispatcher:
                 # position's resolved config. Falls back to 10x if config lookup
                 # fails or config_manager is unavailable.
                 _open_leverages: list[int] = []
-                for _pos in strategy_position_manager.get_all_open_strategy_positions():
+                for (
+                    _pos
+                ) in self.strategy_position_manager.get_all_open_strategy_positions():
                     try:
                         _pos_strat = _pos.get("strategy_id")
                         _pos_sym = _pos.get("symbol", order.symbol)
@@ -2871,7 +3376,7 @@ class Dispatcher:
 
             if not _lb_pass:
                 order.mark_rejected(source="leverage_bound", reason=_lb_reason)
-                risk_checks_total.labels(
+                hot_risk_checks_total.labels(
                     check_type="leverage_bound",
                     result="rejected",
                     exchange=order.exchange,
@@ -2891,7 +3396,7 @@ class Dispatcher:
                     "rejection_source": "leverage_bound",
                 }
 
-            risk_checks_total.labels(
+            hot_risk_checks_total.labels(
                 check_type="leverage_bound",
                 result="passed",
                 exchange=order.exchange,
@@ -2913,12 +3418,14 @@ class Dispatcher:
             # Update position with distributed state management and create position record
             # Market orders return "NEW" status immediately, which is valid for risk management
             self.logger.info(
-                f"🔍 ORDER RESULT CHECK: status={result.get('status') if result else None}, has_result={result is not None}"
+                "🔍 ORDER RESULT CHECK: status=%s, has_result=%s",
+                result.get("status") if result else None,
+                result is not None,
             )
 
             if result and result.get("status") in ["filled", "partially_filled", "NEW"]:
                 self.logger.info(
-                    f"✅ ORDER STATUS VALID FOR POSITION UPDATE: {order.symbol}"
+                    "✅ ORDER STATUS VALID FOR POSITION UPDATE: %s", order.symbol
                 )
                 # CRITICAL FIX: Position update with retry logic
                 position_updated = False
@@ -2927,19 +3434,28 @@ class Dispatcher:
                 for attempt in range(max_retries):
                     try:
                         self.logger.info(
-                            f"🔄 Updating position for {order.symbol} (attempt {attempt + 1}/{max_retries})"
+                            "🔄 Updating position for %s (attempt %s/%s)",
+                            order.symbol,
+                            attempt + 1,
+                            max_retries,
                         )
                         await asyncio.wait_for(
                             self.position_manager.update_position(order, result),
                             timeout=10.0,  # Increased from 5s to 10s
                         )
                         self.logger.info(
-                            f"✅ Position updated | event=position_updated | symbol={order.symbol} | "
-                            f"order_id={order.order_id} | position_id={result.get('position_id')}"
+                            (
+                                "✅ Position updated | event=position_updated | symbol=%s | "
+                                "order_id=%s | position_id=%s"
+                            ),
+                            order.symbol,
+                            order.order_id,
+                            result.get("position_id"),
                         )
                         position_updated = True
                         self.logger.info(
-                            f"🔍 DEBUG: position_updated={position_updated}, breaking from retry loop"
+                            "🔍 DEBUG: position_updated=%s, breaking from retry loop",
+                            position_updated,
                         )
                         break  # Success, exit retry loop
                     except TimeoutError:
@@ -2971,14 +3487,19 @@ class Dispatcher:
 
                 # Only create position record if position update succeeded
                 self.logger.info(
-                    f"🔍 DEBUG: Exited retry loop for {order.symbol}, position_updated={position_updated}"
+                    "🔍 DEBUG: Exited retry loop for %s, position_updated=%s",
+                    order.symbol,
+                    position_updated,
                 )
                 self.logger.info(
-                    f"🔍 DEBUG: About to check position_updated={position_updated} for {order.symbol}"
+                    "🔍 DEBUG: About to check position_updated=%s for %s",
+                    position_updated,
+                    order.symbol,
                 )
                 if position_updated:
                     self.logger.info(
-                        f"🔍 DEBUG: ENTERED if position_updated block for {order.symbol}"
+                        "🔍 DEBUG: ENTERED if position_updated block for %s",
+                        order.symbol,
                     )
                     try:
                         await asyncio.wait_for(
@@ -2986,7 +3507,7 @@ class Dispatcher:
                             timeout=5.0,
                         )
                         self.logger.info(
-                            f"✅ Position record created for {order.symbol}"
+                            "✅ Position record created for %s", order.symbol
                         )
                     except TimeoutError:
                         self.logger.error(
@@ -3002,13 +3523,15 @@ class Dispatcher:
                         signal = self.order_to_signal.get(order.order_id)
                         if signal:
                             strategy_position_id = await asyncio.wait_for(
-                                strategy_position_manager.create_strategy_position(
+                                self.strategy_position_manager.create_strategy_position(
                                     signal, order, result
                                 ),
                                 timeout=5.0,
                             )
                             self.logger.info(
-                                f"✅ Strategy position {strategy_position_id} created for {signal.strategy_id}"
+                                "✅ Strategy position %s created for %s",
+                                strategy_position_id,
+                                signal.strategy_id,
                             )
 
                             # NEW: Map order to strategy position for OCO attribution
@@ -3016,7 +3539,9 @@ class Dispatcher:
                                 strategy_position_id
                             )
                             self.logger.info(
-                                f"📍 Mapped order {order.order_id} → strategy_position {strategy_position_id}"
+                                "📍 Mapped order %s → strategy_position %s",
+                                order.order_id,
+                                strategy_position_id,
                             )
 
                             # Clean up signal mapping
@@ -3041,10 +3566,16 @@ class Dispatcher:
 
                     # Only place risk management orders if position was successfully updated
                     self.logger.info(
-                        f"🔍 DEBUG: About to place risk management orders for {order.symbol}"
+                        "🔍 DEBUG: About to place risk management orders for %s",
+                        order.symbol,
                     )
                     self.logger.info(
-                        f"🛡️ ATTEMPTING TO PLACE RISK MANAGEMENT ORDERS for {order.symbol} | position_updated={position_updated}"
+                        (
+                            "🛡️ ATTEMPTING TO PLACE RISK MANAGEMENT ORDERS for %s | "
+                            "position_updated=%s"
+                        ),
+                        order.symbol,
+                        position_updated,
                     )
 
                     # #371: Route CONDITIONAL/NEW entries to the deferred-OCO path.
@@ -3058,14 +3589,15 @@ class Dispatcher:
 
                     try:
                         self.logger.info(
-                            f"🔧 Calling _place_risk_management_orders() for {order.symbol}"
+                            "🔧 Calling _place_risk_management_orders() for %s",
+                            order.symbol,
                         )
                         await asyncio.wait_for(
                             self._place_risk_management_orders(order, result),
                             timeout=10.0,  # Longer timeout for exchange API calls
                         )
                         self.logger.info(
-                            f"✅ Risk management orders placed for {order.symbol}"
+                            "✅ Risk management orders placed for %s", order.symbol
                         )
                     except Exception as e:
                         self.logger.error(
@@ -3151,7 +3683,7 @@ class Dispatcher:
                                     f"(status={rollback_status}, error={close_err!r})"
                                 )
                             self.logger.info(
-                                f"✅ Atomic rollback successful for {order.symbol}"
+                                "✅ Atomic rollback successful for %s", order.symbol
                             )
 
                             # Log critical event to audit trail
@@ -3430,8 +3962,6 @@ class Dispatcher:
         self, signal: Signal, order_params: dict[str, Any] | None = None
     ) -> TradeOrder:
         """Convert a signal to a trade order with dynamic minimum amounts"""
-        import uuid
-
         # Use parameters from signal, but allow overrides from processed order_params
         current_signal = signal.model_copy()
         if order_params:
@@ -3475,9 +4005,15 @@ class Dispatcher:
 
         # CRITICAL DEBUG: Log TP/SL values from signal
         self.logger.info(
-            f"🔍 SIGNAL TO ORDER CONVERSION | Symbol: {current_signal.symbol} | "
-            f"Signal SL: {current_signal.stop_loss} | Signal TP: {current_signal.take_profit} | "
-            f"Signal SL_pct: {current_signal.stop_loss_pct} | Signal TP_pct: {current_signal.take_profit_pct}"
+            (
+                "🔍 SIGNAL TO ORDER CONVERSION | Symbol: %s | Signal SL: %s | "
+                "Signal TP: %s | Signal SL_pct: %s | Signal TP_pct: %s"
+            ),
+            current_signal.symbol,
+            current_signal.stop_loss,
+            current_signal.take_profit,
+            current_signal.stop_loss_pct,
+            current_signal.take_profit_pct,
         )
 
         # Create the order
@@ -3531,58 +4067,44 @@ class Dispatcher:
                 signal.symbol, current_price
             )
 
-            # Determine whether to use percentage or fixed quantity
-            # 1. Use quantity IF it's provided AND pct is missing (None)
-            # This allows legacy fixed-quantity signals and the test suite to work.
-            if (
-                signal.quantity
-                and signal.quantity > 0
-                and signal.position_size_pct is None
-            ):
-                if signal.quantity < min_amount:
-                    self.logger.warning(
-                        f"Signal quantity {signal.quantity} is below minimum {min_amount} "
-                        f"for {signal.symbol} at ${current_price:.2f}. Using minimum."
-                    )
-                    amount = min_amount
-                else:
-                    amount = signal.quantity
-            # 2. Otherwise use position_size_pct IF it's provided
-            elif signal.position_size_pct and signal.position_size_pct > 0:
-                total_portfolio_value = self.position_manager.total_portfolio_value
-                if total_portfolio_value > 0 and current_price > 0:
-                    # amount = (total_value * pct) / price
-                    calculated_amount = (
-                        total_portfolio_value * signal.position_size_pct
-                    ) / current_price
-
-                    if calculated_amount < min_amount:
-                        self.logger.warning(
-                            f"Calculated amount {calculated_amount} from {signal.position_size_pct:.2%} size "
-                            f"is below minimum {min_amount}. Using minimum."
-                        )
-                        amount = min_amount
-                    else:
-                        amount = calculated_amount
-                        self.logger.info(
-                            f"Amount calculated from position_size_pct ({signal.position_size_pct:.2%}): {amount}"
-                        )
-                else:
-                    self.logger.warning(
-                        f"Cannot calculate amount from pct: portfolio_value={total_portfolio_value}, price={current_price}. Using minimum."
-                    )
-                    amount = min_amount
-            # 3. Fallback to quantity if it exists but pct logic failed/was skipped
-            elif signal.quantity and signal.quantity > 0:
-                amount = max(signal.quantity, min_amount)
-            else:
-                # Use calculated minimum
-                amount = min_amount
+            total_portfolio_value = self.position_manager.total_portfolio_value
+            amount, basis = order_amount(
+                signal.quantity,
+                signal.position_size_pct,
+                total_portfolio_value,
+                current_price,
+                min_amount,
+            )
+            if basis == "quantity_below_min":
+                self.logger.warning(
+                    f"Signal quantity {signal.quantity} is below minimum {min_amount} "
+                    f"for {signal.symbol} at ${current_price:.2f}. Using minimum."
+                )
+            elif basis == "pct_below_min":
+                self.logger.warning(
+                    f"Amount from {signal.position_size_pct:.2%} size "
+                    f"is below minimum {min_amount}. Using minimum."
+                )
+            elif basis == "pct_unavailable":
+                self.logger.warning(
+                    f"Cannot calculate amount from pct: portfolio_value={total_portfolio_value}, price={current_price}. Using minimum."
+                )
+            elif basis == "pct":
+                self.logger.info(
+                    f"Amount calculated from position_size_pct ({signal.position_size_pct:.2%}): {amount}"
+                )
 
             self.logger.info(
-                f"Order amount final for {signal.symbol}: amount={amount}, "
-                f"signal_qty={signal.quantity}, signal_pct={signal.position_size_pct}, "
-                f"min_required={min_amount}, current_price={current_price}"
+                (
+                    "Order amount final for %s: amount=%s, signal_qty=%s, "
+                    "signal_pct=%s, min_required=%s, current_price=%s"
+                ),
+                signal.symbol,
+                amount,
+                signal.quantity,
+                signal.position_size_pct,
+                min_amount,
+                current_price,
             )
 
             return amount
@@ -3618,8 +4140,6 @@ class Dispatcher:
 
     async def execute_order(self, order: TradeOrder) -> dict[str, Any]:
         """Execute a trading order with detailed logging"""
-        import time
-
         start_time = time.time()
 
         with tracer.start_as_current_span("dispatcher.execute_order") as span:
@@ -3638,9 +4158,13 @@ class Dispatcher:
             try:
                 # Enhanced logging for order execution
                 self.logger.info(
-                    f"🔨 EXECUTING ORDER: {order.symbol} {order.side.upper()} "
-                    f"{order.amount} @ {order.target_price} | "
-                    f"Type: {order.type} | ID: {order.order_id}"
+                    "🔨 EXECUTING ORDER: %s %s %s @ %s | Type: %s | ID: %s",
+                    order.symbol,
+                    order.side.upper(),
+                    order.amount,
+                    order.target_price,
+                    order.type,
+                    order.order_id,
                 )
 
                 # Log order
@@ -3651,7 +4175,7 @@ class Dispatcher:
                 if order.simulate:
                     # Simulated order - just track locally
                     self.logger.info(
-                        f"🎭 SIMULATION MODE: Order {order.order_id} simulated"
+                        "🎭 SIMULATION MODE: Order %s simulated", order.order_id
                     )
                     result = {"status": "pending", "simulated": True}
                     await self.order_manager.track_order(order, result)
@@ -3660,19 +4184,27 @@ class Dispatcher:
                     if self.exchange:
                         try:
                             self.logger.info(
-                                f"📤 SENDING TO BINANCE: {order.symbol} {order.side} "
-                                f"{order.amount} @ {order.target_price}"
+                                "📤 SENDING TO BINANCE: %s %s %s @ %s",
+                                order.symbol,
+                                order.side,
+                                order.amount,
+                                order.target_price,
                             )
                             result = await self.exchange.execute(order)
                             await self.order_manager.track_order(order, result)
 
                             # Log success with details
                             self.logger.info(
-                                f"✅ BINANCE ORDER EXECUTED: {order.symbol} {order.side} | "
-                                f"Status: {result.get('status')} | "
-                                f"Order ID: {result.get('order_id', 'N/A')} | "
-                                f"Fill Price: {result.get('fill_price', 'N/A')} | "
-                                f"Result: {result}"
+                                (
+                                    "✅ BINANCE ORDER EXECUTED: %s %s | Status: %s | Order ID: %s | "
+                                    "Fill Price: %s | Result: %s"
+                                ),
+                                order.symbol,
+                                order.side,
+                                result.get("status"),
+                                result.get("order_id", "N/A"),
+                                result.get("fill_price", "N/A"),
+                                result,
                             )
                         except Exception as exchange_error:
                             self.logger.error(
@@ -3722,15 +4254,17 @@ class Dispatcher:
                     )
 
                 self.logger.info(
-                    f"📊 ORDER EXECUTION COMPLETE: {order.order_id} | Status: {result.get('status')}"
+                    "📊 ORDER EXECUTION COMPLETE: %s | Status: %s",
+                    order.order_id,
+                    result.get("status"),
                 )
 
                 # Track order execution metrics
                 execution_time = time.time() - start_time
-                order_execution_time.labels(
+                _hot_order_execution_time.labels(
                     symbol=order.symbol, side=order.side
                 ).observe(execution_time)
-                orders_executed.labels(
+                _hot_orders_executed.labels(
                     symbol=order.symbol,
                     side=order.side,
                     status=result.get("status", "unknown"),
@@ -3740,7 +4274,7 @@ class Dispatcher:
                 order_status = result.get("status", "unknown")
 
                 # Emit order execution by type metric
-                orders_executed_by_type.labels(
+                hot_orders_executed_by_type.labels(
                     order_type=order.type,
                     side=order.side,
                     symbol=order.symbol,
@@ -3750,20 +4284,21 @@ class Dispatcher:
                 # Calculate and emit order latency (signal → execution)
                 if order.meta and "signal_received_at" in order.meta:
                     signal_latency = time.time() - order.meta["signal_received_at"]
-                    order_execution_latency_seconds.labels(
+                    hot_order_execution_latency_seconds.labels(
                         symbol=order.symbol,
                         order_type=order.type,
                         exchange=order.exchange,
                     ).observe(signal_latency)
 
                     self.logger.info(
-                        f"📊 ORDER LATENCY: {signal_latency:.3f}s from signal receipt to execution complete"
+                        "📊 ORDER LATENCY: %.3fs from signal receipt to execution complete",
+                        signal_latency,
                     )
 
                 # Track order failures
                 if order_status in ["error", "rejected", "cancelled"]:
                     failure_reason = result.get("error", "unknown")
-                    order_failures_total.labels(
+                    hot_order_failures_total.labels(
                         symbol=order.symbol,
                         order_type=order.type,
                         failure_reason=str(failure_reason)[
@@ -3895,6 +4430,30 @@ class Dispatcher:
         if exch_order_id:
             self.exchange_order_id_to_signal.pop(str(exch_order_id), None)
 
+    def _active_symbols(self) -> set[str]:
+        """Symbols this dispatcher is working: positions, OCO pairs, pending entries.
+
+        The user-data consumer adds them to its delta-reseed scope so a
+        short stream gap re-reads every symbol the engine could have moved.
+        """
+        symbols = {key[0] for key in self.position_manager.positions}
+        for pairs in self.oco_manager.active_oco_pairs.values():
+            for pair in pairs if isinstance(pairs, list) else [pairs]:
+                if isinstance(pair, dict) and pair.get("symbol"):
+                    symbols.add(pair["symbol"])
+        for entry in self.oco_manager.pending_entries.values():
+            if isinstance(entry, dict) and entry.get("symbol"):
+                symbols.add(entry["symbol"])
+        return symbols
+
+    async def _on_fill_audit_enriched(
+        self, order: TradeOrder, result: dict[str, Any]
+    ) -> None:
+        """Publish the userTrades fee/pnl of an earlier fill as a follow-up event."""
+        await self._emit_execution_event_from_order(
+            order, result, event_type="fill_audit", reason="fill_audit_enriched"
+        )
+
     async def _on_user_data_fill(self, order_obj: dict[str, Any]) -> None:
         """Publish a `filled` execution event for an entry fill (#531).
 
@@ -3905,8 +4464,23 @@ class Dispatcher:
         the OCO close path (``_emit_oco_exit_filled_event``) and are skipped
         here when reduce_only is set, to avoid a duplicate `filled` event.
 
-        Best-effort: never raises into the truth-store callback.
+        Best-effort: never raises into the truth-store callback. With
+        TE_SYMBOL_ACTOR_MODE=on the update is queued on its symbol's actor
+        so the user-data stream never waits behind a slow symbol.
         """
+        actor_symbol = order_obj.get("s")
+        if (
+            self.symbol_actors is not None
+            and actor_symbol
+            and not self.symbol_actors.in_actor(actor_symbol)
+        ):
+            try:
+                self.symbol_actors.post(
+                    actor_symbol, self._on_user_data_fill, order_obj
+                )
+                return
+            except RuntimeError:
+                pass  # runtime stopped (shutdown): handle inline
         try:
             symbol = order_obj.get("s", "")
             order_id = str(order_obj.get("i", ""))
@@ -3945,6 +4519,17 @@ class Dispatcher:
                 )
                 return
 
+            # #371: a FILLED deferred CONDITIONAL entry gets its OCO now, not
+            # on the next backstop sweep. Best-effort; the sweep still covers it.
+            try:
+                await self.oco_manager.on_entry_fill(order_obj)
+            except Exception as oco_err:
+                self.logger.error(
+                    "Deferred OCO trigger from user-data fill failed for %s: %s",
+                    order_id,
+                    oco_err,
+                )
+
             # Recover strategy_id + decision_id, preferring the synchronous
             # exchange_order_id_to_signal map (#546) registered the instant
             # execute_order() returns — this beats the near-instant WS FILLED
@@ -3957,9 +4542,11 @@ class Dispatcher:
             # bounded retry for the residual sub-second window where even the
             # early map has not landed yet.
             from tradeengine.strategy_position_manager import (
-                strategy_position_manager,
+                strategy_positions_for_account,
             )
 
+            strategy_position_manager = strategy_positions_for_account(self.account_id)
+
             def _resolve_from_signal_map() -> tuple[str, str | None] | None:
                 sig = self.exchange_order_id_to_signal.pop(order_id, None)
                 if sig is None:
@@ -4234,8 +4821,11 @@ class Dispatcher:
         try:
             await self.oco_manager.defer_oco_until_filled(order, entry_oid)
             self.logger.info(
-                f"⏸️ Skipping immediate risk-management placement for {order.symbol}: "
-                f"entry is CONDITIONAL/NEW, OCO deferred until FILLED"
+                (
+                    "⏸️ Skipping immediate risk-management placement for %s: entry "
+                    "is CONDITIONAL/NEW, OCO deferred until FILLED"
+                ),
+                order.symbol,
             )
             return result
         except Exception as defer_err:
@@ -4303,9 +4893,15 @@ class Dispatcher:
         try:
             # ENTRY LOG - Always log when this method is called
             self.logger.info(
-                f"🔧 ENTERING _place_risk_management_orders | Symbol: {order.symbol} | "
-                f"SL: {order.stop_loss} | TP: {order.take_profit} | "
-                f"Exchange: {self.exchange is not None} | Reduce_only: {order.reduce_only}"
+                (
+                    "🔧 ENTERING _place_risk_management_orders | Symbol: %s | SL: %s "
+                    "| TP: %s | Exchange: %s | Reduce_only: %s"
+                ),
+                order.symbol,
+                order.stop_loss,
+                order.take_profit,
+                self.exchange is not None,
+                order.reduce_only,
             )
 
             if not self.exchange:
@@ -4334,10 +4930,14 @@ class Dispatcher:
                 if existing_protective:
                     order_placement_skipped_total.labels(reason="already_armed").inc()
                     self.logger.info(
-                        f"⏭️ Skipping protective order placement for {order.symbol}: "
-                        f"exchange already has {len(existing_protective)} armed protective "
-                        f"order(s) ({[o.order_type for o in existing_protective]}). "
-                        "Skipping to prevent duplicates."
+                        (
+                            "⏭️ Skipping protective order placement for %s: exchange already "
+                            "has %s armed protective order(s) (%s). Skipping to prevent "
+                            "duplicates."
+                        ),
+                        order.symbol,
+                        len(existing_protective),
+                        [o.order_type for o in existing_protective],
                     )
                     return
 
@@ -4425,7 +5025,9 @@ class Dispatcher:
                 else:  # SHORT
                     order.stop_loss = entry_price * (1 + order.stop_loss_pct)
                 self.logger.info(
-                    f"Calculated stop_loss price: {order.stop_loss} from {order.stop_loss_pct * 100}%"
+                    "Calculated stop_loss price: %s from %s%%",
+                    order.stop_loss,
+                    order.stop_loss_pct * 100,
                 )
 
             if not order.take_profit and order.take_profit_pct and entry_price > 0:
@@ -4434,7 +5036,9 @@ class Dispatcher:
                 else:  # SHORT
                     order.take_profit = entry_price * (1 - order.take_profit_pct)
                 self.logger.info(
-                    f"Calculated take_profit price: {order.take_profit} from {order.take_profit_pct * 100}%"
+                    "Calculated take_profit price: %s from %s%%",
+                    order.take_profit,
+                    order.take_profit_pct * 100,
                 )
 
             # SL/TP DIRECTION VALIDATION (#479): always enforce position-side-correct
@@ -4597,7 +5201,7 @@ class Dispatcher:
                 and order.take_profit > 0
             ):
                 # Use OCO logic for paired SL/TP orders
-                self.logger.info(f"🔄 PLACING OCO ORDERS FOR {order.symbol}")
+                self.logger.info("🔄 PLACING OCO ORDERS FOR %s", order.symbol)
 
                 # Get the filled quantity with robust extraction
                 # Market orders may return amount=0 when status is NEW (not yet filled)
@@ -4614,11 +5218,12 @@ class Dispatcher:
                 if filled_quantity is None or filled_quantity <= 0:
                     filled_quantity = order.amount
                     self.logger.info(
-                        f"Using order.amount ({order.amount}) for OCO - "
-                        f"result amount was {result.get('amount')}"
+                        "Using order.amount (%s) for OCO - result amount was %s",
+                        order.amount,
+                        result.get("amount"),
                     )
                 else:
-                    self.logger.info(f"Using filled amount {filled_quantity} for OCO")
+                    self.logger.info("Using filled amount %s for OCO", filled_quantity)
 
                 # Final safety check
                 if filled_quantity <= 0:
@@ -4661,8 +5266,12 @@ class Dispatcher:
                     entry_price = 0.0
 
                 self.logger.info(
-                    f"🎯 Placing OCO with strategy context: "
-                    f"strategy_position_id={strategy_position_id}, entry_price={entry_price}"
+                    (
+                        "🎯 Placing OCO with strategy context: strategy_position_id=%s, "
+                        "entry_price=%s"
+                    ),
+                    strategy_position_id,
+                    entry_price,
                 )
 
                 oco_result = await self.oco_manager.place_oco_orders(
@@ -4678,7 +5287,7 @@ class Dispatcher:
 
                 if oco_result["status"] == "success":
                     self.logger.info(
-                        f"✅ OCO ORDERS PLACED SUCCESSFULLY FOR {order.symbol}"
+                        "✅ OCO ORDERS PLACED SUCCESSFULLY FOR %s", order.symbol
                     )
 
                     # Update position record with OCO order IDs
@@ -4697,12 +5306,10 @@ class Dispatcher:
                     # RiskOrderIds, rejecting price-shaped strings.
                     if strategy_position_id:
                         try:
-                            await (
-                                strategy_position_manager.set_strategy_position_orders(
-                                    strategy_position_id=strategy_position_id,
-                                    sl_order_id=oco_result.get("sl_order_id"),
-                                    tp_order_id=oco_result.get("tp_order_id"),
-                                )
+                            await self.strategy_position_manager.set_strategy_position_orders(
+                                strategy_position_id=strategy_position_id,
+                                sl_order_id=oco_result.get("sl_order_id"),
+                                tp_order_id=oco_result.get("tp_order_id"),
                             )
                         except Exception as exc:
                             # Swallow validation/persistence errors here so
@@ -4722,11 +5329,15 @@ class Dispatcher:
                     # and push towards the Binance 10-order-per-symbol limit.
                     strategy_label = strategy_position_id or order.order_id or "unknown"
                     self.logger.info(
-                        f"✅ OCO CONSOLIDATED: {order.symbol} "
-                        f"({oco_result.get('exchange_position_key')}) already has "
-                        f"{oco_result.get('active_pairs', 1)} active OCO pair(s). "
-                        f"order={strategy_label} added to position without "
-                        f"separate risk orders — existing OCO provides coverage."
+                        (
+                            "✅ OCO CONSOLIDATED: %s (%s) already has %s active OCO pair(s). "
+                            "order=%s added to position without separate risk orders — "
+                            "existing OCO provides coverage."
+                        ),
+                        order.symbol,
+                        oco_result.get("exchange_position_key"),
+                        oco_result.get("active_pairs", 1),
+                        strategy_label,
                     )
                 elif oco_result.get("status") == "skipped_no_position_on_exchange":
                     # AC3 of #445: OCOManager pre-check found no position on the
@@ -4832,8 +5443,9 @@ class Dispatcher:
             if filled_quantity is None or filled_quantity <= 0:
                 filled_quantity = order.amount
                 self.logger.info(
-                    f"Using order.amount ({order.amount}) for SL - "
-                    f"result amount was {result.get('amount')}"
+                    "Using order.amount (%s) for SL - result amount was %s",
+                    order.amount,
+                    result.get("amount"),
                 )
 
             # Safety check
@@ -4925,8 +5537,11 @@ class Dispatcher:
             )
 
             self.logger.info(
-                f"📉 PLACING STOP LOSS: {order.symbol} {stop_loss_order.side} "
-                f"{stop_loss_order.amount} @ {adjusted_stop_loss}"
+                "📉 PLACING STOP LOSS: %s %s %s @ %s",
+                order.symbol,
+                stop_loss_order.side,
+                stop_loss_order.amount,
+                adjusted_stop_loss,
             )
 
             # Execute stop loss order with retry and fallback logic
@@ -4946,10 +5561,14 @@ class Dispatcher:
                 "NEW",
             ]:
                 self.logger.info(
-                    f"✅ STOP LOSS PLACED: {order.symbol} | "
-                    f"Order ID: {sl_result.get('order_id', 'N/A')} | "
-                    f"Stop Price: {sl_result.get('stop_price', order.stop_loss)} | "
-                    f"Status: {sl_result.get('status')}"
+                    (
+                        "✅ STOP LOSS PLACED: %s | Order ID: %s | Stop Price: %s | "
+                        "Status: %s"
+                    ),
+                    order.symbol,
+                    sl_result.get("order_id", "N/A"),
+                    sl_result.get("stop_price", order.stop_loss),
+                    sl_result.get("status"),
                 )
 
                 # Track the stop loss order
@@ -4990,8 +5609,9 @@ class Dispatcher:
             if filled_quantity is None or filled_quantity <= 0:
                 filled_quantity = order.amount
                 self.logger.info(
-                    f"Using order.amount ({order.amount}) for TP - "
-                    f"result amount was {result.get('amount')}"
+                    "Using order.amount (%s) for TP - result amount was %s",
+                    order.amount,
+                    result.get("amount"),
                 )
 
             # Safety check
@@ -5068,8 +5688,11 @@ class Dispatcher:
             )
 
             self.logger.info(
-                f"📈 PLACING TAKE PROFIT: {order.symbol} {take_profit_order.side} "
-                f"{take_profit_order.amount} @ {adjusted_take_profit}"
+                "📈 PLACING TAKE PROFIT: %s %s %s @ %s",
+                order.symbol,
+                take_profit_order.side,
+                take_profit_order.amount,
+                adjusted_take_profit,
             )
 
             # Execute take profit order — with -2021 fallback strategy per #372.
@@ -5096,10 +5719,14 @@ class Dispatcher:
                 # than the original (potentially stale) value.
                 resolved_tp = tp_result.get("take_profit_price", order.take_profit)
                 self.logger.info(
-                    f"✅ TAKE PROFIT PLACED: {order.symbol} | "
-                    f"Order ID: {tp_result.get('order_id', 'N/A')} | "
-                    f"Take Profit Price: {resolved_tp} | "
-                    f"Status: {tp_result.get('status')}"
+                    (
+                        "✅ TAKE PROFIT PLACED: %s | Order ID: %s | Take Profit Price: %s "
+                        "| Status: %s"
+                    ),
+                    order.symbol,
+                    tp_result.get("order_id", "N/A"),
+                    resolved_tp,
+                    tp_result.get("status"),
                 )
 
                 # Track the take profit order
@@ -5194,6 +5821,103 @@ class Dispatcher:
             )
         return None
 
+    def _close_guard_skip(
+        self,
+        symbol: str,
+        position_side: str,
+        reason: str,
+        cio_audited: bool,
+        oco_cancelled: bool,
+        presence: bool | None,
+    ) -> dict[str, Any] | None:
+        """Return the skip result when a close must not be emitted, else None.
+
+        An allowed close is recorded with the thrash breaker.
+        """
+        # Step 1b (#481 AC3): do not emit a close order for a position the
+        # exchange no longer holds. The 2026-06-18 thrash loop fired
+        # reduceOnly closes against ghost strategy positions with no
+        # exchange counterpart. Stale OCO legs are still cancelled above
+        # (harmless cleanup); only the wasteful MARKET close is suppressed.
+        if presence is False:
+            self.logger.warning(
+                "⛔ CLOSE BLOCKED (#481 AC3): exchange reports no open "
+                "%s position for %s — refusing to emit reduceOnly close "
+                "(reason=%s). Ghost strategy row will be evicted by the "
+                "#480 reconciler.",
+                position_side,
+                symbol,
+                reason,
+            )
+            strategy_close_blocked_no_exchange_position_total.labels(
+                symbol=symbol, side=position_side
+            ).inc()
+            return {
+                "position_closed": False,
+                "oco_cancelled": oco_cancelled,
+                "close_result": None,
+                "status": "skipped_no_exchange_position",
+            }
+
+        # Step 1c (#481 AC5): fail-safe thrash circuit-breaker. Block a
+        # close when un-audited closes on this symbol have exceeded the
+        # per-window cap (default 2 in 10 min). Audited closes (a close
+        # tied to a CIO decision) never trip or get blocked by the breaker.
+        if not cio_audited and self.thrash_breaker.should_block(symbol):
+            self.logger.error(
+                "🛑 THRASH CIRCUIT OPEN (#481 AC5): %s exceeded %d un-audited "
+                "close(s) within %d min — blocking further churn "
+                "(reason=%s).",
+                symbol,
+                self.thrash_breaker.max_cycles,
+                self.thrash_breaker.window_minutes,
+                reason,
+            )
+            dispatcher_thrash_circuit_open_total.labels(symbol=symbol).inc()
+            return {
+                "position_closed": False,
+                "oco_cancelled": oco_cancelled,
+                "close_result": None,
+                "status": "skipped_thrash_circuit_open",
+            }
+        # Record the allowed close so it counts toward the window.
+        self.thrash_breaker.record_close(symbol, cio_audited=cio_audited)
+        return None
+
+    def _build_close_order(
+        self, position_id: str, symbol: str, position_side: str, quantity: float
+    ) -> TradeOrder:
+        """Reduce-only MARKET order closing ``quantity`` of a position."""
+        # Determine order side for closing (opposite of position)
+        close_side = "sell" if position_side == "LONG" else "buy"
+
+        return TradeOrder(
+            symbol=symbol,
+            side=close_side,
+            type=OrderType.MARKET,
+            amount=quantity,
+            target_price=None,
+            stop_loss=None,
+            take_profit=None,
+            conditional_price=None,
+            conditional_direction=None,
+            conditional_timeout=None,
+            iceberg_quantity=None,
+            client_order_id=None,
+            order_id=f"close_{position_id}_{int(time.time())}",
+            status=OrderStatus.PENDING,
+            filled_amount=0.0,
+            average_price=None,
+            position_id=None,
+            position_side=position_side,
+            exchange="binance",
+            reduce_only=True,  # This is a position-closing order
+            time_in_force=TimeInForce.GTC,
+            position_size_pct=None,
+            simulate=False,
+            updated_at=None,
+        )
+
     async def close_position_with_cleanup(
         self,
         position_id: str,
@@ -5218,109 +5942,45 @@ class Dispatcher:
         """
         try:
             self.logger.info("🔄 CLOSING POSITION WITH OCO CLEANUP")
-            self.logger.info(f"Position ID: {position_id}")
-            self.logger.info(f"Symbol: {symbol}")
-            self.logger.info(f"Position Side: {position_side}")
-            self.logger.info(f"Quantity: {quantity}")
-            self.logger.info(f"Reason: {reason}")
+            self.logger.info("Position ID: %s", position_id)
+            self.logger.info("Symbol: %s", symbol)
+            self.logger.info("Position Side: %s", position_side)
+            self.logger.info("Quantity: %s", quantity)
+            self.logger.info("Reason: %s", reason)
 
             # Step 1: Cancel associated OCO orders first
             oco_cancelled = False
             if position_id in self.oco_manager.active_oco_pairs:
-                self.logger.info(f"🔄 CANCELLING OCO ORDERS FOR POSITION {position_id}")
+                self.logger.info(
+                    "🔄 CANCELLING OCO ORDERS FOR POSITION %s", position_id
+                )
                 oco_cancelled = await self.oco_manager.cancel_oco_pair(position_id)
                 if oco_cancelled:
                     self.logger.info("✅ OCO ORDERS CANCELLED SUCCESSFULLY")
                 else:
                     self.logger.warning("⚠️  FAILED TO CANCEL OCO ORDERS")
 
-            # Step 1b (#481 AC3): do not emit a close order for a position the
-            # exchange no longer holds. The 2026-06-18 thrash loop fired
-            # reduceOnly closes against ghost strategy positions with no
-            # exchange counterpart. Stale OCO legs are still cancelled above
-            # (harmless cleanup); only the wasteful MARKET close is suppressed.
+            # Step 1b/1c (#481 AC3/AC5): exchange-presence guard and thrash
+            # circuit-breaker.
+            presence = None
             if os.getenv("TE_CLOSE_GUARD_ENABLED", "1") == "1":
                 presence = await self._exchange_position_presence(symbol, position_side)
-                if presence is False:
-                    self.logger.warning(
-                        "⛔ CLOSE BLOCKED (#481 AC3): exchange reports no open "
-                        "%s position for %s — refusing to emit reduceOnly close "
-                        "(reason=%s). Ghost strategy row will be evicted by the "
-                        "#480 reconciler.",
-                        position_side,
-                        symbol,
-                        reason,
-                    )
-                    strategy_close_blocked_no_exchange_position_total.labels(
-                        symbol=symbol, side=position_side
-                    ).inc()
-                    return {
-                        "position_closed": False,
-                        "oco_cancelled": oco_cancelled,
-                        "close_result": None,
-                        "status": "skipped_no_exchange_position",
-                    }
-
-            # Step 1c (#481 AC5): fail-safe thrash circuit-breaker. Block a
-            # close when un-audited closes on this symbol have exceeded the
-            # per-window cap (default 2 in 10 min). Audited closes (a close
-            # tied to a CIO decision) never trip or get blocked by the breaker.
-            if not cio_audited and self.thrash_breaker.should_block(symbol):
-                self.logger.error(
-                    "🛑 THRASH CIRCUIT OPEN (#481 AC5): %s exceeded %d un-audited "
-                    "close(s) within %d min — blocking further churn "
-                    "(reason=%s).",
-                    symbol,
-                    self.thrash_breaker.max_cycles,
-                    self.thrash_breaker.window_minutes,
-                    reason,
-                )
-                dispatcher_thrash_circuit_open_total.labels(symbol=symbol).inc()
-                return {
-                    "position_closed": False,
-                    "oco_cancelled": oco_cancelled,
-                    "close_result": None,
-                    "status": "skipped_thrash_circuit_open",
-                }
-            # Record the allowed close so it counts toward the window.
-            self.thrash_breaker.record_close(symbol, cio_audited=cio_audited)
+            skipped = self._close_guard_skip(
+                symbol, position_side, reason, cio_audited, oco_cancelled, presence
+            )
+            if skipped is not None:
+                return skipped
 
             # Step 2: Close the position
             position_closed = False
             try:
-                # Determine order side for closing (opposite of position)
-                close_side = "sell" if position_side == "LONG" else "buy"
-
-                # Create closing order
-                close_order = TradeOrder(
-                    symbol=symbol,
-                    side=close_side,
-                    type=OrderType.MARKET,
-                    amount=quantity,
-                    target_price=None,
-                    stop_loss=None,
-                    take_profit=None,
-                    conditional_price=None,
-                    conditional_direction=None,
-                    conditional_timeout=None,
-                    iceberg_quantity=None,
-                    client_order_id=None,
-                    order_id=f"close_{position_id}_{int(time.time())}",
-                    status=OrderStatus.PENDING,
-                    filled_amount=0.0,
-                    average_price=None,
-                    position_id=None,
-                    position_side=position_side,
-                    exchange="binance",
-                    reduce_only=True,  # This is a position-closing order
-                    time_in_force=TimeInForce.GTC,
-                    position_size_pct=None,
-                    simulate=False,
-                    updated_at=None,
+                close_order = self._build_close_order(
+                    position_id, symbol, position_side, quantity
                 )
+                close_side = close_order.side
 
                 self.logger.info(
-                    f"📤 CLOSING POSITION: {symbol} {close_side} {quantity}"
+                    "📤 CLOSING POSITION: %s %s %s", symbol, close_side, quantity
                 )
 
                 # Execute closing order
@@ -5329,11 +5989,11 @@ class Dispatcher:
                 else:
                     raise ValueError("Exchange not configured")
 
-                if close_result.get("status") in ["NEW", "FILLED", "PARTIALLY_FILLED"]:
+                if close_result.get("status") in _CLOSE_ACCEPTED_STATUSES:
                     position_closed = True
                     self.logger.info("✅ POSITION CLOSED SUCCESSFULLY")
-                    self.logger.info(f"  Order ID: {close_result.get('order_id')}")
-                    self.logger.info(f"  Status: {close_result.get('status')}")
+                    self.logger.info("  Order ID: %s", close_result.get("order_id"))
+                    self.logger.info("  Status: %s", close_result.get("status"))
                 else:
                     self.logger.error(f"❌ FAILED TO CLOSE POSITION: {close_result}")
 
@@ -5369,6 +6029,186 @@ class Dispatcher:
                 "error": str(e),
             }
 
+    async def close_positions_bulk(
+        self,
+        positions: list[dict[str, Any]],
+        reason: str = "bulk_close",
+        cio_audited: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Close many positions in about one exchange round-trip.
+
+        ``positions`` holds dicts with ``position_id``, ``symbol``,
+        ``position_side`` and ``quantity``. The OCO cancels and exchange
+        presence checks for all of them run concurrently, at most
+        ``te_bulk_close_concurrency`` positions at a time. The #481 guards
+        then apply to each position as in :meth:`close_position_with_cleanup`.
+        The surviving closes are submitted together through the exchange's
+        ``execute_batch`` when it has one. Records of the positions the
+        exchange accepted a close for are updated in a background task
+        afterwards (``record_update="deferred"``), so persistence never holds
+        up the next close. A failed close keeps its record open and carries
+        the exchange's ``error``.
+
+        Returns one result per input, in order, shaped like
+        :meth:`close_position_with_cleanup`'s.
+        """
+        if not positions:
+            return []
+        self.logger.info(
+            "🔄 BULK CLOSE: %d position(s) (reason=%s)", len(positions), reason
+        )
+        limit = asyncio.Semaphore(max(1, int(self.settings.te_bulk_close_concurrency)))
+        guard_enabled = os.getenv("TE_CLOSE_GUARD_ENABLED", "1") == "1"
+
+        async def cancel_oco(position_id: str) -> bool:
+            if position_id not in self.oco_manager.active_oco_pairs:
+                return False
+            try:
+                return bool(await self.oco_manager.cancel_oco_pair(position_id))
+            except Exception as e:
+                self.logger.warning(f"⚠️  FAILED TO CANCEL OCO ORDERS: {e}")
+                return False
+
+        async def presence_of(symbol: str, position_side: str) -> bool | None:
+            if not guard_enabled:
+                return None
+            return await self._exchange_position_presence(symbol, position_side)
+
+        async def prepare(p: dict[str, Any]) -> tuple[bool, bool | None]:
+            async with limit:
+                oco_cancelled, presence = await asyncio.gather(
+                    cancel_oco(p["position_id"]),
+                    presence_of(p["symbol"], p["position_side"]),
+                )
+                return oco_cancelled, presence
+
+        prepared = await asyncio.gather(*(prepare(p) for p in positions))
+
+        results: list[dict[str, Any]] = []
+        to_close: list[tuple[int, TradeOrder]] = []
+        for i, (p, (oco_cancelled, presence)) in enumerate(
+            zip(positions, prepared, strict=True)
+        ):
+            skipped = self._close_guard_skip(
+                p["symbol"],
+                p["position_side"],
+                reason,
+                cio_audited,
+                oco_cancelled,
+                presence,
+            )
+            results.append(
+                skipped
+                or {
+                    "position_closed": False,
+                    "oco_cancelled": oco_cancelled,
+                    "close_result": None,
+                    "status": "failed",
+                }
+            )
+            results[i]["position_id"] = p["position_id"]
+            if skipped is None:
+                to_close.append(
+                    (
+                        i,
+                        self._build_close_order(
+                            p["position_id"],
+                            p["symbol"],
+                            p["position_side"],
+                            float(p["quantity"]),
+                        ),
+                    )
+                )
+
+        close_results: list[dict[str, Any]] = []
+        submit_error: str | None = None
+        if to_close and self.exchange:
+            orders = [order for _, order in to_close]
+            try:
+                if hasattr(self.exchange, "execute_batch"):
+                    close_results = await self.exchange.execute_batch(orders)
+                else:
+
+                    async def execute(order: TradeOrder) -> dict[str, Any]:
+                        async with limit:
+                            result: dict[str, Any] = await self.exchange.execute(order)
+                            return result
+
+                    # One failed close must not discard the ones that filled.
+                    outcomes = await asyncio.gather(
+                        *(execute(o) for o in orders), return_exceptions=True
+                    )
+                    close_results = [
+                        {"status": "error", "error": str(outcome)}
+                        if isinstance(outcome, BaseException)
+                        else outcome
+                        for outcome in outcomes
+                    ]
+            except Exception as e:
+                submit_error = str(e)
+                self.logger.error("❌ ERROR IN BULK CLOSE SUBMISSION: %s", e)
+        elif to_close:
+            submit_error = "Exchange not configured"
+            self.logger.error("❌ ERROR CLOSING POSITION: Exchange not configured")
+
+        closed_ids: list[str] = []
+        for n, (i, order) in enumerate(to_close):
+            close_result = close_results[n] if n < len(close_results) else None
+            if (
+                close_result is not None
+                and close_result.get("status") in _CLOSE_ACCEPTED_STATUSES
+            ):
+                results[i].update(
+                    position_closed=True, close_result=close_result, status="success"
+                )
+                if positions[i]["position_id"]:
+                    closed_ids.append(positions[i]["position_id"])
+                    results[i]["record_update"] = "deferred"
+                continue
+            if close_result is None:
+                results[i]["error"] = submit_error or "no result from exchange"
+            else:
+                results[i]["error"] = str(close_result.get("error") or close_result)
+            self.logger.error(
+                "❌ FAILED TO CLOSE POSITION %s %s: %s",
+                order.symbol,
+                order.position_side,
+                results[i]["error"],
+            )
+
+        if closed_ids:
+            task = asyncio.create_task(self._close_position_records(closed_ids, reason))
+            self._close_record_tasks.add(task)
+            task.add_done_callback(self._close_record_tasks.discard)
+
+        closed = sum(1 for r in results if r["position_closed"])
+        self.logger.info(
+            "✅ BULK CLOSE: %d/%d closed, %d skipped",
+            closed,
+            len(positions),
+            len(positions) - len(to_close),
+        )
+        return results
+
+    async def _close_position_records(
+        self, position_ids: list[str], reason: str
+    ) -> None:
+        """Mark closed position records; one failure does not stop the rest."""
+        outcomes = await asyncio.gather(
+            *(
+                self.position_manager.close_position_record(
+                    position_id, {"reason": reason, "manual_close": True}
+                )
+                for position_id in position_ids
+            ),
+            return_exceptions=True,
+        )
+        for position_id, outcome in zip(position_ids, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                self.logger.error(
+                    f"❌ ERROR UPDATING POSITION RECORD {position_id}: {outcome}"
+                )
+
     def _generate_signal_fingerprint(self, signal: Signal) -> str:
         """
         Generate a unique fingerprint for a signal to prevent duplicate processing
@@ -5388,8 +6228,6 @@ class Dispatcher:
         Returns:
             A unique fingerprint string for distributed locking
         """
-        import hashlib
-
         # Use signal_id if available (preferred)
         if signal.signal_id:
             return f"{signal.signal_id}_{signal.symbol}"
@@ -5438,7 +6276,8 @@ class Dispatcher:
         try:
             # Attempt 1: Try with original stop loss price
             self.logger.info(
-                f"🔄 Attempt 1: Placing SL at original price {original_order.stop_loss}"
+                "🔄 Attempt 1: Placing SL at original price %s",
+                original_order.stop_loss,
             )
             from typing import cast
 
@@ -5484,8 +6323,9 @@ class Dispatcher:
                     adjusted_sl = float(original_order.stop_loss) * 1.01
 
                 self.logger.info(
-                    f"🔄 Attempt 2: Placing SL at adjusted price {adjusted_sl} "
-                    f"(original: {original_order.stop_loss})"
+                    "🔄 Attempt 2: Placing SL at adjusted price %s (original: %s)",
+                    adjusted_sl,
+                    original_order.stop_loss,
                 )
 
                 # Update stop loss order with adjusted price
@@ -5514,7 +6354,7 @@ class Dispatcher:
                     adjusted_sl = float(original_order.stop_loss) * 1.02
 
                 self.logger.info(
-                    f"🔄 Attempt 3: Placing SL at wider adjusted price {adjusted_sl}"
+                    "🔄 Attempt 3: Placing SL at wider adjusted price %s", adjusted_sl
                 )
 
                 stop_loss_order.stop_loss = adjusted_sl
@@ -5578,7 +6418,8 @@ class Dispatcher:
             from typing import cast
 
             self.logger.info(
-                f"🔄 Attempt 1: Placing TP at original price {take_profit_order.take_profit}"
+                "🔄 Attempt 1: Placing TP at original price %s",
+                take_profit_order.take_profit,
             )
             tp_result = cast(
                 dict[str, Any], await self.exchange.execute(take_profit_order)
@@ -5621,8 +6462,9 @@ class Dispatcher:
                     adjusted_tp = float(original_tp) * 1.01
 
                 self.logger.info(
-                    f"🔄 Attempt 2: Placing TP at adjusted price {adjusted_tp} "
-                    f"(original: {original_tp})"
+                    "🔄 Attempt 2: Placing TP at adjusted price %s (original: %s)",
+                    adjusted_tp,
+                    original_tp,
                 )
 
                 take_profit_order.take_profit = adjusted_tp
@@ -5650,7 +6492,7 @@ class Dispatcher:
                     adjusted_tp = float(original_tp) * 1.02
 
                 self.logger.info(
-                    f"🔄 Attempt 3: Placing TP at wider adjusted price {adjusted_tp}"
+                    "🔄 Attempt 3: Placing TP at wider adjusted price %s", adjusted_tp
                 )
 
                 take_profit_order.take_profit = adjusted_tp
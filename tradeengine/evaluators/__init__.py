@@ -3,8 +3,9 @@
 Adopts the shared `petrosa_otel.evaluators` framework (P2.1) so tradeengine
 publishes a structured health verdict on ``evaluator.tradeengine.verdict``,
 closing the last of the five "silent service" gaps that keep
-FR17 / FR23 / FR32 at YELLOW. Read-only over existing Prometheus metrics —
-this module never touches the order / risk / position logic.
+FR17 / FR23 / FR32 at YELLOW. Reads the rolling windows in
+``rolling_window`` that the risk / order / reconciliation paths feed; it never
+changes their behaviour.
 """
 
 from tradeengine.evaluators.health_evaluator import (
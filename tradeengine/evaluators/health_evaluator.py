@@ -4,9 +4,13 @@ Emits ``evaluator.tradeengine.verdict`` via the shared P2.1 framework
 (:mod:`petrosa_otel.evaluators`) so the operator dashboard's evaluator strip
 counts tradeengine among the reporting subsystems (FR17 / FR23 / FR32).
 
-The verdict is sourced **read-only** from existing Prometheus instruments
-already exported by tradeengine — this module deliberately does not touch the
-order / risk / position-tracking code. Three signals are sampled on each tick:
+The verdict mirrors existing Prometheus instruments already exported by
+tradeengine, but reads them from the in-process rolling windows in
+:mod:`tradeengine.evaluators.rolling_window`, which the same code paths update
+alongside the metrics; a tick is O(1) instead of a registry walk whose cost
+grew with label cardinality. ``metrics_source`` may still return cumulative
+totals only (deltas between ticks are used then). Three signals are sampled on
+each tick:
 
 1. **Pre-trade-check pass rate** — `tradeengine_risk_rejections_total` /
    `tradeengine_risk_checks_total`. A sustained high rejection rate (per #404
@@ -54,6 +58,7 @@ from petrosa_otel.evaluators import (
 )
 
 if TYPE_CHECKING:
+    import nats.aio.client
     from petrosa_otel.evaluators.base import HysteresisPolicy
     from petrosa_otel.evaluators.publisher import VerdictPublisher
 
@@ -80,29 +85,6 @@ DEFAULT_LATENCY_THRESHOLD_S = 10.0
 DEFAULT_BASELINE_WINDOW = 8
 
 
-def _counter_total(metric: Any) -> float:
-    """Sum a Prometheus Counter across all label permutations."""
-    total = 0.0
-    for family in metric.collect():
-        for sample in family.samples:
-            if sample.name.endswith("_total"):
-                total += sample.value
-    return total
-
-
-def _histogram_sum_count(metric: Any) -> tuple[float, float]:
-    """Return ``(sum, count)`` aggregated across all label permutations."""
-    s = 0.0
-    c = 0.0
-    for family in metric.collect():
-        for sample in family.samples:
-            if sample.name.endswith("_sum"):
-                s += sample.value
-            elif sample.name.endswith("_count"):
-                c += sample.value
-    return s, c
-
-
 class TradeEngineHealthEvaluator(Evaluator):
     """Subsystem evaluator for tradeengine risk/latency/position health."""
 
@@ -215,6 +197,19 @@ class TradeEngineHealthEvaluator(Evaluator):
         snapshot = self._metrics_source()
         now = self._time()
 
+        window = snapshot.get("window")
+        if window is not None:
+            # Pre-aggregated over the trailing emit interval (see
+            # rolling_window.py): no previous sample or reset handling needed.
+            self._prev_sample_at = now
+            return self._verdict_from_deltas(
+                d_checks=float(window.get("risk_checks", 0.0) or 0.0),
+                d_rejections=float(window.get("risk_rejections", 0.0) or 0.0),
+                d_latency_sum=float(window.get("order_latency_sum", 0.0) or 0.0),
+                d_latency_count=float(window.get("order_latency_count", 0.0) or 0.0),
+                d_divergences=float(window.get("divergences", 0.0) or 0.0),
+            )
+
         checks = float(snapshot.get("risk_checks", 0.0) or 0.0)
         rejections = float(snapshot.get("risk_rejections", 0.0) or 0.0)
         latency_sum = float(snapshot.get("order_latency_sum", 0.0) or 0.0)
@@ -248,12 +243,23 @@ class TradeEngineHealthEvaluator(Evaluator):
             self._rejection_rate_baseline.clear()
             return "unknown", "counter reset detected; rebaselining"
 
-        d_divergences = divergences - prev_divergences
-        d_checks = checks - prev_checks
-        d_rejections = rejections - prev_rejections
-        d_latency_sum = latency_sum - prev_latency_sum
-        d_latency_count = latency_count - prev_latency_count
+        return self._verdict_from_deltas(
+            d_checks=checks - prev_checks,
+            d_rejections=rejections - prev_rejections,
+            d_latency_sum=latency_sum - prev_latency_sum,
+            d_latency_count=latency_count - prev_latency_count,
+            d_divergences=divergences - prev_divergences,
+        )
 
+    def _verdict_from_deltas(
+        self,
+        *,
+        d_checks: float,
+        d_rejections: float,
+        d_latency_sum: float,
+        d_latency_count: float,
+        d_divergences: float,
+    ) -> tuple[str, str]:
         # 1) Position-tracker consistency — any new divergence is unhealthy.
         if d_divergences > 0:
             return (
@@ -295,7 +301,7 @@ def build_tradeengine_health_evaluator(
     *,
     nats_servers: str | None = None,
 ) -> TradeEngineHealthEvaluator | None:
-    """Construct an evaluator wired to tradeengine's existing Prometheus metrics.
+    """Construct an evaluator wired to tradeengine's in-process health signals.
 
     The evaluator owns a dedicated NATS connection for publishing verdicts
     (lazy: opened in ``start()``; closed in ``stop()``). Returns ``None`` when
@@ -307,28 +313,12 @@ def build_tradeengine_health_evaluator(
         )
         return None
 
-    # Import metric objects lazily so this module is importable without
-    # tradeengine.metrics side effects in tests.
-    from tradeengine.metrics import (
-        order_execution_latency_seconds,
-        risk_checks_total,
-        risk_rejections_total,
-    )
-    from tradeengine.position_reconciler import reconciliation_divergences_total
-
-    def _snapshot() -> dict[str, Any]:
-        latency_sum, latency_count = _histogram_sum_count(
-            order_execution_latency_seconds
-        )
-        return {
-            "risk_checks": _counter_total(risk_checks_total),
-            "risk_rejections": _counter_total(risk_rejections_total),
-            "order_latency_sum": latency_sum,
-            "order_latency_count": latency_count,
-            "divergences": _counter_total(reconciliation_divergences_total),
-        }
+    # Imported lazily so this module stays importable without the hot-path
+    # metric side effects in tests. The risk-check / rejection / latency
+    # handles and the reconciler feed these windows directly.
+    from tradeengine.evaluators.rolling_window import health_signals
 
     return TradeEngineHealthEvaluator(
-        metrics_source=_snapshot,
+        metrics_source=health_signals.snapshot,
         nats_servers=nats_servers,
     )
@@ -0,0 +1,148 @@
+"""In-process rolling-window aggregates for the health evaluator.
+
+The evaluator used to rebuild its three signals from the Prometheus registry
+on every tick: ``collect()`` on the risk-check and rejection counters, the
+order-latency histogram and the reconciliation-divergence counter, summing
+every labelled series (and every histogram bucket) to get four numbers. The
+cost grew with label cardinality, i.e. with the number of symbols traded.
+
+Here the code paths that already bump those metrics also add to a
+:class:`RollingWindow`: a ring of fixed-width time buckets holding
+``(count, sum)`` with running totals kept alongside, so both the trailing
+window aggregate and the lifetime total are O(1) reads. Expired buckets are
+subtracted as the ring advances, which costs at most one step per bucket
+and is paid by whichever update or read comes next.
+
+:data:`health_signals` is the process-wide set the evaluator reads; its
+window matches the evaluator's emit interval so each tick sees exactly the
+activity since roughly the previous one.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+from tradeengine.evaluators.health_evaluator import EMIT_INTERVAL_S
+
+_DEFAULT_BUCKET_S = 1.0
+
+
+class RollingWindow:
+    """``(count, sum)`` over the trailing ``window_s`` plus lifetime totals."""
+
+    __slots__ = (
+        "_bucket_s",
+        "_counts",
+        "_sums",
+        "_head",
+        "_count",
+        "_sum",
+        "_clock",
+        "total_count",
+        "total_sum",
+    )
+
+    def __init__(
+        self,
+        window_s: float,
+        bucket_s: float = _DEFAULT_BUCKET_S,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._bucket_s = bucket_s
+        size = max(1, round(window_s / bucket_s))
+        self._counts = [0] * size
+        self._sums = [0.0] * size
+        self._clock = clock
+        # absolute index of the newest bucket
+        self._head = int(clock() // bucket_s)
+        self._count = 0
+        self._sum = 0.0
+        self.total_count = 0
+        self.total_sum = 0.0
+
+    @property
+    def window_s(self) -> float:
+        return len(self._counts) * self._bucket_s
+
+    def _advance(self) -> None:
+        now = int(self._clock() // self._bucket_s)
+        steps = now - self._head
+        if steps <= 0:
+            return
+        size = len(self._counts)
+        if steps >= size:
+            self._counts = [0] * size
+            self._sums = [0.0] * size
+            self._count = 0
+            self._sum = 0.0
+        else:
+            for i in range(self._head + 1, now + 1):
+                slot = i % size
+                self._count -= self._counts[slot]
+                self._sum -= self._sums[slot]
+                self._counts[slot] = 0
+                self._sums[slot] = 0.0
+        self._head = now
+
+    def add(self, value: float = 1.0) -> None:
+        self._advance()
+        slot = self._head % len(self._counts)
+        self._counts[slot] += 1
+        self._sums[slot] += value
+        self._count += 1
+        self._sum += value
+        self.total_count += 1
+        self.total_sum += value
+
+    @property
+    def count(self) -> int:
+        self._advance()
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        self._advance()
+        # Float drift from repeated add/subtract must not read as negative.
+        return self._sum if self._count else 0.0
+
+    def mean(self) -> float | None:
+        count = self.count
+        return self.sum / count if count else None
+
+
+class HealthSignals:
+    """The evaluator's inputs, updated directly by the code paths it watches."""
+
+    def __init__(
+        self,
+        window_s: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.risk_checks = RollingWindow(window_s, clock=clock)
+        self.risk_rejections = RollingWindow(window_s, clock=clock)
+        self.order_latency = RollingWindow(window_s, clock=clock)
+        self.divergences = RollingWindow(window_s, clock=clock)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Lifetime totals (evaluator's cumulative keys) plus the window."""
+        latency = self.order_latency
+        return {
+            "risk_checks": self.risk_checks.total_sum,
+            "risk_rejections": self.risk_rejections.total_sum,
+            "order_latency_sum": latency.total_sum,
+            "order_latency_count": latency.total_count,
+            "divergences": self.divergences.total_sum,
+            "window": {
+                "window_s": self.risk_checks.window_s,
+                "risk_checks": self.risk_checks.sum,
+                "risk_rejections": self.risk_rejections.sum,
+                "order_latency_sum": latency.sum,
+                "order_latency_count": latency.count,
+                "divergences": self.divergences.sum,
+            },
+        }
+
+
+health_signals = HealthSignals(window_s=EMIT_INTERVAL_S)
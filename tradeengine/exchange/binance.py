@@ -28,6 +28,13 @@ from binance.exceptions import BinanceAPIException
 
 from contracts.order import TradeOrder
 from shared.constants import MAX_RETRY_ATTEMPTS, RETRY_BACKOFF_MULTIPLIER, RETRY_DELAY
+from tradeengine.exchange.fill_audit import FillAuditPipeline, FillAuditSink
+from tradeengine.exchange.shared_resources import SharedExchangeResources
+from tradeengine.metrics import (
+    binance_4130_resolution_total,
+    record_sl_floor_filter_clamp,
+)
+from tradeengine.risk.pretrade import percent_filter_decision
 from tradeengine.services.rate_monitor import RateLimitMonitor
 
 logger = logging.getLogger(__name__)
@@ -41,13 +48,31 @@ logger = logging.getLogger(__name__)
 # do not expose this value, so it is defined here.
 TIME_IN_FORCE_GTE_GTC = "GTE_GTC"
 
+# Most orders /fapi/v1/batchOrders accepts in one request.
+BATCH_ORDER_LIMIT = 5
+
 
 class BinanceFuturesExchange:
     """Binance Futures exchange client for executing trades"""
 
     _PING_TTL: float = 30.0  # consider healthy if pinged within this window
+    # Deferred fill-audit enrichment; set by set_fill_audit_sink().
+    fill_audit: FillAuditPipeline | None = None
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        account_id: str | None = None,
+        api_key: str = "",
+        api_secret: str = "",
+        shared: SharedExchangeResources | None = None,
+    ) -> None:
+        # account_id None is the process's primary account, configured from
+        # BINANCE_API_KEY / BINANCE_API_SECRET; other accounts (TE_ACCOUNTS)
+        # pass their own credentials and share ``shared`` with the primary.
+        self.account_id = account_id
+        self._api_key = api_key
+        self._api_secret = api_secret
+        self.shared = shared
         self.client: Client | None = None
         self.exchange_info: dict[str, Any] = {}
         self.symbol_info: dict[str, Any] = {}
@@ -78,14 +103,23 @@ class BinanceFuturesExchange:
             )
             logger.info(f"Binance Futures initialization - TESTNET: {BINANCE_TESTNET}")
 
+            api_key, api_secret = BINANCE_API_KEY, BINANCE_API_SECRET
+            if self.account_id is not None:
+                api_key, api_secret = self._api_key, self._api_secret
+                logger.info(
+                    f"Binance Futures initialization - account: {self.account_id}"
+                )
+
             # Create Binance Futures client
-            if BINANCE_API_KEY and BINANCE_API_SECRET:
+            if api_key and api_secret:
                 logger.info("Creating Binance Futures UMFutures client...")
                 self.client = Client(
-                    api_key=BINANCE_API_KEY,
-                    api_secret=BINANCE_API_SECRET,
+                    api_key=api_key,
+                    api_secret=api_secret,
                     testnet=BINANCE_TESTNET,
                 )
+                if self.shared is not None:
+                    self.shared.mount(self.client.session)
 
                 # Explicitly override Futures URL using BINANCE_FUTURES_BASE_URL
                 # This fixes the issue where testnet=True only affects Spot API in some versions
@@ -118,10 +152,14 @@ class BinanceFuturesExchange:
                 # Initialize and start rate limit monitor if enabled
                 from shared.constants import NATS_ENABLED, NATS_URL
 
-                if NATS_ENABLED:
+                if self.shared is not None and self.shared.rate_monitor is not None:
+                    self.rate_monitor = self.shared.rate_monitor
+                elif NATS_ENABLED:
                     logger.info(f"Starting RateLimitMonitor (NATS: {NATS_URL})...")
                     self.rate_monitor = RateLimitMonitor(nats_url=NATS_URL)
                     await self.rate_monitor.start()
+                    if self.shared is not None:
+                        self.shared.rate_monitor = self.rate_monitor
                 else:
                     logger.info("RateLimitMonitor disabled (NATS_ENABLED=false)")
 
@@ -209,6 +247,19 @@ class BinanceFuturesExchange:
             # Get futures exchange information
             if self.client is None:
                 raise RuntimeError("Binance Futures client not initialized")
+            if self.shared is not None:
+                client = self.client
+
+                async def load() -> dict[str, Any]:
+                    return cast(dict[str, Any], client.futures_exchange_info())
+
+                await self.shared.ensure_exchange_info(load)
+                self.exchange_info = self.shared.exchange_info
+                self.symbol_info = self.shared.symbol_info
+                logger.info(
+                    f"Using shared futures exchange info for {len(self.symbol_info)} symbols"
+                )
+                return
             self.exchange_info = self.client.futures_exchange_info()
 
             # Create symbol info lookup
@@ -265,7 +316,7 @@ class BinanceFuturesExchange:
             from shared.config import settings
 
             if settings.te_fill_audit_enrichment_enabled:
-                await self._enrich_fill_audit(result, order)
+                await self._audit_fill(result, order)
 
             # Format and return result
             return self._format_execution_result(result, order)
@@ -277,6 +328,76 @@ class BinanceFuturesExchange:
             logger.error(f"Order execution error: {e}")
             return self._format_error_result(str(e), order)
 
+    async def execute_batch(self, orders: list[TradeOrder]) -> list[dict[str, Any]]:
+        """Execute several orders, MARKET ones through ``/fapi/v1/batchOrders``.
+
+        Results come back in input order in the same shape ``execute``
+        returns. MARKET orders are validated one by one, then sent
+        BATCH_ORDER_LIMIT per request; Binance accepts or rejects each entry
+        of a batch independently. Other order types go through ``execute``.
+        """
+        if not self.initialized:
+            await self.initialize()
+
+        results: list[dict[str, Any] | None] = [None] * len(orders)
+        batchable: list[tuple[int, dict[str, Any]]] = []
+        for i, order in enumerate(orders):
+            if order.type != "market":
+                results[i] = await self.execute(order)
+                continue
+            try:
+                await self._validate_order(order)
+                batchable.append((i, self._market_order_params(order)))
+            except Exception as e:
+                logger.error(f"Order execution error: {e}")
+                results[i] = self._format_error_result(str(e), order)
+
+        from shared.config import settings
+
+        for start in range(0, len(batchable), BATCH_ORDER_LIMIT):
+            chunk = batchable[start : start + BATCH_ORDER_LIMIT]
+            if self.client is None:
+                raise RuntimeError("Binance Futures client not initialized")
+
+            def place(
+                chunk: list[tuple[int, dict[str, Any]]] = chunk,
+                client: Client = self.client,
+            ) -> Any:
+                # The client rewrites batchOrders in place; send a fresh copy
+                # on every retry attempt.
+                return client.futures_place_batch_order(
+                    batchOrders=[dict(params) for _, params in chunk]
+                )
+
+            try:
+                responses = await self._execute_with_retry(place)
+            except Exception as e:
+                logger.error(f"Batch order execution error: {e}")
+                for i, _ in chunk:
+                    results[i] = self._format_error_result(str(e), orders[i])
+                continue
+            logger.info(f"Batch of {len(chunk)} MARKET order(s) submitted")
+            for (i, _), response in zip(chunk, responses or [], strict=False):
+                order = orders[i]
+                if not isinstance(response, dict) or "code" in response:
+                    error = (
+                        f"APIError(code={response.get('code')}): {response.get('msg')}"
+                        if isinstance(response, dict)
+                        else f"Unexpected batch response: {response!r}"
+                    )
+                    logger.error(f"Binance Futures API error: {error}")
+                    results[i] = self._format_error_result(error, order)
+                    continue
+                if settings.te_fill_audit_enrichment_enabled:
+                    await self._audit_fill(response, order)
+                results[i] = self._format_execution_result(response, order)
+            for i, _ in chunk:
+                if results[i] is None:
+                    results[i] = self._format_error_result(
+                        "No response for order in batch", orders[i]
+                    )
+        return [r if r is not None else {} for r in results]
+
     async def _get_current_price(self, symbol: str) -> float:
         """Get current market price for a symbol"""
         if self.client is None:
@@ -380,11 +501,7 @@ class BinanceFuturesExchange:
             current_price = await self._get_current_price(order.symbol)
             await self._validate_notional(order, current_price)
 
-    async def _execute_market_order(self, order: TradeOrder) -> dict[str, Any]:
-        """Execute a market order"""
-        if self.client is None:
-            raise RuntimeError("Binance Futures client not initialized")
-
+    def _market_order_params(self, order: TradeOrder) -> dict[str, Any]:
         params: dict[str, Any] = {
             "symbol": order.symbol,
             "side": SIDE_BUY if order.side == "buy" else SIDE_SELL,
@@ -404,7 +521,14 @@ class BinanceFuturesExchange:
 
         # Note: quote_quantity is not supported in the current TradeOrder model
         # This feature can be added if needed in the future
+        return params
 
+    async def _execute_market_order(self, order: TradeOrder) -> dict[str, Any]:
+        """Execute a market order"""
+        if self.client is None:
+            raise RuntimeError("Binance Futures client not initialized")
+
+        params = self._market_order_params(order)
         result = await self._execute_with_retry(
             self.client.futures_create_order, **params
         )
@@ -806,10 +930,6 @@ class BinanceFuturesExchange:
 
                 if saw_4130:
                     try:
-                        from tradeengine.metrics import (
-                            binance_4130_resolution_total,
-                        )
-
                         binance_4130_resolution_total.labels(
                             outcome="retry_succeeded",
                             symbol=symbol_for_metric,
@@ -871,10 +991,6 @@ class BinanceFuturesExchange:
                             f"(id={existing_id}); skipping retry."
                         )
                         try:
-                            from tradeengine.metrics import (
-                                binance_4130_resolution_total,
-                            )
-
                             binance_4130_resolution_total.labels(
                                 outcome="already_protected",
                                 symbol=symbol_for_metric,
@@ -905,10 +1021,6 @@ class BinanceFuturesExchange:
                             "Falling through to normal retry."
                         )
                         try:
-                            from tradeengine.metrics import (
-                                binance_4130_resolution_total,
-                            )
-
                             binance_4130_resolution_total.labels(
                                 outcome="conflicting_order",
                                 symbol=symbol_for_metric,
@@ -930,8 +1042,6 @@ class BinanceFuturesExchange:
 
         if saw_4130:
             try:
-                from tradeengine.metrics import binance_4130_resolution_total
-
                 binance_4130_resolution_total.labels(
                     outcome="retry_failed",
                     symbol=symbol_for_metric,
@@ -1087,153 +1197,85 @@ class BinanceFuturesExchange:
             multiplier_up = float(filter_info["multiplierUp"])
             multiplier_down = float(filter_info["multiplierDown"])
 
-            # Calculate allowed price range with 1% safety margin to avoid edge cases
-            safety_margin = 0.01  # 1% safety margin
-            max_price = current_price * multiplier_up * (1 - safety_margin)
-            min_price = current_price * multiplier_down * (1 + safety_margin)
-
-            # Calculate deviation percentage
-            deviation_pct = ((price - current_price) / current_price) * 100
-
-            # AC4: for STOP-shaped orders, compute the safety-floor band
-            # around market and refuse to return a price inside it. If the
-            # PERCENT_PRICE band fits entirely inside the safety-floor band
-            # (e.g. filter is ±5% and floor is 6%), refuse any adjustment.
-            if is_stop:
-                floor_lo = current_price * (1 - min_safe_distance_pct / 100.0)
-                floor_hi = current_price * (1 + min_safe_distance_pct / 100.0)
-                # Above-market stop (e.g. short SL): must be >= floor_hi
-                # Below-market stop (e.g. long SL): must be <= floor_lo
-                if price > current_price:
-                    # Above-market: adjusted ceiling under filter is max_price;
-                    # safety floor is floor_hi. Feasible iff max_price >= floor_hi.
-                    if max_price < floor_hi:
-                        # #541: the safety floor is FARTHER from market than the
-                        # PERCENT_PRICE filter permits (e.g. floor 6% vs filter
-                        # cap 5%), so NO price satisfies both. Historically this
-                        # refused the SL (returned None) and left the position
-                        # NAKED — strictly worse than an imperfect stop. Clamp to
-                        # the furthest placeable price (just inside the filter) so
-                        # the position is at least protected; the floor's intent
-                        # (#424: avoid stops so tight they trigger on routine
-                        # volatility) is honored best-effort. Emit a warning +
-                        # metric so operators can see the floor/filter conflict.
-                        adjusted_price = max_price
-                        clamp_msg = (
-                            f"⚠️ #541 SL CLAMPED (floor>filter): {symbol} {order_type} "
-                            f"requested ${price:.2f} ({deviation_pct:+.2f}%) exceeds "
-                            f"PERCENT_PRICE cap (max {(multiplier_up - 1) * 100:+.2f}%) "
-                            f"while safety floor is {min_safe_distance_pct:+.2f}%; no "
-                            f"price satisfies both. Clamping to furthest placeable "
-                            f"${adjusted_price:.2f} "
-                            f"({((adjusted_price - current_price) / current_price) * 100:+.2f}%) "
-                            f"to protect the position rather than leave it naked; "
-                            f"market=${current_price:.2f}"
-                        )
-                        logger.warning(clamp_msg)
-                        try:
-                            from tradeengine.metrics import (
-                                record_sl_floor_filter_clamp,
-                            )
-
-                            record_sl_floor_filter_clamp(symbol)
-                        except Exception:
-                            pass
-                        return (True, adjusted_price, clamp_msg)
-                elif price < current_price:
-                    if min_price > floor_lo:
-                        # #541: mirror of the above-market case for below-market
-                        # stops (e.g. long SL). Clamp to the furthest placeable
-                        # price (min_price, just inside the filter floor) instead
-                        # of refusing and leaving the position naked.
-                        adjusted_price = min_price
-                        clamp_msg = (
-                            f"⚠️ #541 SL CLAMPED (floor>filter): {symbol} {order_type} "
-                            f"requested ${price:.2f} ({deviation_pct:+.2f}%) exceeds "
-                            f"PERCENT_PRICE cap (min {(multiplier_down - 1) * 100:+.2f}%) "
-                            f"while safety floor is {-min_safe_distance_pct:+.2f}%; no "
-                            f"price satisfies both. Clamping to furthest placeable "
-                            f"${adjusted_price:.2f} "
-                            f"({((adjusted_price - current_price) / current_price) * 100:+.2f}%) "
-                            f"to protect the position rather than leave it naked; "
-                            f"market=${current_price:.2f}"
-                        )
-                        logger.warning(clamp_msg)
-                        try:
-                            from tradeengine.metrics import (
-                                record_sl_floor_filter_clamp,
-                            )
+            decision = percent_filter_decision(
+                price,
+                current_price,
+                multiplier_up,
+                multiplier_down,
+                is_stop,
+                min_safe_distance_pct,
+            )
+            deviation_pct = decision.deviation_pct
+            allowed = (
+                f"allowed: {(multiplier_down - 1) * 100:+.1f}% to "
+                f"{(multiplier_up - 1) * 100:+.1f}%"
+            )
 
-                            record_sl_floor_filter_clamp(symbol)
-                        except Exception:
-                            pass
-                        return (True, adjusted_price, clamp_msg)
-
-            # Check if adjustment is needed
-            if price < min_price:
-                # Price too low - adjust to minimum with safety margin
-                adjusted_price = min_price
-                # AC4: for STOP-shaped orders, also respect the safety floor
-                # — clip to the floor edge whose direction matches the price.
-                if is_stop and adjusted_price > current_price * (
-                    1 - min_safe_distance_pct / 100.0
-                ):
-                    adjusted_price = current_price * (1 - min_safe_distance_pct / 100.0)
-                adjustment_msg = (
-                    f"🔧 ADJUSTED {symbol} {order_type} price from ${price:.2f} ({deviation_pct:+.2f}%) "
-                    f"to ${adjusted_price:.2f} ({((adjusted_price - current_price) / current_price) * 100:+.2f}%) "
-                    f"to meet PERCENT_PRICE filter (market: ${current_price:.2f}, "
-                    f"allowed: {(multiplier_down - 1) * 100:+.1f}% to {(multiplier_up - 1) * 100:+.1f}%)"
+            if decision.action == "clamped":
+                # #541: the safety floor is FARTHER from market than the
+                # PERCENT_PRICE filter permits (e.g. floor 6% vs filter cap
+                # 5%), so NO price satisfies both. Refusing the SL would leave
+                # the position NAKED — strictly worse than an imperfect stop —
+                # so it is clamped to the furthest placeable price just inside
+                # the filter. The floor's intent (#424: avoid stops so tight
+                # they trigger on routine volatility) is honored best-effort.
+                adjusted_price = cast(float, decision.price)
+                above = price > current_price
+                cap = (
+                    (multiplier_up - 1) * 100 if above else (multiplier_down - 1) * 100
                 )
-                logger.warning(adjustment_msg)
-                return (True, adjusted_price, adjustment_msg)
+                floor_pct = min_safe_distance_pct if above else -min_safe_distance_pct
+                clamp_msg = (
+                    f"⚠️ #541 SL CLAMPED (floor>filter): {symbol} {order_type} "
+                    f"requested ${price:.2f} ({deviation_pct:+.2f}%) exceeds "
+                    f"PERCENT_PRICE cap ({'max' if above else 'min'} {cap:+.2f}%) "
+                    f"while safety floor is {floor_pct:+.2f}%; no "
+                    f"price satisfies both. Clamping to furthest placeable "
+                    f"${adjusted_price:.2f} "
+                    f"({((adjusted_price - current_price) / current_price) * 100:+.2f}%) "
+                    f"to protect the position rather than leave it naked; "
+                    f"market=${current_price:.2f}"
+                )
+                logger.warning(clamp_msg)
+                try:
+                    record_sl_floor_filter_clamp(symbol)
+                except Exception:
+                    pass
+                return (True, adjusted_price, clamp_msg)
 
-            elif price > max_price:
-                # Price too high - adjust to maximum with safety margin
-                adjusted_price = max_price
-                if is_stop and adjusted_price < current_price * (
-                    1 + min_safe_distance_pct / 100.0
-                ):
-                    adjusted_price = current_price * (1 + min_safe_distance_pct / 100.0)
+            if decision.action == "adjusted":
+                adjusted_price = cast(float, decision.price)
                 adjustment_msg = (
                     f"🔧 ADJUSTED {symbol} {order_type} price from ${price:.2f} ({deviation_pct:+.2f}%) "
                     f"to ${adjusted_price:.2f} ({((adjusted_price - current_price) / current_price) * 100:+.2f}%) "
                     f"to meet PERCENT_PRICE filter (market: ${current_price:.2f}, "
-                    f"allowed: {(multiplier_down - 1) * 100:+.1f}% to {(multiplier_up - 1) * 100:+.1f}%)"
+                    f"{allowed})"
                 )
                 logger.warning(adjustment_msg)
                 return (True, adjusted_price, adjustment_msg)
 
-            # Price is within filter — for stops, also verify it clears the safety floor.
-            if is_stop:
-                if price > current_price and price < current_price * (
-                    1 + min_safe_distance_pct / 100.0
-                ):
-                    reason = (
-                        f"sl_within_safety_floor: requested ${price:.2f} "
-                        f"({deviation_pct:+.2f}%) is inside the safety floor "
-                        f"({min_safe_distance_pct:+.2f}%) for {symbol} {order_type}; "
-                        f"market=${current_price:.2f}"
-                    )
-                    logger.error(reason)
-                    return (False, None, reason)
-                if price < current_price and price > current_price * (
-                    1 - min_safe_distance_pct / 100.0
-                ):
-                    reason = (
-                        f"sl_within_safety_floor: requested ${price:.2f} "
-                        f"({deviation_pct:+.2f}%) is inside the safety floor "
-                        f"({-min_safe_distance_pct:+.2f}%) for {symbol} {order_type}; "
-                        f"market=${current_price:.2f}"
-                    )
-                    logger.error(reason)
-                    return (False, None, reason)
+            if decision.action == "rejected":
+                # AC4: a stop inside the safety floor would trigger on routine
+                # candle volatility — refuse it.
+                floor_pct = (
+                    min_safe_distance_pct
+                    if price > current_price
+                    else -min_safe_distance_pct
+                )
+                reason = (
+                    f"sl_within_safety_floor: requested ${price:.2f} "
+                    f"({deviation_pct:+.2f}%) is inside the safety floor "
+                    f"({floor_pct:+.2f}%) for {symbol} {order_type}; "
+                    f"market=${current_price:.2f}"
+                )
+                logger.error(reason)
+                return (False, None, reason)
 
             # Price is valid - no adjustment needed
             logger.info(
                 f"✓ PERCENT_PRICE validation passed for {symbol} {order_type}: "
                 f"${price:.2f} is {deviation_pct:+.2f}% from market ${current_price:.2f} "
-                f"(allowed: {(multiplier_down - 1) * 100:+.1f}% to {(multiplier_up - 1) * 100:+.1f}%)"
+                f"({allowed})"
             )
             return (False, price, "")
 
@@ -1554,6 +1596,29 @@ class BinanceFuturesExchange:
                 return str(asset)
         return None
 
+    def set_fill_audit_sink(self, sink: FillAuditSink | None) -> None:
+        """Enrich fills in the background and hand them to ``sink`` (None: inline).
+
+        The sink receives the order and its re-formatted execution result
+        once the userTrades fee/P&L are in; see tradeengine/exchange/fill_audit.py.
+        """
+        from shared.config import settings
+
+        if sink is None or not settings.te_fill_audit_deferred:
+            self.fill_audit = None
+            return
+        self.fill_audit = FillAuditPipeline(
+            self,
+            sink,
+            window_seconds=settings.te_fill_audit_batch_window_seconds,
+        )
+
+    async def _audit_fill(self, result: dict[str, Any], order: TradeOrder) -> None:
+        """Queue ``result`` for deferred enrichment, or enrich it inline."""
+        if self.fill_audit is not None and self.fill_audit.submit(result, order):
+            return
+        await self._enrich_fill_audit(result, order)
+
     async def _enrich_fill_audit(
         self, result: dict[str, Any], order: TradeOrder
     ) -> None:
@@ -1624,6 +1689,20 @@ class BinanceFuturesExchange:
         if not isinstance(trades, list) or not trades:
             return
 
+        synthetic_fills, realized_pnl = self._fold_user_trades(trades)
+        if synthetic_fills:
+            result["fills"] = synthetic_fills
+        if realized_pnl is not None:
+            result["pnl"] = realized_pnl
+
+    @staticmethod
+    def _fold_user_trades(
+        trades: list[Any],
+    ) -> tuple[list[dict[str, Any]], float | None]:
+        """userTrades rows as ``fills[]`` entries plus their summed realised P&L.
+
+        The P&L is None when no trade carried ``realizedPnl``.
+        """
         synthetic_fills: list[dict[str, Any]] = []
         realized_pnl = 0.0
         saw_pnl = False
@@ -1665,10 +1744,7 @@ class BinanceFuturesExchange:
                 except (TypeError, ValueError):
                     pass
 
-        if synthetic_fills:
-            result["fills"] = synthetic_fills
-        if saw_pnl:
-            result["pnl"] = realized_pnl
+        return synthetic_fills, realized_pnl if saw_pnl else None
 
     async def get_account_info(self) -> dict[str, Any]:
         """Get account information"""
@@ -1703,8 +1779,21 @@ class BinanceFuturesExchange:
         try:
             if self.client is None:
                 raise RuntimeError("Binance Futures client not initialized")
-            ticker = self.client.futures_symbol_ticker(symbol=symbol)
-            return float(ticker["price"])
+            client = self.client
+
+            async def fetch() -> float:
+                # python-binance is synchronous; the trigger feed reads every
+                # symbol with resting orders each tick, so keep the REST call
+                # off the event loop.
+                loop = asyncio.get_running_loop()
+                ticker = await loop.run_in_executor(
+                    None, lambda: client.futures_symbol_ticker(symbol=symbol)
+                )
+                return float(ticker["price"])
+
+            if self.shared is not None:
+                return await self.shared.price(symbol, fetch)
+            return await fetch()
         except Exception as e:
             logger.error(f"Failed to get price for {symbol}: {e}")
             raise
@@ -1947,7 +2036,10 @@ class BinanceFuturesExchange:
     async def close(self) -> None:
         """Close the Binance Futures client"""
         # UMFutures client doesn't have a close method like AsyncClient
-        if self.rate_monitor:
+        if self.fill_audit is not None:
+            await self.fill_audit.close()
+        # A shared rate monitor is stopped with the shared resources.
+        if self.rate_monitor and self.shared is None:
             await self.rate_monitor.stop()
         logger.info("Binance Futures client connection closed")
 
@@ -0,0 +1,217 @@
+"""Background fill-audit enrichment (#529 follow-up).
+
+``BinanceFuturesExchange._enrich_fill_audit`` used to call
+``futures_account_trades`` (``GET /fapi/v1/userTrades``) inline in
+``execute`` for every FILLED order, so each entry paid a REST round-trip
+before its result reached the dispatcher just to backfill fee, fee asset
+and realised P&L. With a sink registered (the dispatcher registers one)
+the exchange hands those fills to :class:`FillAuditPipeline` instead and
+returns straight away.
+
+The pipeline groups fills per symbol over a short window and resolves
+each group with one userTrades read: by ``orderId`` for a lone fill, by
+``startTime`` for several (trades are then matched back by order id). A
+fill whose trades have not been indexed yet is retried in the next
+window, a few times at most. Each enriched result is handed to the sink,
+which publishes it as a follow-up ``fill_audit`` execution event.
+
+Like the inline path this is best-effort: failures are logged and the
+fill keeps the fee/P&L it was first reported with.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from contracts.order import TradeOrder
+
+if TYPE_CHECKING:
+    from tradeengine.exchange.binance import BinanceFuturesExchange
+
+logger = logging.getLogger(__name__)
+
+FillAuditSink = Callable[[TradeOrder, dict[str, Any]], Awaitable[None]]
+
+# Most trades one userTrades request returns.
+_USER_TRADES_LIMIT = 1000
+# A batch read starts this far before the earliest fill it covers.
+_START_TIME_SLACK_MS = 1000
+
+
+@dataclass
+class _PendingFill:
+    order: TradeOrder
+    result: dict[str, Any]
+    order_id: int
+    transact_ms: int
+    attempts: int = 0
+
+
+def enrichable_order_id(result: dict[str, Any]) -> int | None:
+    """The numeric order id of a fill that still needs enriching, else None."""
+    status = str(result.get("status") or result.get("algoStatus") or "").upper()
+    if status not in ("FILLED", "PARTIALLY_FILLED"):
+        return None
+    fills = result.get("fills")
+    if isinstance(fills, list) and fills:
+        return None
+    try:
+        return int(result.get("orderId") or result.get("algoId") or "")
+    except (TypeError, ValueError):
+        # Non-numeric ids (algo orders) aren't queryable via userTrades.
+        return None
+
+
+class FillAuditPipeline:
+    """Per-symbol batched userTrades lookups feeding a follow-up event sink."""
+
+    def __init__(
+        self,
+        exchange: BinanceFuturesExchange,
+        sink: FillAuditSink,
+        window_seconds: float = 0.5,
+        max_attempts: int = 3,
+    ) -> None:
+        self.exchange = exchange
+        self.sink = sink
+        self.window_seconds = max(0.0, float(window_seconds))
+        self.max_attempts = max(1, int(max_attempts))
+        self._pending: dict[str, list[_PendingFill]] = {}
+        self._timers: dict[str, asyncio.Task[None]] = {}
+        self.queued = 0
+        self.published = 0
+        self.lookups = 0
+        self.dropped = 0
+
+    def submit(self, result: dict[str, Any], order: TradeOrder) -> bool:
+        """Queue ``result`` for enrichment; False when it has nothing to enrich."""
+        if not isinstance(result, dict):
+            return False
+        order_id = enrichable_order_id(result)
+        symbol = result.get("symbol") or order.symbol
+        if order_id is None or not symbol:
+            return False
+        transact_ms = result.get("transactTime") or result.get("updateTime")
+        pending = _PendingFill(
+            order=order,
+            result=dict(result),
+            order_id=order_id,
+            transact_ms=int(transact_ms or time.time() * 1000),
+        )
+        self._enqueue(symbol, pending)
+        self.queued += 1
+        return True
+
+    def _enqueue(self, symbol: str, pending: _PendingFill) -> None:
+        self._pending.setdefault(symbol, []).append(pending)
+        timer = self._timers.get(symbol)
+        if timer is None or timer.done():
+            self._timers[symbol] = asyncio.create_task(
+                self._flush_after_window(symbol), name=f"fill-audit-{symbol}"
+            )
+
+    async def _flush_after_window(self, symbol: str) -> None:
+        await asyncio.sleep(self.window_seconds)
+        self._timers.pop(symbol, None)
+        await self._flush(symbol)
+
+    async def _read_trades(self, symbol: str, batch: list[_PendingFill]) -> list[Any]:
+        client: Any = self.exchange.client
+        if client is None:
+            return []
+        params: dict[str, Any] = {"symbol": symbol}
+        if len(batch) == 1:
+            params["orderId"] = batch[0].order_id
+        else:
+            params["startTime"] = (
+                min(p.transact_ms for p in batch) - _START_TIME_SLACK_MS
+            )
+            params["limit"] = _USER_TRADES_LIMIT
+        loop = asyncio.get_event_loop()
+        self.lookups += 1
+        trades = await loop.run_in_executor(
+            None, lambda: client.futures_account_trades(**params)
+        )
+        return trades if isinstance(trades, list) else []
+
+    async def _flush(self, symbol: str) -> None:
+        batch = self._pending.pop(symbol, [])
+        if not batch:
+            return
+        try:
+            trades = await self._read_trades(symbol, batch)
+        except Exception:
+            logger.warning(
+                "fill-audit: userTrades fetch failed for %s (%d fill(s)); "
+                "keeping the first-reported fee/pnl",
+                symbol,
+                len(batch),
+                exc_info=True,
+            )
+            self.dropped += len(batch)
+            return
+
+        by_order: dict[int, list[dict[str, Any]]] = {}
+        for trade in trades:
+            if isinstance(trade, dict):
+                try:
+                    by_order.setdefault(int(trade.get("orderId") or 0), []).append(
+                        trade
+                    )
+                except (TypeError, ValueError):
+                    continue
+        if len(batch) == 1:
+            # Queried by orderId, so every trade belongs to it.
+            by_order = {batch[0].order_id: [t for t in trades if isinstance(t, dict)]}
+
+        for pending in batch:
+            fills, pnl = self.exchange._fold_user_trades(
+                by_order.get(pending.order_id, [])
+            )
+            if not fills:
+                pending.attempts += 1
+                if pending.attempts < self.max_attempts:
+                    self._enqueue(symbol, pending)
+                else:
+                    self.dropped += 1
+                continue
+            pending.result["fills"] = fills
+            if pnl is not None:
+                pending.result["pnl"] = pnl
+            enriched = self.exchange._format_execution_result(
+                pending.result, pending.order
+            )
+            try:
+                await self.sink(pending.order, enriched)
+                self.published += 1
+            except Exception:
+                logger.warning(
+                    "fill-audit: publishing enriched fill %s failed",
+                    pending.order_id,
+                    exc_info=True,
+                )
+
+    async def close(self) -> None:
+        """Cancel the window timers and flush whatever is still queued once."""
+        timers = list(self._timers.values())
+        self._timers.clear()
+        for timer in timers:
+            timer.cancel()
+        await asyncio.gather(*timers, return_exceptions=True)
+        self.max_attempts = 0
+        for symbol in list(self._pending):
+            await self._flush(symbol)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "pending": sum(len(v) for v in self._pending.values()),
+            "queued": self.queued,
+            "published": self.published,
+            "lookups": self.lookups,
+            "dropped": self.dropped,
+        }
@@ -0,0 +1,135 @@
+"""Process-wide exchange resources shared by every account context.
+
+With ``TE_ACCOUNTS`` set, one process hosts several Binance accounts
+(:mod:`tradeengine.accounts`). Each account still needs its own signed
+client, but the parts that do not depend on the API key are shared:
+
+* the futures exchange-info table and per-symbol filters — loaded once by
+  whichever account initialises first and reused by the rest;
+* the HTTP connection pool — one ``requests`` adapter mounted on every
+  account client's session (the API key travels in per-session headers,
+  not in the pooled connections);
+* a short-TTL ticker cache with in-flight coalescing, so N accounts asking
+  for the same symbol's price issue one REST read;
+* the :class:`RateLimitMonitor` and its NATS connection.
+
+A single-account process never builds one of these and
+``BinanceFuturesExchange`` behaves exactly as before.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any
+
+from requests.adapters import HTTPAdapter
+
+from shared.config import settings
+
+if TYPE_CHECKING:
+    from tradeengine.services.rate_monitor import RateLimitMonitor
+
+logger = logging.getLogger(__name__)
+
+
+class SharedExchangeResources:
+    """Exchange info, HTTP pool, ticker cache and rate monitor for N accounts."""
+
+    def __init__(
+        self,
+        price_ttl_seconds: float = 1.0,
+        http_pool_size: int = 32,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.exchange_info: dict[str, Any] = {}
+        self.symbol_info: dict[str, Any] = {}
+        self.http_adapter = HTTPAdapter(
+            pool_connections=4, pool_maxsize=max(1, int(http_pool_size))
+        )
+        self.rate_monitor: RateLimitMonitor | None = None
+        self.price_ttl_seconds = max(0.0, float(price_ttl_seconds))
+        self._clock = clock
+        self._prices: dict[str, tuple[float, float]] = {}
+        self._inflight: dict[str, asyncio.Future[float]] = {}
+        self._exchange_info_lock = asyncio.Lock()
+        self.price_hits = 0
+        self.price_misses = 0
+
+    @classmethod
+    def from_settings(cls) -> SharedExchangeResources:
+        return cls(
+            price_ttl_seconds=settings.te_shared_price_ttl_seconds,
+            http_pool_size=settings.te_shared_http_pool_size,
+        )
+
+    def mount(self, session: Any) -> None:
+        """Route ``session``'s HTTP(S) traffic through the shared pool."""
+        session.mount("https://", self.http_adapter)
+        session.mount("http://", self.http_adapter)
+
+    async def ensure_exchange_info(
+        self, load: Callable[[], Awaitable[dict[str, Any]]]
+    ) -> None:
+        """Populate the exchange-info table once; later callers reuse it."""
+        async with self._exchange_info_lock:
+            if self.exchange_info:
+                return
+            info = await load()
+            self.exchange_info = info
+            for symbol_data in info.get("symbols", []):
+                self.symbol_info[symbol_data["symbol"]] = {
+                    "baseAsset": symbol_data["baseAsset"],
+                    "quoteAsset": symbol_data["quoteAsset"],
+                    "status": symbol_data["status"],
+                    "filters": symbol_data["filters"],
+                }
+
+    async def price(self, symbol: str, fetch: Callable[[], Awaitable[float]]) -> float:
+        """Cached price for ``symbol``; concurrent misses share one ``fetch``."""
+        now = self._clock()
+        cached = self._prices.get(symbol)
+        if cached is not None and now - cached[1] < self.price_ttl_seconds:
+            self.price_hits += 1
+            return cached[0]
+        pending = self._inflight.get(symbol)
+        if pending is not None:
+            self.price_hits += 1
+            return await asyncio.shield(pending)
+
+        self.price_misses += 1
+        future: asyncio.Future[float] = asyncio.get_running_loop().create_future()
+        self._inflight[symbol] = future
+        try:
+            value = await fetch()
+        except Exception as e:
+            future.set_exception(e)
+            # Waiters re-raise it; mark it retrieved for the owner path.
+            future.exception()
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            self._prices[symbol] = (value, self._clock())
+            future.set_result(value)
+            return value
+        finally:
+            self._inflight.pop(symbol, None)
+
+    async def close(self) -> None:
+        monitor, self.rate_monitor = self.rate_monitor, None
+        if monitor is not None:
+            await monitor.stop()
+        self.http_adapter.close()
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "symbols": len(self.symbol_info),
+            "cached_prices": len(self._prices),
+            "price_hits": self.price_hits,
+            "price_misses": self.price_misses,
+            "rate_monitor": self.rate_monitor is not None,
+        }
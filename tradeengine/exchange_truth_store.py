@@ -11,6 +11,18 @@ AC1: UserDataStreamConsumer — WS stream, ACCOUNT_UPDATE, ORDER_TRADE_UPDATE,
 AC2: ExchangeTruthStore — thread/async-safe interface.
 AC3: start()/stop() lifecycle, health_check(), OTel counter.
 AC4: unit tests in tests/test_exchange_truth_store.py.
+
+Reconnects do not pay for a full REST snapshot every time. The store keeps
+the exchange time of the last event applied to each position and order
+key (REST ``updateTime`` seeds it), so stale or replayed events are
+dropped; an order event identical to the last one applied (same time,
+status and filled quantity) is a replay too and never fires ``on_fill``
+twice. The consumer opens the replacement connection before closing the
+old one on a planned rotation and buffers its events across the handover;
+after an unplanned drop shorter than ``TE_USER_DATA_DELTA_RESEED_MAX_GAP_SECONDS``
+it re-reads only the symbols that could have changed (open positions, open
+orders and the engine's own active symbols). Longer outages, first boot
+and scopes too wide to be cheaper take the full seed.
 """
 
 from __future__ import annotations
@@ -20,15 +32,19 @@ import json
 import logging
 import os
 import time
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable
+from contextlib import AsyncExitStack
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timezone
 from typing import TYPE_CHECKING, Any
 
 from prometheus_client import Counter, Gauge
 
+from tradeengine.query_index import ObservedDict
+
 if TYPE_CHECKING:
     from tradeengine.exchange.binance import BinanceFuturesExchange
+    from tradeengine.query_index import RecordIndex
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +64,22 @@ exchange_truth_store_stale_seconds = Gauge(
 _LISTEN_KEY_RENEWAL_SECS = 55 * 60  # Binance expires keys at 60 min
 _RECONNECT_BASE_DELAY = 2.0
 _RECONNECT_MAX_DELAY = 60.0
+# Binance drops user-data connections after 24h; rotate before that.
+_STREAM_ROTATE_SECS = 23 * 60 * 60
+_DELTA_RESEED_MAX_GAP_SECS = 120.0
+_DELTA_RESEED_MAX_SYMBOLS = 10
+# REST weight of the reads a seed makes: positionRisk costs 5 with or
+# without a symbol, openOrders 1 per symbol but 40 unfiltered. A delta
+# reseed (positions once plus one order read per symbol) is lighter than
+# the full seed only below this many symbols.
+_OPEN_ORDERS_UNFILTERED_WEIGHT = 40
+
+
+def _event_ms(value: Any) -> int:
+    try:
+        return int(value or 0)
+    except (TypeError, ValueError):
+        return 0
 
 
 # ---------------------------------------------------------------------------
@@ -64,6 +96,23 @@ class PositionSnapshot:
     unrealized_pnl: float
     updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
 
+    def as_position(self) -> dict[str, Any]:
+        """The snapshot in PositionManager's position-dict shape."""
+        return {
+            "symbol": self.symbol,
+            "position_side": self.side,
+            "quantity": self.quantity,
+            "avg_price": self.entry_price,
+            "unrealized_pnl": self.unrealized_pnl,
+            "realized_pnl": 0.0,
+            "total_cost": 0.0,
+            "total_value": self.quantity * self.entry_price,
+            "entry_time": self.updated_at,
+            "last_update": self.updated_at,
+            "status": "open",
+            "source": "exchange",
+        }
+
 
 @dataclass
 class OrderSnapshot:
@@ -91,6 +140,10 @@ class ExchangeTruthStore:
     stream task holds the lock.
     """
 
+    # Secondary index over the positions in PositionManager's row shape,
+    # attached by PositionManager for the /positions query; None until then.
+    _position_index: RecordIndex | None = None
+
     def __init__(
         self,
         on_fill: Callable[[dict[str, Any]], Awaitable[None]] | None = None,
@@ -100,6 +153,14 @@ class ExchangeTruthStore:
         # keyed by (symbol, order_id)
         self._open_orders: dict[tuple[str, str], OrderSnapshot] = {}
         self._last_updated: datetime | None = None
+        # Exchange time (ms) of the newest state applied per key; events
+        # older than it are stale (buffered handover replays, slow REST).
+        self._position_versions: dict[tuple[str, str], int] = {}
+        self._order_versions: dict[tuple[str, str], int] = {}
+        # (event ms, status, cumulative filled qty) last applied per order: a
+        # rotation handover can deliver the same event on both connections.
+        self._order_applied: dict[tuple[str, str], tuple[int, str, str]] = {}
+        self._last_event_ms = 0
         self._last_rest_sync: datetime | None = None
         self._is_ready: bool = False
         # #531: optional async callback invoked with the raw Binance order
@@ -108,6 +169,41 @@ class ExchangeTruthStore:
         # execution event for entry fills — the highest-fidelity fill signal.
         self._on_fill = on_fill
 
+    @property
+    def _positions(self) -> dict[tuple[str, str], PositionSnapshot]:
+        return self._position_map
+
+    @_positions.setter
+    def _positions(self, value: dict[tuple[str, str], PositionSnapshot]) -> None:
+        # Every write path (stream events, REST seeds, tests assigning a
+        # dict) goes through the ObservedDict, keeping the index in step.
+        self._position_map = ObservedDict(
+            value,
+            on_set=self._index_position,
+            on_delete=self._forget_position,
+            on_reset=self._reset_positions,
+        )
+        self._reset_positions()
+
+    def _index_position(self, key: tuple[str, str], snapshot: PositionSnapshot) -> None:
+        if self._position_index is not None:
+            self._position_index.upsert(key, snapshot.as_position())
+
+    def _forget_position(self, key: tuple[str, str]) -> None:
+        if self._position_index is not None:
+            self._position_index.remove(key)
+
+    def _reset_positions(self) -> None:
+        if self._position_index is not None:
+            self._position_index.rebuild(
+                {k: v.as_position() for k, v in self._position_map.items()}
+            )
+
+    def attach_position_index(self, index: RecordIndex) -> None:
+        """Keep ``index`` in step with the positions, starting from now."""
+        self._position_index = index
+        self._reset_positions()
+
     def set_on_fill(
         self, on_fill: Callable[[dict[str, Any]], Awaitable[None]] | None
     ) -> None:
@@ -126,6 +222,26 @@ class ExchangeTruthStore:
     def last_rest_sync(self) -> datetime | None:
         return self._last_rest_sync
 
+    @property
+    def last_event_ms(self) -> int:
+        """Exchange time of the newest stream event applied (0 before any)."""
+        return self._last_event_ms
+
+    def tracked_symbols(self) -> set[str]:
+        """Symbols with an open position or open order in the store."""
+        return {sym for sym, _ in self._positions} | {
+            sym for sym, _ in self._open_orders
+        }
+
+    @staticmethod
+    def _is_stale(versions: dict[tuple[str, str], int], key: Any, ms: int) -> bool:
+        if not ms:
+            return False
+        if ms < versions.get(key, 0):
+            return True
+        versions[key] = ms
+        return False
+
     def get_positions(self) -> dict[tuple[str, str], PositionSnapshot]:
         return dict(self._positions)
 
@@ -135,10 +251,14 @@ class ExchangeTruthStore:
     async def update_positions_from_account_update(self, event: dict[str, Any]) -> None:
         """Apply an ACCOUNT_UPDATE WS event to the positions snapshot."""
         positions = event.get("a", {}).get("P", []) or event.get("P", [])
+        event_ms = _event_ms(event.get("E"))
         async with self._lock:
+            self._last_event_ms = max(self._last_event_ms, event_ms)
             for p in positions:
                 symbol = p.get("s", "")
                 side = p.get("ps", "BOTH").upper()
+                if self._is_stale(self._position_versions, (symbol, side), event_ms):
+                    continue
                 qty = float(p.get("pa", 0))
                 entry = float(p.get("ep", 0))
                 upnl = float(p.get("up", 0))
@@ -161,7 +281,15 @@ class ExchangeTruthStore:
         symbol = o.get("s", "")
         order_id = str(o.get("i", ""))
         status = o.get("X", "")
+        event_ms = _event_ms(o.get("T") or event.get("E"))
+        applied = (event_ms, status, str(o.get("z", "")))
         async with self._lock:
+            self._last_event_ms = max(self._last_event_ms, event_ms)
+            if event_ms and self._order_applied.get((symbol, order_id)) == applied:
+                return  # exact replay of the last applied event
+            if self._is_stale(self._order_versions, (symbol, order_id), event_ms):
+                return
+            self._order_applied[(symbol, order_id)] = applied
             if status in ("FILLED", "CANCELED", "EXPIRED", "REJECTED"):
                 self._open_orders.pop((symbol, order_id), None)
             else:
@@ -198,35 +326,76 @@ class ExchangeTruthStore:
         """Overwrite store with REST snapshot (used on connect/reconnect)."""
         async with self._lock:
             self._positions.clear()
-            for p in positions:
-                symbol = p.get("symbol", "")
-                side = p.get("positionSide", "BOTH").upper()
-                qty = float(p.get("positionAmt", 0))
-                if abs(qty) < 1e-9:
-                    continue
-                self._positions[(symbol, side)] = PositionSnapshot(
-                    symbol=symbol,
-                    side=side,
-                    quantity=qty,
-                    entry_price=float(p.get("entryPrice", 0)),
-                    unrealized_pnl=float(p.get("unrealizedProfit", 0)),
-                )
             self._open_orders.clear()
-            for o in orders:
-                symbol = o.get("symbol", "")
-                order_id = str(o.get("orderId", ""))
-                self._open_orders[(symbol, order_id)] = OrderSnapshot(
-                    symbol=symbol,
-                    order_id=order_id,
-                    side=o.get("side", ""),
-                    order_type=o.get("type", ""),
-                    status=o.get("status", ""),
-                    quantity=float(o.get("origQty", 0)),
-                    price=float(o.get("price", 0)),
-                )
+            self._position_versions.clear()
+            self._order_versions.clear()
+            self._order_applied.clear()
+            self._load_rest_rows(positions, orders)
             self._last_updated = datetime.now(UTC)
             self._is_ready = True
 
+    async def apply_rest_delta(
+        self,
+        symbols: set[str],
+        positions: list[dict[str, Any]],
+        orders: list[dict[str, Any]],
+        fetched_ms: int = 0,
+    ) -> None:
+        """Replace only ``symbols``' positions and orders with a REST read.
+
+        Keys of those symbols that REST no longer reports are dropped and
+        fenced at ``fetched_ms`` (the local time the read started), so a
+        buffered event from before the read cannot resurrect them.
+        """
+        async with self._lock:
+            for key in [k for k in self._positions if k[0] in symbols]:
+                del self._positions[key]
+                self._position_versions[key] = fetched_ms
+            for key in [k for k in self._open_orders if k[0] in symbols]:
+                del self._open_orders[key]
+                self._order_versions[key] = fetched_ms
+            self._load_rest_rows(
+                [p for p in positions if p.get("symbol", "") in symbols],
+                [o for o in orders if o.get("symbol", "") in symbols],
+            )
+            self._last_updated = datetime.now(UTC)
+            self._is_ready = True
+
+    def _load_rest_rows(
+        self, positions: list[dict[str, Any]], orders: list[dict[str, Any]]
+    ) -> None:
+        # Caller holds self._lock.
+        for p in positions:
+            symbol = p.get("symbol", "")
+            side = p.get("positionSide", "BOTH").upper()
+            qty = float(p.get("positionAmt", 0))
+            if abs(qty) < 1e-9:
+                continue
+            self._positions[(symbol, side)] = PositionSnapshot(
+                symbol=symbol,
+                side=side,
+                quantity=qty,
+                entry_price=float(p.get("entryPrice", 0)),
+                unrealized_pnl=float(p.get("unrealizedProfit", 0)),
+            )
+            if p.get("updateTime"):
+                self._position_versions[(symbol, side)] = _event_ms(p["updateTime"])
+        for o in orders:
+            symbol = o.get("symbol", "")
+            order_id = str(o.get("orderId", ""))
+            self._open_orders[(symbol, order_id)] = OrderSnapshot(
+                symbol=symbol,
+                order_id=order_id,
+                side=o.get("side", ""),
+                order_type=o.get("type", ""),
+                status=o.get("status", ""),
+                quantity=float(o.get("origQty", 0)),
+                price=float(o.get("price", 0)),
+                position_side=o.get("positionSide", "BOTH").upper(),
+            )
+            if o.get("updateTime"):
+                self._order_versions[(symbol, order_id)] = _event_ms(o["updateTime"])
+
     async def update_from_rest(
         self,
         positions: list[dict[str, Any]],
@@ -274,12 +443,27 @@ class ExchangeTruthStore:
 # ---------------------------------------------------------------------------
 
 
+@dataclass
+class _StreamLink:
+    """One open WebSocket connection and the task reading it.
+
+    While ``buffer`` is a list the reader parks events there instead of
+    applying them (handover and reseed windows); ``None`` applies directly.
+    """
+
+    stack: AsyncExitStack
+    key: str
+    buffer: list[dict[str, Any]] | None = field(default_factory=list)
+    task: asyncio.Task | None = None  # type: ignore[type-arg]
+
+
 class UserDataStreamConsumer:
     """
     Binance Futures user-data WebSocket stream consumer.
 
     Maintains ExchangeTruthStore with real-time position/order state.
-    Reconnects with exponential backoff; seeds from REST on each connect.
+    Reconnects with exponential backoff; reseeds from REST on each connect,
+    fully on first connect or after a long outage and per symbol otherwise.
     """
 
     _WS_MAINNET_URL = "wss://fstream.binance.com/ws"
@@ -290,6 +474,10 @@ class UserDataStreamConsumer:
         exchange: BinanceFuturesExchange,
         store: ExchangeTruthStore | None = None,
         on_fill: Callable[[dict[str, Any]], Awaitable[None]] | None = None,
+        active_symbols: Callable[[], Iterable[str]] | None = None,
+        delta_reseed_max_gap_seconds: float = _DELTA_RESEED_MAX_GAP_SECS,
+        delta_reseed_max_symbols: int = _DELTA_RESEED_MAX_SYMBOLS,
+        rotate_seconds: float = _STREAM_ROTATE_SECS,
     ) -> None:
         self._exchange = exchange
         # #531: propagate the fill callback into the store so entry fills
@@ -302,6 +490,21 @@ class UserDataStreamConsumer:
         self._listen_key: str | None = None
         self._stream_connected: bool = False
         self._running: bool = False
+        # Symbols the engine itself is working (local positions, OCO pairs,
+        # pending entries); added to the delta-reseed scope.
+        self._active_symbols = active_symbols
+        self._delta_reseed_max_gap = float(delta_reseed_max_gap_seconds)
+        self._delta_reseed_max_symbols = min(
+            int(delta_reseed_max_symbols), _OPEN_ORDERS_UNFILTERED_WEIGHT - 1
+        )
+        self._rotate_seconds = float(rotate_seconds)
+        # Monotonic time the store was last known to match the exchange: an
+        # event applied, a reseed finished, or a live stream dropped.
+        self._in_sync_at: float | None = None
+        self.last_resync: str | None = None  # "full" | "delta"
+        self.full_seeds = 0
+        self.delta_seeds = 0
+        self.handovers = 0
 
     # ------------------------------------------------------------------
     # AC3 — lifecycle
@@ -342,6 +545,10 @@ class UserDataStreamConsumer:
             ),
             "is_ready": self.store.is_ready,
             "stream_connected": self._stream_connected,
+            "last_resync": self.last_resync,
+            "full_seeds": self.full_seeds,
+            "delta_seeds": self.delta_seeds,
+            "handovers": self.handovers,
         }
 
     # ------------------------------------------------------------------
@@ -400,10 +607,179 @@ class UserDataStreamConsumer:
             except Exception:
                 logger.exception("UserDataStreamConsumer: listen key renewal failed")
 
-    async def _consumer_loop(self) -> None:
-        """Main loop: connect, seed, stream, reconnect with backoff on failure."""
+    async def _delta_seed(self, symbols: set[str]) -> None:
+        """Re-read only ``symbols`` from REST; raises so the caller can go full.
+
+        Positions come from one unfiltered read (a symbol filter does not
+        make it cheaper); open orders are read per symbol.
+        """
+        loop = asyncio.get_event_loop()
+        client: Any = self._exchange.client
+        fetched_ms = int(time.time() * 1000)
+
+        async def _orders(symbol: str) -> list[Any]:
+            orders = await loop.run_in_executor(
+                None, lambda: client.futures_get_open_orders(symbol=symbol)
+            )
+            return orders or []
+
+        positions, *reads = await asyncio.gather(
+            loop.run_in_executor(None, client.futures_position_information),
+            *(_orders(sym) for sym in sorted(symbols)),
+        )
+        await self.store.apply_rest_delta(
+            symbols,
+            positions or [],
+            [o for orders in reads for o in orders],
+            fetched_ms,
+        )
+        exchange_truth_store_events_total.labels(event_type="rest_delta_seed").inc()
+
+    def _reseed_scope(self) -> set[str]:
+        symbols = self.store.tracked_symbols()
+        if self._active_symbols is not None:
+            try:
+                symbols.update(s for s in self._active_symbols() if s)
+            except Exception:
+                logger.exception("UserDataStreamConsumer: active_symbols failed")
+        return symbols
+
+    async def _resync(self) -> None:
+        """Bring the store level with the exchange after a (re)connect."""
+        gap = None if self._in_sync_at is None else time.monotonic() - self._in_sync_at
+        if gap is not None and gap <= self._delta_reseed_max_gap:
+            symbols = self._reseed_scope()
+            if len(symbols) <= self._delta_reseed_max_symbols:
+                try:
+                    await self._delta_seed(symbols)
+                except Exception:
+                    logger.exception(
+                        "UserDataStreamConsumer: delta reseed failed, seeding fully"
+                    )
+                else:
+                    logger.info(
+                        "UserDataStreamConsumer: %.1fs gap, reseeded %d symbol(s)",
+                        gap,
+                        len(symbols),
+                    )
+                    self.last_resync = "delta"
+                    self.delta_seeds += 1
+                    self._in_sync_at = time.monotonic()
+                    return
+        await self._seed_store()
+        self.last_resync = "full"
+        self.full_seeds += 1
+        self._in_sync_at = time.monotonic()
+
+    async def _apply_event(self, event: dict[str, Any]) -> None:
+        event_type = event.get("e", "")
+        if event_type == "ACCOUNT_UPDATE":
+            await self.store.update_positions_from_account_update(event)
+            exchange_truth_store_events_total.labels(event_type="account_update").inc()
+        elif event_type == "ORDER_TRADE_UPDATE":
+            await self.store.update_order_from_trade_update(event)
+            exchange_truth_store_events_total.labels(
+                event_type="order_trade_update"
+            ).inc()
+        else:
+            logger.debug("UserDataStreamConsumer: ignoring event_type=%s", event_type)
+            return
+        self._in_sync_at = time.monotonic()
+
+    async def _read_stream(self, ws: Any, link: _StreamLink) -> None:
+        async for message in ws:
+            if not self._running:
+                break
+            try:
+                event = json.loads(message)
+            except json.JSONDecodeError:
+                logger.warning("UserDataStreamConsumer: invalid JSON payload")
+                continue
+            if event.get("e") == "listenKeyExpired":
+                logger.warning("UserDataStreamConsumer: listen key expired")
+                break
+            if link.buffer is not None:
+                link.buffer.append(event)
+            else:
+                await self._apply_event(event)
+
+    async def _open_stream(self, ws_base: str, key: str) -> _StreamLink:
         import websockets  # deferred import so tests can patch easily
 
+        stack = AsyncExitStack()
+        try:
+            ws = await stack.enter_async_context(websockets.connect(f"{ws_base}/{key}"))
+        except BaseException:
+            await stack.aclose()
+            raise
+        link = _StreamLink(stack=stack, key=key)
+        link.task = asyncio.create_task(
+            self._read_stream(ws, link), name="user-data-stream-reader"
+        )
+        return link
+
+    async def _drain(self, link: _StreamLink) -> None:
+        """Apply the events buffered on ``link`` in order, then go direct."""
+        buffer = link.buffer or []
+        while buffer:
+            await self._apply_event(buffer.pop(0))
+        link.buffer = None
+
+    async def _close_stream(self, link: _StreamLink) -> None:
+        if link.task is not None and not link.task.done():
+            link.task.cancel()
+        try:
+            if link.task is not None:
+                await link.task
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            logger.debug("UserDataStreamConsumer: reader ended with an error")
+        finally:
+            await link.stack.aclose()
+
+    def _start_renewal(self, key: str) -> None:
+        if self._renewal_task and not self._renewal_task.done():
+            self._renewal_task.cancel()
+        self._renewal_task = asyncio.create_task(
+            self._renewal_loop(key), name="listen-key-renewal"
+        )
+
+    async def _stream_until_rotation(
+        self, link: _StreamLink, ws_base: str
+    ) -> _StreamLink | None:
+        """Stream on ``link``; on the rotation deadline hand over to a new one.
+
+        Returns the replacement link, or None once ``link`` has ended.
+        """
+        assert link.task is not None
+        done, _ = await asyncio.wait({link.task}, timeout=self._rotate_seconds)
+        if done:
+            link.task.result()  # re-raise reader errors into the reconnect path
+            return None
+        # Planned rotation: the new connection is open (and buffering)
+        # before the old one closes, so no event falls in between.
+        key = await self._create_listen_key()
+        replacement = await self._open_stream(ws_base, key)
+        try:
+            if key != link.key:
+                self._start_renewal(key)
+            await self._close_stream(link)
+            await self._drain(replacement)
+        except BaseException:
+            await self._close_stream(replacement)
+            raise
+        self.handovers += 1
+        exchange_truth_store_events_total.labels(event_type="handover").inc()
+        logger.info("UserDataStreamConsumer: rotated stream connection")
+        return replacement
+
+    async def _consumer_loop(self) -> None:
+        """Main loop: connect, reseed, stream, reconnect with backoff on failure.
+
+        The connection opens before the reseed and buffers events meanwhile;
+        the store's per-key versions drop any the REST read already covers.
+        """
         is_testnet = bool(
             getattr(getattr(self._exchange, "client", None), "testnet", False)
         )
@@ -411,56 +787,26 @@ class UserDataStreamConsumer:
         delay = _RECONNECT_BASE_DELAY
 
         while self._running:
+            link: _StreamLink | None = None
+            live = False
             try:
                 key = await self._create_listen_key()
-                url = f"{ws_base}/{key}"
-
-                if self._renewal_task and not self._renewal_task.done():
-                    self._renewal_task.cancel()
-                    try:
-                        await self._renewal_task
-                    except asyncio.CancelledError:
-                        pass
-                self._renewal_task = asyncio.create_task(
-                    self._renewal_loop(key), name="listen-key-renewal"
+                self._start_renewal(key)
+                link = await self._open_stream(ws_base, key)
+                self._stream_connected = True
+                logger.info(
+                    "UserDataStreamConsumer: connected (testnet=%s)", is_testnet
                 )
+                delay = _RECONNECT_BASE_DELAY  # reset on clean connect
 
-                await self._seed_store()
-
-                async with websockets.connect(url) as ws:
-                    self._stream_connected = True
-                    logger.info(
-                        "UserDataStreamConsumer: connected (testnet=%s)", is_testnet
-                    )
-                    delay = _RECONNECT_BASE_DELAY  # reset on clean connect
-
-                    async for message in ws:
-                        if not self._running:
-                            break
-                        try:
-                            event = json.loads(message)
-                        except json.JSONDecodeError:
-                            logger.warning(
-                                "UserDataStreamConsumer: invalid JSON payload"
-                            )
-                            continue
-
-                        event_type = event.get("e", "")
-                        if event_type == "ACCOUNT_UPDATE":
-                            await self.store.update_positions_from_account_update(event)
-                            exchange_truth_store_events_total.labels(
-                                event_type="account_update"
-                            ).inc()
-                        elif event_type == "ORDER_TRADE_UPDATE":
-                            await self.store.update_order_from_trade_update(event)
-                            exchange_truth_store_events_total.labels(
-                                event_type="order_trade_update"
-                            ).inc()
-                        else:
-                            logger.debug(
-                                "UserDataStreamConsumer: ignoring event_type=%s",
-                                event_type,
-                            )
+                await self._resync()
+                await self._drain(link)
+                live = True
+                while self._running:
+                    replacement = await self._stream_until_rotation(link, ws_base)
+                    if replacement is None:
+                        break
+                    link = replacement
 
             except asyncio.CancelledError:
                 raise
@@ -471,6 +817,11 @@ class UserDataStreamConsumer:
                 exchange_truth_store_events_total.labels(event_type="reconnect").inc()
             finally:
                 self._stream_connected = False
+                if live:
+                    # The store matched the exchange right up to the drop.
+                    self._in_sync_at = time.monotonic()
+                if link is not None:
+                    await self._close_stream(link)
 
             if not self._running:
                 break
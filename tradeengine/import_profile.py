@@ -0,0 +1,148 @@
+"""Import-time profile and cold-import budget for the trade engine.
+
+Runs ``python -X importtime -c "import <module>"`` in a fresh interpreter
+(so nothing is already cached in ``sys.modules``), parses the per-module
+timings CPython writes to stderr and reports the heaviest import subtrees.
+
+Usage::
+
+    python -m tradeengine.import_profile                 # tradeengine.api
+    python -m tradeengine.import_profile tradeengine.dispatcher --top 40
+    python -m tradeengine.import_profile --budget        # exit 1 if over
+
+``COLD_IMPORT_BUDGET_S`` is the wall-clock ceiling the test suite enforces
+for ``import tradeengine.api``; optional subsystems (MySQL audit logger,
+pyroscope) are expected to stay out of the cold import entirely.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+
+DEFAULT_MODULE = "tradeengine.api"
+
+# Wall-clock ceiling for a cold ``import tradeengine.api`` (seconds). The
+# import is ~2s on a developer laptop; the headroom absorbs slow CI runners.
+COLD_IMPORT_BUDGET_S = 6.0
+
+# Modules that must only be imported when their feature is enabled.
+LAZY_MODULES = ("sqlalchemy", "pyroscope")
+
+
+@dataclass
+class ImportNode:
+    name: str
+    self_us: int
+    cumulative_us: int
+    children: list[ImportNode] = field(default_factory=list)
+
+
+def parse_importtime(stderr: str) -> list[ImportNode]:
+    """Build the import tree from ``-X importtime`` output.
+
+    CPython prints children before their parent, indenting names by two
+    spaces per nesting level, so a stack of pending children per depth is
+    enough to attach each finished module to its parent.
+    """
+    pending: dict[int, list[ImportNode]] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # header line
+        raw_name = parts[2].rstrip()
+        stripped = raw_name.lstrip()
+        depth = (len(raw_name) - len(stripped) - 1) // 2
+        node = ImportNode(
+            name=stripped,
+            self_us=int(parts[0]),
+            cumulative_us=int(parts[1]),
+            children=pending.pop(depth + 1, []),
+        )
+        pending.setdefault(depth, []).append(node)
+    return pending.get(0, [])
+
+
+def profile_import(module: str = DEFAULT_MODULE) -> tuple[float, list[ImportNode]]:
+    """Cold-import ``module`` in a subprocess; return (wall seconds, tree)."""
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+    elapsed = time.perf_counter() - started
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr[-2000:]}")
+    return elapsed, parse_importtime(proc.stderr)
+
+
+def loaded_modules(module: str = DEFAULT_MODULE) -> set[str]:
+    """Top-level package names present in ``sys.modules`` after a cold import."""
+    proc = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys, {module}; print('\\n'.join(sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return {name.split(".")[0] for name in proc.stdout.split()}
+
+
+def format_tree(
+    roots: list[ImportNode], top: int = 25, min_ms: float = 5.0, max_depth: int = 3
+) -> str:
+    """Render the heaviest subtrees, largest cumulative time first."""
+    lines: list[str] = []
+
+    def walk(node: ImportNode, depth: int) -> None:
+        if node.cumulative_us / 1000 < min_ms or depth > max_depth:
+            return
+        lines.append(
+            f"{node.cumulative_us / 1000:9.1f} ms {node.self_us / 1000:8.1f} ms  "
+            f"{'  ' * depth}{node.name}"
+        )
+        for child in sorted(node.children, key=lambda n: -n.cumulative_us):
+            walk(child, depth + 1)
+
+    for root in sorted(roots, key=lambda n: -n.cumulative_us)[:top]:
+        walk(root, 0)
+    return "\n".join([" cumulative      self  module", *lines])
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("module", nargs="?", default=DEFAULT_MODULE)
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument("--min-ms", type=float, default=5.0)
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument(
+        "--budget",
+        action="store_true",
+        help=f"exit 1 if the cold import exceeds {COLD_IMPORT_BUDGET_S}s",
+    )
+    args = parser.parse_args(argv)
+
+    elapsed, roots = profile_import(args.module)
+    print(format_tree(roots, top=args.top, min_ms=args.min_ms, max_depth=args.depth))
+    print(f"\ncold import {args.module}: {elapsed:.2f}s wall")
+    if args.budget and elapsed > COLD_IMPORT_BUDGET_S:
+        print(f"over budget ({COLD_IMPORT_BUDGET_S}s)")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,239 @@
+"""Event-loop lag and slow-callback monitor.
+
+Blocking work on the event loop (synchronous python-binance calls,
+leverage checks, formatting large audit payloads) stalls every other
+coroutine in the process, and nothing used to measure it. Two probes
+run while :class:`LoopMonitor` is started:
+
+* a sampler task sleeps ``interval`` seconds at a time and observes how
+  late it wakes up into ``tradeengine_event_loop_lag_seconds``;
+* a watchdog thread notices when the sampler is overdue by more than
+  ``slow_threshold`` and, while the loop is still stuck, samples the loop
+  thread's stack and the task it is running.
+
+When the loop comes back the stall's full duration is recorded with that
+sample. The worst recent stalls, individually and grouped by offending
+call site, are served on ``GET /debug/loop`` behind the debug token, as
+the samples expose code paths. Stalls that end before the watchdog sees
+them are still counted, without attribution.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sys
+import sysconfig
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from prometheus_client import Counter, Histogram
+
+from shared.config import settings
+
+logger = logging.getLogger(__name__)
+
+event_loop_lag_seconds = Histogram(
+    "tradeengine_event_loop_lag_seconds",
+    "How late the loop-lag sampler woke up",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+event_loop_slow_callbacks_total = Counter(
+    "tradeengine_event_loop_slow_callbacks_total",
+    "Event-loop stalls longer than the slow-callback threshold",
+)
+
+_STDLIB = sysconfig.get_paths()["stdlib"]
+
+
+@dataclass
+class SlowCallback:
+    """One stall of the event loop."""
+
+    at: float
+    duration: float
+    task: str | None = None
+    coroutine: str | None = None
+    site: str | None = None
+    stack: list[str] = field(default_factory=list)
+
+
+def _is_app_frame(filename: str) -> bool:
+    return "site-packages" not in filename and not filename.startswith(_STDLIB)
+
+
+class LoopMonitor:
+    """Measures loop lag and attributes stalls to the task and code running."""
+
+    def __init__(
+        self,
+        interval: float = 0.25,
+        slow_threshold: float = 0.1,
+        keep: int = 256,
+        stack_depth: int = 12,
+    ) -> None:
+        self.interval = max(0.01, float(interval))
+        self.slow_threshold = max(0.001, float(slow_threshold))
+        self.stack_depth = stack_depth
+        self.recent: deque[SlowCallback] = deque(maxlen=keep)
+        self._lags: deque[float] = deque(maxlen=max(1, int(60 / self.interval)))
+        self._lock = threading.Lock()
+        self._task: asyncio.Task[None] | None = None
+        self._thread: threading.Thread | None = None
+        self._stopped = threading.Event()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        self._last_tick = time.perf_counter()
+        # Sample taken by the watchdog for the stall in progress, if any.
+        self._stall: SlowCallback | None = None
+        self.max_lag = 0.0
+        self.slow_total = 0
+
+    @classmethod
+    def from_settings(cls) -> LoopMonitor:
+        return cls(
+            interval=settings.te_loop_lag_interval_seconds,
+            slow_threshold=settings.te_slow_callback_threshold_seconds,
+        )
+
+    def start(self) -> None:
+        """Start both probes; call from the loop being monitored."""
+        if self._task is not None and not self._task.done():
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._last_tick = time.perf_counter()
+        self._stopped.clear()
+        self._task = asyncio.create_task(self._sample(), name="loop-lag-sampler")
+        self._thread = threading.Thread(
+            target=self._watch, name="loop-lag-watchdog", daemon=True
+        )
+        self._thread.start()
+
+    async def stop(self) -> None:
+        self._stopped.set()
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    async def _sample(self) -> None:
+        while True:
+            expected = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.perf_counter()
+            self._record_tick(max(0.0, now - expected), now)
+
+    def _record_tick(self, lag: float, now: float) -> None:
+        event_loop_lag_seconds.observe(lag)
+        with self._lock:
+            self._last_tick = now
+            self._lags.append(lag)
+            self.max_lag = max(self.max_lag, lag)
+            stall, self._stall = self._stall, None
+            if lag < self.slow_threshold:
+                return
+            if stall is None:
+                stall = SlowCallback(at=time.time() - lag, duration=lag)
+            stall.duration = lag
+            self.recent.append(stall)
+            self.slow_total += 1
+        event_loop_slow_callbacks_total.inc()
+        if stall.site is not None:
+            logger.warning(
+                "Event loop blocked %.0fms in %s (%s)",
+                lag * 1000,
+                stall.site,
+                stall.coroutine or stall.task or "callback",
+            )
+
+    def _watch(self) -> None:
+        period = min(self.slow_threshold / 2, self.interval)
+        while not self._stopped.wait(period):
+            with self._lock:
+                overdue = time.perf_counter() - self._last_tick - self.interval
+                if overdue < self.slow_threshold or self._stall is not None:
+                    continue
+                self._stall = self._capture(overdue)
+
+    def _capture(self, overdue: float) -> SlowCallback:
+        stall = SlowCallback(at=time.time() - overdue, duration=overdue)
+        frame = sys._current_frames().get(self._loop_thread_id or 0)
+        if frame is not None:
+            summary = traceback.extract_stack(frame)
+            stall.stack = [
+                f"{f.filename}:{f.lineno} {f.name}"
+                for f in summary[-self.stack_depth :]
+            ]
+            for f in reversed(summary):
+                if _is_app_frame(f.filename):
+                    stall.site = f"{f.filename}:{f.lineno} {f.name}"
+                    break
+        try:
+            task = asyncio.current_task(self._loop) if self._loop else None
+        except RuntimeError:
+            task = None
+        if task is not None:
+            stall.task = task.get_name()
+            stall.coroutine = getattr(task.get_coro(), "__qualname__", None)
+        return stall
+
+    def offenders(self, limit: int = 10) -> list[dict[str, Any]]:
+        """Attributed stalls grouped by call site, worst total first."""
+        groups: dict[tuple[str | None, str | None], dict[str, Any]] = {}
+        with self._lock:
+            stalls = [s for s in self.recent if s.site is not None]
+        for stall in stalls:
+            key = (stall.site, stall.coroutine)
+            group = groups.setdefault(
+                key,
+                {
+                    "site": stall.site,
+                    "coroutine": stall.coroutine,
+                    "count": 0,
+                    "total_seconds": 0.0,
+                    "max_seconds": 0.0,
+                    "last_at": 0.0,
+                },
+            )
+            group["count"] += 1
+            group["total_seconds"] += stall.duration
+            group["max_seconds"] = max(group["max_seconds"], stall.duration)
+            group["last_at"] = max(group["last_at"], stall.at)
+        return sorted(groups.values(), key=lambda g: -g["total_seconds"])[:limit]
+
+    def snapshot(self, limit: int = 10) -> dict[str, Any]:
+        with self._lock:
+            lags = sorted(self._lags)
+            worst = sorted(self.recent, key=lambda s: -s.duration)[:limit]
+
+        def pct(q: float) -> float | None:
+            return lags[min(len(lags) - 1, int(q * len(lags)))] if lags else None
+
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "interval_seconds": self.interval,
+            "slow_threshold_seconds": self.slow_threshold,
+            "lag_last_minute": {
+                "p50": pct(0.5),
+                "p99": pct(0.99),
+                "max": lags[-1] if lags else None,
+            },
+            "max_lag_seconds": self.max_lag,
+            "slow_callbacks_total": self.slow_total,
+            "worst_recent": [asdict(s) for s in worst],
+            "offenders": self.offenders(limit),
+        }
+
+
+loop_monitor = LoopMonitor.from_settings()
@@ -0,0 +1,235 @@
+"""Pre-bound, cardinality-limited metric handles for the hot path.
+
+Every signal walks the dispatcher through a dozen ``metric.labels(...)``
+calls. ``prometheus_client`` validates and stringifies the label values,
+takes the metric lock and hashes the tuple on *every* call, and nothing
+bounds the values: ``order_failures_total`` was labelled with the first 50
+characters of the exchange error message, so each new error text minted a
+new series that the scrape then had to walk forever.
+
+:class:`BoundMetric` wraps one ``prometheus_client`` instrument (and,
+optionally, its OTel dual-export twin from :mod:`tradeengine.metrics`):
+
+* ``labels(**values)`` returns a cached child per label tuple, so the
+  prometheus lookup happens once per series instead of once per update;
+* labels listed as ``limited`` go through :class:`CardinalityLimiter`: the
+  first ``te_metric_label_cap`` distinct values of a label keep their own
+  series, later ones fold into ``"other"``;
+* the OTel side is not called inline. Children queue their deltas on
+  :class:`OTelBatcher`, which coalesces counter adds per attribute set and
+  replays them from a background task every
+  ``te_otel_batch_interval_seconds`` (or inline once the queue gets long, so
+  nothing grows without bound when the task is not running).
+
+A handle may also carry a ``tap``: a callable that receives every
+``inc``/``observe`` amount, used to feed in-process aggregates (the health
+evaluator's rolling windows) without a second call at each site.
+
+Call sites keep the prometheus shape::
+
+    risk_checks.labels(
+        check_type="daily_loss", result="passed", exchange=order.exchange
+    ).inc()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from shared.config import settings
+
+logger = logging.getLogger(__name__)
+
+OTHER = "other"
+_MAX_PENDING_OTEL = 10_000
+
+
+class CardinalityLimiter:
+    """Caps the distinct values each (metric, label) pair may take."""
+
+    def __init__(self, max_values: int, overflow: str = OTHER) -> None:
+        self._max_values = max(1, int(max_values))
+        self._overflow = overflow
+        self._admitted: dict[tuple[str, str], set[str]] = {}
+        self.folded_total = 0
+
+    def admit(self, metric: str, label: str, value: str) -> str:
+        seen = self._admitted.setdefault((metric, label), set())
+        if value in seen:
+            return value
+        if len(seen) < self._max_values:
+            seen.add(value)
+            return value
+        self.folded_total += 1
+        return self._overflow
+
+    def series_count(self, metric: str, label: str) -> int:
+        return len(self._admitted.get((metric, label), ()))
+
+
+class OTelBatcher:
+    """Coalesces OTel instrument updates and replays them off the hot path."""
+
+    def __init__(self, interval: float, max_pending: int = _MAX_PENDING_OTEL) -> None:
+        self._interval = interval
+        self._max_pending = max_pending
+        # (instrument id, attrs key) -> [instrument, attrs, summed amount]
+        self._adds: dict[tuple[int, tuple[Any, ...]], list[Any]] = {}
+        self._records: list[tuple[Any, float, dict[str, str]]] = []
+        self._task: asyncio.Task[None] | None = None
+
+    def __len__(self) -> int:
+        return len(self._adds) + len(self._records)
+
+    def add(
+        self,
+        instrument: Any,
+        amount: float,
+        attrs: dict[str, str],
+        key: tuple[Any, ...],
+    ) -> None:
+        slot = self._adds.get((id(instrument), key))
+        if slot is None:
+            self._adds[(id(instrument), key)] = [instrument, attrs, amount]
+        else:
+            slot[2] += amount
+        self._maybe_flush_inline()
+
+    def record(self, instrument: Any, value: float, attrs: dict[str, str]) -> None:
+        self._records.append((instrument, value, attrs))
+        self._maybe_flush_inline()
+
+    def _maybe_flush_inline(self) -> None:
+        if len(self) >= self._max_pending:
+            self.flush()
+
+    def flush(self) -> None:
+        """Replay every pending update onto its OTel instrument."""
+        adds, self._adds = self._adds, {}
+        records, self._records = self._records, []
+        for instrument, attrs, amount in adds.values():
+            try:
+                instrument.add(amount, attrs)
+            except Exception:
+                logger.debug("OTel batched add failed", exc_info=True)
+        for instrument, value, attrs in records:
+            try:
+                instrument.record(value, attrs)
+            except Exception:
+                logger.debug("OTel batched record failed", exc_info=True)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="otel-metric-batcher")
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self.flush()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            self.flush()
+
+
+label_limiter = CardinalityLimiter(settings.te_metric_label_cap)
+otel_batcher = OTelBatcher(settings.te_otel_batch_interval_seconds)
+
+
+class _BoundChild:
+    """One labelled series: the prometheus child plus its OTel attributes."""
+
+    __slots__ = ("_prom", "_otel", "_attrs", "_key", "_tap")
+
+    def __init__(
+        self,
+        prom: Any,
+        otel: Any,
+        attrs: dict[str, str],
+        key: tuple[Any, ...],
+        tap: Callable[[float], None] | None = None,
+    ) -> None:
+        self._prom = prom
+        self._otel = otel
+        self._attrs = attrs
+        self._key = key
+        self._tap = tap
+
+    def inc(self, amount: float = 1) -> None:
+        self._prom.inc(amount)
+        if self._tap is not None:
+            self._tap(amount)
+        if self._otel is not None:
+            otel_batcher.add(self._otel, amount, self._attrs, self._key)
+
+    def observe(self, value: float) -> None:
+        self._prom.observe(value)
+        if self._tap is not None:
+            self._tap(value)
+        if self._otel is not None:
+            otel_batcher.record(self._otel, value, self._attrs)
+
+    def set(self, value: float) -> None:
+        self._prom.set(value)
+
+
+class BoundMetric:
+    """Cached, cardinality-limited ``.labels()`` front for one instrument."""
+
+    def __init__(
+        self,
+        metric: Any,
+        *,
+        otel: Any = None,
+        limited: Iterable[str] = (),
+        limiter: CardinalityLimiter | None = None,
+        tap: Callable[[float], None] | None = None,
+    ) -> None:
+        self._metric = metric
+        self._otel = otel
+        self._tap = tap
+        self._name: str = getattr(metric, "_name", repr(metric))
+        self._labelnames: tuple[str, ...] = tuple(getattr(metric, "_labelnames", ()))
+        self._limited = frozenset(limited) & frozenset(self._labelnames)
+        self._limiter = limiter or label_limiter
+        self._children: dict[tuple[Any, ...], _BoundChild] = {}
+
+    def labels(self, **values: Any) -> _BoundChild:
+        key = tuple(values[name] for name in self._labelnames)
+        child = self._children.get(key)
+        if child is not None:
+            return child
+        folded: dict[str, str] = {}
+        overflowed = False
+        for name, value in zip(self._labelnames, key, strict=True):
+            text = str(value)
+            if name in self._limited:
+                admitted = self._limiter.admit(self._name, name, text)
+                overflowed = overflowed or admitted != text
+                text = admitted
+            folded[name] = text
+        folded_key = tuple(folded.values())
+        child = self._children.get(folded_key)
+        if child is None:
+            child = _BoundChild(
+                self._metric.labels(**folded),
+                self._otel,
+                folded,
+                folded_key,
+                self._tap,
+            )
+            self._children[folded_key] = child
+        if not overflowed:
+            # Folded raw values are unbounded by definition; caching them
+            # would just move the growth from the registry into this dict.
+            self._children[key] = child
+        return child
@@ -16,6 +16,9 @@ OTLP push pipeline to Grafana Alloy. The prometheus_client path is unchanged.
 from petrosa_otel import get_meter
 from prometheus_client import Counter, Gauge, Histogram
 
+from tradeengine.evaluators.rolling_window import health_signals
+from tradeengine.metric_handles import BoundMetric
+
 # Position Lifecycle Metrics
 positions_opened_total = Counter(
     "tradeengine_positions_opened_total",
@@ -517,6 +520,38 @@ def set_position_reconciler_running(
     )
 
 
+# Startup dependency graph (tradeengine/startup_graph.py): wall time of each
+# lifespan step and whether it failed, so slow or broken boot dependencies
+# show up per step instead of as one long cold start.
+startup_step_duration_seconds = Gauge(
+    "tradeengine_startup_step_duration_seconds",
+    "Wall-clock duration of each startup step in the last boot.",
+    ["step"],
+)
+
+startup_step_failed = Gauge(
+    "tradeengine_startup_step_failed",
+    "1 when the startup step raised (or was skipped because a dependency did).",
+    ["step"],
+)
+
+# Per-symbol actor runtime (tradeengine/symbol_actors.py, TE_SYMBOL_ACTOR_MODE):
+# how long a command waited in its symbol's mailbox before running, and how
+# many commands are queued per symbol right now.
+symbol_actor_queue_latency_seconds = Histogram(
+    "tradeengine_symbol_actor_queue_latency_seconds",
+    "Time a command waited in its symbol's actor mailbox before running.",
+    ["symbol"],
+    buckets=[0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10],
+)
+
+symbol_actor_mailbox_depth = Gauge(
+    "tradeengine_symbol_actor_mailbox_depth",
+    "Commands queued in a symbol's actor mailbox.",
+    ["symbol"],
+)
+
+
 # ============================================================
 # OTel SDK instruments (dual-export — OTLP push to Grafana Alloy)
 # ============================================================
@@ -621,3 +656,35 @@ otel_oco_pair_age_seconds = meter.create_gauge(
     description="Age in seconds of each active OCO pair (time since it entered active_oco_pairs) (OTLP dual-export)",
     unit="s",
 )
+
+# ============================================================
+# Hot-path handles (cached children, capped labels, batched OTel)
+# ============================================================
+# The dispatcher's per-signal path goes through these instead of calling
+# ``.labels()`` on the instruments above; the series names and label sets are
+# unchanged. See tradeengine/metric_handles.py. The risk and latency handles
+# also feed the health evaluator's rolling windows.
+
+hot_orders_executed_by_type = BoundMetric(
+    orders_executed_by_type, otel=otel_orders_executed_by_type, limited=("symbol",)
+)
+hot_order_execution_latency_seconds = BoundMetric(
+    order_execution_latency_seconds,
+    otel=otel_order_execution_latency_seconds,
+    limited=("symbol",),
+    tap=health_signals.order_latency.add,
+)
+hot_order_failures_total = BoundMetric(
+    order_failures_total,
+    otel=otel_order_failures,
+    limited=("symbol", "failure_reason"),
+)
+hot_risk_rejections_total = BoundMetric(
+    risk_rejections_total,
+    otel=otel_risk_rejections,
+    limited=("symbol",),
+    tap=health_signals.risk_rejections.add,
+)
+hot_risk_checks_total = BoundMetric(
+    risk_checks_total, otel=otel_risk_checks, tap=health_signals.risk_checks.add
+)
@@ -27,6 +27,12 @@ from typing import TYPE_CHECKING, Any, Literal
 from prometheus_client import Counter, Histogram
 
 from contracts.order import OrderStatus, TradeOrder
+from tradeengine.compute_pool import ComputePool
+from tradeengine.risk.pretrade import (
+    ProtectivePrices,
+    derive_protective_prices,
+    derive_protective_prices_batch,
+)
 
 if TYPE_CHECKING:
     from tradeengine.exchange.binance import BinanceFuturesExchange
@@ -110,6 +116,7 @@ class NakedPositionRemediator:
         fallback_tp_pct: float = 4.0,
         min_sl_distance_pct: float = 6.0,
         clock: Callable[[], float] = time.monotonic,
+        compute_pool: ComputePool | None = None,
     ) -> None:
         self._exchange = exchange
         self._position_manager = position_manager
@@ -125,6 +132,9 @@ class NakedPositionRemediator:
         # (2026-07-20 second-wave OCO-orphan incident).
         self._min_sl_distance_pct = float(min_sl_distance_pct)
         self._clock = clock
+        # Batch protective-price derivation for a whole pass (see remediate).
+        self._compute_pool = compute_pool
+        self._batch_prices: dict[tuple[str, str], ProtectivePrices] = {}
         # (symbol, side) -> first-seen monotonic timestamp
         self._first_seen: dict[tuple[str, str], float] = {}
         # #547: (symbol, side) keys already CRITICAL-logged as malformed, so
@@ -173,6 +183,9 @@ class NakedPositionRemediator:
 
         now = self._clock()
         currently_unhedged: set[tuple[str, str]] = set()
+        await self._precompute_protective_prices(
+            unhedged_divergences, binance_positions
+        )
 
         for div in unhedged_divergences:
             symbol = div["symbol"]
@@ -234,9 +247,45 @@ class NakedPositionRemediator:
         for k in list(self._malformed_alerted):
             if k not in currently_unhedged:
                 self._malformed_alerted.discard(k)
+        self._batch_prices.clear()
 
         return counts
 
+    async def _precompute_protective_prices(
+        self,
+        divergences: list[dict[str, Any]],
+        binance_positions: dict[tuple[str, str], dict[str, Any]] | None,
+    ) -> None:
+        """Derive SL/TP for every re-armable position of this pass in one
+        batch on the compute pool, so a large book's arithmetic does not run
+        between the re-arm awaits. Without a pool each re-arm derives inline.
+        """
+        self._batch_prices.clear()
+        if self._compute_pool is None or self._mode not in (
+            "arm_only",
+            "arm_or_flatten",
+        ):
+            return
+        keys = [
+            (d["symbol"], d["side"])
+            for d in divergences
+            if d.get("category") != "malformed_position"
+        ]
+        inputs = [
+            self._protective_inputs(s, side, binance_positions) for s, side in keys
+        ]
+        try:
+            results = await self._compute_pool.map_chunked(
+                derive_protective_prices_batch, inputs
+            )
+        except Exception:
+            logger.exception(
+                "NakedPositionRemediator: batch price derivation failed; "
+                "deriving per position"
+            )
+            return
+        self._batch_prices = dict(zip(keys, results, strict=True))
+
     # ------------------------------------------------------------------
     # Mode handlers
     # ------------------------------------------------------------------
@@ -560,138 +609,95 @@ class NakedPositionRemediator:
         is placeable without immediate trigger the third return value
         ``must_flatten`` is True so the caller escalates instead of looping.
         """
-        sl_price: float | None = None
-        tp_price: float | None = None
-        must_flatten = False
+        result = self._batch_prices.pop((symbol, side), None)
+        if result is None:
+            result = derive_protective_prices(
+                *self._protective_inputs(symbol, side, binance_positions)
+            )
+        self._log_protective_adjustments(symbol, side, result)
+        return result.sl_price, result.tp_price, result.must_flatten
 
+    def _protective_inputs(
+        self,
+        symbol: str,
+        side: str,
+        binance_positions: dict[tuple[str, str], dict[str, Any]] | None,
+    ) -> tuple[Any, ...]:
+        """Plain-value arguments for :func:`derive_protective_prices`."""
+        stored_sl: float | None = None
+        stored_tp: float | None = None
         try:
             local = self._position_manager.get_positions().get((symbol, side))
         except Exception:
             local = None
-
         if local:
             try:
                 lsl = local.get("stop_loss_price")
                 if lsl is not None:
-                    sl_price = float(lsl)
+                    stored_sl = float(lsl)
             except (TypeError, ValueError):
                 pass
             try:
                 ltp = local.get("take_profit_price")
                 if ltp is not None:
-                    tp_price = float(ltp)
+                    stored_tp = float(ltp)
             except (TypeError, ValueError):
                 pass
 
-        # Resolve entry price unconditionally — needed both for the fallback
-        # legs AND to clamp a too-tight stored SL out to the safety floor.
         entry_price: float | None = None
-        if binance_positions:
-            bp = binance_positions.get((symbol, side))
-            if bp:
-                try:
-                    entry_price = float(bp.get("entryPrice") or 0.0) or None
-                except (TypeError, ValueError):
-                    entry_price = None
-
-        # Without an entry price we cannot compute the floor band or the
-        # fallback — return whatever local values we have (legacy behaviour).
-        if entry_price is None or entry_price <= 0:
-            return sl_price, tp_price, must_flatten
-
-        # Fill missing legs from the entry-anchored fallback.
-        if sl_price is None:
-            if side == "LONG":
-                sl_price = entry_price * (1.0 - self._fallback_sl_pct / 100.0)
-            else:
-                sl_price = entry_price * (1.0 + self._fallback_sl_pct / 100.0)
-        if tp_price is None:
-            if side == "LONG":
-                tp_price = entry_price * (1.0 + self._fallback_tp_pct / 100.0)
-            else:
-                tp_price = entry_price * (1.0 - self._fallback_tp_pct / 100.0)
-
-        # Clamp a too-tight SL (stored OR fallback) out to the safety floor.
-        # LONG SL is below entry: it must be <= entry * (1 - floor).
-        # SHORT SL is above entry: it must be >= entry * (1 + floor).
-        if sl_price is not None and self._min_sl_distance_pct > 0:
-            floor = self._min_sl_distance_pct / 100.0
-            if side == "LONG":
-                floor_price = entry_price * (1.0 - floor)
-                if sl_price > floor_price:
-                    logger.warning(
-                        "NakedPositionRemediator: widening too-tight LONG SL "
-                        "%s/%s from %s to floor %s (entry=%s, floor=%.2f%%)",
-                        symbol,
-                        side,
-                        sl_price,
-                        floor_price,
-                        entry_price,
-                        self._min_sl_distance_pct,
-                    )
-                    sl_price = floor_price
-            else:
-                floor_price = entry_price * (1.0 + floor)
-                if sl_price < floor_price:
-                    logger.warning(
-                        "NakedPositionRemediator: widening too-tight SHORT SL "
-                        "%s/%s from %s to floor %s (entry=%s, floor=%.2f%%)",
-                        symbol,
-                        side,
-                        sl_price,
-                        floor_price,
-                        entry_price,
-                        self._min_sl_distance_pct,
-                    )
-                    sl_price = floor_price
-
-        # Market-crossed-entry gate (#551): the entry-anchored floor above does
-        # not know where the LIVE market is. If the market has crossed entry,
-        # an entry-side-correct SL can be wrong-side of markPrice and trigger
-        # immediately (-2021). Re-anchor to the correct side of markPrice; if no
-        # placeable stop exists, signal a flatten so the caller stops retrying
-        # the identical dead price.
         mark_price: float | None = None
-        if binance_positions:
-            bp = binance_positions.get((symbol, side))
-            if bp:
-                try:
-                    mark_price = float(bp.get("markPrice") or 0.0) or None
-                except (TypeError, ValueError):
-                    mark_price = None
-
-        if sl_price is not None and mark_price and mark_price > 0:
-            from tradeengine.risk.sl_tp_direction import enforce_market_side_stop
-
-            decision = enforce_market_side_stop(
-                position_side=side,  # type: ignore[arg-type]
-                stop_price=float(sl_price),
-                market_price=mark_price,
-                min_distance_pct=self._min_sl_distance_pct / 100.0,
-            )
-            if decision.should_flatten:
-                logger.error(
-                    "NakedPositionRemediator: %s/%s SL unplaceable vs live "
-                    "market %s — %s; signalling flatten (#551)",
-                    symbol,
-                    side,
-                    mark_price,
-                    decision.reason,
-                )
-                must_flatten = True
-            elif decision.was_reanchored:
-                logger.warning(
-                    "NakedPositionRemediator: re-anchoring %s/%s SL from %s to "
-                    "%s (correct side of live market %s) (#551)",
-                    symbol,
-                    side,
-                    sl_price,
-                    decision.price,
-                    mark_price,
-                )
-                sl_price = decision.price
+        bp = binance_positions.get((symbol, side)) if binance_positions else None
+        if bp:
+            try:
+                entry_price = float(bp.get("entryPrice") or 0.0) or None
+            except (TypeError, ValueError):
+                entry_price = None
+            try:
+                mark_price = float(bp.get("markPrice") or 0.0) or None
+            except (TypeError, ValueError):
+                mark_price = None
 
-        return sl_price, tp_price, must_flatten
+        return (
+            side,
+            stored_sl,
+            stored_tp,
+            entry_price,
+            mark_price,
+            self._fallback_sl_pct,
+            self._fallback_tp_pct,
+            self._min_sl_distance_pct,
+        )
+
+    def _log_protective_adjustments(
+        self, symbol: str, side: str, result: ProtectivePrices
+    ) -> None:
+        if result.sl_widened_from is not None:
+            logger.warning(
+                "NakedPositionRemediator: widening too-tight %s SL %s/%s from %s "
+                "to floor (floor=%.2f%%)",
+                side,
+                symbol,
+                side,
+                result.sl_widened_from,
+                self._min_sl_distance_pct,
+            )
+        if result.must_flatten:
+            logger.error(
+                "NakedPositionRemediator: %s/%s SL unplaceable vs live market — "
+                "%s; signalling flatten (#551)",
+                symbol,
+                side,
+                result.flatten_reason,
+            )
+        elif result.sl_reanchored_from is not None:
+            logger.warning(
+                "NakedPositionRemediator: re-anchoring %s/%s SL from %s to %s "
+                "(correct side of live market) (#551)",
+                symbol,
+                side,
+                result.sl_reanchored_from,
+                result.sl_price,
+            )
 
     def _resolve_position_id(self, symbol: str, side: str) -> str:
         """Best-effort: use the local position's id if known, otherwise
@@ -5,31 +5,231 @@ Order Manager - Tracks orders and manages conditional execution
 import asyncio
 import logging
 import time
+from collections.abc import Awaitable, Callable, Iterator
 from datetime import datetime, timedelta
-from typing import Any
+from typing import Any, overload
 
 from contracts.order import TradeOrder
 from shared.audit import audit_logger
+from shared.config import settings
 from shared.constants import CONDITIONAL_ORDER_TIMEOUT, PRICE_MONITORING_INTERVAL, UTC
+from tradeengine.price_triggers import PriceTriggerBook
+from tradeengine.query_index import RecordIndex
 
 logger = logging.getLogger(__name__)
 
+# Terminal timestamps, most recent first, used as the /orders ``updated_at``.
+_ORDER_UPDATE_FIELDS = ("cancelled_at", "executed_at", "timeout_at")
+
+
+def _order_query_field(record: Any, field: str) -> Any:
+    if field == "created_at":
+        return record.get("created_at") or record.get("timestamp") or 0
+    if field == "updated_at":
+        for name in _ORDER_UPDATE_FIELDS:
+            if record.get(name):
+                return record[name]
+        return record.get("created_at") or record.get("timestamp") or 0
+    return record.get(field, 0)
+
+
+class OrderJournal:
+    """Fixed-capacity ring buffer of finished orders.
+
+    Replaces the unbounded ``order_history`` list. Slots are preallocated, an
+    ``order_id -> slot`` map makes :meth:`get` O(1), and per-status counters
+    are maintained on append/evict so summaries never rescan the buffer.
+    Once full, each append evicts the oldest entry and hands it to
+    ``on_evict`` (used for the optional data-manager spill).
+
+    Supports the list operations callers rely on: ``append``, ``len``,
+    iteration (oldest first), indexing/slicing, ``copy`` and ``clear``.
+    """
+
+    __slots__ = (
+        "_capacity",
+        "_slots",
+        "_statuses",
+        "_head",
+        "_size",
+        "_slot_by_id",
+        "_status_counts",
+        "_on_evict",
+        "evicted_total",
+    )
+
+    def __init__(
+        self,
+        capacity: int,
+        on_evict: Callable[[dict[str, Any]], None] | None = None,
+    ) -> None:
+        self._capacity = max(1, int(capacity))
+        self._slots: list[dict[str, Any] | None] = [None] * self._capacity
+        # Status captured at append time so eviction decrements the same key
+        self._statuses: list[str] = [""] * self._capacity
+        self._head = 0  # slot of the oldest entry
+        self._size = 0
+        self._slot_by_id: dict[Any, int] = {}
+        self._status_counts: dict[str, int] = {}
+        self._on_evict = on_evict
+        self.evicted_total = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def append(self, entry: dict[str, Any]) -> None:
+        if self._size == self._capacity:
+            self._evict_oldest()
+        slot = (self._head + self._size) % self._capacity
+        status = str(entry.get("status", "unknown"))
+        self._slots[slot] = entry
+        self._statuses[slot] = status
+        self._status_counts[status] = self._status_counts.get(status, 0) + 1
+        order_id = entry.get("order_id")
+        if order_id is not None:
+            self._slot_by_id[order_id] = slot
+        self._size += 1
+
+    def _evict_oldest(self) -> None:
+        slot = self._head
+        entry = self._slots[slot]
+        status = self._statuses[slot]
+        self._slots[slot] = None
+        self._head = (self._head + 1) % self._capacity
+        self._size -= 1
+        remaining = self._status_counts.get(status, 0) - 1
+        if remaining > 0:
+            self._status_counts[status] = remaining
+        else:
+            self._status_counts.pop(status, None)
+        if entry is None:
+            return
+        order_id = entry.get("order_id")
+        # A later entry for the same id may own the mapping; leave it alone.
+        if order_id is not None and self._slot_by_id.get(order_id) == slot:
+            del self._slot_by_id[order_id]
+        self.evicted_total += 1
+        if self._on_evict is not None:
+            self._on_evict(entry)
+
+    def get(self, order_id: Any) -> dict[str, Any] | None:
+        """Most recent entry recorded for ``order_id``."""
+        slot = self._slot_by_id.get(order_id)
+        return None if slot is None else self._slots[slot]
+
+    def status_counts(self) -> dict[str, int]:
+        return dict(self._status_counts)
+
+    def clear(self) -> None:
+        self._slots = [None] * self._capacity
+        self._statuses = [""] * self._capacity
+        self._head = 0
+        self._size = 0
+        self._slot_by_id.clear()
+        self._status_counts.clear()
+
+    def copy(self) -> list[dict[str, Any]]:
+        return list(self)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        for i in range(self._size):
+            entry = self._slots[(self._head + i) % self._capacity]
+            if entry is not None:
+                yield entry
+
+    @overload
+    def __getitem__(self, index: int) -> dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[dict[str, Any]]: ...
+
+    def __getitem__(self, index: int | slice) -> dict[str, Any] | list[dict[str, Any]]:
+        if isinstance(index, slice):
+            return self.copy()[index]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("order journal index out of range")
+        entry = self._slots[(self._head + index) % self._capacity]
+        assert entry is not None
+        return entry
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, OrderJournal | list):
+            return self.copy() == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
 
 class OrderManager:
     """Manages order tracking and conditional execution"""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        history_capacity: int | None = None,
+        spill_evicted: bool | None = None,
+    ) -> None:
         self.active_orders: dict[str, dict[str, Any]] = {}
         self.conditional_orders: dict[str, dict[str, Any]] = {}
-        self.order_history: list[dict[str, Any]] = []
+        self.order_history = OrderJournal(
+            history_capacity
+            if history_capacity is not None
+            else settings.te_order_history_capacity,
+            on_evict=self._on_history_evict,
+        )
+        self._spill_enabled = (
+            spill_evicted
+            if spill_evicted is not None
+            else settings.te_order_history_spill_enabled
+        )
+        self._spill_buffer: list[dict[str, Any]] = []
+        self._spill_task: asyncio.Task[None] | None = None
         self.price_cache: dict[str, float] = {}
         self.last_price_update: dict[str, datetime] = {}
+        # Resting conditional orders, laddered per symbol. One shared feed
+        # task reads each symbol's price once per interval and fires every
+        # crossed trigger, instead of one polling task per order.
+        self.price_triggers = PriceTriggerBook()
+        self._price_source: Callable[[str], Awaitable[float]] | None = None
+        # Called with every (symbol, price) tick the trigger feed reads.
+        self._price_listeners: list[Callable[[str, float], None]] = []
+        self._trigger_feed_task: asyncio.Task[None] | None = None
+        # One row per order_id across active, conditional and history, behind
+        # the /orders endpoint.
+        self.order_index = RecordIndex(
+            indexed_fields=("symbol", "status", "side", "type"),
+            sorted_fields=("created_at", "updated_at", "symbol", "status"),
+            getter=_order_query_field,
+        )
 
     async def initialize(self) -> None:
         pass
 
     async def close(self) -> None:
-        pass
+        task = self._trigger_feed_task
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._trigger_feed_task = None
+        await self._flush_spill()
+
+    def set_price_source(
+        self, source: Callable[[str], Awaitable[float]] | None
+    ) -> None:
+        """Set the coroutine the trigger feed uses to read a symbol's price."""
+        self._price_source = source
+
+    def add_price_listener(self, listener: Callable[[str, float], None]) -> None:
+        """Also hand every price tick to ``listener`` (e.g. position revaluation)."""
+        self._price_listeners.append(listener)
 
     def log_event(self, event_type: str, event_data: dict[str, Any]) -> None:
         audit_logger.log_event(event_type, event_data)
@@ -64,6 +264,7 @@ class OrderManager:
             self.active_orders[order_id] = order_info
         else:
             self.order_history.append(order_info)
+        self._index_order(order_info)
 
         audit_logger.log_order(
             order.model_dump(), status=result.get("status", "tracked")
@@ -96,56 +297,87 @@ class OrderManager:
 
         if order_id:
             self.conditional_orders[order_id] = conditional_info
+            self._index_order(conditional_info)
+            self.price_triggers.add(
+                order_id,
+                order.symbol,
+                conditional_info["conditional_direction"],
+                conditional_info["conditional_price"],
+                deadline=time.monotonic() + float(conditional_info["timeout"]),
+            )
+            self._ensure_trigger_feed()
         audit_logger.log_event("conditional_order_setup", conditional_info)
 
-        # Start monitoring task
-        if order_id:
-            asyncio.create_task(self._monitor_conditional_order(order_id))
-
         logger.info(
             f"Started monitoring conditional order {order_id} for {order.symbol}"
         )
 
-    async def _monitor_conditional_order(self, order_id: str) -> None:
-        """Monitor conditional order for price conditions"""
-        if order_id not in self.conditional_orders:
-            return
-
-        order_info = self.conditional_orders[order_id]
-        timeout = order_info.get("timeout", CONDITIONAL_ORDER_TIMEOUT)
+    def _ensure_trigger_feed(self) -> None:
+        """Start the shared trigger feed if it is not already running."""
+        task = self._trigger_feed_task
+        if task is None or task.done():
+            self._trigger_feed_task = asyncio.create_task(self._trigger_feed_loop())
+
+    async def _trigger_feed_loop(self) -> None:
+        """Read each triggered symbol's price once per interval and fire crossings.
+
+        Exits once no conditional order is resting; the next setup restarts it.
+        """
+        while len(self.price_triggers):
+            await self._expire_conditional_orders()
+            symbols = self.price_triggers.symbols()
+            prices = await asyncio.gather(
+                *(self._read_trigger_price(symbol) for symbol in symbols),
+                return_exceptions=True,
+            )
+            for symbol, price in zip(symbols, prices, strict=True):
+                if isinstance(price, BaseException):
+                    logger.error(f"Error reading trigger price for {symbol}: {price}")
+                    continue
+                try:
+                    await self.on_price_update(symbol, price)
+                except Exception as e:
+                    logger.error(f"Error firing conditional orders for {symbol}: {e}")
+                    audit_logger.log_error(
+                        {"error": str(e), "symbol": symbol},
+                        context={"symbol": symbol, "price": price},
+                    )
+            if not len(self.price_triggers):
+                break
+            await asyncio.sleep(PRICE_MONITORING_INTERVAL)
 
-        start_time = datetime.now(UTC)
+    async def _read_trigger_price(self, symbol: str) -> float:
+        if self._price_source is not None:
+            return float(await self._price_source(symbol))
+        return await self._get_current_price(symbol)
 
-        while datetime.now(UTC) - start_time < timedelta(seconds=timeout):
+    async def on_price_update(self, symbol: str, price: float) -> None:
+        """Apply a price tick: execute every conditional order it crosses."""
+        self.price_cache[symbol] = price
+        self.last_price_update[symbol] = datetime.now(UTC)
+        for listener in self._price_listeners:
             try:
-                # Check current price
-                current_price = await self._get_current_price(order_info["symbol"])
-
-                # Check condition
-                if self._check_condition(order_info, current_price):
-                    # Execute conditional order
-                    await self._execute_conditional_order(order_id)
-                    break
-
-                await asyncio.sleep(PRICE_MONITORING_INTERVAL)
-
+                listener(symbol, price)
             except Exception as e:
-                logger.error(f"Error monitoring conditional order {order_id}: {e}")
-                audit_logger.log_error(
-                    {"error": str(e), "order_id": order_id},
-                    context={"order_id": order_id, "order_info": order_info},
-                )
-                break
+                logger.warning(f"Price listener failed for {symbol}: {e}")
+        for order_id in self.price_triggers.pop_crossed(symbol, price):
+            await self._execute_conditional_order(order_id, execution_price=price)
 
-        # Cleanup if timeout reached
-        if order_id in self.conditional_orders:
-            order_info = self.conditional_orders[order_id]
-            order_info["status"] = "timeout"
-            order_info["timeout_at"] = datetime.now(UTC)
-            self.order_history.append(order_info)
-            del self.conditional_orders[order_id]
-            audit_logger.log_event("conditional_order_timeout", order_info)
-            logger.info(f"Conditional order {order_id} timed out")
+    async def _expire_conditional_orders(self) -> None:
+        for order_id in self.price_triggers.pop_expired(time.monotonic()):
+            self._timeout_conditional_order(order_id)
+
+    def _timeout_conditional_order(self, order_id: str) -> None:
+        if order_id not in self.conditional_orders:
+            return
+        order_info = self.conditional_orders[order_id]
+        order_info["status"] = "timeout"
+        order_info["timeout_at"] = datetime.now(UTC)
+        self.order_history.append(order_info)
+        self._index_order(order_info)
+        del self.conditional_orders[order_id]
+        audit_logger.log_event("conditional_order_timeout", order_info)
+        logger.info(f"Conditional order {order_id} timed out")
 
     def _check_condition(
         self, order_info: dict[str, Any], current_price: float
@@ -185,10 +417,13 @@ class OrderManager:
 
         return current_price
 
-    async def _execute_conditional_order(self, order_id: str) -> None:
+    async def _execute_conditional_order(
+        self, order_id: str, execution_price: float | None = None
+    ) -> None:
         """Execute a conditional order when conditions are met"""
         if order_id not in self.conditional_orders:
             return
+        self.price_triggers.remove(order_id)
 
         order_info = self.conditional_orders[order_id]
         logger.info(f"Executing conditional order {order_id}")
@@ -197,17 +432,88 @@ class OrderManager:
         # For now, just mark as executed
         order_info["status"] = "executed"
         order_info["executed_at"] = datetime.now(UTC)
-        order_info["execution_price"] = await self._get_current_price(
-            order_info["symbol"]
+        order_info["execution_price"] = (
+            execution_price
+            if execution_price is not None
+            else await self._get_current_price(order_info["symbol"])
         )
 
         # Move to order history
         self.order_history.append(order_info)
+        self._index_order(order_info)
         del self.conditional_orders[order_id]
         audit_logger.log_event("conditional_order_executed", order_info)
 
         logger.info(f"Conditional order {order_id} executed successfully")
 
+    def _on_history_evict(self, entry: dict[str, Any]) -> None:
+        """Drop an evicted journal entry from the query index and maybe spill it."""
+        order_id = entry.get("order_id")
+        if order_id is not None and self.order_index.get(order_id) is entry:
+            self.order_index.remove(order_id)
+        if not self._spill_enabled:
+            return
+        self._spill_buffer.append(entry)
+        if self._spill_task is None or self._spill_task.done():
+            try:
+                self._spill_task = asyncio.get_running_loop().create_task(
+                    self._flush_spill()
+                )
+            except RuntimeError:
+                # No loop (sync caller); close() flushes what is left.
+                pass
+
+    async def _flush_spill(self) -> None:
+        """Archive buffered evicted orders to the data manager in one batch."""
+        if not self._spill_buffer:
+            return
+        from shared.mysql_client import position_client
+
+        batch, self._spill_buffer = self._spill_buffer, []
+        records = [
+            {k: v for k, v in entry.items() if k != "original_order"} for entry in batch
+        ]
+        result = await position_client.archive_orders(records)
+        if not result.ok:
+            logger.warning(
+                "Dropped %d evicted orders after failed archive: %s",
+                len(records),
+                result.error,
+            )
+
+    def _index_order(self, order_info: dict[str, Any]) -> None:
+        order_id = order_info.get("order_id")
+        if order_id is not None:
+            self.order_index.upsert(order_id, order_info)
+
+    def query_orders(
+        self,
+        *,
+        symbol: str | None = None,
+        status: str | None = None,
+        side: str | None = None,
+        type: str | None = None,
+        from_time: datetime | None = None,
+        to_time: datetime | None = None,
+        sort_by: str = "created_at",
+        descending: bool = True,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> tuple[int, list[dict[str, Any]]]:
+        """Filter, sort and page tracked orders via the secondary indexes.
+
+        Returns ``(total_matches, page)``.
+        """
+        total, page = self.order_index.query(
+            equals={"symbol": symbol, "status": status, "side": side, "type": type},
+            ranges={"created_at": (from_time, to_time)},
+            sort_by=sort_by,
+            descending=descending,
+            offset=offset,
+            limit=limit,
+        )
+        return total, [dict(o) for o in page]
+
     def get_active_orders(self) -> list[dict[str, Any]]:
         """Get all active orders"""
         return list(self.active_orders.values())
@@ -230,12 +536,7 @@ class OrderManager:
         if order_id in self.conditional_orders:
             return self.conditional_orders[order_id]
 
-        # Check history
-        for order in self.order_history:
-            if order.get("order_id") == order_id:
-                return order
-
-        return None
+        return self.order_history.get(order_id)
 
     def cancel_order(self, order_id: str) -> bool:
         """Cancel an order"""
@@ -245,6 +546,7 @@ class OrderManager:
             order_info["status"] = "cancelled"
             order_info["cancelled_at"] = datetime.now(UTC)
             self.order_history.append(order_info)
+            self._index_order(order_info)
             del self.active_orders[order_id]
             logger.info(f"Order {order_id} cancelled")
             return True
@@ -255,7 +557,9 @@ class OrderManager:
             order_info["status"] = "cancelled"
             order_info["cancelled_at"] = datetime.now(UTC)
             self.order_history.append(order_info)
+            self._index_order(order_info)
             del self.conditional_orders[order_id]
+            self.price_triggers.remove(order_id)
             logger.info(f"Conditional order {order_id} cancelled")
             return True
 
@@ -267,17 +571,13 @@ class OrderManager:
         conditional_count = len(self.conditional_orders)
         history_count = len(self.order_history)
 
-        # Count by status
-        status_counts: dict[str, int] = {}
-        for order in self.order_history:
-            status = order.get("status", "unknown")
-            status_counts[status] = status_counts.get(status, 0) + 1
-
         return {
             "active_orders": active_count,
             "conditional_orders": conditional_count,
             "total_orders": history_count,
-            "status_distribution": status_counts,
+            # Running counters maintained by the journal on append/evict
+            "status_distribution": self.order_history.status_counts(),
+            "evicted_orders": self.order_history.evicted_total,
         }
 
 
@@ -0,0 +1,161 @@
+"""Running portfolio totals over ``PositionManager.positions``.
+
+``check_position_limits`` used to rescan every position on every order to
+compute portfolio exposure, and the CIO summary, portfolio summary and
+unrealised-P&L reads each did the same. :class:`PortfolioAggregates` keeps
+the totals current instead: the manager reports each record change (the
+same hooks that maintain its query index) and the aggregate swaps the
+record's old contribution for its new one in O(1).
+
+Each record contributes
+
+* ``long_notional`` — ``quantity * avg_price`` for positive quantities
+  (what ``_calculate_portfolio_exposure`` has always summed);
+* ``gross_notional`` — ``abs(quantity * avg_price)`` for non-zero
+  quantities, also broken down per symbol and per position side (the CIO
+  summary's gross and same-asset exposure);
+* ``unrealized_pnl``;
+* one to ``open_count`` when its quantity is non-zero.
+
+Running float sums drift by rounding; the totals snap back to exactly zero
+whenever the last contributing record leaves, and a wholesale reload of
+``positions`` rebuilds them from scratch.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Hashable, Mapping
+from typing import Any, NamedTuple
+
+
+class _Terms(NamedTuple):
+    symbol: str
+    side: str
+    long_notional: float
+    gross_notional: float
+    unrealized_pnl: float
+    is_open: bool
+
+
+def _number(value: Any) -> float:
+    try:
+        return float(value or 0.0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _terms(key: Hashable, record: Mapping[str, Any]) -> _Terms:
+    if isinstance(key, tuple) and len(key) == 2:
+        symbol, side = str(key[0]), str(key[1])
+    else:
+        symbol = str(record.get("symbol", key))
+        side = str(record.get("position_side", ""))
+    quantity = _number(record.get("quantity"))
+    notional = quantity * _number(record.get("avg_price"))
+    return _Terms(
+        symbol=symbol,
+        side=side,
+        long_notional=notional if quantity > 0 else 0.0,
+        gross_notional=abs(notional) if quantity != 0 else 0.0,
+        unrealized_pnl=_number(record.get("unrealized_pnl")),
+        is_open=quantity != 0,
+    )
+
+
+class PortfolioAggregates:
+    """Totals over a keyed set of position records, maintained per change."""
+
+    def __init__(self) -> None:
+        self._terms: dict[Hashable, _Terms] = {}
+        self.long_notional = 0.0
+        self.gross_notional = 0.0
+        self.unrealized_pnl = 0.0
+        self.open_count = 0
+        self.symbol_notional: dict[str, float] = {}
+        self.side_notional: dict[str, float] = {}
+        # open records behind each symbol/side bucket, so empty ones are dropped
+        self._symbol_members: dict[str, int] = {}
+        self._side_members: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def upsert(self, key: Hashable, record: Mapping[str, Any]) -> None:
+        previous = self._terms.pop(key, None)
+        if previous is not None:
+            self._apply(previous, -1)
+        terms = _terms(key, record)
+        self._terms[key] = terms
+        self._apply(terms, 1)
+
+    def remove(self, key: Hashable) -> None:
+        previous = self._terms.pop(key, None)
+        if previous is not None:
+            self._apply(previous, -1)
+        if not self._terms:
+            self.clear()
+
+    def clear(self) -> None:
+        self._terms.clear()
+        self.long_notional = 0.0
+        self.gross_notional = 0.0
+        self.unrealized_pnl = 0.0
+        self.open_count = 0
+        self.symbol_notional.clear()
+        self.side_notional.clear()
+        self._symbol_members.clear()
+        self._side_members.clear()
+
+    def rebuild(self, records: Mapping[Any, Mapping[str, Any]]) -> None:
+        self.clear()
+        for key, record in records.items():
+            if isinstance(record, Mapping):
+                self.upsert(key, record)
+
+    def _apply(self, terms: _Terms, sign: int) -> None:
+        self.long_notional += sign * terms.long_notional
+        self.gross_notional += sign * terms.gross_notional
+        self.unrealized_pnl += sign * terms.unrealized_pnl
+        if not terms.is_open:
+            return
+        self.open_count += sign
+        _bump(
+            self.symbol_notional,
+            self._symbol_members,
+            terms.symbol,
+            sign,
+            terms.gross_notional,
+        )
+        _bump(
+            self.side_notional,
+            self._side_members,
+            terms.side,
+            sign,
+            terms.gross_notional,
+        )
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "positions": len(self._terms),
+            "open_positions": self.open_count,
+            "long_notional": self.long_notional,
+            "gross_notional": self.gross_notional,
+            "unrealized_pnl": self.unrealized_pnl,
+            "notional_by_side": dict(self.side_notional),
+        }
+
+
+def _bump(
+    totals: dict[str, float],
+    members: dict[str, int],
+    bucket: str,
+    sign: int,
+    amount: float,
+) -> None:
+    count = members.get(bucket, 0) + sign
+    if count <= 0:
+        members.pop(bucket, None)
+        totals.pop(bucket, None)
+        return
+    members[bucket] = count
+    totals[bucket] = totals.get(bucket, 0.0) + sign * amount
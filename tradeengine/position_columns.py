@@ -0,0 +1,230 @@
+"""Columnar (NumPy) divergence and unhedged detection.
+
+:func:`tradeengine.position_reconciler.detect_divergences` and
+:func:`~tradeengine.position_reconciler.detect_unhedged_positions` walk
+dicts of positions and, per position, the symbol's whole open-order list,
+calling ``_order_is_reduce_only`` / ``_is_malformed_sign`` per element.
+That is O(positions × orders-per-symbol) interpreted Python per pass, which
+is fine for a dozen positions and not for a multi-account book.
+
+Here each input is packed once into arrays — positions as
+``(symbol code, side code, amount)``, protective orders as
+``(symbol code, side code, kind)`` for the reduce-only STOP / TAKE_PROFIT
+rows — and the malformed, SL-present, TP-present and size-mismatch masks
+come out of a handful of vectorised operations. Only flagged rows are
+turned back into divergence dicts, which are identical (content and
+order) to the loop implementations', so the reconciler can switch paths
+by book size (``te_reconcile_columnar_min_positions``).
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+from tradeengine.position_reconciler import _FLOAT_TOLERANCE, _order_is_reduce_only
+
+_BOTH = 0
+_KIND_SL = 1
+_KIND_TP = 2
+
+
+def _side_codes(sides: list[str], vocab: dict[str, int]) -> np.ndarray:
+    return np.fromiter(
+        (vocab.setdefault(s, len(vocab)) for s in sides),
+        dtype=np.int32,
+        count=len(sides),
+    )
+
+
+def detect_unhedged_positions_columnar(
+    binance_positions: dict[tuple[str, str], dict[str, Any]],
+    binance_open_orders_by_symbol: dict[str, list[dict[str, Any]]],
+) -> list[dict[str, Any]]:
+    """Vectorised :func:`~tradeengine.position_reconciler.detect_unhedged_positions`."""
+    n = len(binance_positions)
+    if n == 0:
+        return []
+    keys = list(binance_positions)
+    records = list(binance_positions.values())
+
+    symbol_codes: dict[str, int] = {}
+    side_vocab: dict[str, int] = {"BOTH": _BOTH}
+    pos_sym = np.fromiter(
+        (symbol_codes.setdefault(sym, len(symbol_codes)) for sym, _ in keys),
+        dtype=np.int32,
+        count=n,
+    )
+    pos_side = _side_codes([side for _, side in keys], side_vocab)
+    amt = np.fromiter(
+        (float(bp.get("positionAmt", 0) or 0.0) for bp in records),
+        dtype=np.float64,
+        count=n,
+    )
+
+    # Protective orders for symbols that hold a position: one row each.
+    o_sym: list[int] = []
+    o_side: list[str] = []
+    o_kind: list[int] = []
+    for symbol, code in symbol_codes.items():
+        for o in binance_open_orders_by_symbol.get(symbol, []) or []:
+            if not _order_is_reduce_only(o):
+                continue
+            o_type = str(o.get("type") or o.get("origType") or "").upper()
+            if "STOP" in o_type:
+                kind = _KIND_SL
+            elif "TAKE_PROFIT" in o_type:
+                kind = _KIND_TP
+            else:
+                continue
+            o_sym.append(code)
+            o_side.append(str(o.get("positionSide", "BOTH")).upper())
+            o_kind.append(kind)
+
+    # covered[kind][symbol, side]: a reduce-only leg of that kind exists;
+    # BOTH (one-way mode) rows cover every side of their symbol.
+    order_side = _side_codes(o_side, side_vocab)
+    n_sides = len(side_vocab)
+    order_sym = np.asarray(o_sym, dtype=np.int32)
+    order_kind = np.asarray(o_kind, dtype=np.int32)
+    present = {}
+    for kind in (_KIND_SL, _KIND_TP):
+        grid = np.zeros((len(symbol_codes), n_sides), dtype=bool)
+        rows = order_kind == kind
+        grid[order_sym[rows], order_side[rows]] = True
+        present[kind] = grid[pos_sym, pos_side] | grid[pos_sym, _BOTH]
+
+    long_code = side_vocab.get("LONG", -1)
+    short_code = side_vocab.get("SHORT", -1)
+    malformed = ((pos_side == long_code) & (amt < 0)) | (
+        (pos_side == short_code) & (amt > 0)
+    )
+    sl_present, tp_present = present[_KIND_SL], present[_KIND_TP]
+    flagged = malformed | ~(sl_present & tp_present)
+
+    divergences: list[dict[str, Any]] = []
+    for i in np.flatnonzero(flagged).tolist():
+        symbol, side = keys[i]
+        raw_amt = float(amt[i])
+        if malformed[i]:
+            divergences.append(
+                {
+                    "category": "malformed_position",
+                    "symbol": symbol,
+                    "side": side,
+                    "binance_qty": abs(raw_amt),
+                    "raw_position_amt": raw_amt,
+                    "local_qty": 0.0,
+                    "sl_present": False,
+                    "tp_present": False,
+                    "detail": (
+                        f"Malformed hedge-mode position: positionSide={side} "
+                        f"but positionAmt={raw_amt} (sign/side mismatch) — "
+                        f"cannot be armed; requires flatten or alert"
+                    ),
+                }
+            )
+            continue
+        sl, tp = bool(sl_present[i]), bool(tp_present[i])
+        missing = [leg for leg, ok in (("SL", sl), ("TP", tp)) if not ok]
+        divergences.append(
+            {
+                "category": "unhedged",
+                "symbol": symbol,
+                "side": side,
+                "binance_qty": abs(raw_amt),
+                "local_qty": 0.0,
+                "sl_present": sl,
+                "tp_present": tp,
+                "detail": (
+                    f"Position on Binance lacks reduceOnly {'+'.join(missing)} "
+                    f"order(s) — unhedged"
+                ),
+            }
+        )
+    return divergences
+
+
+def detect_divergences_columnar(
+    binance_positions: dict[tuple[str, str], dict[str, Any]],
+    local_positions: dict[tuple[str, str], dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Vectorised :func:`~tradeengine.position_reconciler.detect_divergences`."""
+    b_keys = list(binance_positions)
+    l_keys = list(local_positions)
+    b_qty = np.abs(
+        np.fromiter(
+            (float(bp.get("positionAmt", 0)) for bp in binance_positions.values()),
+            dtype=np.float64,
+            count=len(b_keys),
+        )
+    )
+    l_qty = np.abs(
+        np.fromiter(
+            (
+                float(lp.get("quantity", lp.get("amount", 0)))
+                for lp in local_positions.values()
+            ),
+            dtype=np.float64,
+            count=len(l_keys),
+        )
+    )
+    # Row of each key in the other side's arrays (-1 when absent).
+    b_index = {key: i for i, key in enumerate(b_keys)}
+    l_in_b = np.fromiter(
+        (b_index.get(key, -1) for key in l_keys), dtype=np.int64, count=len(l_keys)
+    )
+    b_tracked = np.zeros(len(b_keys), dtype=bool)
+    b_tracked[l_in_b[l_in_b >= 0]] = True
+
+    ghost = l_in_b < 0
+    matched_b_qty = (
+        np.where(ghost, 0.0, b_qty[np.maximum(l_in_b, 0)])
+        if len(b_keys)
+        else np.zeros(len(l_keys))
+    )
+    mutation = ~ghost & (np.abs(matched_b_qty - l_qty) > _FLOAT_TOLERANCE)
+
+    divergences: list[dict[str, Any]] = []
+    for i in np.flatnonzero(~b_tracked).tolist():
+        symbol, side = b_keys[i]
+        divergences.append(
+            {
+                "category": "untracked",
+                "symbol": symbol,
+                "side": side,
+                "binance_qty": float(b_qty[i]),
+                "local_qty": 0.0,
+                "detail": "Position on Binance but absent from local tracker",
+            }
+        )
+    for i in np.flatnonzero(ghost | mutation).tolist():
+        symbol, side = l_keys[i]
+        local_qty = float(l_qty[i])
+        if ghost[i]:
+            divergences.append(
+                {
+                    "category": "ghost",
+                    "symbol": symbol,
+                    "side": side,
+                    "binance_qty": 0.0,
+                    "local_qty": local_qty,
+                    "detail": "Position in local tracker but absent from Binance",
+                }
+            )
+        else:
+            binance_qty = float(matched_b_qty[i])
+            divergences.append(
+                {
+                    "category": "mutation",
+                    "symbol": symbol,
+                    "side": side,
+                    "binance_qty": binance_qty,
+                    "local_qty": local_qty,
+                    "detail": (
+                        f"Size mismatch: Binance={binance_qty:.6f}, local={local_qty:.6f}"
+                    ),
+                }
+            )
+    return divergences
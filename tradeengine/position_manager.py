@@ -44,16 +44,62 @@ from tradeengine.metrics import (
     total_realized_pnl_usd,
     total_unrealized_pnl_usd,
 )
+from tradeengine.position_aggregates import PortfolioAggregates
+from tradeengine.query_index import ObservedDict, RecordIndex
+from tradeengine.state_snapshot import TradingStateSnapshot
 
 logger = logging.getLogger(__name__)
 
+# /positions query names -> stored position fields. The endpoint has always
+# advertised side/size/pnl/created_at, but local position dicts store them as
+# position_side/quantity/unrealized_pnl/entry_time.
+_POSITION_QUERY_ALIASES = {
+    "side": "position_side",
+    "size": "quantity",
+    "pnl": "unrealized_pnl",
+    "created_at": "entry_time",
+}
+# Local positions only ever hold open rows; update_position() never sets it.
+_POSITION_QUERY_DEFAULTS = {"status": "open"}
+
+
+def _position_query_field(record: Any, field: str) -> Any:
+    if field in record:
+        return record[field]
+    alias = _POSITION_QUERY_ALIASES.get(field)
+    if alias is not None and alias in record:
+        return record[alias]
+    return _POSITION_QUERY_DEFAULTS.get(field, 0)
+
+
+def _new_position_index() -> RecordIndex:
+    return RecordIndex(
+        indexed_fields=("symbol", "side", "status"),
+        sorted_fields=("created_at", "symbol", "size", "pnl"),
+        getter=_position_query_field,
+    )
+
 
 class PositionManager:
     """Manages trading positions and risk limits with distributed state management
     using Data Manager API for persistence and MongoDB for coordination only."""
 
-    def __init__(self, exchange: Any = None) -> None:
-        self.positions: dict[tuple[str, str], dict[str, Any]] = {}
+    # None is the primary (or only) account; TE_ACCOUNTS secondaries tag the
+    # Data Manager documents they write and only load their own.
+    account_id: str | None = None
+    # Index over the ExchangeTruthStore's positions, kept in step by the
+    # store once it is injected; backs query_positions() when the flag is on.
+    _exchange_truth_store: ExchangeTruthStore | None = None
+    truth_position_index: RecordIndex | None = None
+
+    def __init__(self, exchange: Any = None, account_id: str | None = None) -> None:
+        self.account_id = account_id
+        # Secondary indexes behind the /positions endpoint; kept in step by
+        # the ObservedDict backing ``positions`` and by update_position().
+        self.position_index = _new_position_index()
+        # Exposure / notional / uPnL totals, maintained by the same hooks.
+        self.aggregates = PortfolioAggregates()
+        self.positions = {}
         self.daily_pnl: float = 0.0
         self.max_position_size_pct: float = MAX_POSITION_SIZE_PCT
         self.max_daily_loss_pct: float = MAX_DAILY_LOSS_PCT
@@ -61,6 +107,8 @@ class PositionManager:
         self.total_portfolio_value: float = 0.0  # Initialized from exchange
         self.last_sync_time: datetime | None = None
         self.sync_lock = asyncio.Lock()
+        # (date, daily_pnl) last written to the Data Manager
+        self._synced_daily_pnl: tuple[str, float] | None = None
         self.settings = Settings()
         self.mongodb_client: Any = None
         self.mongodb_db: Any = None
@@ -72,10 +120,67 @@ class PositionManager:
         )
         # AC2 (#459 — 446-C): injected by Dispatcher.initialize() after
         # UserDataStreamConsumer starts; None until then.
-        self.exchange_truth_store: ExchangeTruthStore | None = None
+        self.exchange_truth_store = None
+
+    @property
+    def exchange_truth_store(self) -> ExchangeTruthStore | None:
+        return self._exchange_truth_store
+
+    @exchange_truth_store.setter
+    def exchange_truth_store(self, store: ExchangeTruthStore | None) -> None:
+        self._exchange_truth_store = store
+        self.truth_position_index = None
+        if store is not None:
+            self.truth_position_index = _new_position_index()
+            store.attach_position_index(self.truth_position_index)
+
+    @property
+    def positions(self) -> dict[tuple[str, str], dict[str, Any]]:
+        return self._positions
+
+    @positions.setter
+    def positions(self, value: dict[tuple[str, str], dict[str, Any]]) -> None:
+        if "position_index" not in self.__dict__:
+            # Instances built via __new__ (tests) skip __init__.
+            self.position_index = _new_position_index()
+            self.aggregates = PortfolioAggregates()
+        # Keys changed since the last Data Manager sync. A wholesale
+        # assignment (load from Data Manager) starts clean.
+        self._dirty_positions: set[tuple[str, str]] = set()
+        self._positions = ObservedDict(
+            value,
+            on_set=self._index_position,
+            on_delete=self._forget_position,
+            on_reset=self._reset_positions,
+        )
+        self.position_index.rebuild(self._positions)
+        self.aggregates.rebuild(self._positions)
+
+    def _index_position(self, position_key: Any, position: Any) -> None:
+        if isinstance(position, dict):
+            self.position_index.upsert(position_key, position)
+            self.aggregates.upsert(position_key, position)
+            self._dirty_positions.add(position_key)
+        else:
+            self._forget_position(position_key)
+
+    def _forget_position(self, position_key: Any) -> None:
+        # Closed positions are persisted by _close_position_in_data_manager.
+        self.position_index.remove(position_key)
+        self.aggregates.remove(position_key)
+        self._dirty_positions.discard(position_key)
+
+    def _reset_positions(self) -> None:
+        self.position_index.clear()
+        self.aggregates.clear()
+        self._dirty_positions.clear()
 
-    async def initialize(self) -> None:
-        """Initialize position manager with Data Manager API for persistence and MongoDB for coordination"""
+    async def initialize(self, snapshot: TradingStateSnapshot | None = None) -> None:
+        """Initialize position manager with Data Manager API for persistence and MongoDB for coordination
+
+        With a warm-restart ``snapshot`` the positions (and, on the same UTC
+        day, the daily P&L) come from it instead of the Data Manager.
+        """
         try:
             # Initialize MongoDB connection for distributed coordination only
             await self._initialize_mongodb()
@@ -85,11 +190,15 @@ class PositionManager:
                 await position_client.connect()
                 logger.info("Data Manager client connected for position tracking")
 
-                # Load positions from Data Manager (primary source)
-                await self._load_positions_from_data_manager()
+                if snapshot is not None:
+                    self.restore_state(snapshot)
+                else:
+                    # Load positions from Data Manager (primary source)
+                    await self._load_positions_from_data_manager()
 
-                # Load daily P&L from Data Manager
-                await self._load_daily_pnl_from_data_manager()
+                if snapshot is None or not snapshot.same_utc_day():
+                    # Load daily P&L from Data Manager
+                    await self._load_daily_pnl_from_data_manager()
 
                 # Fetch initial portfolio value from exchange
                 await self._refresh_portfolio_value()
@@ -172,10 +281,12 @@ class PositionManager:
     async def close(self) -> None:
         """Close position manager and sync final state"""
         try:
-            await self._sync_positions_to_data_manager()
+            await self._sync_positions_to_data_manager(full=True)
             if self.mongodb_client:
                 self.mongodb_client.close()
-            await position_client.disconnect()
+            if self.account_id is None:
+                # The Data Manager client is process-wide; the primary owns it.
+                await position_client.disconnect()
             logger.info("Position manager closed successfully")
         except Exception as e:
             logger.error(f"Error closing position manager: {e}")
@@ -208,6 +319,16 @@ class PositionManager:
             self.mongodb_db = None
             raise
 
+    def restore_state(self, snapshot: TradingStateSnapshot) -> None:
+        """Load positions and daily P&L from a warm-restart snapshot."""
+        self.positions = {key: dict(pos) for key, pos in snapshot.positions.items()}
+        # The snapshot may be ahead of the Data Manager; write it all back.
+        self._dirty_positions.update(self.positions)
+        if snapshot.same_utc_day():
+            self.daily_pnl = snapshot.daily_pnl
+        self.last_sync_time = datetime.now(UTC)
+        logger.info(f"Restored {len(self.positions)} positions from state snapshot")
+
     async def _load_positions_from_data_manager(self) -> None:
         """Load positions from Data Manager with hedge mode support"""
         try:
@@ -216,6 +337,8 @@ class PositionManager:
             positions = {}
 
             for doc in positions_data:
+                if doc.get("account_id") != self.account_id:
+                    continue
                 symbol = doc["symbol"]
                 # Get position_side, default to LONG for backward compatibility
                 position_side = doc.get("position_side", "LONG")
@@ -267,45 +390,89 @@ class PositionManager:
         except Exception as e:
             logger.error(f"Failed to load positions from exchange: {e}")
 
-    async def _sync_positions_to_data_manager(self) -> None:
-        """Sync current positions to Data Manager with hedge mode support"""
+    def _position_record(
+        self, position_key: tuple[str, str], position: dict[str, Any]
+    ) -> dict[str, Any]:
+        symbol, position_side = position_key
+        position_data = {
+            "symbol": symbol,
+            "position_side": position_side,
+            "quantity": position["quantity"],
+            "avg_price": position["avg_price"],
+            "unrealized_pnl": position["unrealized_pnl"],
+            "realized_pnl": position["realized_pnl"],
+            "total_cost": position["total_cost"],
+            "total_value": position["total_value"],
+            "entry_time": position["entry_time"],
+            "last_update": position["last_update"],
+            "status": "open",
+            "updated_at": datetime.now(UTC),
+        }
+        if self.account_id is not None:
+            position_data["account_id"] = self.account_id
+        return position_data
+
+    async def _sync_positions_to_data_manager(self, full: bool = False) -> int:
+        """Sync positions changed since the last sync to Data Manager with hedge mode support
+
+        ``full`` rewrites every open position. The daily P&L is written only
+        when it (or the date) changed. Returns the number of positions written.
+        """
         async with self.sync_lock:
             try:
-                # Sync current positions to Data Manager
-                for position_key, position in self.positions.items():
-                    symbol, position_side = position_key
-                    position_data = {
-                        "symbol": symbol,
-                        "position_side": position_side,
-                        "quantity": position["quantity"],
-                        "avg_price": position["avg_price"],
-                        "unrealized_pnl": position["unrealized_pnl"],
-                        "realized_pnl": position["realized_pnl"],
-                        "total_cost": position["total_cost"],
-                        "total_value": position["total_value"],
-                        "entry_time": position["entry_time"],
-                        "last_update": position["last_update"],
-                        "status": "open",
-                        "updated_at": datetime.now(UTC),
+                keys = list(self.positions) if full else list(self._dirty_positions)
+                # Cleared up front: a position edited while the writes are in
+                # flight is marked dirty again and goes out on the next pass.
+                self._dirty_positions.difference_update(keys)
+                records = [
+                    self._position_record(key, self.positions[key])
+                    for key in keys
+                    if key in self.positions
+                ]
+                if records:
+                    results = await position_client.upsert_positions(records)
+                    failed = {
+                        (r["symbol"], r["position_side"])
+                        for r, result in zip(records, results, strict=True)
+                        if not result.ok
                     }
-                    await position_client.upsert_position(position_data)
+                    # Retry failed writes on the next pass.
+                    self._dirty_positions.update(failed & set(self.positions))
 
-                # Update daily P&L in Data Manager
                 today = datetime.now(UTC).date().isoformat()
-                await position_client.update_daily_pnl(today, self.daily_pnl)
+                if full or self._synced_daily_pnl != (today, self.daily_pnl):
+                    result = await position_client.update_daily_pnl(
+                        today, self.daily_pnl
+                    )
+                    if result.ok:
+                        self._synced_daily_pnl = (today, self.daily_pnl)
 
                 self.last_sync_time = datetime.now(UTC)
-                logger.debug("Positions synced to Data Manager")
+                logger.debug("Synced %d positions to Data Manager", len(records))
+                return len(records)
 
             except Exception as e:
                 logger.error(f"Failed to sync positions to Data Manager: {e}")
+                return 0
 
     async def _periodic_sync(self) -> None:
-        """Periodically sync positions to Data Manager"""
+        """Periodically sync changed positions to Data Manager.
+
+        The interval adapts to the change rate: it halves after a pass that
+        wrote something and doubles after an idle one, between
+        ``te_position_sync_min_interval_seconds`` and
+        ``te_position_sync_max_interval_seconds``.
+        """
+        low = float(self.settings.te_position_sync_min_interval_seconds)
+        high = max(low, float(self.settings.te_position_sync_max_interval_seconds))
+        interval = min(max(30.0, low), high)
         while True:
             try:
-                await asyncio.sleep(30)  # Sync every 30 seconds
-                await self._sync_positions_to_data_manager()
+                await asyncio.sleep(interval)
+                written = await self._sync_positions_to_data_manager()
+                interval = (
+                    max(low, interval / 2) if written else min(high, interval * 2)
+                )
             except Exception as e:
                 logger.error(f"Error in periodic sync: {e}")
 
@@ -486,6 +653,9 @@ class PositionManager:
                     position["avg_price"] - fill_price
                 ) * position["quantity"]
 
+            # In-place edits above are invisible to the ObservedDict.
+            self._index_position(position_key, position)
+
             logger.info(
                 f"Updated position for {symbol} {position_side}: "
                 f"quantity={position['quantity']:.6f}, "
@@ -661,6 +831,8 @@ class PositionManager:
                 "commission_asset": result.get("commission_asset", "USDT"),
                 "commission_total": commission,
             }
+            if self.account_id is not None:
+                position_data["account_id"] = self.account_id
 
             # AC-1 (#352): durable write with retry — a silent timeout drop here causes
             # MySQL positions table to be empty, which triggers every subsequent signal to
@@ -1181,6 +1353,8 @@ class PositionManager:
             refreshed_positions = {}
 
             for doc in positions_data:
+                if doc.get("account_id") != self.account_id:
+                    continue
                 symbol = doc.get("symbol")
                 if not symbol:
                     logger.warning("Skipping Data Manager document without symbol")
@@ -1259,16 +1433,8 @@ class PositionManager:
         if self.total_portfolio_value <= 0:
             return 1.0
 
-        total_exposure = 0.0
-
-        for position in self.positions.values():
-            if position["quantity"] > 0:
-                # Calculate position value as percentage of portfolio
-                position_value = position["quantity"] * position["avg_price"]
-                exposure_pct = position_value / self.total_portfolio_value
-                total_exposure += exposure_pct
-
-        return total_exposure
+        # Long notional is maintained incrementally by self.aggregates.
+        return self.aggregates.long_notional / self.total_portfolio_value
 
     def get_cio_portfolio_summary(self, symbol: str) -> dict[str, Any]:
         """
@@ -1283,25 +1449,11 @@ class PositionManager:
                 "open_positions_count": 0,
             }
 
-        total_exposure = 0.0
-        same_asset_value = 0.0
-        open_count = 0
-
-        for key, pos in self.positions.items():
-            qty = pos.get("quantity", 0.0)
-            if qty != 0:
-                open_count += 1
-                pos_value = abs(qty * pos.get("avg_price", 0.0))
-                total_exposure += pos_value
-                # Check if this position is for the requested symbol
-                pos_symbol = key[0] if isinstance(key, tuple) else str(key)
-                if pos_symbol == symbol:
-                    same_asset_value += pos_value
-
+        aggregates = self.aggregates
         return {
-            "gross_exposure": total_exposure / total_value,
-            "same_asset_pct": same_asset_value / total_value,
-            "open_positions_count": open_count,
+            "gross_exposure": aggregates.gross_notional / total_value,
+            "same_asset_pct": aggregates.symbol_notional.get(symbol, 0.0) / total_value,
+            "open_positions_count": aggregates.open_count,
         }
 
     def get_positions(self) -> dict[tuple[str, str], dict[str, Any]]:
@@ -1320,71 +1472,100 @@ class PositionManager:
             and self.exchange_truth_store is not None
         ):
             snapshots = self.exchange_truth_store.get_positions()
-            return {
-                k: {
-                    "symbol": v.symbol,
-                    "position_side": v.side,
-                    "quantity": v.quantity,
-                    "avg_price": v.entry_price,
-                    "unrealized_pnl": v.unrealized_pnl,
-                    "realized_pnl": 0.0,
-                    "total_cost": 0.0,
-                    "total_value": v.quantity * v.entry_price,
-                    "entry_time": v.updated_at,
-                    "last_update": v.updated_at,
-                    "status": "open",
-                    "source": "exchange",
-                }
-                for k, v in snapshots.items()
-            }
+            return {k: v.as_position() for k, v in snapshots.items()}
 
         # AC1 (#461): shadow mode — compare local vs exchange, emit deltas, return local.
         if (
             TE_EXCHANGE_TRUTH_STORE_ENABLED == "shadow"
             and self.exchange_truth_store is not None
         ):
-            exchange_snaps = self.exchange_truth_store.get_positions()
-            local_copy = self.positions.copy()
+            self._emit_shadow_deltas(self.exchange_truth_store)
 
-            for key, local_pos in local_copy.items():
-                symbol, side = key
-                exchange_snap = exchange_snaps.get(key)
-                if exchange_snap is None:
-                    exchange_truth_shadow_delta_total.labels(
-                        symbol=symbol, side=side, field="missing_in_exchange"
-                    ).inc()
-                    logger.warning(
-                        "shadow_delta: %s/%s present locally but absent from exchange",
-                        symbol,
-                        side,
-                    )
-                    continue
-                local_qty = float(local_pos.get("quantity", 0))
-                if abs(local_qty - exchange_snap.quantity) > 1e-8:
-                    exchange_truth_shadow_delta_total.labels(
-                        symbol=symbol, side=side, field="quantity"
-                    ).inc()
-                    logger.warning(
-                        "shadow_delta: %s/%s quantity local=%.6f exchange=%.6f",
-                        symbol,
-                        side,
-                        local_qty,
-                        exchange_snap.quantity,
-                    )
+        return self.positions.copy()
 
-            for key in exchange_snaps:
-                if key not in local_copy:
-                    symbol, side = key
-                    exchange_truth_shadow_delta_total.labels(
-                        symbol=symbol, side=side, field="missing_in_local"
-                    ).inc()
-                    logger.warning(
-                        "shadow_delta: %s/%s present on exchange but absent locally",
-                        symbol,
-                        side,
-                    )
+    def _emit_shadow_deltas(self, store: ExchangeTruthStore) -> None:
+        exchange_snaps = store.get_positions()
+        local_copy = self.positions.copy()
 
-        return self.positions.copy()
+        for key, local_pos in local_copy.items():
+            symbol, side = key
+            exchange_snap = exchange_snaps.get(key)
+            if exchange_snap is None:
+                exchange_truth_shadow_delta_total.labels(
+                    symbol=symbol, side=side, field="missing_in_exchange"
+                ).inc()
+                logger.warning(
+                    "shadow_delta: %s/%s present locally but absent from exchange",
+                    symbol,
+                    side,
+                )
+                continue
+            local_qty = float(local_pos.get("quantity", 0))
+            if abs(local_qty - exchange_snap.quantity) > 1e-8:
+                exchange_truth_shadow_delta_total.labels(
+                    symbol=symbol, side=side, field="quantity"
+                ).inc()
+                logger.warning(
+                    "shadow_delta: %s/%s quantity local=%.6f exchange=%.6f",
+                    symbol,
+                    side,
+                    local_qty,
+                    exchange_snap.quantity,
+                )
+
+        for key in exchange_snaps:
+            if key not in local_copy:
+                symbol, side = key
+                exchange_truth_shadow_delta_total.labels(
+                    symbol=symbol, side=side, field="missing_in_local"
+                ).inc()
+                logger.warning(
+                    "shadow_delta: %s/%s present on exchange but absent locally",
+                    symbol,
+                    side,
+                )
+
+    def query_positions(
+        self,
+        *,
+        symbol: str | None = None,
+        side: str | None = None,
+        status: str | None = None,
+        min_size: float | None = None,
+        max_size: float | None = None,
+        min_pnl: float | None = None,
+        max_pnl: float | None = None,
+        sort_by: str = "created_at",
+        descending: bool = True,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> tuple[int, list[dict[str, Any]]]:
+        """Filter, sort and page positions through the secondary indexes.
+
+        Returns ``(total_matches, page)``. With the ExchangeTruthStore flag
+        on the rows come from the store's own index, kept in step with the
+        stream; in shadow mode local stays authoritative and the deltas are
+        emitted as in :meth:`get_positions`.
+        """
+        index = self.position_index
+        store = self.exchange_truth_store
+        if (
+            TE_EXCHANGE_TRUTH_STORE_ENABLED == "on"
+            and self.truth_position_index is not None
+        ):
+            index = self.truth_position_index
+        elif store is not None and TE_EXCHANGE_TRUTH_STORE_ENABLED == "shadow":
+            self._emit_shadow_deltas(store)
+
+        total, page = index.query(
+            equals={"symbol": symbol, "side": side, "status": status},
+            ranges={"size": (min_size, max_size), "pnl": (min_pnl, max_pnl)},
+            sort_by=sort_by,
+            descending=descending,
+            offset=offset,
+            limit=limit,
+        )
+        return total, [dict(p) for p in page]
 
     def get_position(
         self, symbol: str, position_side: str | None = None
@@ -1440,10 +1621,31 @@ class PositionManager:
 
     def get_total_unrealized_pnl(self) -> float:
         """Get total unrealized P&L across all positions"""
-        total_unrealized = 0.0
-        for position in self.positions.values():
-            total_unrealized += position.get("unrealized_pnl", 0.0)
-        return total_unrealized
+        return self.aggregates.unrealized_pnl
+
+    def apply_mark_price(self, symbol: str, price: float) -> None:
+        """Revalue ``symbol``'s positions at ``price`` and update the totals.
+
+        Touches at most the symbol's LONG/SHORT/BOTH rows. A revaluation is
+        not a position change, so it does not mark the row for Data Manager
+        sync; the fresh ``unrealized_pnl`` rides along with the next real one.
+        """
+        if price <= 0:
+            return
+        for side in ("LONG", "SHORT", "BOTH"):
+            key = (symbol, side)
+            position = self._positions.get(key)
+            if not isinstance(position, dict):
+                continue
+            quantity = float(position.get("quantity") or 0.0)
+            avg_price = float(position.get("avg_price") or 0.0)
+            if side == "SHORT":
+                pnl = (avg_price - price) * abs(quantity)
+            else:
+                pnl = (price - avg_price) * quantity
+            position["unrealized_pnl"] = pnl
+            self.position_index.upsert(key, position)
+            self.aggregates.upsert(key, position)
 
     def get_portfolio_summary(self) -> dict[str, Any]:
         """Get portfolio summary"""
@@ -1456,6 +1658,7 @@ class PositionManager:
             "total_exposure": total_exposure,
             "daily_pnl": self.daily_pnl,
             "total_unrealized_pnl": total_unrealized,
+            "notional_by_side": dict(self.aggregates.side_notional),
             "portfolio_value": self.total_portfolio_value,
             "max_position_size_pct": self.max_position_size_pct,
             "max_daily_loss_pct": self.max_daily_loss_pct,
@@ -11,12 +11,16 @@ state (AC5).
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
 from prometheus_client import Counter, Gauge
 
+from shared.config import settings
+from tradeengine.compute_pool import ComputePool
+from tradeengine.evaluators.rolling_window import health_signals
 from tradeengine.exchange_truth_store import (
     ExchangeTruthStore,
     exchange_truth_store_stale_seconds,
@@ -278,6 +282,14 @@ def detect_unhedged_positions(
     return divergences
 
 
+def _detect_unhedged_chunk(
+    orders_by_symbol: dict[str, list[dict[str, Any]]],
+    items: list[tuple[tuple[str, str], dict[str, Any]]],
+) -> list[dict[str, Any]]:
+    """:func:`detect_unhedged_positions` over a slice of positions (compute pool)."""
+    return detect_unhedged_positions(dict(items), orders_by_symbol)
+
+
 # ---------------------------------------------------------------------------
 # PositionReconciler
 # ---------------------------------------------------------------------------
@@ -297,12 +309,14 @@ class PositionReconciler:
         interval_seconds: int = 60,
         remediator: NakedPositionRemediator | None = None,
         store: ExchangeTruthStore | None = None,
+        compute_pool: ComputePool | None = None,
     ) -> None:
         self._exchange = exchange
         self._position_manager = position_manager
         self._interval = interval_seconds
         self._remediator = remediator
         self._store = store
+        self._compute_pool = compute_pool
         self._task: asyncio.Task | None = None  # type: ignore[type-arg]
         self._last_divergence_count: int = 0
 
@@ -355,7 +369,15 @@ class PositionReconciler:
         binance_positions = _index_binance_positions(raw)
         local_positions = self._position_manager.get_positions()
 
-        divergences = detect_divergences(binance_positions, local_positions)
+        if self._use_columnar(binance_positions):
+            # Local import: position_columns reuses this module's helpers.
+            from tradeengine.position_columns import detect_divergences_columnar
+
+            divergences = detect_divergences_columnar(
+                binance_positions, local_positions
+            )
+        else:
+            divergences = detect_divergences(binance_positions, local_positions)
 
         # AC5 of #424: also detect positions on Binance with no matching
         # reduceOnly SL+TP orders. Fetch open algo orders per unique
@@ -371,6 +393,8 @@ class PositionReconciler:
             reconciliation_divergences_total.labels(
                 category=d["category"], symbol=d["symbol"]
             ).inc()
+        if divergences:
+            health_signals.divergences.add(len(divergences))
 
         if divergences:
             self._emit_unhealthy(divergences)
@@ -450,9 +474,27 @@ class PositionReconciler:
                 )
                 orders = []
             orders_by_symbol[symbol] = orders or []
-        return detect_unhedged_positions(
-            binance_positions, orders_by_symbol
-        ), orders_by_symbol
+        if self._use_columnar(binance_positions):
+            from tradeengine.position_columns import (
+                detect_unhedged_positions_columnar,
+            )
+
+            unhedged = detect_unhedged_positions_columnar(
+                binance_positions, orders_by_symbol
+            )
+        elif self._compute_pool is not None:
+            unhedged = await self._compute_pool.map_chunked(
+                functools.partial(_detect_unhedged_chunk, orders_by_symbol),
+                list(binance_positions.items()),
+            )
+        else:
+            unhedged = detect_unhedged_positions(binance_positions, orders_by_symbol)
+        return unhedged, orders_by_symbol
+
+    @staticmethod
+    def _use_columnar(binance_positions: dict[tuple[str, str], Any]) -> bool:
+        threshold = settings.te_reconcile_columnar_min_positions
+        return threshold > 0 and len(binance_positions) >= threshold
 
     # ------------------------------------------------------------------
     # Alert / evaluator helpers
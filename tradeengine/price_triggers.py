@@ -0,0 +1,143 @@
+"""Shared price-trigger book for conditional orders.
+
+``OrderManager`` used to start one ``_monitor_conditional_order`` task per
+conditional order, each polling the price for its own symbol in a sleep
+loop and re-checking its own condition. A few thousand resting
+conditionals meant a few thousand tasks and as many price reads per
+interval, mostly for the same handful of symbols.
+
+:class:`PriceTriggerBook` keeps every resting trigger in two sorted
+ladders per symbol:
+
+* ``above`` — fires once the price rises to/through the trigger, so a tick
+  at ``p`` fires the prefix of the ladder with ``trigger <= p``;
+* ``below`` — fires once the price falls to/through the trigger, so a tick
+  at ``p`` fires the suffix with ``trigger >= p``.
+
+Both cut points are found with :mod:`bisect`, so a tick costs
+``O(log n)`` plus the triggers it actually fires, regardless of how many
+are resting. Deadlines live in one min-heap with lazy deletion, so
+timeouts are swept without a per-order task either.
+
+The book is pure bookkeeping: it never fetches prices and never executes
+anything. The owner feeds ticks (:meth:`pop_crossed`) and sweeps
+(:meth:`pop_expired`) and acts on the returned order ids.
+"""
+
+from __future__ import annotations
+
+import bisect
+import heapq
+import itertools
+from typing import Any
+
+DIRECTIONS = ("above", "below")
+
+
+class PriceTriggerBook:
+    """Per-symbol above/below trigger ladders plus a deadline heap."""
+
+    def __init__(self) -> None:
+        # symbol -> direction -> [(trigger_price, seq, order_id), ...] ascending
+        self._ladders: dict[str, dict[str, list[tuple[float, int, str]]]] = {}
+        # order_id -> (symbol, direction | None, trigger_price | None, seq)
+        self._entries: dict[str, tuple[str, str | None, float | None, int]] = {}
+        # (deadline, seq, order_id); stale rows are skipped on pop
+        self._deadlines: list[tuple[float, int, str]] = []
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, order_id: object) -> bool:
+        return order_id in self._entries
+
+    def symbols(self) -> list[str]:
+        """Symbols with at least one price trigger resting."""
+        return [s for s, sides in self._ladders.items() if any(sides.values())]
+
+    def add(
+        self,
+        order_id: str,
+        symbol: str,
+        direction: Any,
+        trigger_price: Any,
+        deadline: float | None = None,
+    ) -> None:
+        """Register (or replace) a conditional order.
+
+        Orders without a usable price/direction still get their deadline
+        tracked; they simply never cross, which matches
+        ``OrderManager._check_condition`` returning ``False`` for them.
+        """
+        self.remove(order_id)
+        seq = next(self._counter)
+        side: str | None = None
+        price: float | None = None
+        if direction in DIRECTIONS and trigger_price:
+            side = direction
+            price = float(trigger_price)
+            ladder = self._ladders.setdefault(symbol, {"above": [], "below": []})
+            bisect.insort(ladder[side], (price, seq, order_id))
+        self._entries[order_id] = (symbol, side, price, seq)
+        if deadline is not None:
+            heapq.heappush(self._deadlines, (deadline, seq, order_id))
+
+    def remove(self, order_id: str) -> bool:
+        entry = self._entries.pop(order_id, None)
+        if entry is None:
+            return False
+        symbol, side, price, seq = entry
+        if side is not None and price is not None:
+            ladder = self._ladders[symbol][side]
+            pos = bisect.bisect_left(ladder, (price, seq, order_id))
+            if pos < len(ladder) and ladder[pos][2] == order_id:
+                del ladder[pos]
+            self._drop_symbol_if_empty(symbol)
+        return True
+
+    def pop_crossed(self, symbol: str, price: float) -> list[str]:
+        """Remove and return every order whose trigger ``price`` has crossed.
+
+        Above-triggers fire before below-triggers; within a ladder the order
+        is by trigger price, then registration.
+        """
+        ladder = self._ladders.get(symbol)
+        if ladder is None:
+            return []
+        above = ladder["above"]
+        cut = bisect.bisect_right(above, (price, float("inf")))
+        fired = above[:cut]
+        del above[:cut]
+        below = ladder["below"]
+        cut = bisect.bisect_left(below, (price,))
+        fired_below = below[cut:]
+        del below[cut:]
+        fired.extend(reversed(fired_below))
+        for _, _, order_id in fired:
+            self._entries.pop(order_id, None)
+        self._drop_symbol_if_empty(symbol)
+        return [order_id for _, _, order_id in fired]
+
+    def pop_expired(self, now: float) -> list[str]:
+        """Remove and return every order whose deadline is at or before ``now``."""
+        expired: list[str] = []
+        heap = self._deadlines
+        while heap and heap[0][0] <= now:
+            _, seq, order_id = heapq.heappop(heap)
+            entry = self._entries.get(order_id)
+            if entry is None or entry[3] != seq:
+                continue  # fired, cancelled or re-registered since
+            self.remove(order_id)
+            expired.append(order_id)
+        return expired
+
+    def clear(self) -> None:
+        self._ladders.clear()
+        self._entries.clear()
+        self._deadlines.clear()
+
+    def _drop_symbol_if_empty(self, symbol: str) -> None:
+        ladder = self._ladders.get(symbol)
+        if ladder is not None and not ladder["above"] and not ladder["below"]:
+            del self._ladders[symbol]
@@ -0,0 +1,349 @@
+"""In-memory secondary indexes for the ``/positions`` and ``/orders`` reads.
+
+The REST handlers used to copy the whole position/order set on every
+request, run up to seven list-comprehension filters over it and then sort
+and slice in Python. Grafana panels poll those endpoints every few seconds,
+so each poll was an O(n log n) walk on the event loop.
+
+:class:`RecordIndex` keeps the records keyed by id alongside
+
+* hash indexes (``value -> {ids}``) for the equality filters
+  (symbol, side, status, ...), and
+* sorted views (``[(sort_key, seq, id), ...]`` maintained with
+  :mod:`bisect`) for the common sort keys, which also answer range filters.
+
+The owning manager calls :meth:`RecordIndex.upsert` / :meth:`remove` as
+records change. Field values are captured at upsert time, so a record that
+is mutated in place must be re-upserted for the index to see the change.
+
+Query semantics match the old handlers: fields are read with
+``record.get(field, 0)`` unless the owner passes its own getter (positions
+map the endpoint's ``side``/``size``/``pnl``/``created_at`` names onto the
+stored ``position_side``/``quantity``/``unrealized_pnl``/``entry_time``).
+Sort keys are normalised to ``(rank, value)`` so numbers, datetimes and
+strings can share one view without ``TypeError``; the old handlers silently
+skipped sorting in that case.
+"""
+
+from __future__ import annotations
+
+import bisect
+import itertools
+from collections.abc import Callable, Hashable, Iterable, Mapping
+from datetime import datetime
+from typing import Any
+
+FieldGetter = Callable[[Mapping[str, Any], str], Any]
+
+
+def _default_getter(record: Mapping[str, Any], field: str) -> Any:
+    return record.get(field, 0)
+
+
+def sort_key(value: Any) -> tuple[int, Any]:
+    """Normalise a field value into a totally ordered key.
+
+    Numbers and datetimes (as POSIX timestamps) share rank 0 so they compare
+    with the ``0`` default used for missing fields; strings sort after them.
+    Anything else falls back to its ``str()`` form.
+    """
+    if value is None:
+        return (0, 0.0)
+    if isinstance(value, bool):
+        return (0, float(value))
+    if isinstance(value, int | float):
+        return (0, float(value))
+    if isinstance(value, datetime):
+        return (0, value.timestamp())
+    if isinstance(value, str):
+        return (1, value)
+    return (2, str(value))
+
+
+class RecordIndex:
+    """Records keyed by id with hash indexes and sorted views."""
+
+    def __init__(
+        self,
+        indexed_fields: Iterable[str],
+        sorted_fields: Iterable[str],
+        getter: FieldGetter | None = None,
+    ) -> None:
+        self._indexed_fields = tuple(indexed_fields)
+        self._sorted_fields = tuple(sorted_fields)
+        self._get = getter or _default_getter
+        self._records: dict[Hashable, Mapping[str, Any]] = {}
+        # id -> captured field values, so removal works after in-place edits
+        self._captured: dict[Hashable, dict[str, Any]] = {}
+        # id -> insertion sequence (stable tie-break inside sorted views)
+        self._seq: dict[Hashable, int] = {}
+        self._counter = itertools.count()
+        self._hash: dict[str, dict[Any, set[Hashable]]] = {
+            f: {} for f in self._indexed_fields
+        }
+        self._views: dict[str, list[tuple[tuple[int, Any], int, Hashable]]] = {
+            f: [] for f in self._sorted_fields
+        }
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, record_id: object) -> bool:
+        return record_id in self._records
+
+    def get(self, record_id: Hashable) -> Mapping[str, Any] | None:
+        return self._records.get(record_id)
+
+    def upsert(self, record_id: Hashable, record: Mapping[str, Any]) -> None:
+        """Insert or refresh a record and all of its index entries."""
+        if record_id in self._records:
+            self._unlink(record_id)
+        seq = self._seq.setdefault(record_id, next(self._counter))
+        captured: dict[str, Any] = {}
+        for field in self._indexed_fields:
+            value = self._get(record, field)
+            captured[field] = value
+            self._hash[field].setdefault(_hashable(value), set()).add(record_id)
+        for field in self._sorted_fields:
+            key = sort_key(self._get(record, field))
+            captured[f"__sort__{field}"] = key
+            bisect.insort(self._views[field], (key, seq, record_id))
+        self._records[record_id] = record
+        self._captured[record_id] = captured
+
+    def remove(self, record_id: Hashable) -> None:
+        if record_id not in self._records:
+            return
+        self._unlink(record_id)
+        del self._records[record_id]
+        del self._captured[record_id]
+        self._seq.pop(record_id, None)
+
+    def clear(self) -> None:
+        self._records.clear()
+        self._captured.clear()
+        self._seq.clear()
+        for bucket in self._hash.values():
+            bucket.clear()
+        for view in self._views.values():
+            view.clear()
+
+    def rebuild(self, records: Mapping[Any, Mapping[str, Any]]) -> None:
+        """Replace the whole index content (bulk load after a reseed)."""
+        self.clear()
+        for record_id, record in records.items():
+            self.upsert(record_id, record)
+
+    def _unlink(self, record_id: Hashable) -> None:
+        captured = self._captured[record_id]
+        seq = self._seq[record_id]
+        for field in self._indexed_fields:
+            value = _hashable(captured[field])
+            ids = self._hash[field].get(value)
+            if ids is not None:
+                ids.discard(record_id)
+                if not ids:
+                    del self._hash[field][value]
+        for field in self._sorted_fields:
+            view = self._views[field]
+            entry = (captured[f"__sort__{field}"], seq, record_id)
+            pos = bisect.bisect_left(view, entry)
+            if pos < len(view) and view[pos] == entry:
+                del view[pos]
+
+    def query(
+        self,
+        *,
+        equals: Mapping[str, Any] | None = None,
+        ranges: Mapping[str, tuple[Any, Any]] | None = None,
+        sort_by: str | None = None,
+        descending: bool = False,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> tuple[int, list[Mapping[str, Any]]]:
+        """Return ``(total_matches, page)`` for the given filters.
+
+        ``equals`` keys must be indexed fields (unindexed ones fall back to a
+        per-candidate check). ``ranges`` maps a field to inclusive
+        ``(low, high)`` bounds, either of which may be ``None``.
+        """
+        equals = {k: v for k, v in (equals or {}).items() if v is not None}
+        ranges = {
+            k: v
+            for k, v in (ranges or {}).items()
+            if v[0] is not None or v[1] is not None
+        }
+
+        if not equals and not ranges and sort_by in self._views:
+            # Fast path: no filters, page straight off the sorted view.
+            view = self._views[sort_by]
+            total = len(view)
+            stop = total if limit is None else min(total, offset + limit)
+            if descending:
+                picked = [view[total - 1 - i][2] for i in range(offset, stop)]
+            else:
+                picked = [view[i][2] for i in range(offset, stop)]
+            return total, [self._records[i] for i in picked]
+
+        candidates = self._candidates(equals, ranges)
+        residual_equals = {
+            k: v for k, v in equals.items() if k not in self._indexed_fields
+        }
+        matched = [
+            rid
+            for rid in candidates
+            if self._matches(self._records[rid], residual_equals, ranges)
+        ]
+        total = len(matched)
+
+        if sort_by:
+            if sort_by in self._views:
+                matched.sort(
+                    key=lambda rid: (
+                        self._captured[rid][f"__sort__{sort_by}"],
+                        self._seq[rid],
+                    ),
+                    reverse=descending,
+                )
+            else:
+                matched.sort(
+                    key=lambda rid: (
+                        sort_key(self._get(self._records[rid], sort_by)),
+                        self._seq[rid],
+                    ),
+                    reverse=descending,
+                )
+        else:
+            matched.sort(key=self._seq.__getitem__)
+
+        end = None if limit is None else offset + limit
+        return total, [self._records[rid] for rid in matched[offset:end]]
+
+    def _candidates(
+        self,
+        equals: Mapping[str, Any],
+        ranges: Mapping[str, tuple[Any, Any]],
+    ) -> Iterable[Hashable]:
+        sets = [
+            self._hash[f].get(_hashable(v), set())
+            for f, v in equals.items()
+            if f in self._hash
+        ]
+        if sets:
+            sets.sort(key=len)
+            result = set(sets[0])
+            for other in sets[1:]:
+                result &= other
+                if not result:
+                    break
+            return result
+        for field, (low, high) in ranges.items():
+            if field in self._views:
+                return self._range_ids(field, low, high)
+        return list(self._records)
+
+    def _range_ids(self, field: str, low: Any, high: Any) -> list[Hashable]:
+        view = self._views[field]
+        start = 0 if low is None else bisect.bisect_left(view, (sort_key(low),))
+        if high is None:
+            stop = len(view)
+        else:
+            # (rank, value, +inf seq) sorts after every entry equal to high
+            stop = bisect.bisect_right(view, (sort_key(high), float("inf")))
+        return [entry[2] for entry in view[start:stop]]
+
+    def _matches(
+        self,
+        record: Mapping[str, Any],
+        equals: Mapping[str, Any],
+        ranges: Mapping[str, tuple[Any, Any]],
+    ) -> bool:
+        for field, value in equals.items():
+            if self._get(record, field) != value:
+                return False
+        for field, (low, high) in ranges.items():
+            value = self._get(record, field)
+            try:
+                if low is not None and value < low:
+                    return False
+                if high is not None and value > high:
+                    return False
+            except TypeError:
+                return False
+        return True
+
+
+def _hashable(value: Any) -> Any:
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+class ObservedDict(dict):  # type: ignore[type-arg]
+    """``dict`` that reports key-level writes to an observer.
+
+    Used as the backing store of manager dicts (e.g.
+    ``PositionManager.positions``) so direct ``d[key] = ...`` / ``del d[key]``
+    writes from other modules and tests keep the owner's indexes in step.
+    Nested edits (``d[key]["quantity"] = ...``) are not visible; the owner
+    must call its own reindex hook after mutating a record in place.
+    """
+
+    def __init__(
+        self,
+        data: Mapping[Any, Any] | None = None,
+        *,
+        on_set: Callable[[Any, Any], None],
+        on_delete: Callable[[Any], None],
+        on_reset: Callable[[], None],
+    ) -> None:
+        super().__init__(data or {})
+        self._on_set = on_set
+        self._on_delete = on_delete
+        self._on_reset = on_reset
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        self._on_set(key, value)
+
+    def __delitem__(self, key: Any) -> None:
+        super().__delitem__(key)
+        self._on_delete(key)
+
+    _MISSING = object()
+
+    def pop(self, key: Any, default: Any = _MISSING) -> Any:
+        if key in self:
+            value = super().pop(key)
+            self._on_delete(key)
+            return value
+        if default is ObservedDict._MISSING:
+            raise KeyError(key)
+        return default
+
+    def popitem(self) -> tuple[Any, Any]:
+        key, value = super().popitem()
+        self._on_delete(key)
+        return key, value
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return super().__getitem__(key)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self) -> None:
+        super().clear()
+        self._on_reset()
+
+    def copy(self) -> dict[Any, Any]:
+        return dict(self)
+
+    def __reduce__(self) -> Any:
+        # Pickle/deepcopy as a plain dict; observers are process-local.
+        return (dict, (dict(self),))
@@ -0,0 +1,201 @@
+"""Side-effect-free pre-trade arithmetic on plain values.
+
+The order-sizing, PERCENT_PRICE and protective-price rules used to live
+inline in async methods (``Dispatcher._calculate_order_amount``,
+``BinanceFuturesExchange.validate_and_adjust_price_for_percent_filter``,
+``NakedPositionRemediator._derive_protective_prices``), interleaved with
+price fetches, logging and metrics. The functions here take numbers and
+return numbers plus a small outcome tag, so callers keep their I/O,
+messages and metrics while the arithmetic can run anywhere — inline, or
+batched on :class:`tradeengine.compute_pool.ComputePool` for
+reconciliation-time sweeps over every open position.
+
+Everything here is module-level and picklable so a process pool can run it.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from tradeengine.risk.sl_tp_direction import enforce_market_side_stop
+
+# PERCENT_PRICE band shrink so an adjusted price never sits on the edge.
+PERCENT_FILTER_SAFETY_MARGIN = 0.01
+
+
+def order_amount(
+    quantity: float | None,
+    position_size_pct: float | None,
+    portfolio_value: float,
+    current_price: float,
+    min_amount: float,
+) -> tuple[float, str]:
+    """Order size for a signal and how it was chosen.
+
+    Returns ``(amount, basis)`` where basis is one of ``quantity``,
+    ``quantity_below_min``, ``pct``, ``pct_below_min``, ``pct_unavailable``,
+    ``quantity_fallback`` or ``minimum``.
+    """
+    # A fixed quantity wins only when no percentage was supplied.
+    if quantity and quantity > 0 and position_size_pct is None:
+        if quantity < min_amount:
+            return min_amount, "quantity_below_min"
+        return quantity, "quantity"
+    if position_size_pct and position_size_pct > 0:
+        if portfolio_value > 0 and current_price > 0:
+            calculated = (portfolio_value * position_size_pct) / current_price
+            if calculated < min_amount:
+                return min_amount, "pct_below_min"
+            return calculated, "pct"
+        return min_amount, "pct_unavailable"
+    if quantity and quantity > 0:
+        return max(quantity, min_amount), "quantity_fallback"
+    return min_amount, "minimum"
+
+
+@dataclass(frozen=True)
+class PercentFilterDecision:
+    """Outcome of fitting a price into PERCENT_PRICE and the SL safety floor.
+
+    ``action`` is ``valid`` (price unchanged), ``adjusted`` (moved inside the
+    filter), ``clamped`` (#541: floor and filter cannot both hold, so the
+    furthest placeable price is used) or ``rejected`` (a stop inside the
+    safety floor; ``price`` is None).
+    """
+
+    action: str
+    price: float | None
+    min_price: float
+    max_price: float
+    deviation_pct: float
+
+
+def percent_filter_decision(
+    price: float,
+    current_price: float,
+    multiplier_up: float,
+    multiplier_down: float,
+    is_stop: bool,
+    min_safe_distance_pct: float,
+) -> PercentFilterDecision:
+    """Fit ``price`` into the PERCENT_PRICE band around ``current_price``.
+
+    For stop-shaped orders the result also clears the AC4 (#424) safety
+    floor of ``min_safe_distance_pct`` percent from market.
+    """
+    max_price = current_price * multiplier_up * (1 - PERCENT_FILTER_SAFETY_MARGIN)
+    min_price = current_price * multiplier_down * (1 + PERCENT_FILTER_SAFETY_MARGIN)
+    deviation_pct = ((price - current_price) / current_price) * 100
+    floor = min_safe_distance_pct / 100.0
+    floor_lo = current_price * (1 - floor)
+    floor_hi = current_price * (1 + floor)
+
+    def decision(action: str, value: float | None) -> PercentFilterDecision:
+        return PercentFilterDecision(action, value, min_price, max_price, deviation_pct)
+
+    # The floor is farther from market than the filter allows: no price
+    # satisfies both, so protect the position at the furthest placeable one.
+    if is_stop and price > current_price and max_price < floor_hi:
+        return decision("clamped", max_price)
+    if is_stop and price < current_price and min_price > floor_lo:
+        return decision("clamped", min_price)
+
+    if price < min_price:
+        adjusted = min_price
+        if is_stop and adjusted > floor_lo:
+            adjusted = floor_lo
+        return decision("adjusted", adjusted)
+    if price > max_price:
+        adjusted = max_price
+        if is_stop and adjusted < floor_hi:
+            adjusted = floor_hi
+        return decision("adjusted", adjusted)
+
+    if is_stop and (
+        current_price < price < floor_hi or floor_lo < price < current_price
+    ):
+        return decision("rejected", None)
+    return decision("valid", price)
+
+
+@dataclass(frozen=True)
+class ProtectivePrices:
+    """SL/TP to re-arm a position with, plus what was changed and why."""
+
+    sl_price: float | None
+    tp_price: float | None
+    must_flatten: bool = False
+    sl_widened_from: float | None = None
+    sl_reanchored_from: float | None = None
+    flatten_reason: str | None = None
+
+
+def derive_protective_prices(
+    side: str,
+    stored_sl: float | None,
+    stored_tp: float | None,
+    entry_price: float | None,
+    mark_price: float | None,
+    fallback_sl_pct: float,
+    fallback_tp_pct: float,
+    min_sl_distance_pct: float,
+) -> ProtectivePrices:
+    """Protective prices for a naked ``side`` position (#445/#551).
+
+    Stored strategy values win; missing legs fall back to ``entry ±
+    fallback_pct``. An SL inside the safety floor around entry is widened
+    to the floor, then re-anchored to the correct side of the live mark;
+    when no placeable stop exists ``must_flatten`` is set.
+    """
+    sl_price, tp_price = stored_sl, stored_tp
+    if entry_price is None or entry_price <= 0:
+        return ProtectivePrices(sl_price, tp_price)
+
+    long = side == "LONG"
+    if sl_price is None:
+        sl_price = entry_price * (
+            1.0 - fallback_sl_pct / 100.0 if long else 1.0 + fallback_sl_pct / 100.0
+        )
+    if tp_price is None:
+        tp_price = entry_price * (
+            1.0 + fallback_tp_pct / 100.0 if long else 1.0 - fallback_tp_pct / 100.0
+        )
+
+    widened_from: float | None = None
+    if min_sl_distance_pct > 0:
+        floor = min_sl_distance_pct / 100.0
+        floor_price = entry_price * (1.0 - floor if long else 1.0 + floor)
+        if (long and sl_price > floor_price) or (not long and sl_price < floor_price):
+            widened_from, sl_price = sl_price, floor_price
+
+    if mark_price and mark_price > 0:
+        market = enforce_market_side_stop(
+            position_side=side,  # type: ignore[arg-type]
+            stop_price=float(sl_price),
+            market_price=mark_price,
+            min_distance_pct=min_sl_distance_pct / 100.0,
+        )
+        if market.should_flatten:
+            return ProtectivePrices(
+                sl_price,
+                tp_price,
+                must_flatten=True,
+                sl_widened_from=widened_from,
+                flatten_reason=market.reason,
+            )
+        if market.was_reanchored:
+            return ProtectivePrices(
+                market.price,
+                tp_price,
+                sl_widened_from=widened_from,
+                sl_reanchored_from=sl_price,
+            )
+    return ProtectivePrices(sl_price, tp_price, sl_widened_from=widened_from)
+
+
+def derive_protective_prices_batch(
+    inputs: list[tuple[Any, ...]],
+) -> list[ProtectivePrices]:
+    """:func:`derive_protective_prices` over a list of argument tuples."""
+    return [derive_protective_prices(*args) for args in inputs]
@@ -0,0 +1,206 @@
+"""In-process statistical profiler behind ``GET /debug/profile``.
+
+``profiler_init.py`` only knows Pyroscope, whose agent does not build on
+the Alpine image, so live pods had no profiling at all. This profiler is
+pure Python: for the requested number of seconds a daemon thread reads
+every other thread's current frame (``sys._current_frames``) ``rate_hz``
+times a second, and a coroutine on the event loop walks each asyncio
+task's await chain at a lower rate. Thread samples show where CPU time
+goes (a busy loop thread is the Dispatcher/OCOManager work itself); task
+samples show where coroutines are waiting.
+
+Stacks are aggregated as folded stacks — ``root;caller;callee count`` —
+with one root per thread (``thread:<name>``) or task (``task:<name>``).
+Frames are labelled by function and definition line, so one function is
+one frame regardless of the line executing. :func:`to_speedscope`
+renders the same data as a speedscope "sampled" profile.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from types import CodeType, FrameType
+from typing import Any
+
+from shared.config import settings
+
+_TASK_RATE_HZ_CAP = 20
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+Stack = tuple[str, ...]
+
+
+class ProfilerBusyError(RuntimeError):
+    """Another profile is already being collected."""
+
+
+@dataclass
+class Profile:
+    """Folded stack counts from one profiling run."""
+
+    seconds: float
+    rate_hz: float
+    task_rate_hz: float
+    threads: Counter[Stack] = field(default_factory=Counter)
+    tasks: Counter[Stack] = field(default_factory=Counter)
+
+    def collapsed(self) -> str:
+        """Brendan Gregg's folded-stack text, one ``a;b;c count`` per line."""
+        lines = [
+            f"{';'.join(stack)} {count}"
+            for samples in (self.threads, self.tasks)
+            for stack, count in samples.most_common()
+        ]
+        return "\n".join(lines) + ("\n" if lines else "")
+
+
+def _label(code: CodeType) -> str:
+    path = code.co_filename
+    if path.startswith(_ROOT):
+        path = os.path.relpath(path, _ROOT)
+    # ';' separates frames in folded stacks.
+    name = f"{code.co_qualname} ({path}:{code.co_firstlineno})"
+    return name.replace(";", ":")
+
+
+def _thread_stack(frame: FrameType | None) -> list[str]:
+    labels: list[str] = []
+    while frame is not None:
+        labels.append(_label(frame.f_code))
+        frame = frame.f_back
+    labels.reverse()
+    return labels
+
+
+def _task_stack(task: asyncio.Task[Any]) -> list[str]:
+    labels: list[str] = []
+    coro: Any = task.get_coro()
+    while coro is not None:
+        frame = getattr(coro, "cr_frame", None) or getattr(coro, "gi_frame", None)
+        if frame is None:
+            break
+        labels.append(_label(frame.f_code))
+        coro = getattr(coro, "cr_await", None) or getattr(coro, "gi_yieldfrom", None)
+    return labels
+
+
+class SamplingProfiler:
+    """Collects one :class:`Profile` at a time."""
+
+    def __init__(self, default_rate_hz: float = 100.0) -> None:
+        self.default_rate_hz = default_rate_hz
+        self._busy = False
+
+    @property
+    def busy(self) -> bool:
+        return self._busy
+
+    async def profile(
+        self,
+        seconds: float,
+        rate_hz: float | None = None,
+        include_tasks: bool = True,
+    ) -> Profile:
+        if self._busy:
+            raise ProfilerBusyError("a profile is already being collected")
+        self._busy = True
+        try:
+            rate = max(1.0, float(rate_hz or self.default_rate_hz))
+            task_rate = min(rate, _TASK_RATE_HZ_CAP) if include_tasks else 0.0
+            result = Profile(seconds=seconds, rate_hz=rate, task_rate_hz=task_rate)
+            stop = threading.Event()
+            sampler = threading.Thread(
+                target=self._sample_threads,
+                args=(result.threads, 1.0 / rate, stop),
+                name="sampling-profiler",
+                daemon=True,
+            )
+            sampler.start()
+            try:
+                if task_rate:
+                    await self._sample_tasks(result.tasks, 1.0 / task_rate, seconds)
+                else:
+                    await asyncio.sleep(seconds)
+            finally:
+                stop.set()
+                await asyncio.to_thread(sampler.join)
+            return result
+        finally:
+            self._busy = False
+
+    @staticmethod
+    def _sample_threads(
+        samples: Counter[Stack], interval: float, stop: threading.Event
+    ) -> None:
+        me = threading.get_ident()
+        while not stop.wait(interval):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == me:
+                    continue
+                root = f"thread:{names.get(ident, ident)}".replace(";", ":")
+                samples[(root, *_thread_stack(frame))] += 1
+
+    @staticmethod
+    async def _sample_tasks(
+        samples: Counter[Stack], interval: float, seconds: float
+    ) -> None:
+        me = asyncio.current_task()
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            await asyncio.sleep(interval)
+            for task in asyncio.all_tasks():
+                if task is me or task.done():
+                    continue
+                root = f"task:{task.get_name()}".replace(";", ":")
+                samples[(root, *_task_stack(task))] += 1
+
+
+def to_speedscope(profile: Profile, name: str = "tradeengine") -> dict[str, Any]:
+    """The profile as a speedscope file: one sampled profile per source."""
+    frame_index: dict[str, int] = {}
+    frames: list[dict[str, str]] = []
+
+    def index(label: str) -> int:
+        if label not in frame_index:
+            frame_index[label] = len(frames)
+            frames.append({"name": label})
+        return frame_index[label]
+
+    profiles = []
+    for source, samples, rate in (
+        ("threads", profile.threads, profile.rate_hz),
+        ("tasks", profile.tasks, profile.task_rate_hz),
+    ):
+        if not samples:
+            continue
+        stacks = [[index(label) for label in stack] for stack in samples]
+        weights = [count / rate for count in samples.values()]
+        profiles.append(
+            {
+                "type": "sampled",
+                "name": f"{name} {source}",
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": stacks,
+                "weights": weights,
+            }
+        )
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "shared": {"frames": frames},
+        "profiles": profiles,
+        "name": name,
+        "activeProfileIndex": 0,
+        "exporter": "tradeengine.sampling_profiler",
+    }
+
+
+sampling_profiler = SamplingProfiler(settings.te_profile_rate_hz)
@@ -27,8 +27,15 @@ logger = logging.getLogger(__name__)
 tracer = trace.get_tracer(__name__)
 
 
+# "fill_audit" follows a "filled"/"partial_fill" event for the same order_id
+# with the userTrades fee, fee_asset and pnl (tradeengine/exchange/fill_audit.py).
 EventType = Literal[
-    "placed", "filled", "rejected", "partial_fill", "position_force_closed_no_stops"
+    "placed",
+    "filled",
+    "rejected",
+    "partial_fill",
+    "position_force_closed_no_stops",
+    "fill_audit",
 ]
 _VALID_EVENT_TYPES: set[str] = {
     "placed",
@@ -36,6 +43,7 @@ _VALID_EVENT_TYPES: set[str] = {
     "rejected",
     "partial_fill",
     "position_force_closed_no_stops",
+    "fill_audit",
 }
 
 
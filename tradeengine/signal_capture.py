@@ -0,0 +1,201 @@
+"""Signal capture and replay.
+
+With ``TE_SIGNAL_CAPTURE_PATH`` set, :class:`~tradeengine.consumer.SignalConsumer`
+appends every NATS signal it receives to a capture file before parsing
+it: the raw payload bytes, the subject and the receive time. Nothing is
+decoded on the way in, so a capture also keeps the malformed messages
+that made production misbehave.
+
+The file is append-only and compact: a ``TESC\\x01`` magic followed by
+records of ``<receive time: float64 epoch seconds><subject length:
+uint16><payload length: uint32>`` (little-endian) and the two byte
+strings. A record cut short by a crash is ignored on read.
+
+:func:`replay` feeds a capture back through ``Dispatcher.dispatch``,
+either with the original spacing (``speed=1``), scaled (``speed=10``
+is ten times faster) or as fast as the dispatcher goes (``speed=0``).
+Signal timestamps are moved forward by the time elapsed since capture,
+so signal age checks see the age the signal had when it arrived.
+``scripts/replay_signals.py`` runs a replay against the simulator
+exchange.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import struct
+import time
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, BinaryIO
+
+from contracts.signal import Signal
+from shared.constants import UTC, parse_datetime_aware
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"TESC\x01"
+_HEADER = struct.Struct("<dHI")
+
+
+@dataclass(frozen=True)
+class CapturedSignal:
+    """One message as the consumer received it."""
+
+    received_at: float
+    subject: str
+    payload: bytes
+
+
+class SignalCaptureWriter:
+    """Appends raw signal messages to a capture file."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.records = 0
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file: BinaryIO | None = open(path, "ab")  # noqa: SIM115
+        if self._file.tell() == 0:
+            self._file.write(MAGIC)
+            self._file.flush()
+
+    def write(
+        self, subject: str, payload: bytes, received_at: float | None = None
+    ) -> None:
+        if self._file is None:
+            return
+        encoded = subject.encode()[:0xFFFF]
+        self._file.write(
+            _HEADER.pack(
+                time.time() if received_at is None else received_at,
+                len(encoded),
+                len(payload),
+            )
+            + encoded
+            + payload
+        )
+        # One flush per message: signals are sparse and a crash should not
+        # lose the messages leading up to it.
+        self._file.flush()
+        self.records += 1
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def read_capture(path: str) -> Iterator[CapturedSignal]:
+    """Yield the records of a capture file in the order they were written."""
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a signal capture file")
+        while True:
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                return
+            received_at, subject_len, payload_len = _HEADER.unpack(header)
+            body = f.read(subject_len + payload_len)
+            if len(body) < subject_len + payload_len:
+                logger.warning("Ignoring truncated final record in %s", path)
+                return
+            yield CapturedSignal(
+                received_at=received_at,
+                subject=body[:subject_len].decode(errors="replace"),
+                payload=body[subject_len:],
+            )
+
+
+def signal_from_payload(payload: bytes, shift_seconds: float = 0.0) -> Signal:
+    """Parse a raw payload the way the consumer does, shifting its timestamp."""
+    data = json.loads(payload.decode())
+    raw = data.get("timestamp")
+    try:
+        timestamp = parse_datetime_aware(raw) if raw else None
+    except (ValueError, TypeError):
+        timestamp = None
+    if timestamp is None:
+        data["timestamp"] = datetime.now(UTC)
+    else:
+        data["timestamp"] = timestamp + timedelta(seconds=shift_seconds)
+    return Signal(**data)
+
+
+@dataclass
+class ReplayStats:
+    """Outcome of one replay."""
+
+    signals: int = 0
+    errors: int = 0
+    statuses: Counter[str] = field(default_factory=Counter)
+    wall_seconds: float = 0.0
+    capture_seconds: float = 0.0
+    dispatch_seconds: float = 0.0
+    max_dispatch_seconds: float = 0.0
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "signals": self.signals,
+            "errors": self.errors,
+            "statuses": dict(self.statuses),
+            "wall_seconds": self.wall_seconds,
+            "capture_seconds": self.capture_seconds,
+            "signals_per_second": (
+                self.signals / self.wall_seconds if self.wall_seconds else None
+            ),
+            "mean_dispatch_ms": (
+                1000 * self.dispatch_seconds / self.signals if self.signals else None
+            ),
+            "max_dispatch_ms": 1000 * self.max_dispatch_seconds,
+        }
+
+
+async def replay(
+    dispatcher: Any,
+    records: Iterable[CapturedSignal],
+    speed: float = 1.0,
+) -> ReplayStats:
+    """Dispatch captured signals in order.
+
+    ``speed`` scales the captured inter-arrival gaps; 0 replays without
+    waiting. A payload that fails to parse or dispatch counts as an error
+    and the replay carries on, as the consumer would.
+    """
+    stats = ReplayStats()
+    first_at: float | None = None
+    started = time.perf_counter()
+    for record in records:
+        if first_at is None:
+            first_at = record.received_at
+        offset = record.received_at - first_at
+        stats.capture_seconds = max(stats.capture_seconds, offset)
+        if speed > 0:
+            delay = offset / speed - (time.perf_counter() - started)
+            if delay > 0:
+                await asyncio.sleep(delay)
+        stats.signals += 1
+        try:
+            signal = signal_from_payload(
+                record.payload, shift_seconds=time.time() - record.received_at
+            )
+            dispatched_at = time.perf_counter()
+            result = await dispatcher.dispatch(signal)
+            took = time.perf_counter() - dispatched_at
+        except Exception as e:
+            stats.errors += 1
+            stats.statuses["error"] += 1
+            logger.warning("Replay of %s record failed: %s", record.subject, e)
+            continue
+        stats.dispatch_seconds += took
+        stats.max_dispatch_seconds = max(stats.max_dispatch_seconds, took)
+        status = result.get("status", "unknown") if isinstance(result, dict) else None
+        stats.statuses[str(status)] += 1
+    stats.wall_seconds = time.perf_counter() - started
+    return stats
@@ -0,0 +1,181 @@
+"""Concurrent startup dependency graph for the FastAPI lifespan.
+
+The lifespan used to await every initialiser in sequence (config manager,
+Binance init + exchange info, account/ticker probe, dispatcher, DataManager
+boot probe, reconciler, NATS consumer, health evaluator), so a cold start
+took the sum of every remote round-trip even though most of them do not
+depend on each other.
+
+:class:`StartupGraph` runs each registered step as its own task as soon as
+the steps it declares ``after`` have succeeded:
+
+* a step whose dependency failed is marked ``skipped`` instead of running
+  against half-initialised state;
+* :meth:`StartupGraph.wait_critical` returns once every ``critical`` step
+  has settled, which is when the lifespan yields and the pod can report
+  ready; non-critical steps keep running in the background;
+* per-step status and wall time are exported as
+  ``tradeengine_startup_step_*`` gauges and returned by :meth:`report`,
+  which ``/ready`` includes.
+
+Steps must be added after their dependencies, which also rules out cycles.
+A critical step may not depend on a non-critical one (readiness would then
+wait on it anyway).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from tradeengine.metrics import startup_step_duration_seconds, startup_step_failed
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+RUNNING = "running"
+OK = "ok"
+FAILED = "failed"
+SKIPPED = "skipped"
+
+
+@dataclass
+class StartupStep:
+    name: str
+    fn: Callable[[], Awaitable[Any]]
+    after: tuple[str, ...] = ()
+    critical: bool = True
+    status: str = PENDING
+    started_at: float | None = None
+    duration_s: float | None = None
+    error: str | None = None
+
+
+class StartupGraph:
+    """Runs startup steps concurrently in dependency order."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._steps: dict[str, StartupStep] = {}
+        self._tasks: dict[str, asyncio.Task[None]] = {}
+        self._started_at: float | None = None
+        self._ready_at: float | None = None
+
+    def add(
+        self,
+        name: str,
+        fn: Callable[[], Awaitable[Any]],
+        *,
+        after: tuple[str, ...] = (),
+        critical: bool = True,
+    ) -> None:
+        if name in self._steps:
+            raise ValueError(f"Duplicate startup step: {name}")
+        for dep in after:
+            if dep not in self._steps:
+                raise ValueError(f"Startup step {name} depends on unknown step {dep}")
+            if critical and not self._steps[dep].critical:
+                raise ValueError(
+                    f"Critical startup step {name} cannot depend on "
+                    f"non-critical step {dep}"
+                )
+        self._steps[name] = StartupStep(name, fn, tuple(after), critical)
+
+    def start(self) -> None:
+        """Schedule every step; each waits for its own dependencies."""
+        if self._tasks:
+            return
+        self._started_at = self._clock()
+        for step in self._steps.values():
+            self._tasks[step.name] = asyncio.create_task(
+                self._run(step), name=f"startup:{step.name}"
+            )
+
+    async def wait_critical(self) -> bool:
+        """Wait for the critical steps; True when all of them succeeded."""
+        self.start()
+        critical = [self._tasks[s.name] for s in self._steps.values() if s.critical]
+        if critical:
+            await asyncio.gather(*critical)
+        self._ready_at = self._clock()
+        return all(s.status == OK for s in self._steps.values() if s.critical)
+
+    async def wait_all(self) -> None:
+        if self._tasks:
+            await asyncio.gather(*self._tasks.values())
+
+    async def cancel_pending(self) -> None:
+        """Cancel steps still running (shutdown before they finished)."""
+        pending = [t for t in self._tasks.values() if not t.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _run(self, step: StartupStep) -> None:
+        for dep in step.after:
+            await self._tasks[dep]
+            dep_status = self._steps[dep].status
+            if dep_status != OK:
+                step.status = SKIPPED
+                step.error = f"dependency {dep} {dep_status}"
+                logger.error("Startup step %s skipped: %s", step.name, step.error)
+                self._record(step)
+                return
+        step.status = RUNNING
+        step.started_at = self._clock()
+        try:
+            await step.fn()
+            step.status = OK
+        except asyncio.CancelledError:
+            step.status = FAILED
+            step.error = "cancelled"
+            raise
+        except Exception as e:
+            step.status = FAILED
+            step.error = str(e)
+            logger.error("Startup step %s failed: %s", step.name, e, exc_info=True)
+        finally:
+            step.duration_s = self._clock() - step.started_at
+            self._record(step)
+            logger.info(
+                "Startup step %s %s in %.3fs", step.name, step.status, step.duration_s
+            )
+
+    @staticmethod
+    def _record(step: StartupStep) -> None:
+        startup_step_duration_seconds.labels(step=step.name).set(step.duration_s or 0.0)
+        startup_step_failed.labels(step=step.name).set(0 if step.status == OK else 1)
+
+    def report(self) -> dict[str, Any]:
+        started = self._started_at
+        return {
+            "ready": self._ready_at is not None,
+            "time_to_ready_s": (
+                self._ready_at - started
+                if self._ready_at is not None and started is not None
+                else None
+            ),
+            "complete": all(
+                s.status in (OK, FAILED, SKIPPED) for s in self._steps.values()
+            ),
+            "steps": {
+                s.name: {
+                    "status": s.status,
+                    "critical": s.critical,
+                    "after": list(s.after),
+                    "offset_s": (
+                        s.started_at - started
+                        if s.started_at is not None and started is not None
+                        else None
+                    ),
+                    "duration_s": s.duration_s,
+                    "error": s.error,
+                }
+                for s in self._steps.values()
+            },
+        }
@@ -0,0 +1,300 @@
+"""Warm-restart snapshot of the dispatcher's in-memory trading state.
+
+A cold boot rebuilds everything the pod needs before it can trade safely
+from REST and Data Manager calls: ``OCOManager.reconcile_from_exchange``
+walks every open protective order, ``PositionManager`` reloads its
+positions, and the strategy-layer contributions are simply lost. With
+``TE_STATE_SNAPSHOT_PATH`` set, :class:`StateSnapshotter` periodically
+writes that state to local disk and :meth:`StateSnapshotter.load` hands
+it back on the next boot:
+
+* OCO pairs and deferred (pending) entries;
+* ``PositionManager`` positions and the day's realised P&L;
+* the account's strategy positions, exchange positions and contributions;
+* the time of the last user-data stream event.
+
+The file is a small header (magic, format version, CRC32) followed by
+zlib-compressed JSON; datetimes and tuple keys are tagged so they round
+trip. It is written to a temporary file, fsynced and renamed over the old
+one, so a crash mid-write leaves the previous snapshot intact. Anything
+unreadable — wrong magic, version, checksum, account, or older than
+``TE_STATE_SNAPSHOT_MAX_AGE_SECONDS`` — is ignored and the boot falls back
+to the cold path.
+
+Restoring is not trusting blindly: the OCO monitor re-polls every restored
+pair, and the dispatcher runs ``reconcile_from_exchange`` in the
+background, which then only adds protective orders the snapshot did not
+already track.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import struct
+import tempfile
+import time
+import zlib
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from shared.config import settings
+
+if TYPE_CHECKING:
+    from tradeengine.dispatcher import Dispatcher
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_MAGIC = b"TESNAP"
+SNAPSHOT_VERSION = 1
+# magic, version, crc32 of the compressed body
+_HEADER = struct.Struct(">6sHI")
+
+
+class SnapshotError(ValueError):
+    """The snapshot file is not one this build can restore."""
+
+
+@dataclass
+class TradingStateSnapshot:
+    """Everything a warm restart restores, as plain data."""
+
+    taken_at: float
+    account_id: str | None = None
+    oco_pairs: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
+    pending_entries: dict[str, dict[str, Any]] = field(default_factory=dict)
+    positions: dict[tuple[str, str], dict[str, Any]] = field(default_factory=dict)
+    daily_pnl: float = 0.0
+    strategy_positions: dict[str, dict[str, Any]] | None = None
+    exchange_positions: dict[str, dict[str, Any]] | None = None
+    contributions: dict[str, list[dict[str, Any]]] | None = None
+    last_user_data_event: datetime | None = None
+
+    def age_seconds(self, now: float | None = None) -> float:
+        return (time.time() if now is None else now) - self.taken_at
+
+    def same_utc_day(self, now: float | None = None) -> bool:
+        """True when the snapshot was taken on today's UTC date."""
+        today = datetime.fromtimestamp(time.time() if now is None else now, UTC)
+        return datetime.fromtimestamp(self.taken_at, UTC).date() == today.date()
+
+
+# ---------------------------------------------------------------------------
+# Encoding
+# ---------------------------------------------------------------------------
+
+
+def _tag(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"__dt__": value.isoformat()}
+    if isinstance(value, dict):
+        if any(isinstance(k, tuple) for k in value):
+            return {"__tk__": [[list(k), _tag(v)] for k, v in value.items()]}
+        return {str(k): _tag(v) for k, v in value.items()}
+    if isinstance(value, list | tuple | set):
+        return [_tag(v) for v in value]
+    return value
+
+
+def _untag(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "__dt__" in value and len(value) == 1:
+            return datetime.fromisoformat(value["__dt__"])
+        if "__tk__" in value and len(value) == 1:
+            return {tuple(k): _untag(v) for k, v in value["__tk__"]}
+        return {k: _untag(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_untag(v) for v in value]
+    return value
+
+
+def encode(snapshot: TradingStateSnapshot) -> bytes:
+    body = zlib.compress(
+        json.dumps(_tag(asdict(snapshot)), separators=(",", ":"), default=str).encode(),
+        6,
+    )
+    return _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, zlib.crc32(body)) + body
+
+
+def decode(data: bytes) -> TradingStateSnapshot:
+    if len(data) < _HEADER.size:
+        raise SnapshotError("truncated header")
+    magic, version, crc = _HEADER.unpack_from(data)
+    if magic != SNAPSHOT_MAGIC:
+        raise SnapshotError("not a state snapshot")
+    if version != SNAPSHOT_VERSION:
+        raise SnapshotError(f"unsupported snapshot version {version}")
+    body = data[_HEADER.size :]
+    if zlib.crc32(body) != crc:
+        raise SnapshotError("checksum mismatch")
+    try:
+        fields = _untag(json.loads(zlib.decompress(body)))
+        return TradingStateSnapshot(**fields)
+    except (ValueError, TypeError, zlib.error) as e:
+        raise SnapshotError(f"corrupt snapshot body: {e}") from e
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Replace ``path`` with ``data`` so readers see the old or new file, whole."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    try:
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+# ---------------------------------------------------------------------------
+# Dispatcher glue
+# ---------------------------------------------------------------------------
+
+
+def capture(dispatcher: Dispatcher) -> TradingStateSnapshot:
+    """Copy the dispatcher's restorable state; synchronous, so it is consistent."""
+    oco_pairs, pending_entries = dispatcher.oco_manager.export_state()
+    pm = dispatcher.position_manager
+    snapshot = TradingStateSnapshot(
+        taken_at=time.time(),
+        account_id=dispatcher.account_id,
+        oco_pairs=oco_pairs,
+        pending_entries=pending_entries,
+        positions={key: dict(pos) for key, pos in pm.positions.items()},
+        daily_pnl=float(pm.daily_pnl),
+    )
+    (
+        snapshot.strategy_positions,
+        snapshot.exchange_positions,
+        snapshot.contributions,
+    ) = dispatcher.strategy_position_manager.export_state()
+    consumer = dispatcher.user_data_consumer
+    if consumer is not None:
+        snapshot.last_user_data_event = consumer.store.last_updated
+    return snapshot
+
+
+class StateSnapshotter:
+    """Periodic writer and boot-time reader of one dispatcher's snapshot file."""
+
+    def __init__(
+        self,
+        dispatcher: Dispatcher,
+        path: str | Path,
+        interval_seconds: float = 15.0,
+        max_age_seconds: float = 900.0,
+    ) -> None:
+        self.dispatcher = dispatcher
+        self.path = Path(path)
+        self.interval_seconds = max(1.0, float(interval_seconds))
+        self.max_age_seconds = float(max_age_seconds)
+        self._task: asyncio.Task[None] | None = None
+        self.last_written: float | None = None
+        self.last_write_ms: float | None = None
+        self.restored_from: float | None = None
+        self.write_errors = 0
+
+    @classmethod
+    def from_settings(cls, dispatcher: Dispatcher) -> StateSnapshotter | None:
+        config = getattr(dispatcher, "settings", settings)
+        path = config.te_state_snapshot_path
+        if not path:
+            return None
+        if dispatcher.account_id is not None:
+            path = f"{path}.{dispatcher.account_id}"
+        return cls(
+            dispatcher,
+            path,
+            interval_seconds=config.te_state_snapshot_interval_seconds,
+            max_age_seconds=config.te_state_snapshot_max_age_seconds,
+        )
+
+    def load(self) -> TradingStateSnapshot | None:
+        """The snapshot to warm-start from, or None to take the cold path."""
+        try:
+            snapshot = decode(self.path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, SnapshotError) as e:
+            logger.warning("Ignoring state snapshot %s: %s", self.path, e)
+            return None
+        if snapshot.account_id != self.dispatcher.account_id:
+            logger.warning(
+                "Ignoring state snapshot %s: written for account %s",
+                self.path,
+                snapshot.account_id,
+            )
+            return None
+        age = snapshot.age_seconds()
+        if not 0 <= age <= self.max_age_seconds:
+            logger.info(
+                "Ignoring state snapshot %s: %.0fs old (max %.0fs)",
+                self.path,
+                age,
+                self.max_age_seconds,
+            )
+            return None
+        self.restored_from = snapshot.taken_at
+        return snapshot
+
+    def _write(self, snapshot: TradingStateSnapshot) -> None:
+        started = time.perf_counter()
+        write_atomic(self.path, encode(snapshot))
+        self.last_written = snapshot.taken_at
+        self.last_write_ms = (time.perf_counter() - started) * 1000
+
+    def save(self) -> None:
+        self._write(capture(self.dispatcher))
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                # Capture on the loop (consistent), encode and write off it.
+                await asyncio.to_thread(self._write, capture(self.dispatcher))
+            except Exception as e:
+                self.write_errors += 1
+                logger.warning("State snapshot write failed: %s", e)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._loop(), name="state-snapshot")
+
+    async def stop(self) -> None:
+        """Stop the periodic writer and write a final snapshot."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        try:
+            self.save()
+        except Exception as e:
+            self.write_errors += 1
+            logger.warning("Final state snapshot write failed: %s", e)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "path": str(self.path),
+            "restored_from": self.restored_from,
+            "last_written": self.last_written,
+            "last_write_ms": self.last_write_ms,
+            "write_errors": self.write_errors,
+        }
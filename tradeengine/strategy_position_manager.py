@@ -16,6 +16,7 @@ This enables:
 - Profit attribution to contributing strategies
 """
 
+import copy
 import logging
 import uuid
 from datetime import datetime
@@ -33,6 +34,7 @@ from tradeengine.metrics import (
     otel_position_persist_failed,
     position_persist_failed_total,
 )
+from tradeengine.query_index import ObservedDict, RecordIndex
 from tradeengine.services.alert_publisher import alert_publisher
 from tradeengine.services.persist_retry_queue import PendingWrite, persist_retry_queue
 
@@ -96,13 +98,42 @@ def _on_persist_failure(result: PersistResult, position_data: dict[str, Any]) ->
         logger.warning("Enqueue to persist_retry_queue failed: %s", exc)
 
 
+def _strategy_query_field(record: Any, field: str) -> Any:
+    value = record.get(field)
+    if field == "entry_order_id" and value is not None:
+        # Binance sends ints on the stream; ids are stored as strings.
+        return str(value)
+    return value
+
+
+def _new_strategy_index() -> RecordIndex:
+    return RecordIndex(
+        indexed_fields=(
+            "entry_order_id",
+            "strategy_id",
+            "status",
+            "exchange_position_key",
+        ),
+        sorted_fields=(),
+        getter=_strategy_query_field,
+    )
+
+
 class StrategyPositionManager:
     """Manages virtual strategy positions and their contributions to exchange positions"""
 
-    def __init__(self) -> None:
-        self.strategy_positions: dict[
-            str, dict[str, Any]
-        ] = {}  # strategy_position_id -> position
+    # None is the primary (or only) account. Each TE_ACCOUNTS secondary has
+    # its own manager (strategy_positions_for_account) and tags the Data
+    # Manager documents it writes.
+    account_id: str | None = None
+
+    def __init__(self, account_id: str | None = None) -> None:
+        self.account_id = account_id
+        # Secondary indexes for fill attribution and the reconcilers; kept
+        # in step by the ObservedDict backing ``strategy_positions`` and by
+        # the in-place status edits in close/evict.
+        self.strategy_index = _new_strategy_index()
+        self.strategy_positions = {}  # strategy_position_id -> position
         self.exchange_positions: dict[
             str, dict[str, Any]
         ] = {}  # exchange_position_key -> position
@@ -112,6 +143,34 @@ class StrategyPositionManager:
         # AC4 (#459 — 446-C): injected by Dispatcher after UserDataStreamConsumer starts.
         self.exchange_truth_store: ExchangeTruthStore | None = None
 
+    @property
+    def strategy_positions(self) -> dict[str, dict[str, Any]]:
+        return self._strategy_positions
+
+    @strategy_positions.setter
+    def strategy_positions(self, value: dict[str, dict[str, Any]]) -> None:
+        if "strategy_index" not in self.__dict__:
+            # Instances built via __new__ (tests) skip __init__.
+            self.strategy_index = _new_strategy_index()
+        self._strategy_positions = ObservedDict(
+            value,
+            on_set=self._index_position,
+            on_delete=self.strategy_index.remove,
+            on_reset=self.strategy_index.clear,
+        )
+        self.strategy_index.rebuild(self._strategy_positions)
+
+    def _index_position(self, strategy_position_id: Any, position: Any) -> None:
+        if isinstance(position, dict):
+            self.strategy_index.upsert(strategy_position_id, position)
+        else:
+            self.strategy_index.remove(strategy_position_id)
+
+    def _lookup(self, **equals: Any) -> list[dict[str, Any]]:
+        """Indexed equality lookup, in insertion order."""
+        _, rows = self.strategy_index.query(equals=equals)
+        return rows  # type: ignore[return-value]
+
     async def initialize(self) -> None:
         """Initialize strategy position manager"""
         try:
@@ -243,6 +302,9 @@ class StrategyPositionManager:
                 },
             }
 
+            if self.account_id is not None:
+                strategy_position["account_id"] = self.account_id
+
             # Store in memory
             self.strategy_positions[strategy_position_id] = strategy_position
 
@@ -366,6 +428,7 @@ class StrategyPositionManager:
             position["close_reason"] = close_reason
             position["realized_pnl"] = pnl
             position["realized_pnl_pct"] = pnl_pct
+            self._index_position(strategy_position_id, position)
 
             # Persist to Data Manager
             await self._update_strategy_position_closure(strategy_position_id, position)
@@ -417,15 +480,9 @@ class StrategyPositionManager:
             List of open strategy position dicts
         """
         try:
-            open_positions = []
-
-            # First, check in-memory strategy positions
-            for strategy_position_id, position in self.strategy_positions.items():
-                if (
-                    position.get("exchange_position_key") == exchange_position_key
-                    and position.get("status") == "open"
-                ):
-                    open_positions.append(position)
+            open_positions = self._lookup(
+                exchange_position_key=exchange_position_key, status="open"
+            )
 
             # Note: Data Manager fallback query removed - positions are managed in memory
 
@@ -487,7 +544,7 @@ class StrategyPositionManager:
         try:
             if exchange_position_key not in self.exchange_positions:
                 # Create new exchange position
-                self.exchange_positions[exchange_position_key] = {
+                exchange_position: dict[str, Any] = {
                     "exchange_position_key": exchange_position_key,
                     "symbol": symbol,
                     "side": side,
@@ -499,6 +556,9 @@ class StrategyPositionManager:
                     "last_update_time": datetime.now(UTC),
                     "status": "open",
                 }
+                if self.account_id is not None:
+                    exchange_position["account_id"] = self.account_id
+                self.exchange_positions[exchange_position_key] = exchange_position
             else:
                 # Update existing position
                 position = self.exchange_positions[exchange_position_key]
@@ -621,6 +681,8 @@ class StrategyPositionManager:
                 "exchange_quantity_after": qty_after,
                 "status": "active",
             }
+            if self.account_id is not None:
+                contribution_data["account_id"] = self.account_id
             result = await position_client.create_position(contribution_data)
             if result.failed:
                 logger.error(
@@ -663,12 +725,12 @@ class StrategyPositionManager:
             _on_persist_failure(result, update_data)
 
     def get_all_open_strategy_positions(self) -> list[dict[str, Any]]:
-        """Return a shallow copy of all in-memory positions with status == 'open'."""
-        return [
-            dict(pos)
-            for pos in self.strategy_positions.values()
-            if pos.get("status") == "open"
-        ]
+        """Return the in-memory positions with status == 'open'.
+
+        The list is new but the rows are the live records; callers that
+        edit a row must copy it first.
+        """
+        return self._lookup(status="open")
 
     async def evict_ghost_position(
         self, strategy_position_id: str, reason: str = "no_exchange_position"
@@ -692,6 +754,7 @@ class StrategyPositionManager:
         position["status"] = "closed_externally"
         position["exit_time"] = datetime.now(UTC)
         position["close_reason"] = reason
+        self._index_position(strategy_position_id, position)
 
         try:
             await self._update_strategy_position_closure(strategy_position_id, position)
@@ -712,6 +775,31 @@ class StrategyPositionManager:
         )
         return True
 
+    def export_state(
+        self,
+    ) -> tuple[
+        dict[str, dict[str, Any]],
+        dict[str, dict[str, Any]],
+        dict[str, list[dict[str, Any]]],
+    ]:
+        """Deep copies of the in-memory state for a warm-restart snapshot."""
+        return (
+            copy.deepcopy(self.strategy_positions),
+            copy.deepcopy(self.exchange_positions),
+            copy.deepcopy(self.contributions),
+        )
+
+    def restore_state(
+        self,
+        strategy_positions: dict[str, dict[str, Any]],
+        exchange_positions: dict[str, dict[str, Any]],
+        contributions: dict[str, list[dict[str, Any]]],
+    ) -> None:
+        """Load state from a warm-restart snapshot; live entries win on conflict."""
+        self.strategy_positions = {**strategy_positions, **self.strategy_positions}
+        self.exchange_positions = {**exchange_positions, **self.exchange_positions}
+        self.contributions = {**contributions, **self.contributions}
+
     def get_strategy_position(self, strategy_position_id: str) -> dict[str, Any] | None:
         """Get strategy position by ID"""
         return self.strategy_positions.get(strategy_position_id)
@@ -728,21 +816,14 @@ class StrategyPositionManager:
         """
         if not entry_order_id:
             return None
-        target = str(entry_order_id)
-        for pos in self.strategy_positions.values():
-            if str(pos.get("entry_order_id")) == target:
-                return pos
-        return None
+        matches = self._lookup(entry_order_id=str(entry_order_id))
+        return matches[0] if matches else None
 
     def get_strategy_positions_by_strategy(
         self, strategy_id: str
     ) -> list[dict[str, Any]]:
         """Get all strategy positions for a strategy"""
-        return [
-            pos
-            for pos in self.strategy_positions.values()
-            if pos["strategy_id"] == strategy_id
-        ]
+        return self._lookup(strategy_id=strategy_id)
 
     def get_exchange_position(
         self, exchange_position_key: str
@@ -757,3 +838,25 @@ class StrategyPositionManager:
 
 # Global strategy position manager instance
 strategy_position_manager = StrategyPositionManager()
+
+# TE_ACCOUNTS secondaries: account id -> that account's manager
+_account_managers: dict[str, StrategyPositionManager] = {}
+
+
+def strategy_positions_for_account(
+    account_id: str | None,
+) -> StrategyPositionManager:
+    """The strategy position manager of ``account_id`` (None: the primary).
+
+    Exchange position keys (``SYMBOL_SIDE``) and the ghost reconciler's truth
+    store are per account, so secondaries must not share the primary's
+    manager.
+    """
+    if account_id is None:
+        return strategy_position_manager
+    manager = _account_managers.get(account_id)
+    if manager is None:
+        manager = _account_managers[account_id] = StrategyPositionManager(
+            account_id=account_id
+        )
+    return manager
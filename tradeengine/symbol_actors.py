@@ -0,0 +1,185 @@
+"""Per-symbol actor runtime for dispatcher state mutations.
+
+Dispatcher state for a symbol — ``PositionManager.positions``, the OCO
+pairs in ``OCOManager.active_oco_pairs``, deferred entries, strategy
+positions — is mutated from the NATS signal handler, the HTTP API, the
+user-data fill callback and the OCO monitor. Those paths interleave at
+every ``await``, so correctness has relied on call ordering plus a few
+coarse locks.
+
+With ``TE_SYMBOL_ACTOR_MODE=on`` each symbol gets an actor: a mailbox
+(``asyncio.Queue``) drained by one task, so commands for the same symbol
+run one at a time in arrival order while different symbols run fully in
+parallel:
+
+* :meth:`SymbolActorRuntime.call` enqueues a coroutine function and awaits
+  its result (exceptions propagate to the caller);
+* :meth:`SymbolActorRuntime.post` enqueues without waiting, for callbacks
+  that must not stall their producer (the user-data stream);
+* a command that calls back into its own symbol's actor (e.g. a close
+  signal issued while handling a fill) runs inline instead of deadlocking
+  on its own mailbox;
+* actors retire after ``idle_seconds`` without work and are recreated on
+  the next command, so quiet symbols hold no task.
+
+Mailbox wait time and depth are exported per symbol as
+``tradeengine_symbol_actor_queue_latency_seconds`` and
+``tradeengine_symbol_actor_mailbox_depth``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from tradeengine.metric_handles import BoundMetric
+from tradeengine.metrics import (
+    symbol_actor_mailbox_depth,
+    symbol_actor_queue_latency_seconds,
+)
+
+logger = logging.getLogger(__name__)
+
+_queue_latency = BoundMetric(symbol_actor_queue_latency_seconds, limited=("symbol",))
+_mailbox_depth = BoundMetric(symbol_actor_mailbox_depth, limited=("symbol",))
+
+# (fn, args, kwargs, result future or None for post(), enqueued at)
+_Command = tuple[
+    Callable[..., Awaitable[Any]],
+    tuple[Any, ...],
+    dict[str, Any],
+    "asyncio.Future[Any] | None",
+    float,
+]
+
+
+class _SymbolActor:
+    def __init__(self, symbol: str) -> None:
+        self.symbol = symbol
+        self.mailbox: asyncio.Queue[_Command] = asyncio.Queue()
+        self.task: asyncio.Task[None] | None = None
+        self.processed = 0
+        self.max_queue_latency_s = 0.0
+
+
+class SymbolActorRuntime:
+    """Owns one mailbox task per symbol and runs its commands in order."""
+
+    def __init__(
+        self,
+        idle_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.idle_seconds = idle_seconds
+        self._clock = clock
+        self._actors: dict[str, _SymbolActor] = {}
+        self._closed = False
+
+    def in_actor(self, symbol: str) -> bool:
+        """True when the current task is ``symbol``'s actor."""
+        actor = self._actors.get(symbol)
+        return actor is not None and asyncio.current_task() is actor.task
+
+    async def call(
+        self, symbol: str, fn: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any
+    ) -> Any:
+        """Run ``fn(*args, **kwargs)`` on ``symbol``'s actor and return its result."""
+        if self.in_actor(symbol):
+            return await fn(*args, **kwargs)
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._enqueue(symbol, (fn, args, kwargs, future, self._clock()))
+        return await future
+
+    def post(
+        self, symbol: str, fn: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any
+    ) -> None:
+        """Queue ``fn`` on ``symbol``'s actor without waiting for it."""
+        self._enqueue(symbol, (fn, args, kwargs, None, self._clock()))
+
+    def _enqueue(self, symbol: str, command: _Command) -> None:
+        if self._closed:
+            raise RuntimeError("Symbol actor runtime is stopped")
+        actor = self._actors.get(symbol)
+        if actor is None:
+            actor = self._actors[symbol] = _SymbolActor(symbol)
+        actor.mailbox.put_nowait(command)
+        _mailbox_depth.labels(symbol=symbol).set(actor.mailbox.qsize())
+        if actor.task is None or actor.task.done():
+            actor.task = asyncio.create_task(
+                self._run(actor), name=f"symbol-actor:{symbol}"
+            )
+
+    async def _run(self, actor: _SymbolActor) -> None:
+        while True:
+            try:
+                fn, args, kwargs, future, enqueued_at = await asyncio.wait_for(
+                    actor.mailbox.get(), timeout=self.idle_seconds
+                )
+            except TimeoutError:
+                # No await between the empty check and the removal, so no
+                # command can slip into a mailbox nobody drains.
+                if actor.mailbox.empty():
+                    if self._actors.get(actor.symbol) is actor:
+                        del self._actors[actor.symbol]
+                    return
+                continue
+
+            waited = self._clock() - enqueued_at
+            actor.max_queue_latency_s = max(actor.max_queue_latency_s, waited)
+            _queue_latency.labels(symbol=actor.symbol).observe(waited)
+            _mailbox_depth.labels(symbol=actor.symbol).set(actor.mailbox.qsize())
+
+            if future is not None and future.cancelled():
+                continue  # caller gave up while the command was queued
+            try:
+                result = await fn(*args, **kwargs)
+            except asyncio.CancelledError:
+                if future is not None and not future.done():
+                    future.cancel()
+                raise
+            except Exception as e:
+                if future is not None:
+                    if not future.done():
+                        future.set_exception(e)
+                else:
+                    logger.error(
+                        "Symbol actor %s command %s failed: %s",
+                        actor.symbol,
+                        getattr(fn, "__qualname__", fn),
+                        e,
+                        exc_info=True,
+                    )
+            else:
+                if future is not None and not future.done():
+                    future.set_result(result)
+            finally:
+                actor.processed += 1
+
+    async def stop(self) -> None:
+        """Cancel every actor and fail commands still waiting in mailboxes."""
+        self._closed = True
+        actors, self._actors = list(self._actors.values()), {}
+        tasks = [a.task for a in actors if a.task is not None and not a.task.done()]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        for actor in actors:
+            while not actor.mailbox.empty():
+                future = actor.mailbox.get_nowait()[3]
+                if future is not None and not future.done():
+                    future.cancel()
+            _mailbox_depth.labels(symbol=actor.symbol).set(0)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            symbol: {
+                "queued": actor.mailbox.qsize(),
+                "processed": actor.processed,
+                "max_queue_latency_s": actor.max_queue_latency_s,
+            }
+            for symbol, actor in self._actors.items()
+        }